@@ -34,7 +34,6 @@ from typing import Dict, List, Tuple, Optional
 import sys
 import os
 import logging
-import requests
 from datetime import datetime
 from pathlib import Path
 import multiprocessing
@@ -50,14 +49,7 @@ sys.path.append( '../../BibleOrgSys/' ) # So we can run "Biblelator.py from the
 from BibleOrgSys import BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
 from BibleOrgSys.Reference.BibleOrganisationalSystems import BibleOrganisationalSystem
-from BibleOrgSys.Reference.BibleVersificationSystems import BibleVersificationSystems
-from BibleOrgSys.Online.BibleBrainOnline import BibleBrainBibles
 from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
-from BibleOrgSys.Reference.BibleStylesheets import BibleStylesheet
-from BibleOrgSys.Formats.SwordResources import SwordType, SwordInterface
-from BibleOrgSys.Formats.USFMBible import USFMBible
-from BibleOrgSys.Formats.PTX7Bible import PTX7Bible, loadPTX7ProjectData
-from BibleOrgSys.Formats.PTX8Bible import PTX8Bible, loadPTX8ProjectData
 from BibleOrgSys.Formats.PickledBible import ZIPPED_PICKLE_FILENAME_END, getZippedPickledBiblesDetails
 
 # Biblelator imports
@@ -79,28 +71,19 @@ from Biblelator.Dialogs.BiblelatorDialogs import SelectResourceBoxDialog, GetNew
                                 BookNameDialog, NumberButtonDialog, \
                                 DownloadResourcesDialog, ChooseResourcesDialog
 from Biblelator.Helpers.BiblelatorHelpers import mapReferencesVerseKey, createEmptyUSFMBooks, parseEnteredBooknameField
+from Biblelator.Helpers.VerseCache import SharedVerseCache, VersePrefetcher
+from Biblelator.Helpers.ParallelBibleSearch import shutdownSearchPool
+from Biblelator.Helpers.BackgroundJobs import BackgroundJobScheduler
+from Biblelator.Helpers.BackgroundLogWriter import getLogWriter, closeLogWriter
 from Biblelator.Settings.Settings import ApplicationSettings, BiblelatorProjectSettings, uWProjectSettings
+from Biblelator.Settings.StartupSnapshots import getSnapshotFolderpath, loadDefaultStylesheet
 from Biblelator.Settings.BiblelatorSettingsFunctions import parseAndApplySettings, writeSettingsFile, \
-        saveNewWindowSetup, deleteExistingWindowSetup, applyGivenWindowsSettings, viewSettings, \
+        saveNewWindowSetup, deleteExistingWindowSetup, applyGivenWindowsSettings, cancelWindowRestores, viewSettings, \
         doSendUsageStatistics
 from Biblelator.Windows.TextBoxes import BEntry, BCombobox
-from Biblelator.Windows.ChildWindows import ChildWindows, CollateProjectsWindow, HTMLWindow
-from Biblelator.Windows.BibleResourceWindows import SwordBibleResourceWindow, InternalBibleResourceWindow, \
-                                DBPBibleResourceWindow, HebrewBibleResourceWindow
-from Biblelator.Windows.BibleResourceCollection import BibleResourceCollectionWindow
-from Biblelator.Windows.BibleReferenceCollection import BibleReferenceCollectionWindow
-from Biblelator.Windows.LexiconResourceWindows import BibleLexiconResourceWindow
-from Biblelator.Windows.TextEditWindow import TextEditWindow
-from Biblelator.Windows.USFMEditWindow import USFMEditWindow
-#from Biblelator.Windows.ESFMEditWindow import ESFMEditWindow
-from Biblelator.Windows.CSVEditWindow import CSVEditWindow
-from Biblelator.Windows.TSVEditWindow import TSVEditWindow
-from Biblelator.Windows.BibleNotesWindow import BibleNotesWindow
-
-# Biblelator apps imports
-from Biblelator.Apps.BiblelatorSettingsEditor import openBiblelatorSettingsEditor
-from Biblelator.Apps.BOSManager import openBOSManager
-from Biblelator.Apps.SwordManager import openSwordManager
+from Biblelator.Windows.ChildWindows import ChildWindows, CollateProjectsWindow, HTMLWindow, JobStatusWindow
+# NOTE: The other window modules (and the Biblelator apps and most BibleOrgSys format modules)
+#   are only imported when a window of that type is first opened (to speed up program start-up)
 
 
 LAST_MODIFIED_DATE = '2022-10-17' # by RJH -- note that this isn't necessarily the displayed date at start-up
@@ -123,6 +106,12 @@ PARATEXT8_FILETYPES = [('Settings files','Settings.xml'), ('All files','*')]
 PARATEXT7_FILETYPES = [('SSF files','.ssf'), ('All files','*')]
 NUM_BCV_REFERENCE_POPUP_LINES = 8
 BOS_RESOURCE_FILETYPES = [('Resource files', ZIPPED_PICKLE_FILENAME_END),('All files',  '*')]
+GREP_POLL_TIME = 100 # milliseconds between checks for new grep matches
+STARTUP_IMPORT_TIME_BUDGET = 2.0 # seconds -- checkStartupImportTime() complains if importing this module takes longer
+LAZILY_IMPORTED_MODULE_NAMES = ( 'requests', 'BibleOrgSys.Formats.SwordResources', 'BibleOrgSys.Formats.USFMBible',
+                'BibleOrgSys.Formats.PTX7Bible', 'BibleOrgSys.Formats.PTX8Bible', 'BibleOrgSys.Online.BibleBrainOnline',
+                'Biblelator.Windows.BibleResourceWindows', 'Biblelator.Windows.USFMEditWindow',
+                'Biblelator.Windows.TextEditWindow', 'Biblelator.Windows.TSVEditWindow', 'Biblelator.Apps.SwordManager' )
 
 
 
@@ -197,10 +186,16 @@ class Application( Frame ):
         #self.genericBibleOrganisationalSystemName = 'GENERIC-KJV-ENG' # Handles all bookcodes
         #self.setGenericBibleOrganisationalSystem( self.genericBibleOrganisationalSystemName )
 
-        self.stylesheet = BibleStylesheet().loadDefault()
+        self.stylesheet = loadDefaultStylesheet( getSnapshotFolderpath( self.homeFolderpath ) ) # Same as BibleStylesheet().loadDefault()
 
         self.childWindows = ChildWindows( self )
         self.internalBibles = [] # Contains 2-tuples being (internalBibleObject,list of window objects displaying that Bible)
+        self.verseCache = SharedVerseCache() # Shared by all Bible resource windows and boxes
+        self.versePrefetcher = VersePrefetcher( self.verseCache, self )
+        self.jobScheduler = BackgroundJobScheduler( self ) # For exports and checks, etc.
+        self.windowsToRestore = [] # Saved windows waiting to be reopened (see applyGivenWindowsSettings)
+        self.restoreWindowsAfterID = None
+        self.isRestoringWindows = False
 
         self.createStatusBar()
         if BibleOrgSysGlobals.debugFlag: # Create a scrolling debug box
@@ -284,15 +279,8 @@ class Application( Frame ):
         self.BCVHistory = []
         self.BCVHistoryIndex = None
 
-        # Make sure all our Bible windows get updated initially
-        for groupCode in BIBLE_GROUP_CODES:
-            if groupCode != self.currentVerseKeyGroup: # that gets done below
-                groupVerseKey = self.getVerseKey( groupCode )
-                if BibleOrgSysGlobals.debugFlag: assert isinstance( groupVerseKey, SimpleVerseKey )
-                for appWin in self.childWindows:
-                    if 'Bible' in appWin.genericWindowType:
-                        if appWin._groupCode == groupCode:
-                            appWin.updateShownBCV( groupVerseKey )
+        # The restored Bible windows get updated (one at a time) as they're first shown
+        #   -- see ChildWindows.scheduleFirstBCVUpdate
         self.updateBCVGroup( self.currentVerseKeyGroup ) # Does an acceptNewBnCV
 
         # See if there's any developer messages
@@ -478,6 +466,7 @@ class Application( Frame ):
         toolsMenu.add_command( label=_('Collate projects…'), underline=0, command=self.doOpenCollateProjects )
         toolsMenu.add_separator()
         toolsMenu.add_command( label=_('Search files…'), underline=0, command=self.onGrep )
+        toolsMenu.add_command( label=_('Background jobs…'), underline=0, command=self.doOpenJobStatusWindow )
         toolsMenu.add_separator()
         toolsMenu.add_command( label=_('Checks…'), underline=1, command=self.notWrittenYet )
         toolsMenu.add_separator()
@@ -644,6 +633,7 @@ class Application( Frame ):
         toolsMenu = tk.Menu( self.menubar, tearoff=False )
         self.menubar.add_cascade( menu=toolsMenu, label=_('Tools'), underline=0 )
         toolsMenu.add_command( label=_('Search files…'), underline=0, command=self.onGrep )
+        toolsMenu.add_command( label=_('Background jobs…'), underline=0, command=self.doOpenJobStatusWindow )
         toolsMenu.add_separator()
         toolsMenu.add_command( label=_('Checks…'), underline=0, command=self.notWrittenYet )
         toolsMenu.add_separator()
@@ -1343,6 +1333,7 @@ class Application( Frame ):
                         f"\n      aBs={iB.availableBBBs}"
                         f"\n      sF={iB.sourceFolder!r}  sFn={iB.sourceFilename!r}  sFp={iB.sourceFilepath!r}  fExt={iB.fileExtension!r}"
                         f"\n      stat={iB.status!r}  rev={iB.revision!r}  ver={iB.version!r}  enc={iB.encoding!r}" )
+        self.debugTextBox.insert( tk.END, '\n\n' + self.verseCache.getStatsText() )
 
         #self.debugTextBox.insert( tk.END, '\n{} resource frames:'.format( len(self.childWindows) ) )
         #for j, projFrame in enumerate( self.childWindows ):
@@ -1374,6 +1365,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"Application.doCheckForMessagesFromDeveloper( {event} )" )
         logging.info( "Application.doCheckForMessagesFromDeveloper()" )
+        import requests
 
         hadError = False
         # NOTE: needs to be https eventually!!!
@@ -1471,6 +1463,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.doOpenNewDBPBibleResourceWindow()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "doOpenNewDBPBibleResourceWindow…" )
+        from BibleOrgSys.Online.BibleBrainOnline import BibleBrainBibles
 
         if self.internetAccessEnabled:
             self.setWaitStatus( _("doOpenNewDBPBibleResourceWindow…") )
@@ -1505,6 +1498,7 @@ class Application( Frame ):
         Returns the new DBPBibleResourceWindow object.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openDBPBibleResourceWindow()" )
+        from Biblelator.Windows.BibleResourceWindows import DBPBibleResourceWindow
         if BibleOrgSysGlobals.debugFlag:
             if DEBUGGING_THIS_MODULE: self.setDebugText( "openDBPBibleResourceWindow…" )
             assert moduleAbbreviation and isinstance( moduleAbbreviation, str ) and len(moduleAbbreviation)==6
@@ -1520,7 +1514,7 @@ class Application( Frame ):
             self.setReadyStatus()
             return None
         else:
-            dBRW.updateShownBCV( self.getVerseKey( dBRW._groupCode ) )
+            if not self.isRestoringWindows: dBRW.updateShownBCV( self.getVerseKey( dBRW._groupCode ) )
             self.childWindows.append( dBRW )
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openDBPBibleResourceWindow" )
             self.setReadyStatus()
@@ -1536,6 +1530,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openSwordResource()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "doOpenNewSwordResourceWindow…" )
+        from BibleOrgSys.Formats.SwordResources import SwordType, SwordInterface
 
         self.setWaitStatus( _("doOpenNewSwordResourceWindow…") )
         if self.SwordInterface is None and SwordType is not None:
@@ -1597,6 +1592,8 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openSwordBibleResourceWindow( {}, {} )".format( moduleAbbreviation, windowGeometry ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openSwordBibleResourceWindow…" )
+        from Biblelator.Windows.BibleResourceWindows import SwordBibleResourceWindow
+        from BibleOrgSys.Formats.SwordResources import SwordInterface
 
         self.setWaitStatus( _("openSwordBibleResourceWindow…") )
         if self.SwordInterface is None:
@@ -1607,7 +1604,7 @@ class Application( Frame ):
             self.SwordInterface.augmentModules( self.lastSwordDir )
             swBRW = SwordBibleResourceWindow( self, moduleAbbreviation )
         if windowGeometry: swBRW.geometry( windowGeometry )
-        swBRW.updateShownBCV( self.getVerseKey( swBRW._groupCode ) )
+        if not self.isRestoringWindows: swBRW.updateShownBCV( self.getVerseKey( swBRW._groupCode ) )
         self.childWindows.append( swBRW )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openSwordBibleResourceWindow" )
         self.setReadyStatus()
@@ -1621,6 +1618,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.doDownloadResource( {} )".format( abbrev ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "doDownloadResource {}…".format( abbrev ) )
+        import requests
         if BibleOrgSysGlobals.debugFlag or DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.strictCheckingFlag:
             assert self.internetAccessEnabled
 
@@ -1722,6 +1720,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openInternalBibleResourceWindow( {}, {} )".format( modulePath, windowGeometry ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openInternalBibleResourceWindow…" )
+        from Biblelator.Windows.BibleResourceWindows import InternalBibleResourceWindow
 
         self.setWaitStatus( _("openInternalBibleResourceWindow…") )
         iBRW = InternalBibleResourceWindow( self, modulePath )
@@ -1734,7 +1733,7 @@ class Application( Frame ):
             self.setReadyStatus()
             return None
         else:
-            iBRW.updateShownBCV( self.getVerseKey( iBRW._groupCode ) )
+            if not self.isRestoringWindows: iBRW.updateShownBCV( self.getVerseKey( iBRW._groupCode ) )
             self.childWindows.append( iBRW )
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openInternalBibleResourceWindow" )
             self.setReadyStatus()
@@ -1775,6 +1774,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"Application.openHebrewBibleResourceWindow( mP={modulePath}, wG={windowGeometry} )…" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openHebrewBibleResourceWindow…" )
+        from Biblelator.Windows.BibleResourceWindows import HebrewBibleResourceWindow
 
         self.setWaitStatus( _("openHebrewBibleResourceWindow…") )
         iHRW = HebrewBibleResourceWindow( self, modulePath )
@@ -1787,7 +1787,7 @@ class Application( Frame ):
             self.setReadyStatus()
             return None
         else:
-            iHRW.updateShownBCV( self.getVerseKey( iHRW._groupCode ) )
+            if not self.isRestoringWindows: iHRW.updateShownBCV( self.getVerseKey( iHRW._groupCode ) )
             self.childWindows.append( iHRW )
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openHebrewBibleResourceWindow" )
             self.setReadyStatus()
@@ -1821,6 +1821,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openBibleLexiconResourceWindow()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openBibleLexiconResourceWindow…" )
+        from Biblelator.Windows.LexiconResourceWindows import BibleLexiconResourceWindow
 
         self.setWaitStatus( _("openBibleLexiconResourceWindow…") )
         bLRW = BibleLexiconResourceWindow( self )
@@ -1867,6 +1868,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"Application.openBibleNotesWindow( fp={folderpath}, wG={windowGeometry} )…" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openBibleNotesWindow…" )
+        from Biblelator.Windows.BibleNotesWindow import BibleNotesWindow
 
         if folderpath is None:
             return
@@ -1918,6 +1920,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openBibleResourceCollectionWindow( {!r} )".format( collectionName ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openBibleResourceCollectionWindow…" )
+        from Biblelator.Windows.BibleResourceCollection import BibleResourceCollectionWindow
 
         self.setWaitStatus( _("openBibleResourceCollectionWindow…") )
         BRC = BibleResourceCollectionWindow( self, collectionName )
@@ -1930,7 +1933,7 @@ class Application( Frame ):
         #    self.setReadyStatus()
         #    return None
         #else:
-        BRC.updateShownBCV( self.getVerseKey( BRC._groupCode ) )
+        if not self.isRestoringWindows: BRC.updateShownBCV( self.getVerseKey( BRC._groupCode ) )
         self.childWindows.append( BRC )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openBibleResourceCollection" )
         self.setReadyStatus()
@@ -1963,6 +1966,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openBibleReferenceCollectionWindow( {!r} )".format( collectionName ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openBibleReferenceCollectionWindow…" )
+        from Biblelator.Windows.BibleReferenceCollection import BibleReferenceCollectionWindow
 
         self.setWaitStatus( _("openBibleReferenceCollectionWindow…") )
         BRC = BibleReferenceCollectionWindow( self, collectionName )
@@ -1988,6 +1992,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.doOpenNewTextEditWindow()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "doOpenNewTextEditWindow…" )
+        from Biblelator.Windows.TextEditWindow import TextEditWindow
 
         self.setWaitStatus( _("doOpenNewTextEditWindow…") )
         txEW = TextEditWindow( self )
@@ -2031,6 +2036,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openFileTextEditWindow( {} )".format( filepath ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openFileTextEditWindow…" )
+        from Biblelator.Windows.TextEditWindow import TextEditWindow
 
         self.setWaitStatus( _("openFileTextEditWindow…") )
         if filepath is None: # it's a blank window
@@ -2169,6 +2175,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application._doViewLog()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "_doViewLog…" )
+        from Biblelator.Windows.TextEditWindow import TextEditWindow
 
         self.setWaitStatus( _("_doViewLog…") )
         filename = APP_NAME.replace('/','-').replace(':','_').replace('\\','_') + '_log.txt'
@@ -2194,6 +2201,9 @@ class Application( Frame ):
         and then opens an editor window.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.doStartNewProject()" )
+        from BibleOrgSys.Reference.BibleVersificationSystems import BibleVersificationSystems
+        from BibleOrgSys.Formats.USFMBible import USFMBible
+        from Biblelator.Windows.USFMEditWindow import USFMEditWindow
 
         self.setWaitStatus( _("doStartNewProject…") )
         gnpn = GetNewProjectNameDialog( self, title=_("New Project Name") )
@@ -2238,7 +2248,7 @@ class Application( Frame ):
             uEW.settings = BiblelatorProjectSettings( newFolderpath )
             uEW.settings.saveNameAndAbbreviation( projName, projAbbrev )
             if cnpf.result: uEW.settings.saveNewBookSettings( cnpf.result )
-            uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
+            if not self.isRestoringWindows: uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
             self.childWindows.append( uEW )
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished doStartNewProject" )
             self.setReadyStatus()
@@ -2277,6 +2287,8 @@ class Application( Frame ):
         Returns the new USFMEditWindow object.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openBiblelatorBibleEditWindow( {!r} )".format( projectFolderpath ) )
+        from Biblelator.Windows.USFMEditWindow import USFMEditWindow
+        from BibleOrgSys.Formats.USFMBible import USFMBible
         if BibleOrgSysGlobals.debugFlag:
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openBiblelatorBibleEditWindow…" )
             assert os.path.isdir( projectFolderpath )
@@ -2294,7 +2306,7 @@ class Application( Frame ):
             uEW.projectName = uEW.settings.data['Project']['Name']
         if not uEW.projectAbbreviation:
             uEW.projectAbbreviation = uEW.settings.data['Project']['Abbreviation']
-        uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
+        if not self.isRestoringWindows: uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
         self.childWindows.append( uEW )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openBiblelatorBibleEditWindow" )
         self.setReadyStatus()
@@ -2335,6 +2347,8 @@ class Application( Frame ):
         Returns the new USFMEditWindow object.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openUWUSFMBibleEditWindow( {!r} )".format( projectFolderpath ) )
+        from Biblelator.Windows.USFMEditWindow import USFMEditWindow
+        from BibleOrgSys.Formats.USFMBible import USFMBible
         if BibleOrgSysGlobals.debugFlag:
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openUWUSFMBibleEditWindow…" )
             assert os.path.isdir( projectFolderpath )
@@ -2352,7 +2366,7 @@ class Application( Frame ):
             uEW.projectName = uEW.settings.data['dublin_core']['title']
         if not uEW.projectAbbreviation:
             uEW.projectAbbreviation = uEW.settings.data['dublin_core']['identifier'].upper()
-        uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
+        if not self.isRestoringWindows: uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
         self.childWindows.append( uEW )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openUWUSFMBibleEditWindow" )
         self.setReadyStatus()
@@ -2395,6 +2409,8 @@ class Application( Frame ):
         Returns the new USFMEditWindow object.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openUSFMBibleEditWindow( {!r} )".format( projectFolderpath ) )
+        from Biblelator.Windows.USFMEditWindow import USFMEditWindow
+        from BibleOrgSys.Formats.USFMBible import USFMBible
         if BibleOrgSysGlobals.debugFlag:
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openUSFMBibleEditWindow…" )
             assert os.path.isdir( projectFolderpath )
@@ -2412,7 +2428,7 @@ class Application( Frame ):
             uEW.projectName = uEW.settings.data['Project']['Name']
         if not uEW.projectAbbreviation:
             uEW.projectAbbreviation = uEW.settings.data['Project']['Abbreviation']
-        uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
+        if not self.isRestoringWindows: uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
         self.childWindows.append( uEW )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "Finished openUSFMBibleEditWindow" )
         self.setReadyStatus()
@@ -2439,6 +2455,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.doOpenParatext8Project()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "doOpenParatext8Project…" )
+        from BibleOrgSys.Formats.PTX8Bible import PTX8Bible, loadPTX8ProjectData
 
         self.setWaitStatus( _("doOpenParatext8Project…") )
         #if not self.openDialog:
@@ -2487,6 +2504,8 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openParatext8BibleEditWindow( {!r} )".format( settingsFolder ) )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openParatext8BibleEditWindow…" )
+        from Biblelator.Windows.USFMEditWindow import USFMEditWindow
+        from BibleOrgSys.Formats.PTX8Bible import PTX8Bible
         if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag:
             assert os.path.isdir( settingsFolder )
 
@@ -2508,7 +2527,7 @@ class Application( Frame ):
         uEW.windowType = 'Paratext8USFMBibleEditWindow' # override the default
         uEW.moduleID = settingsFolder
         #uEW.setFilepath( settingsFilepath ) # needed ???
-        uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
+        if not self.isRestoringWindows: uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
         self.childWindows.append( uEW )
         if uEW.autocompleteMode: uEW.prepareAutocomplete()
 
@@ -2533,6 +2552,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.doOpenParatext7Project()" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "doOpenParatext7Project…" )
+        from BibleOrgSys.Formats.PTX7Bible import PTX7Bible, loadPTX7ProjectData
 
         self.setWaitStatus( _("doOpenParatext7Project…") )
         #if not self.openDialog:
@@ -2602,6 +2622,8 @@ class Application( Frame ):
         Returns the new USFMEditWindow object.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Application.openParatext7BibleEditWindow( {!r} )".format( SSFFilepath ) )
+        from Biblelator.Windows.USFMEditWindow import USFMEditWindow
+        from BibleOrgSys.Formats.PTX7Bible import PTX7Bible, loadPTX7ProjectData
         if BibleOrgSysGlobals.debugFlag:
             if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openParatext7BibleEditWindow…" )
             assert os.path.isfile( SSFFilepath )
@@ -2643,7 +2665,7 @@ class Application( Frame ):
         uEW.windowType = 'Paratext7USFMBibleEditWindow' # override the default
         uEW.moduleID = SSFFilepath
         uEW.setFilepath( SSFFilepath )
-        uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
+        if not self.isRestoringWindows: uEW.updateShownBCV( self.getVerseKey( uEW._groupCode ) )
         self.childWindows.append( uEW )
         if uEW.autocompleteMode: uEW.prepareAutocomplete()
 
@@ -2680,6 +2702,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"openTSVEditWindow( fp={folderpath}, wG={windowGeometry} )…" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openTSVEditWindow…" )
+        from Biblelator.Windows.TSVEditWindow import TSVEditWindow
 
         if folderpath is None:
             # tsvEW = TSVEditWindow( self )
@@ -2743,6 +2766,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"openCSVEditWindow( fp={filepath}, wG={windowGeometry} )" )
         if BibleOrgSysGlobals.debugFlag: self.setDebugText( "openCSVEditWindow…" )
+        from Biblelator.Windows.CSVEditWindow import CSVEditWindow
 
         if filepath is None:
             # csvEW = TSVEditWindow( self )
@@ -2803,6 +2827,21 @@ class Application( Frame ):
     # end of Application.openCollateProjectsWindow
 
 
+    def doOpenJobStatusWindow( self ) -> None:
+        """
+        Open the background jobs window (called from a menu/GUI action)
+            or bring it to the front if it's already open.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "Application.doOpenJobStatusWindow()" )
+
+        for appWin in self.childWindows:
+            if appWin.windowType == 'JobStatusWindow':
+                appWin.deiconify(); appWin.lift()
+                return
+        self.childWindows.append( JobStatusWindow( self ) )
+    # end of Application.doOpenJobStatusWindow
+
+
     #def doProjectExports( self ):
     #    """
     #    Taking the
@@ -3466,6 +3505,7 @@ class Application( Frame ):
         for appWin in self.childWindows:
             if 'Sword' in appWin.windowType:
                 if self.SwordInterface is None:
+                    from BibleOrgSys.Formats.SwordResources import SwordInterface
                     self.SwordInterface = SwordInterface() # Load the Sword library
                 return True
         return False
@@ -3513,9 +3553,9 @@ class Application( Frame ):
             dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Application.gotoBnCV changed invalid {originator} {V=} to '1'" )
             V = '1'
 
+        self.childWindows.cancelBibleGroupUpdates( self.currentVerseKeyGroup ) # Don't let them be done while we're waiting
         self.setWaitStatus( _("Moving to new Bible reference ({} {}:{})…").format( BBB, C, V ) )
         self.setCurrentVerseKey( SimpleVerseKey( BBB, C, V ) )
-        self.update_idletasks() # Try to make the main window respond even before child windows can react
         if self.bookNumberTable[BBB] > 0: # Preface and glossary, etc. might fail this
             isValid = self.isValidBCVRef( self.currentVerseKey, 'gotoBCV '+str(self.currentVerseKey), extended=True )
             if not isValid:
@@ -3526,7 +3566,7 @@ class Application( Frame ):
             self.SwordKey = self.SwordInterface.makeKey( BBB, C, V )
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "swK", self.SwordKey.getText() )
         self.childWindows.updateThisBibleGroup( self.currentVerseKeyGroup, self.currentVerseKey, originator=originator )
-        self.setReadyStatus()
+        if not self.childWindows.pendingBCVUpdates: self.setReadyStatus() # otherwise ChildWindows will do it when they're finished
     # end of Application.gotoBCV
 
 
@@ -3816,6 +3856,8 @@ class Application( Frame ):
         without error per utf-8, and search strings won't be found;
         TBD: could allow input of multiple encoding names, split on
         comma, try each one for every file, without open loadEncode?
+        now: each file's encoding is sniffed once from its BOM or first
+        few KB (UTF-16 and UTF-8 are recognised, else the input encoding);
         """
         #from tkinter import Toplevel, StringVar, X, RIDGE, tk.SUNKEN
         #from tkinter.ttk import Label, Entry, Button
@@ -3856,145 +3898,116 @@ class Application( Frame ):
 
     def onDoGrep( self, dirname, filenamepatt, grepkey, encoding) -> None:
         """
-        on Go in grep dialog: populate scrolled list with matches
-        tbd: should producer thread be daemon so it dies with app?
-        """
-        #from tkinter import Tk
-        #from tkinter.ttk import Label
-        import threading
-        import queue
-
-        # make non-modal un-closeable dialog
-        mypopup = tk.Tk()
-        mypopup.title( _('PyEdit - grepping') )
-        status = Label( mypopup, text=_('Grep thread searching for: {}…').format( grepkey ) )
-        status.pack(padx=20, pady=20)
-        mypopup.protocol( 'WM_DELETE_WINDOW', lambda: None)  # ignore X close
-
-        # start producer thread, consumer loop
-        myqueue = queue.Queue()
-        threadargs = (filenamepatt, dirname, grepkey, encoding, myqueue)
-        threading.Thread(target=self.grepThreadProducer, args=threadargs).start()
-        self.grepThreadConsumer(grepkey, encoding, myqueue, mypopup)
+        on Go in grep dialog: open the list window straight away
+            and start the (multiprocess) search which fills it in;
+        the search is cancelled if the list window is closed;
+        """
+        from Biblelator.Helpers.ParallelGrep import ParallelGrep
+        if not grepkey:
+            showError( self, APP_NAME, _("Please enter a search string") ); return
+
+        grepSearch = ParallelGrep( dirname, filenamepatt, grepkey, encoding )
+        matchesList = self.grepMatchesList( grepSearch, grepkey, encoding )
+        self.grepThreadConsumer( grepSearch, matchesList )
     # end of Application.onDoGrep
 
 
-    def grepThreadProducer( self, filenamepatt, dirname, grepkey, encoding, myqueue) -> None:
+    def grepThreadConsumer( self, grepSearch, matchesList ) -> None:
         """
-        in a non-GUI parallel thread: queue find.find results list;
-        could also queue matches as found, but need to keep window;
-        file content and file names may both fail to decode here;
-
-        TBD: could pass encoded bytes to find() to avoid filename
-        decoding excs in os.walk/listdir, but which encoding to use:
-        sys.getfilesystemencoding() if not None?  see also Chapter6
-        footnote issue: 3.1 fnmatch always converts bytes per Latin-1;
+        in the main GUI thread: add any new matches to the list
+            and poll again until the search is finished;
+        there may be multiple active greps at the same time;
         """
-        import fnmatch
-
-        def find(pattern, startdir=os.curdir):
-            for (thisDir, subsHere, filesHere) in os.walk(startdir):
-                for name in subsHere + filesHere:
-                    if fnmatch.fnmatch(name, pattern):
-                        fullpath = os.path.join(thisDir, name)
-                        yield fullpath
-        # end of find
-
-        matches = []
-        try:
-            for filepath in find( pattern=filenamepatt, startdir=dirname ):
-                try:
-                    textfile = open(filepath, encoding=encoding)
-                    for (linenum, linestr) in enumerate(textfile):
-                        if grepkey in linestr:
-                            msg = '%s@%d  [%s]' % (filepath, linenum + 1, linestr)
-                            matches.append(msg)
-                except UnicodeError as X:
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Unicode error in:', filepath, X)       # eg: decode, bom
-                except IOError as X:
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'IO error in:', filepath, X)            # eg: permission
-        finally:
-            myqueue.put( matches )      # stop consumer loop on find excs: filenames?
-    # end of Application.grepThreadProducer
-
-
-    def grepThreadConsumer( self, grepkey:str, encoding:str, myqueue, mypopup ) -> None:
-        """
-        in the main GUI thread: watch queue for results or [];
-        there may be multiple active grep threads/loops/queues;
-        there may be other types of threads/checkers in process,
-        especially when PyEdit is attached component (PyMailGUI);
-        """
-        import queue
-        try:
-            matches = myqueue.get( block=False )
-        except queue.Empty:
-            myargs  = (grepkey, encoding, myqueue, mypopup)
-            self.after( 250, self.grepThreadConsumer, *myargs )
+        if not matchesList.winfo_exists(): # They closed the window
+            grepSearch.cancel(); return
+        finished = grepSearch.isFinished # Must be checked before getting the matches
+        newMatches = grepSearch.getNewMatches()
+        if newMatches: matchesList.addMatches( newMatches )
+        if not finished:
+            matchesList.setStatus( _("Searching for {!r}: {:,} matches in {:,} files so far…") \
+                        .format( grepSearch.grepKey, matchesList.numMatches, grepSearch.numFilesSearched ) )
+            self.after( GREP_POLL_TIME, self.grepThreadConsumer, grepSearch, matchesList )
+            return
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Matches for '{grepSearch.grepKey}': {matchesList.numMatches:,}" )
+        if not matchesList.numMatches and not grepSearch.isCancelled:
+            matchesList.master.destroy()
+            showInfo( self, APP_NAME, 'Grep found no matches for: %r' % grepSearch.grepKey )
         else:
-            mypopup.destroy()     # close status
-            self.update()         # erase it now
-            if not matches:
-                showInfo( self, APP_NAME, 'Grep found no matches for: %r' % grepkey)
-            else:
-                self.grepMatchesList( matches, grepkey, encoding )
+            matchesList.setStatus( _("{} {:,} matches for {!r} in {:,} files") \
+                        .format( _("Stopped after") if grepSearch.isCancelled else _("Found"),
+                                matchesList.numMatches, grepSearch.grepKey, grepSearch.numFilesSearched ) )
+            matchesList.stopButton.configure( state=tk.DISABLED )
     # end of Application.grepThreadConsumer
 
 
-    def grepMatchesList( self, matches, grepkey:str, encoding:str ) -> None:
+    def grepMatchesList( self, grepSearch, grepkey:str, encoding:str ):
         """
-        populate list after successful matches;
+        make the (non-modal) list window which the matches are added to as they're found;
         we already know Unicode encoding from the search: use
         it here when filename clicked, so open doesn't ask user;
+
+        Returns the ScrolledFilenames list frame.
         """
         #from tkinter import Tk, tk.Listbox, tk.SUNKEN, Y
         from tkinter.ttk import Scrollbar
         class ScrolledList( Frame ):
             def __init__( self, options, parent=None ):
                 super().__init__( parent )
-                self.pack( expand=tk.YES, fill=tk.BOTH )                   # make me expandable
                 self.makeWidgets(options)
+                self.pack( expand=tk.YES, fill=tk.BOTH )                   # make me expandable
 
             def handleList(self, event):
-                index = self.tk.Listbox.curselection()                # on list double-click
-                label = self.tk.Listbox.get(index)                    # fetch selection text
+                index = self.matchBox.curselection()                # on list double-click
+                label = self.matchBox.get(index)                    # fetch selection text
                 self.runCommand(label)                             # and call action here
                                                                    # or get(tk.ACTIVE)
             def makeWidgets(self, options):
+                self.statusLabel = Label( self )
+                self.statusLabel.pack( side=tk.TOP, fill=tk.X )
+                self.stopButton = Button( self, text=_('Stop'), command=grepSearch.cancel )
+                self.stopButton.pack( side=tk.BOTTOM )
                 sbar = Scrollbar( self )
                 matchBox = tk.Listbox( self, relief=tk.SUNKEN )
                 sbar.configure( command=matchBox.yview )                    # xlink sbar and list
                 matchBox.configure( yscrollcommand=sbar.set )               # move one moves other
                 sbar.pack( side=tk.RIGHT, fill=tk.Y )                      # pack first=clip last
                 matchBox.pack( side=tk.LEFT, expand=tk.YES, fill=tk.BOTH )        # list clipped first
-                pos = 0
-                for label in options:                              # add to tk.Listbox
-                    matchBox.insert( pos, label )                        # or insert(tk.END,label)
-                    pos += 1                                       # or enumerate(options)
+                if options: matchBox.insert( tk.END, *options )            # add to tk.Listbox
                #list.configure(selectmode=SINGLE, setgrid=1)          # select,resize modes
                 matchBox.bind('<Double-Button-1>', self.handleList)           # set event handler
-                self.tk.Listbox = matchBox
+                self.matchBox = matchBox
+                self.numMatches = len( options )
+
+            def addMatches( self, matches ):                   # (filepath, lineNumber, line) tuples
+                self.matchBox.insert( tk.END, *('%s@%d  [%s]' % match for match in matches) )
+                self.numMatches += len( matches )
+
+            def setStatus( self, statusText ):
+                self.statusLabel.configure( text=statusText )
 
             def runCommand(self, selection):                       # redefine me lower
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'You selected:', selection)
         # end of class ScrolledList
 
-        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Matches for '{grepkey}': {len(matches):,}" )
-
         # catch list double-click
         class ScrolledFilenames(ScrolledList):
             def runCommand( self, selection):
-                file, line = selection.split( '  [', 1)[0].split( '@')
+                file, line = selection.split( '  [', 1)[0].rsplit( '@', 1)
                 # TODO: None of the following exists !!!! xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
                 editor = TextEditorMainPopup(
                     loadFirst=file, winTitle=' grep match', loadEncode=encoding)
                 editor.onGoto(int(line))
                 editor.text.focus_force()   # no, really
 
-        # new non-modal widnow
-        popup = tk.Tk()
+        # new non-modal window
+        popup = tk.Toplevel( self )
         popup.title( f"Grep matches: {grepkey!r} ({encoding})" )
-        ScrolledFilenames( parent=popup, options=matches )
+        matchesList = ScrolledFilenames( parent=popup, options=[] )
+        def closeMatches():
+            grepSearch.cancel()
+            popup.destroy()
+        popup.protocol( 'WM_DELETE_WINDOW', closeMatches )
+        return matchesList
     # end of Application.grepMatchesList
 
 
@@ -4004,6 +4017,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"Application.doOpenSettingsEditor( {event} )" )
         self.logUsage( PROGRAM_NAME, DEBUGGING_THIS_MODULE, 'doOpenSettingsEditor' )
+        from Biblelator.Apps.BiblelatorSettingsEditor import openBiblelatorSettingsEditor
 
         openBiblelatorSettingsEditor( self )
     # end of Application.doOpenSettingsEditor
@@ -4014,6 +4028,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"Application.doOpenBOSManager( {event} )" )
         self.logUsage( PROGRAM_NAME, DEBUGGING_THIS_MODULE, 'doOpenBOSManager' )
+        from Biblelator.Apps.BOSManager import openBOSManager
 
         openBOSManager( self )
     # end of Application.doOpenBOSManager
@@ -4024,6 +4039,7 @@ class Application( Frame ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"Application.doOpenSwordManager( {event} )" )
         self.logUsage( PROGRAM_NAME, DEBUGGING_THIS_MODULE, 'doOpenSwordManager' )
+        from Biblelator.Apps.SwordManager import openSwordManager
 
         openSwordManager( self )
     # end of Application.doOpenSwordManager
@@ -4032,6 +4048,8 @@ class Application( Frame ):
     def logUsage( self, moduleName, debuggingThatModule, usageText ) -> None:
         """
         Log usage information for developer to understand typical program use.
+
+        The text is only queued here -- it's written to the file later by the BackgroundLogWriter.
         """
         timeString = datetime.now().strftime( '%H:%M')
         if timeString == self.lastLoggedUsageTime: timeString = dateString = None
@@ -4042,16 +4060,15 @@ class Application( Frame ):
             else: self.lastLoggedUsageDate = dateString
 
         logText = '{}\n'.format( usageText )
-
-        with open( self.usageLogPath, 'at', encoding='utf-8' ) as logFile: # Append puts the file pointer at the end of the file
-            if dateString:
-                logFile.write( "\nNew start or new day: {} for {!r} as {!r} on {!r} on {}\n". \
-                    format( dateString, self.currentUserName, self.currentUserRole, self.currentProjectName, PROGRAM_NAME_VERSION ) )
-            if timeString:
-                if timeString.endswith( '00' ):
-                    logFile.write( "New time: {} for {}\n".format( timeString, dateString ) )
-                else: logFile.write( "New time: {}\n".format( timeString ) )
-            logFile.write( logText )
+        if timeString:
+            if timeString.endswith( '00' ):
+                logText = "New time: {} for {}\n".format( timeString, dateString ) + logText
+            else: logText = "New time: {}\n".format( timeString ) + logText
+        if dateString:
+            logText = "\nNew start or new day: {} for {!r} as {!r} on {!r} on {}\n". \
+                format( dateString, self.currentUserName, self.currentUserRole, self.currentProjectName, PROGRAM_NAME_VERSION ) + logText
+
+        getLogWriter().write( self.usageLogPath, logText )
     # end of Application.logUsage
 
 
@@ -4238,6 +4255,7 @@ class Application( Frame ):
             return False
 
         # Should be able to close all apps now
+        cancelWindowRestores() # Any that haven't been opened yet
         for appWin in self.childWindows.copy():
             appWin.doClose()
         return True
@@ -4254,7 +4272,10 @@ class Application( Frame ):
 
         writeSettingsFile()
         if self.doCloseMyChildWindows():
+            self.jobScheduler.shutdown()
             self.rootWindow.destroy()
+            shutdownSearchPool()
+            closeLogWriter() # Writes any waiting usage and change log lines
         if self.internetAccessEnabled and self.sendUsageStatisticsEnabled:
             try: doSendUsageStatistics( self )
             except: pass # Don't worry too much if something fails in this
@@ -4406,6 +4427,46 @@ def handlePossibleCrash( homeFolderpath:str, dataFolderName:str, settingsFolderN
 
 
 
+def checkStartupImportTime() -> bool:
+    """
+    Import this module in a fresh Python process and check that
+        it doesn't take longer than STARTUP_IMPORT_TIME_BUDGET seconds,
+        and that none of the lazily-imported (window and format) modules got pulled in.
+
+    Returns True if everything is ok.
+    (The demos exit with a non-zero status if it's not.)
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "checkStartupImportTime()" )
+
+    checkCode = "import sys, time; startTime = time.perf_counter(); import Biblelator.Biblelator; " \
+                "print( time.perf_counter() - startTime ); " \
+                f"print( ' '.join( name for name in {LAZILY_IMPORTED_MODULE_NAMES!r} if name in sys.modules ) )"
+    environment = os.environ.copy()
+    environment['PYTHONPATH'] = os.pathsep.join( [p for p in sys.path if p] )
+    try:
+        completedProcess = subprocess.run( [sys.executable, '-c', checkCode], env=environment,
+                                    capture_output=True, text=True, timeout=60 )
+    except (OSError, subprocess.SubprocessError) as err:
+        logging.error( f"checkStartupImportTime: Unable to run import check: {err}" )
+        return False
+    if completedProcess.returncode:
+        logging.error( f"checkStartupImportTime: Import failed: {completedProcess.stderr.strip()}" )
+        return False
+    outputLines = completedProcess.stdout.split( '\n' ) # Last two printed lines (the final list might be empty)
+    importTime, eagerlyImported = float( outputLines[-3] ), outputLines[-2].split()
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Importing {APP_NAME} took {importTime:.3f}s (budget is {STARTUP_IMPORT_TIME_BUDGET}s)" )
+    result = True
+    if importTime > STARTUP_IMPORT_TIME_BUDGET:
+        logging.error( f"checkStartupImportTime: Start-up imports took {importTime:.3f}s which is over the {STARTUP_IMPORT_TIME_BUDGET}s budget" )
+        result = False
+    if eagerlyImported:
+        logging.error( f"checkStartupImportTime: These modules should only be imported when needed: {eagerlyImported}" )
+        result = False
+    return result
+# end of Biblelator.checkStartupImportTime
+
+
+
 def briefDemo() -> None:
     """
     Unattended demo program to handle command line parameters and then run what they want.
@@ -4414,6 +4475,9 @@ def briefDemo() -> None:
     """
     BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
 
+    if not checkStartupImportTime():
+        sys.exit( _("Start-up import check FAILED -- see the log") ) # Exits with a non-zero status
+
     tkRootWindow = tk.Tk()
     if BibleOrgSysGlobals.debugFlag:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Windowing system is', repr( tkRootWindow.tk.call('tk', 'windowingsystem') ) )
@@ -4446,6 +4510,9 @@ def fullDemo() -> None:
     """
     BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
 
+    if not checkStartupImportTime():
+        sys.exit( _("Start-up import check FAILED -- see the log") ) # Exits with a non-zero status
+
     tkRootWindow = tk.Tk()
     if BibleOrgSysGlobals.debugFlag:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Windowing system is', repr( tkRootWindow.tk.call('tk', 'windowingsystem') ) )
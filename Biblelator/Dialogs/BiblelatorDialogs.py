@@ -59,7 +59,7 @@ Various modal dialog windows for Biblelator Bible display/editing.
         Get the new name for a resource collection.
         __init__( self, parentWindow, existingName, existingNames, title )
     class GetBibleBookRangeDialog( ModalDialog )
-        __init__( self, parentWindow, givenBible, currentBBB, currentList, title )
+        __init__( self, parentWindow, givenBible, currentBBB, currentList, title, availableBookList=None )
     class SelectIndividualBibleBooksDialog( ModalDialog )
         __init__( self, parentWindow, availableList, currentList, title )
 
@@ -71,6 +71,9 @@ Various modal dialog windows for Biblelator Bible display/editing.
         __init__( self, parentWindow, givenBible, optionsDict, title )
     class ReplaceConfirmDialog( ModalDialog )
         __init__( self, parentWindow, referenceString, contextBefore, findText, contextAfter, finalText, haveUndos, title )
+    class ReplacePreviewDialog( ModalDialog )
+        Show all the possible replacements and let the user untick any unwanted ones.
+        __init__( self, parentWindow, candidateList, title )
 
     class SelectInternalBibleDialog( ModalDialog )
         Select one internal Bible from a given list.
@@ -115,11 +118,10 @@ from gettext import gettext as _
 from typing import List
 import os
 import logging
-import requests
 
 import tkinter as tk
 import tkinter.font as tkFont
-from tkinter.ttk import Style, Label, Radiobutton, Button, Frame
+from tkinter.ttk import Style, Label, Radiobutton, Button, Frame, Treeview, Scrollbar
 
 # BibleOrgSys imports
 from BibleOrgSys import BibleOrgSysGlobals
@@ -869,12 +871,16 @@ class RenameResourceCollectionDialog( ModalDialog ):
 class GetBibleBookRangeDialog( ModalDialog ):
     """
     """
-    def __init__( self, parentWindow, givenBible, currentBBB, currentList, title ):
+    def __init__( self, parentWindow, givenBible, currentBBB, currentList, title, availableBookList=None ):
         """
+        If availableBookList is given, the books are chosen from it
+            rather than from the loaded books of givenBible
+            (e.g., if not all of the books are loaded yet).
         """
         if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "GetBibleBookRangeDialog…" )
         #assert currentBBB in givenBible -- no, it might not be loaded yet!
         self.givenBible, self.currentBBB, self.currentList = givenBible, currentBBB, currentList
+        self.availableBookList = availableBookList if availableBookList is not None else [book.BBB for book in givenBible]
         ModalDialog.__init__( self, parentWindow, title )
     # end of GetBibleBookRangeDialog.__init__
 
@@ -888,7 +894,7 @@ class GetBibleBookRangeDialog( ModalDialog ):
 
         rb1 = Radiobutton( master, text=_('Current book')+" ({})".format( self.currentBBB ), variable=self.booksSelectVariable, value=1 )
         rb1.grid( row=0, column=0, sticky=tk.W )
-        allText = _("All {} books").format( len(self.givenBible) ) if len(self.givenBible)>2 else _('All books')
+        allText = _("All {} books").format( len(self.availableBookList) ) if len(self.availableBookList)>2 else _('All books')
         rb2 = Radiobutton( master, text=allText, variable=self.booksSelectVariable, value=2 )
         rb2.grid( row=1, column=0, sticky=tk.W )
         rb3 = Radiobutton( master, text=_('OT books'), variable=self.booksSelectVariable, value=3 )
@@ -926,7 +932,7 @@ class GetBibleBookRangeDialog( ModalDialog ):
         """
         Allow the user to select individual books(s).
         """
-        self.availableList = self.givenBible.getBookList()
+        self.availableList = self.availableBookList
         sIBBD = SelectIndividualBibleBooksDialog( self, self.availableList, self.currentList, title=_('Books to be searched') )
         dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "individualBooks sIBBDResult", repr(sIBBD.result) )
         if sIBBD.result: # Returns a list of books
@@ -956,10 +962,10 @@ class GetBibleBookRangeDialog( ModalDialog ):
         """
         resultNumber = self.booksSelectVariable.get()
         if resultNumber == 1: self.result = [self.currentBBB]
-        elif resultNumber == 2: self.result = [book.BBB for book in self.givenBible] # all
-        elif resultNumber == 3: self.result = [book.BBB for book in self.givenBible if BibleOrgSysGlobals.loadedBibleBooksCodes.isOldTestament_NR(book.BBB)] # OT
-        elif resultNumber == 4: self.result = [book.BBB for book in self.givenBible if BibleOrgSysGlobals.loadedBibleBooksCodes.isNewTestament_NR(book.BBB)] # NT
-        elif resultNumber == 5: self.result = [book.BBB for book in self.givenBible if BibleOrgSysGlobals.loadedBibleBooksCodes.isDeuterocanon_NR(book.BBB)] # DC
+        elif resultNumber == 2: self.result = list( self.availableBookList ) # all
+        elif resultNumber == 3: self.result = [BBB for BBB in self.availableBookList if BibleOrgSysGlobals.loadedBibleBooksCodes.isOldTestament_NR(BBB)] # OT
+        elif resultNumber == 4: self.result = [BBB for BBB in self.availableBookList if BibleOrgSysGlobals.loadedBibleBooksCodes.isNewTestament_NR(BBB)] # NT
+        elif resultNumber == 5: self.result = [BBB for BBB in self.availableBookList if BibleOrgSysGlobals.loadedBibleBooksCodes.isDeuterocanon_NR(BBB)] # DC
         elif resultNumber == 6: self.result = self.currentList
         else:
             halt # Unexpected result value
@@ -1960,6 +1966,135 @@ class ReplaceConfirmDialog( ModalDialog ):
 # end of class ReplaceConfirmDialog
 
 
+class ReplacePreviewDialog( ModalDialog ):
+    """
+    Show all the replacements that could be made (from findReplaceCandidates)
+        and let the user untick any that they don't want.
+
+    The rows are added to the list a batch at a time in idle time
+        so that the dialog appears straight away even for thousands of replacements.
+
+    Returns a list of the accepted candidates (or None if cancelled).
+    """
+    def __init__( self, parentWindow, candidateList, title ):
+        """
+        """
+        if BibleOrgSysGlobals.debugFlag:
+            BiblelatorGlobals.theApp.setDebugText( "ReplacePreviewDialog…" )
+            assert isinstance( candidateList, list )
+        self.candidateList = candidateList
+        self.untickedIndexes = set()
+        ModalDialog.__init__( self, parentWindow, title, okText=_('Replace') )
+    # end of ReplacePreviewDialog.__init__
+
+
+    def makeBody( self, master ):
+        """
+        Override the empty ModalDialog.makeBody function
+            to set up the dialog how we want it.
+        """
+        numBooks = len( {candidate[0] for candidate in self.candidateList} )
+        self.infoLabel = Label( master, text=_("{:,} replacements in {:,} book(s) -- untick any that you don't want") \
+                                                .format( len(self.candidateList), numBooks ) )
+        self.infoLabel.pack( side=tk.TOP, anchor=tk.W )
+
+        buttonFrame = Frame( master )
+        Button( buttonFrame, text=_('Tick all'), command=self.doTickAll ).pack( side=tk.LEFT, padx=2, pady=2 )
+        Button( buttonFrame, text=_('Untick all'), command=self.doUntickAll ).pack( side=tk.LEFT, padx=2, pady=2 )
+        buttonFrame.pack( side=tk.TOP, anchor=tk.W )
+
+        vScrollbar = Scrollbar( master )
+        vScrollbar.pack( side=tk.RIGHT, fill=tk.Y )
+        self.previewTreeview = Treeview( master, height=20, yscrollcommand=vScrollbar.set,
+                                        columns=('ref','before','fText','rText','after') )
+        vScrollbar.configure( command=self.previewTreeview.yview )
+        self.previewTreeview.column( '#0', width=30, stretch=False, anchor='center' )
+        self.previewTreeview.column( 'ref', width=85, stretch=False, anchor='w' )
+        self.previewTreeview.heading( 'ref', text=_("Ref") )
+        self.previewTreeview.column( 'before', width=200, anchor='e' )
+        self.previewTreeview.heading( 'before', text=_("Before") )
+        self.previewTreeview.column( 'fText', width=100, anchor='center' )
+        self.previewTreeview.heading( 'fText', text=_("Found") )
+        self.previewTreeview.column( 'rText', width=100, anchor='center' )
+        self.previewTreeview.heading( 'rText', text=_("Replace with") )
+        self.previewTreeview.column( 'after', width=200, anchor='w' )
+        self.previewTreeview.heading( 'after', text=_("After") )
+        self.previewTreeview.pack( side=tk.TOP, expand=tk.YES, fill=tk.BOTH )
+        self.previewTreeview.bind( '<Button-1>', self.doClick )
+        self.previewTreeview.bind( '<space>', self.doToggleSelected )
+
+        self.numRowsShown = 0
+        self._insertPreviewRows()
+        return self.previewTreeview
+    # end of ReplacePreviewDialog.makeBody
+
+
+    def _insertPreviewRows( self ) -> None:
+        """
+        Add the next batch of candidates to the TreeView
+            (and schedule the next batch if there are more).
+        """
+        try:
+            if not self.previewTreeview.winfo_exists(): return # The dialog has been closed
+        except tk.TclError: return
+        startIndex, endIndex = self.numRowsShown, min( self.numRowsShown+500, len(self.candidateList) )
+        for j in range( startIndex, endIndex ):
+            BBB, C, V, _ix, _ixAfter, foundText, replacementText, contextBefore, contextAfter = self.candidateList[j]
+            self.previewTreeview.insert( '', 'end', j, text='☐' if j in self.untickedIndexes else '☑',
+                values=('{} {}:{}'.format( BBB, C, V ), contextBefore.replace( '\n', ' ' ), foundText, replacementText, contextAfter.replace( '\n', ' ' )) )
+        self.numRowsShown = endIndex
+        if endIndex < len(self.candidateList):
+            self.after_idle( self._insertPreviewRows )
+    # end of ReplacePreviewDialog._insertPreviewRows
+
+
+    def _setTicked( self, j:int, tickedFlag:bool ) -> None:
+        """
+        """
+        if tickedFlag: self.untickedIndexes.discard( j )
+        else: self.untickedIndexes.add( j )
+        if j < self.numRowsShown: self.previewTreeview.item( j, text='☑' if tickedFlag else '☐' )
+    # end of ReplacePreviewDialog._setTicked
+
+    def doClick( self, event=None ):
+        """
+        Toggle the tick on the row if they clicked in the tick column.
+        """
+        if self.previewTreeview.identify_column( event.x ) != '#0': return
+        rowID = self.previewTreeview.identify_row( event.y )
+        if rowID:
+            j = int( rowID )
+            self._setTicked( j, j in self.untickedIndexes )
+    # end of ReplacePreviewDialog.doClick
+
+    def doToggleSelected( self, event=None ):
+        """
+        Toggle the ticks on the selected rows.
+        """
+        for rowID in self.previewTreeview.selection():
+            j = int( rowID )
+            self._setTicked( j, j in self.untickedIndexes )
+    # end of ReplacePreviewDialog.doToggleSelected
+
+    def doTickAll( self, event=None ):
+        for j in list( self.untickedIndexes ): self._setTicked( j, True )
+    # end of ReplacePreviewDialog.doTickAll
+
+    def doUntickAll( self, event=None ):
+        for j in range( len(self.candidateList) ): self._setTicked( j, False )
+    # end of ReplacePreviewDialog.doUntickAll
+
+
+    def apply( self ):
+        """
+        Override the empty ModalDialog.apply function
+            to process the results how we need them.
+        """
+        self.result = [candidate for j,candidate in enumerate( self.candidateList ) if j not in self.untickedIndexes]
+    # end of ReplacePreviewDialog.apply
+# end of class ReplacePreviewDialog
+
+
 
 class SelectInternalBibleDialog( ModalDialog ):
     """
@@ -2570,6 +2705,7 @@ class DownloadResourcesDialog( ModalDialog ):
         """
         import re
         from datetime import datetime
+        import requests
 
         responseObject = requests.get( BibleOrgSysGlobals.DISTRIBUTABLE_RESOURCES_URL )
         if responseObject.status_code != 200:
@@ -35,8 +35,13 @@ import sys
 import os
 import logging
 import multiprocessing
+import pickle
 import time
 from collections import defaultdict
+from bisect import bisect_left, insort
+from itertools import islice
+import heapq
+from typing import Dict, List, Optional, Tuple
 
 import tkinter as tk
 
@@ -45,6 +50,8 @@ if __name__ == '__main__':
     aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
     if aboveAboveFolderpath not in sys.path:
         sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator import BiblelatorGlobals
+from Biblelator.BiblelatorGlobals import DATA_SUBFOLDER_NAME
 from Biblelator.Windows.TextBoxes import TRAILING_SPACE_SUBSTITUTE, MULTIPLE_SPACE_SUBSTITUTE
 
 # BibleOrgSys imports
@@ -66,17 +73,213 @@ DEBUGGING_THIS_MODULE = False
 AVOID_BOOKS = ( 'FRT', 'BAK', 'GLS', 'XXA','XXB','XXC','XXD','XXE','XXF','XXG', 'NDX', 'UNK', )
 END_CHARS_TO_REMOVE = ',—.–!?”:;' # NOTE: This intentionally doesn't include close parenthesis and similar
 HUNSPELL_DICTIONARY_FOLDERS = ( '/usr/share/hunspell/', )
+PREFIX_END_CHAR = '\U0010FFFF' # Sorts after any character that we expect to find in a word
+CURRENT_BOOK_COUNT_FACTOR = 3 # Each word in the current book counts higher so appears higher in the list
 
+AUTOCOMPLETE_CACHE_SUBFOLDER_NAME = 'Cache/Autocomplete/'
+AUTOCOMPLETE_CACHE_FILENAME = 'BookWordCounts.pickle'
+AUTOCOMPLETE_CACHE_VERSION = 2 # Increment this if countUSFMWords changes how it counts (or what we save)
 
 
-def setAutocompleteWords( editWindowObject, wordList, append=False ):
+
+class AutocompleteIndex:
+    """
+    A frequency-ranked prefix index for the autocomplete words of an edit window.
+
+    The words are kept in a sorted list so that all the words starting with a given prefix
+        are contiguous and can be found with two binary searches.
+    So a lookup depends on the length of the prefix and the number of matching words,
+        not on the total number of words loaded (which can be large for whole Bibles or dictionaries).
+
+    Each word also has a rank (smaller is better) so that the more common/likely words
+        are returned first. If the words came from counting a Bible,
+        the usage counts are also kept so that the index can be updated as the text is edited.
+    """
+    def __init__( self ) -> None:
+        """
+        """
+        self.sortedWords:List[str] = []
+        self.wordRanks:Dict[str,int] = {}
+        self.wordCounts:Dict[str,int] = {} # Only used for counted (Bible) words
+        self.promotedWords = set() # Words brought to the top by the user -- their rank isn't count-based
+        self.minWordLength = 0
+        self.minMultiWordCount = 0 # Multi-word sequences must be more common than this to be included
+        self.nextRank = 0 # Rank for the next word added at the bottom of the list
+        self.topRank = 0 # Rank that the last word brought to the top of the list was given
+    # end of AutocompleteIndex.__init__
+
+    def __len__( self ) -> int: return len( self.sortedWords )
+    def __contains__( self, word:str ) -> bool: return word in self.wordRanks
+    def __iter__( self ): return iter( self.sortedWords )
+
+
+    def clear( self ) -> None:
+        """
+        Remove all words from the index.
+        """
+        self.sortedWords, self.wordRanks, self.wordCounts = [], {}, {}
+        self.promotedWords = set()
+        self.nextRank = self.topRank = 0
+    # end of AutocompleteIndex.clear
+
+
+    def _insertWord( self, word:str, rank:int ) -> None:
+        """
+        Add or rerank a word.
+        """
+        if word not in self.wordRanks: insort( self.sortedWords, word )
+        self.wordRanks[word] = rank
+        if rank < self.topRank: self.topRank = rank
+    # end of AutocompleteIndex._insertWord
+
+
+    def _removeWord( self, word:str ) -> None:
+        """
+        Remove a word from the index (but not its count).
+        """
+        del self.wordRanks[word]
+        wordIndex = bisect_left( self.sortedWords, word )
+        assert self.sortedWords[wordIndex] == word
+        del self.sortedWords[wordIndex]
+        self.promotedWords.discard( word )
+    # end of AutocompleteIndex._removeWord
+
+
+    def appendWord( self, word:str ) -> bool:
+        """
+        Add a new word with a lower rank than any word already in the index.
+
+        This is for adding single words (use appendWords for loading a list).
+
+        Returns True if the word was added, or False if it was already there
+            (in which case its rank is unchanged).
+        """
+        if word in self.wordRanks: return False
+        self._insertWord( word, self.nextRank )
+        self.nextRank += 1
+        return True
+    # end of AutocompleteIndex.appendWord
+
+
+    def appendWords( self, words ) -> List[str]:
+        """
+        Add the new words (in order) with lower ranks than any words already in the index,
+            sorting the word list only once at the end (rather than inserting each word).
+
+        Returns a list of the words which were added
+            (i.e., leaving out any which were already there).
+        """
+        addedWords = []
+        for word in words:
+            if word in self.wordRanks: continue
+            self.wordRanks[word] = self.nextRank
+            self.nextRank += 1
+            addedWords.append( word )
+        if addedWords:
+            self.sortedWords.extend( addedWords )
+            self.sortedWords.sort()
+        return addedWords
+    # end of AutocompleteIndex.appendWords
+
+
+    def setCountedWords( self, wordCounts:Dict[str,int], minWordLength:int, minMultiWordCount:int ) -> None:
+        """
+        Set the index from a dictionary of word (and word sequence) usage counts.
+
+        Words are ranked by their counts (most common first).
+        """
+        self.clear()
+        self.minWordLength, self.minMultiWordCount = minWordLength, minMultiWordCount
+        self.wordCounts = dict( wordCounts )
+        for word,count in self.wordCounts.items():
+            if self._qualifies( word, count ):
+                self.wordRanks[word] = -count
+        self.sortedWords = sorted( self.wordRanks )
+        self.topRank = min( self.wordRanks.values(), default=0 )
+    # end of AutocompleteIndex.setCountedWords
+
+
+    def _qualifies( self, word:str, count:int ) -> bool:
+        """
+        Returns True if a counted word should be offered for autocomplete.
+        """
+        return count > 0 and len(word) >= self.minWordLength \
+            and (' ' not in word or count > self.minMultiWordCount)
+    # end of AutocompleteIndex._qualifies
+
+
+    def adjustWordCounts( self, countDeltas:Dict[str,int] ) -> None:
+        """
+        Apply the count changes (from edited text) to the counted words,
+            adding, reranking, or removing words as necessary.
+
+        Words which were brought to the top by the user keep their place
+            unless they've completely disappeared from the text.
+        """
+        for word,delta in countDeltas.items():
+            if not delta: continue
+            newCount = self.wordCounts.get( word, 0 ) + delta
+            if newCount > 0: self.wordCounts[word] = newCount
+            else: self.wordCounts.pop( word, None )
+            if word in self.promotedWords:
+                if newCount <= 0 and delta < 0: self._removeWord( word )
+            elif self._qualifies( word, newCount ):
+                self._insertWord( word, -newCount )
+            elif word in self.wordRanks:
+                self._removeWord( word )
+    # end of AutocompleteIndex.adjustWordCounts
+
+
+    def promoteWord( self, word:str ) -> None:
+        """
+        Bring the word to the top of the ranking (adding it first if necessary)
+            so that it comes up first next time.
+        """
+        self._insertWord( word, self.topRank-1 )
+        self.promotedWords.add( word )
+    # end of AutocompleteIndex.promoteWord
+
+
+    def getPrefixRange( self, prefix:str ):
+        """
+        Returns a 2-tuple with the start and end indexes into self.sortedWords
+            of the words which start with the given prefix.
+        """
+        startIndex = bisect_left( self.sortedWords, prefix )
+        return startIndex, bisect_left( self.sortedWords, prefix+PREFIX_END_CHAR, startIndex )
+    # end of AutocompleteIndex.getPrefixRange
+
+
+    def getCompletions( self, prefix:str, maxCount:Optional[int]=None ) -> List[str]:
+        """
+        Returns a list of the words which start with (but aren't equal to) the given prefix,
+            with the best ranked words first.
+
+        If maxCount is given (e.g., the number of words that the pop-up box will display),
+            only that many of the best ranked words are found (without sorting them all).
+        """
+        startIndex, endIndex = self.getPrefixRange( prefix )
+        completions = (word for word in islice( self.sortedWords, startIndex, endIndex ) if word != prefix)
+        if maxCount is None: return sorted( completions, key=self.wordRanks.__getitem__ )
+        return heapq.nsmallest( maxCount, completions, key=self.wordRanks.__getitem__ )
+    # end of AutocompleteIndex.getCompletions
+# end of class AutocompleteIndex
+
+
+
+def setAutocompleteWords( editWindowObject, wordList=None, append=False, wordCounts=None, minMultiWordCount=0 ):
     """
     Given a word list, set the entries into the autocomplete words
         for an edit window and then do necessary house-keeping.
 
     Note that the original word order is preserved (if the supplied wordList has an order)
         so that more common/likely words can appear at the top of the list if desired.
+
+    If wordCounts is given (for words counted from a Bible), the words are ranked by those counts instead
+        and the counts are kept so that the list can be updated as the user edits the text.
+        (No wordList is needed in that case.)
     """
+    if wordList is None: wordList = []
     logging.info( "AutocompleteFunctions.setAutocompleteWords( …, {}, {} )".format( len(wordList), append ) )
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "AutocompleteFunctions.setAutocompleteWords( {} )".format( wordList, append ) )
@@ -84,59 +287,40 @@ def setAutocompleteWords( editWindowObject, wordList, append=False ):
         BiblelatorGlobals.theApp.setDebugText( "setAutocompleteWords…" )
 
     BiblelatorGlobals.theApp.setWaitStatus( _("Setting autocomplete words…") )
-    if not append: editWindowObject.autocompleteWords = {}
-
-    for word in wordList:
-        #if "'" not in word and '1' not in word:
-            #if '(' in word and ')' not in word: # perhaps something like we(excl
-                #word = word + ')' # append a matching/final parenthesis
-        if len(word) >= editWindowObject.autocompleteMinLength:
-            firstLetter, remainder = word[0], word[1:]
-            if firstLetter not in editWindowObject.autocompleteWords: editWindowObject.autocompleteWords[firstLetter] = []
-            if remainder in editWindowObject.autocompleteWords[firstLetter]:
-                if 0 and BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    setAutocompleteWords discarded {!r} duplicate".format( word ) )
-            else: # not already in the list
-                editWindowObject.autocompleteWords[firstLetter].append( remainder )
-                for char in word:
-                    if char not in editWindowObject.autocompleteWordChars:
-                        if BibleOrgSysGlobals.debugFlag: assert char not in '\n\r'
-                        if char not in ' .':
-                            editWindowObject.autocompleteWordChars += char
-                            if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
-                                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    setAutocompleteWords added {!r} as new wordChar".format( char ) )
-        #elif BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    setAutocompleteWords discarded {!r} as too short".format( word ) )
-        #elif BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
-            #if "'" not in word:
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    setAutocompleteWords discarded {!r} as unwanted".format( word ) )
+    if not append: editWindowObject.autocompleteWords = AutocompleteIndex()
+    autocompleteIndex = editWindowObject.autocompleteWords
+    if wordCounts is not None:
+        autocompleteIndex.setCountedWords( wordCounts, editWindowObject.autocompleteMinLength, minMultiWordCount )
+        for word in autocompleteIndex: addAutocompleteWordChars( editWindowObject, word )
+
+    # Append the words in one go (rather than inserting each one into the sorted list)
+    for word in autocompleteIndex.appendWords( word for word in wordList if len(word) >= editWindowObject.autocompleteMinLength ):
+        addAutocompleteWordChars( editWindowObject, word ) # it wasn't already in the index
 
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE: # write wordlist
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  setAutocompleteWords: Writing autocomplete words to file…" )
-        sortedKeys = sorted( editWindowObject.autocompleteWords.keys() )
         with open( 'autocompleteWordList.txt', 'wt', encoding='utf-8' ) as wordFile:
             wordCount = 0
-            for firstLetter in sortedKeys:
-                for remainder in sorted( editWindowObject.autocompleteWords[firstLetter] ):
-                    wordFile.write( firstLetter+remainder )
-                    wordCount += 1
-                    if wordCount == 8: wordFile.write( '\n' ); wordCount = 0
-                    else: wordFile.write( ' ' )
+            for word in autocompleteIndex:
+                wordFile.write( word )
+                wordCount += 1
+                if wordCount == 8: wordFile.write( '\n' ); wordCount = 0
+                else: wordFile.write( ' ' )
 
     if BibleOrgSysGlobals.debugFlag: # print detailed stats
-        sortedKeys = sorted( editWindowObject.autocompleteWords.keys() )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, "  autocomplete first letters", len(editWindowObject.autocompleteWords), sortedKeys )
-        grandtotal = 0
+        firstLetterTotals = defaultdict( int )
         wordNumTotals = defaultdict( int )
-        for firstLetter in sortedKeys:
-            total = len(editWindowObject.autocompleteWords[firstLetter])
-            for wordRemainder in editWindowObject.autocompleteWords[firstLetter]:
-                wordNumTotals[wordRemainder.count(' ')] += 1
+        for word in autocompleteIndex:
+            firstLetterTotals[word[0]] += 1
+            wordNumTotals[word.count(' ')] += 1
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "  autocomplete first letters", len(firstLetterTotals), sorted( firstLetterTotals ) )
+        for firstLetter in sorted( firstLetterTotals ):
+            total = firstLetterTotals[firstLetter]
+            startIndex, endIndex = autocompleteIndex.getPrefixRange( firstLetter )
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    {!r} {:,}{}" \
-                    .format( firstLetter, total, '' if total>19 else ' '+str(editWindowObject.autocompleteWords[firstLetter]) ) )
-            grandtotal += total
+                    .format( firstLetter, total, '' if total>19 else ' '+str(autocompleteIndex.sortedWords[startIndex:endIndex]) ) )
         #if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel > 1:
-        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  autocomplete total words loaded = {:,}".format( grandtotal ) )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  autocomplete total words loaded = {:,}".format( len(autocompleteIndex) ) )
         if DEBUGGING_THIS_MODULE:
             for spaceCount in wordNumTotals:
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    {} words: {}".format( spaceCount+1, wordNumTotals[spaceCount] ) )
@@ -145,36 +329,34 @@ def setAutocompleteWords( editWindowObject, wordList, append=False ):
 # end of AutocompleteFunctions.setAutocompleteWords
 
 
-
-internalMarkers = None
-
-def countBookWords( BBB, internalBible, filename, isCurrentBook, internalMarkers ):
+def addAutocompleteWordChars( editWindowObject, word ):
     """
-    Find all the words in the Bible book and their usage counts.
+    Make sure that all the characters in the word are recognised as word characters.
+    """
+    for char in word:
+        if char not in editWindowObject.autocompleteWordChars:
+            if BibleOrgSysGlobals.debugFlag: assert char not in '\n\r'
+            if char not in ' .':
+                editWindowObject.autocompleteWordChars += char
+                if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
+                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "    addAutocompleteWordChars added {!r} as new wordChar".format( char ) )
+# end of AutocompleteFunctions.addAutocompleteWordChars
 
-    Note that this function doesn't use the internalBible books
-        but rather loads the USFM (text) files directly.
 
-    Note also that the internalMarkersList has to be passed as a paramter,
-        because multi-processing on Windows can't access global variables.
 
-    Returns a dictionary containing the results for the book.
+internalMarkers = None
+
+def countUSFMWords( USFMLines, internalMarkers, countIncrement=1, wordCounts=None, sourceName='USFM text' ):
     """
-    logging.debug( "countBookWords( {}, {}, {} )".format( BBB, internalBible, filename ) )
-    if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
-        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "countBookWords( {}, {}, {} )".format( BBB, internalBible, filename ) )
-    if BBB in AVOID_BOOKS:
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Didn't load autocomplete words from {} {}".format( internalBible.getAName(), BBB ) )
-        return # Sometimes these books contain words from other languages, etc.
+    Find all the words (and short word sequences) in the printable text of the USFM lines
+        and add their usage counts into the wordCounts dictionary.
 
-    countIncrement = 3 if isCurrentBook else 1 # Each word in current book counts higher so appears higher in the list
-    # NOTE: This idea fails as soon as they change books in the edit window
-    #       as the word lists are only loaded once at startup. (A reasonable compromise I think.)
+    This is used for whole book files, and also for the changed parts of the text in an edit window.
 
-    encoding = None
-    if encoding is None: encoding = 'utf-8'
-    lastLine, lineCount, lineDuples, lastMarker = '', 0, [], None
-    wordCounts = defaultdict( int )
+    Returns the wordCounts dictionary.
+    """
+    if wordCounts is None: wordCounts = defaultdict( int )
+    lastLine, lineCount, lastMarker = '', 0, None
 
     def countWords( textLine ):
         """
@@ -226,82 +408,109 @@ def countBookWords( BBB, internalBible, filename, isCurrentBook, internalMarkers
                                 wordCounts[adjustedQuinWord] += countIncrement
     # end of countWords
 
-    # main code for countBookWords
-    USFMFilepath = os.path.join( internalBible.sourceFolder, filename )
-    with open( USFMFilepath, 'rt', encoding=internalBible.encoding ) as bookFile:
-        try:
-            for line in bookFile:
-                lineCount += 1
-                if lineCount==1 and encoding.lower()=='utf-8' and line[0]==BibleOrgSysGlobals.BOM:
-                    logging.info( "countBookWords: Detected Unicode Byte Order Marker (BOM) in {}".format( USFMFilepath ) )
-                    line = line[1:] # Remove the Unicode Byte Order Marker (BOM)
-                if line and line[-1]=='\n': line=line[:-1] # Removing trailing newline character
-                if not line: continue # Just discard blank lines
-                lastLine = line
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'USFM file line is {!r}'.format( line ) )
-                #if line[0:2]=='\\_': continue # Just discard Toolbox header lines
-                if line[0]=='#': continue # Just discard comment lines
-
-                if line[0]!='\\': # Not a SFM line
-                    if lastMarker is None: # We don't have any SFM data lines yet
-                        logging.error( "countBookWords: Non-USFM line in {} -- line ignored at #{}".format( USFMFilepath, lineCount) )
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "SFMFile.py: XXZXResult is", lineDuples, len(line) )
-                        #for x in range(0, min(6,len(line))):
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, x, "'" + str(ord(line[x])) + "'" )
-                        #raise IOError('Oops: Line break on last line ??? not handled here "' + line + '"')
-                    else: # Append this continuation line
-                        if lastMarker in USFM_PRINTABLE_MARKERS:
-                            #oldmarker, oldtext = lineDuples.pop()
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Popped",oldmarker,oldtext)
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Adding", line, "to", oldmarker, oldtext)
-                            #lineDuples.append( (oldmarker, oldtext+' '+line) )
-                            countWords( line )
-                        continue
-
-                lineAfterBackslash = line[1:]
-                si1 = lineAfterBackslash.find( ' ' )
-                si2 = lineAfterBackslash.find( '*' )
-                si3 = lineAfterBackslash.find( '\\' )
-                if si1==-1: si1 = LARGE_DUMMY_VALUE
-                if si2==-1: si2 = LARGE_DUMMY_VALUE
-                if si3==-1: si3 = LARGE_DUMMY_VALUE
-                si = min( si1, si2, si3 )
-
-                if si != LARGE_DUMMY_VALUE:
-                    if si == si3: # Marker stops before a backslash
-                        marker = lineAfterBackslash[:si3]
-                        text = lineAfterBackslash[si3:]
-                    elif si == si2: # Marker stops at an asterisk
-                        marker = lineAfterBackslash[:si2+1]
-                        text = lineAfterBackslash[si2+1:]
-                    elif si == si1: # Marker stops before a space
-                        marker = lineAfterBackslash[:si1]
-                        text = lineAfterBackslash[si1+1:] # We drop the space completely
-                else: # The line is only the marker
-                    marker = lineAfterBackslash
-                    text = ''
-
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, " ", repr(marker), repr(text) )
-                #if marker not in ignoreSFMs:
-                if marker in USFM_PRINTABLE_MARKERS and text:
-                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "   1", marker, text )
-                    if marker == 'v' and text[0].isdigit():
-                        try: text = text.split( None, 1 )[1]
-                        except IndexError: text = ''
-                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "   2", marker, text )
-                    countWords( text )
-                    #if not lineDuples: # Just for detection of start of real USFM
-                        #lineDuples.append( (marker, text) )
-                lastMarker = marker
-
-        except UnicodeError as err:
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Unicode error:", sys.exc_info()[0], err )
-            logging.critical( "countBookWords: Invalid line in {} -- line ignored at #{}".format( USFMFilepath, lineCount) )
-            if lineCount > 1: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Previous line was: ', lastLine )
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, line )
-            #raise
+    # main code for countUSFMWords
+    try:
+        for line in USFMLines:
+            lineCount += 1
+            if lineCount==1 and line and line[0]==BibleOrgSysGlobals.BOM:
+                logging.info( "countUSFMWords: Detected Unicode Byte Order Marker (BOM) in {}".format( sourceName ) )
+                line = line[1:] # Remove the Unicode Byte Order Marker (BOM)
+            if line and line[-1]=='\n': line=line[:-1] # Removing trailing newline character
+            if not line: continue # Just discard blank lines
+            lastLine = line
+            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'USFM file line is {!r}'.format( line ) )
+            #if line[0:2]=='\\_': continue # Just discard Toolbox header lines
+            if line[0]=='#': continue # Just discard comment lines
+
+            if line[0]!='\\': # Not a SFM line
+                if lastMarker is None: # We don't have any SFM data lines yet
+                    logging.error( "countUSFMWords: Non-USFM line in {} -- line ignored at #{}".format( sourceName, lineCount) )
+                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "SFMFile.py: XXZXResult is", lineDuples, len(line) )
+                    #for x in range(0, min(6,len(line))):
+                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, x, "'" + str(ord(line[x])) + "'" )
+                    #raise IOError('Oops: Line break on last line ??? not handled here "' + line + '"')
+                else: # Append this continuation line
+                    if lastMarker in USFM_PRINTABLE_MARKERS:
+                        #oldmarker, oldtext = lineDuples.pop()
+                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Popped",oldmarker,oldtext)
+                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Adding", line, "to", oldmarker, oldtext)
+                        #lineDuples.append( (oldmarker, oldtext+' '+line) )
+                        countWords( line )
+                    continue
+
+            lineAfterBackslash = line[1:]
+            si1 = lineAfterBackslash.find( ' ' )
+            si2 = lineAfterBackslash.find( '*' )
+            si3 = lineAfterBackslash.find( '\\' )
+            if si1==-1: si1 = LARGE_DUMMY_VALUE
+            if si2==-1: si2 = LARGE_DUMMY_VALUE
+            if si3==-1: si3 = LARGE_DUMMY_VALUE
+            si = min( si1, si2, si3 )
+
+            if si != LARGE_DUMMY_VALUE:
+                if si == si3: # Marker stops before a backslash
+                    marker = lineAfterBackslash[:si3]
+                    text = lineAfterBackslash[si3:]
+                elif si == si2: # Marker stops at an asterisk
+                    marker = lineAfterBackslash[:si2+1]
+                    text = lineAfterBackslash[si2+1:]
+                elif si == si1: # Marker stops before a space
+                    marker = lineAfterBackslash[:si1]
+                    text = lineAfterBackslash[si1+1:] # We drop the space completely
+            else: # The line is only the marker
+                marker = lineAfterBackslash
+                text = ''
+
+            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, " ", repr(marker), repr(text) )
+            #if marker not in ignoreSFMs:
+            if marker in USFM_PRINTABLE_MARKERS and text:
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "   1", marker, text )
+                if marker == 'v' and text[0].isdigit():
+                    try: text = text.split( None, 1 )[1]
+                    except IndexError: text = ''
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "   2", marker, text )
+                countWords( text )
+                #if not lineDuples: # Just for detection of start of real USFM
+                    #lineDuples.append( (marker, text) )
+            lastMarker = marker
+
+    except UnicodeError as err:
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Unicode error:", sys.exc_info()[0], err )
+        logging.critical( "countUSFMWords: Invalid line in {} -- line ignored at #{}".format( sourceName, lineCount) )
+        if lineCount > 1: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Previous line was: ', lastLine )
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, line )
+        #raise
 
     return wordCounts
+# end of AutocompleteFunctions.countUSFMWords
+
+
+def countBookWords( BBB, internalBible, filename, isCurrentBook, internalMarkers ):
+    """
+    Find all the words in the Bible book and their usage counts.
+
+    Note that this function doesn't use the internalBible books
+        but rather loads the USFM (text) files directly.
+
+    Note also that the internalMarkersList has to be passed as a paramter,
+        because multi-processing on Windows can't access global variables.
+
+    Returns a dictionary containing the results for the book.
+    """
+    logging.debug( "countBookWords( {}, {}, {} )".format( BBB, internalBible, filename ) )
+    if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "countBookWords( {}, {}, {} )".format( BBB, internalBible, filename ) )
+    if BBB in AVOID_BOOKS:
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Didn't load autocomplete words from {} {}".format( internalBible.getAName(), BBB ) )
+        return # Sometimes these books contain words from other languages, etc.
+
+    countIncrement = CURRENT_BOOK_COUNT_FACTOR if isCurrentBook else 1 # Each word in current book counts higher so appears higher in the list
+    # NOTE: This idea fails as soon as they change books in the edit window
+    #       as the word lists are only loaded once at startup. (A reasonable compromise I think.)
+
+    USFMFilepath = os.path.join( internalBible.sourceFolder, filename )
+    with open( USFMFilepath, 'rt', encoding=internalBible.encoding ) as bookFile:
+        return countUSFMWords( bookFile, internalMarkers, countIncrement, sourceName=USFMFilepath )
 # end of AutocompleteFunctions.countBookWords
 
 
@@ -315,6 +524,146 @@ def countBookWordsHelper( parameters ):
 # end of AutocompleteFunctions.countBookWordsHelper
 
 
+def getInternalMarkers() -> List[str]:
+    """
+    Returns the list of internal (note and character) markers (with backslashes)
+        that countUSFMWords removes from the text.
+
+    Note that the more common note markers are first.
+    """
+    global internalMarkers
+    if internalMarkers is None: # Get our list of markers
+        internalMarkers = BibleOrgSysGlobals.loadedUSFMMarkers.getNoteMarkersList() \
+            + BibleOrgSysGlobals.loadedUSFMMarkers.getCharacterMarkersList( includeBackslash=False, includeEndMarkers=False, includeNestedMarkers=True, expandNumberableMarkers=True )
+        internalMarkers = ['\\'+marker for marker in internalMarkers]
+    return internalMarkers
+# end of AutocompleteFunctions.getInternalMarkers
+
+
+def getAutocompleteCacheFilepath( internalBible ) -> str:
+    """
+    Returns the filepath of the word-count cache file for the given Bible project.
+    """
+    return os.path.join( internalBible.sourceFolder, DATA_SUBFOLDER_NAME, AUTOCOMPLETE_CACHE_SUBFOLDER_NAME, AUTOCOMPLETE_CACHE_FILENAME )
+# end of AutocompleteFunctions.getAutocompleteCacheFilepath
+
+
+def loadAutocompleteCache( cacheFilepath:str ) -> Dict[str,tuple]:
+    """
+    Load the word-count cache for a project
+        which is a dictionary with book filenames as keys
+        and 2-tuples (cacheKey, wordCounts) as entries
+        (see getBookCacheKey).
+
+    Returns an empty dictionary if there's no (usable) cache file.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadAutocompleteCache( {cacheFilepath} )" )
+    try:
+        with open( cacheFilepath, 'rb' ) as cacheFile:
+            cacheVersion, bookCache = pickle.load( cacheFile )
+    except FileNotFoundError: return {}
+    except Exception as err: # Could be a truncated or out-of-date pickle file
+        logging.warning( f"loadAutocompleteCache: Ignoring unreadable cache file {cacheFilepath}: {err}" )
+        return {}
+    if cacheVersion != AUTOCOMPLETE_CACHE_VERSION: return {}
+    return bookCache
+# end of AutocompleteFunctions.loadAutocompleteCache
+
+
+def saveAutocompleteCache( cacheFilepath:str, bookCache:Dict[str,tuple] ) -> None:
+    """
+    Save the word-count cache for a project.
+
+    The file is written under a temporary name and then renamed
+        so that we never leave a partly-written cache file behind.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveAutocompleteCache( {cacheFilepath}, {len(bookCache)} )" )
+    try:
+        os.makedirs( os.path.dirname( cacheFilepath ), exist_ok=True )
+        tempFilepath = cacheFilepath + '.tmp'
+        with open( tempFilepath, 'wb' ) as cacheFile:
+            pickle.dump( (AUTOCOMPLETE_CACHE_VERSION,bookCache), cacheFile, pickle.HIGHEST_PROTOCOL )
+        os.replace( tempFilepath, cacheFilepath )
+    except OSError as err: # e.g., read-only project folder -- we can still continue without the cache
+        logging.warning( f"saveAutocompleteCache: Unable to save cache file {cacheFilepath}: {err}" )
+# end of AutocompleteFunctions.saveAutocompleteCache
+
+
+def getBookCacheKey( USFMFilepath:str ) -> Optional[tuple]:
+    """
+    Returns the key that a cached word-count entry for the book file must match,
+        i.e., the cache format version, the BibleOrgSys version (for the USFM markers),
+        and the file size and modification time.
+
+    Returns None if the file can't be accessed.
+    """
+    try: fileStat = os.stat( USFMFilepath )
+    except OSError: return None # countBookWords will report the problem
+    return AUTOCOMPLETE_CACHE_VERSION, BibleOrgSysGlobals.PROGRAM_VERSION, fileStat.st_size, fileStat.st_mtime_ns
+# end of AutocompleteFunctions.getBookCacheKey
+
+
+def getBibleBookWordCounts( internalBible, bookFilenameTuples ) -> Dict[str,Optional[Dict[str,int]]]:
+    """
+    Get the (unweighted) word counts for each of the given (BBB,filename) books.
+
+    The counts are kept in a per-project cache file keyed by the book filename,
+        and each entry is only used if its cache key still matches (see getBookCacheKey).
+    So only new or changed books have to be recounted (using multiprocessing if allowed).
+    Entries for books which no longer exist (or are out-of-date) are dropped when the cache is saved.
+
+    Returns a dictionary with BBB keys and word-count dictionaries (or None for avoided books).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getBibleBookWordCounts( {internalBible}, {len(bookFilenameTuples)} )" )
+    ourInternalMarkers = getInternalMarkers()
+
+    cacheFilepath = getAutocompleteCacheFilepath( internalBible )
+    bookCache = loadAutocompleteCache( cacheFilepath )
+    bookWordCounts, booksToCount, cacheKeys = {}, [], {}
+    for BBB,filename in bookFilenameTuples:
+        cacheKeys[BBB] = getBookCacheKey( os.path.join( internalBible.sourceFolder, filename ) )
+        try:
+            cachedKey, cachedCounts = bookCache[filename]
+            if cacheKeys[BBB] is not None and cachedKey == cacheKeys[BBB]:
+                bookWordCounts[BBB] = cachedCounts
+                continue
+        except (KeyError, ValueError): pass
+        booksToCount.append( (BBB,filename) )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, "Autocomplete: using cached word counts for {} books and counting {} books…".format( len(bookWordCounts), len(booksToCount) ) )
+
+    if booksToCount:
+        if BibleOrgSysGlobals.maxProcesses > 1 and len(booksToCount) > 1: # Load all the books as quickly as possible
+            parameters = [(BBB,internalBible,filename,False,ourInternalMarkers) for BBB,filename in booksToCount] # Can only pass a single parameter to map
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "Autocomplete: loading up to {} USFM books using {} processes…".format( len(booksToCount), BibleOrgSysGlobals.maxProcesses ) )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error & warning messages) from loading words from BibleOrgSys.Bible books may be interspersed." )
+            BibleOrgSysGlobals.alreadyMultiprocessing = True
+            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
+                results = pool.map( countBookWordsHelper, parameters ) # have the pool do our loads
+                assert len(results) == len(booksToCount)
+                for (BBB,filename),counts in zip( booksToCount, results ):
+                    bookWordCounts[BBB] = counts
+            BibleOrgSysGlobals.alreadyMultiprocessing = False
+        else: # Just single threaded
+            for BBB,filename in booksToCount:
+                bookWordCounts[BBB] = countBookWords( BBB, internalBible, filename, False, ourInternalMarkers )
+
+        # Update, prune, and save the cache
+        for BBB,filename in booksToCount:
+            if cacheKeys[BBB] is not None:
+                counts = bookWordCounts[BBB]
+                bookCache[filename] = cacheKeys[BBB], None if counts is None else dict( counts )
+        for filename in list( bookCache ):
+            try: cachedKey = bookCache[filename][0]
+            except (TypeError, IndexError): cachedKey = None
+            if not isinstance( cachedKey, tuple ) or cachedKey[:2] != (AUTOCOMPLETE_CACHE_VERSION,BibleOrgSysGlobals.PROGRAM_VERSION) \
+            or not os.path.exists( os.path.join( internalBible.sourceFolder, filename ) ):
+                del bookCache[filename]
+        saveAutocompleteCache( cacheFilepath, bookCache )
+
+    return bookWordCounts
+# end of AutocompleteFunctions.getBibleBookWordCounts
+
+
 def loadBibleBookAutocompleteWords( editWindowObject ):
     """
     Load all the existing words in a USFM or Paratext Bible book
@@ -322,7 +671,8 @@ def loadBibleBookAutocompleteWords( editWindowObject ):
 
     editWindowObject here is a USFM or ESFM edit window.
 
-    NOTE: This list should theoretically be updated as the user enters new words!
+    The word counts are kept so that the list can be updated as the user edits the text
+        (see updateAutocompleteWordsFromVerses).
     """
     logging.info( "loadBibleBookAutocompleteWords()" )
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
@@ -339,31 +689,13 @@ def loadBibleBookAutocompleteWords( editWindowObject ):
     for BBB2,filename in editWindowObject.internalBible.maximumPossibleFilenameTuples:
         if BBB2 == currentBBB: foundFilename = filename; break
 
-    wordCountResults = countBookWords( currentBBB, editWindowObject.internalBible, foundFilename, False )
+    wordCountResults = getBibleBookWordCounts( editWindowObject.internalBible, [(currentBBB,foundFilename)] )[currentBBB]
+    if wordCountResults is None: wordCountResults = {} # e.g., an avoided book
     #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'wordCountResults', len(wordCountResults) )
 
-    # Would be nice to load current book first, but we don't know it yet
-    autocompleteWords = []
-    #if BibleOrgSysGlobals.debugFlag:
-        #autocompleteWords = [ 'Lord God', 'Lord your(pl) God', '(is)', '(are)', '(were)', '(one who)', ]
-    try:
-        # Sort the word-list for the book to put the most common words first
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'wordCountResults', currentBBB, discoveryResults )
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, currentBBB, 'mTWC', discoveryResults['mainTextWordCounts'] )
-        #qqq = sorted( discoveryResults['mainTextWordCounts'].items(), key=lambda c: -c[1] )
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'qqq', qqq )
-        for word,count in sorted( wordCountResults.items(),
-                                key=lambda duple: -duple[1] ):
-            if len(word) >= editWindowObject.autocompleteMinLength \
-            and word not in autocompleteWords: # just in case we had some (common) words in there already
-                if ' ' not in word or count > 4:
-                    autocompleteWords.append( word )
-                #else: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'loadBibleBookAutocompleteWords discarding', repr(word) )
-    except KeyError:
-        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Why did {} have no words???".format( currentBBB ) )
-        #pass # Nothing for this book
-    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'autocompleteWords', len(autocompleteWords) )
-    setAutocompleteWords( editWindowObject, autocompleteWords )
+    # The index ranks the words by their counts (most common first)
+    setAutocompleteWords( editWindowObject, wordCounts=wordCountResults, minMultiWordCount=4 )
+    editWindowObject.autocompleteCountFactors = currentBBB, 1, 0 # Edits in other books don't affect our words
     editWindowObject.addAllNewWords = True
 # end of AutocompleteFunctions.loadBibleBookAutocompleteWords
 
@@ -378,19 +710,14 @@ def loadBibleAutocompleteWords( editWindowObject ):
 
     editWindowObject here is a USFM or ESFM edit window.
 
-    NOTE: This list should theoretically be updated as the user enters new words!
+    The word counts are kept so that the list can be updated as the user edits the text
+        (see updateAutocompleteWordsFromVerses).
     """
     startTime = time.time()
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "AutocompleteFunctions.loadBibleAutocompleteWords()" )
         BiblelatorGlobals.theApp.setDebugText( "loadBibleAutocompleteWords…" )
 
-    global internalMarkers
-    if internalMarkers is None: # Get our list of markers -- note that the more common note markers are first
-        internalMarkers = BibleOrgSysGlobals.loadedUSFMMarkers.getNoteMarkersList() \
-            + BibleOrgSysGlobals.loadedUSFMMarkers.getCharacterMarkersList( includeBackslash=False, includeEndMarkers=False, includeNestedMarkers=True, expandNumberableMarkers=True )
-        internalMarkers = ['\\'+marker for marker in internalMarkers]
-
     BiblelatorGlobals.theApp.setWaitStatus( _("Loading {} Bible words…").format( editWindowObject.projectName ) )
     currentBBB = editWindowObject.currentVerseKey.getBBB()
     vPrint( 'Never', DEBUGGING_THIS_MODULE, "  got current BBB", repr(currentBBB) )
@@ -398,24 +725,8 @@ def loadBibleAutocompleteWords( editWindowObject ):
     if not editWindowObject.internalBible.preloadDone: editWindowObject.internalBible.preload()
     bookWordCounts = {}
     if editWindowObject.internalBible.maximumPossibleFilenameTuples:
-        if BibleOrgSysGlobals.maxProcesses > 1: # Load all the books as quickly as possible
-            parameters = [(BBB,editWindowObject.internalBible,filename,BBB==currentBBB,internalMarkers) for BBB,filename in editWindowObject.internalBible.maximumPossibleFilenameTuples] # Can only pass a single parameter to map
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "Autocomplete: loading up to {} USFM books using {} processes…".format( len(editWindowObject.internalBible.maximumPossibleFilenameTuples), BibleOrgSysGlobals.maxProcesses ) )
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error & warning messages) from loading words from BibleOrgSys.Bible books may be interspersed." )
-            BibleOrgSysGlobals.alreadyMultiprocessing = True
-            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                results = pool.map( countBookWordsHelper, parameters ) # have the pool do our loads
-                assert len(results) == len(editWindowObject.internalBible.maximumPossibleFilenameTuples)
-                for (BBB,filename),counts in zip( editWindowObject.internalBible.maximumPossibleFilenameTuples, results ):
-                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "XX", BBB, filename, len(counts) if counts else counts )
-                    bookWordCounts[BBB] = counts
-                BibleOrgSysGlobals.alreadyMultiprocessing = False
-        else: # Just single threaded
-            # Load the books one by one -- assuming that they have regular Paratext style filenames
-            for BBB,filename in editWindowObject.internalBible.maximumPossibleFilenameTuples:
-                #if BibleOrgSysGlobals.verbosityLevel>1 or BibleOrgSysGlobals.debugFlag:
-                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("  USFMBible: Loading {} from {} from {}…").format( BBB, editWindowObject.internalBible.getAName(), editWindowObject.internalBible.sourceFolder ) )
-                bookWordCounts[BBB] = countBookWords( BBB, editWindowObject.internalBible, filename, BBB==currentBBB ) # also saves it
+        # Only books which have changed since last time actually get loaded and counted
+        bookWordCounts = getBibleBookWordCounts( editWindowObject.internalBible, editWindowObject.internalBible.maximumPossibleFilenameTuples )
     else:
         logging.critical( "Autocomplete: " + _("No books to load in folder '{}'!").format( editWindowObject.internalBible.sourceFolder ) )
 
@@ -424,33 +735,52 @@ def loadBibleAutocompleteWords( editWindowObject ):
     for BBB,counts in bookWordCounts.items(): # combine word counts for all books
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "here", BBB, len(counts) )
         if counts:
+            countFactor = CURRENT_BOOK_COUNT_FACTOR if BBB==currentBBB else 1
             for word, count in counts.items():
                 #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  ", word, count )
+                count *= countFactor
                 if len(word) >= editWindowObject.autocompleteMinLength:
                     if word in autocompleteCounts: autocompleteCounts[word] += count
                     else: autocompleteCounts[word] = count
     #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "there", len(autocompleteCounts) )
 
-    # Now make our list sorted with most common words first
-    autocompleteWords = []
-    #if BibleOrgSysGlobals.debugFlag: # add some multi-word entries just for testing
-        #autocompleteWords = [ 'Lord God', 'Lord your(pl) God', '(is)', '(are)', '(were)', '(one who)', ]
-    for word,count in sorted( autocompleteCounts.items(), key=lambda duple: -duple[1] ):
-        if ' ' not in word or count > 9:
-            autocompleteWords.append( word )
-        #else:
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'loadBibleAutocompleteWords discarding', repr(word) )
-            #if ' ' not in word: halt
-    #dPrint( 'Never', DEBUGGING_THIS_MODULE, 'acW', autocompleteWords )
-
-    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'autocompleteWords', len(autocompleteWords) )
-    setAutocompleteWords( editWindowObject, autocompleteWords )
+    # The index ranks the words by their counts (most common first)
+    setAutocompleteWords( editWindowObject, wordCounts=autocompleteCounts, minMultiWordCount=9 )
+    editWindowObject.autocompleteCountFactors = currentBBB, CURRENT_BOOK_COUNT_FACTOR, 1
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "loadBibleAutocompleteWords took", time.time()-startTime )
     editWindowObject.addAllNewWords = True
 # end of AutocompleteFunctions.loadBibleAutocompleteWords
 
 
+def updateAutocompleteWordsFromVerses( editWindowObject, BBB:str, changedVerses:List[Tuple[str,str]] ) -> None:
+    """
+    Update the counted (Bible) autocomplete words after the user has edited some verses of the book.
+
+    changedVerses is a list of (oldVerseText,newVerseText) 2-tuples for only the verses that changed
+        (see USFMEditWindow.updateAutocompleteWords) so the rest of the book isn't recounted.
+    The word counts are adjusted (so new words can be added and deleted words dropped).
+    """
+    countFactors = getattr( editWindowObject, 'autocompleteCountFactors', None )
+    if not changedVerses or countFactors is None or not editWindowObject.autocompleteWords.wordCounts:
+        return # Nothing changed, or the words didn't come from a Bible
+    weightedBBB, weightedFactor, otherFactor = countFactors
+    countFactor = weightedFactor if BBB==weightedBBB else otherFactor
+    if not countFactor or BBB in AVOID_BOOKS: return
+
+    ourInternalMarkers = getInternalMarkers()
+    countDeltas = defaultdict( int )
+    for oldVerseText, newVerseText in changedVerses:
+        countUSFMWords( oldVerseText.split( '\n' ), ourInternalMarkers, -countFactor, countDeltas, sourceName=BBB )
+        countUSFMWords( newVerseText.split( '\n' ), ourInternalMarkers, countFactor, countDeltas, sourceName=BBB )
+    dPrint( 'Never', DEBUGGING_THIS_MODULE, f"updateAutocompleteWordsFromVerses adjusting {len(countDeltas)} word counts for {len(changedVerses)} {BBB} verses" )
+    editWindowObject.autocompleteWords.adjustWordCounts( countDeltas )
+    for word,delta in countDeltas.items():
+        if delta > 0 and word in editWindowObject.autocompleteWords:
+            addAutocompleteWordChars( editWindowObject, word )
+# end of AutocompleteFunctions.updateAutocompleteWordsFromVerses
+
+
 
 def loadHunspellAutocompleteWords( editWindowObject, dictionaryFilepath, encoding='utf-8' ):
     """
@@ -870,13 +1200,8 @@ def addNewAutocompleteWord( self, possibleNewWord ):
 
     if len( possibleNewWord ) > self.autocompleteMinLength:
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Adding new autocomplete word: {!r}".format( possibleNewWord ) )
-        # Put this word at the beginning of the list so it comes up on top next time
-        firstLetter, remainder = possibleNewWord[0], possibleNewWord[1:]
-        try: self.autocompleteWords[firstLetter].remove( remainder )
-        except ValueError: pass # remove will fail if this really is a new word
-        except KeyError: # There's no list existing for this letter
-            self.autocompleteWords[firstLetter] = []
-        self.autocompleteWords[firstLetter].insert( 0, remainder )
+        # Put this word at the top of the list so it comes up first next time
+        self.autocompleteWords.promoteWord( possibleNewWord )
 # end of AutocompleteFunctions.addNewAutocompleteWord
 
 
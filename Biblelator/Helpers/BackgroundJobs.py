@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BackgroundJobs.py
+#
+# Run slow jobs (like exports and checks) in the background
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+An application-wide scheduler (owned by the Application as theApp.jobScheduler)
+    which runs slow jobs (like Bible exports and checks) on a small pool of worker threads
+    so that the user can keep editing and navigating while they run.
+
+The jobs work on Python objects (like Bibles) that are set up in this process,
+    so they're run in threads (rather than in other processes).
+But the Bible objects aren't thread-safe, so a job shouldn't use one that the GUI is also using
+    (e.g., see ParallelBibleSearch.loadPrivateBible).
+The job functions must NOT touch any Tk widgets:
+    the onDone and onError functions are called later (from the Tk main loop)
+    to display the results.
+
+Each job function is called with the BackgroundJob as its first parameter
+    so that it can report its progress (with setProgress)
+    and see if the user has cancelled it (with isCancelled).
+A job that hasn't started yet can always be cancelled,
+    but a running job can only stop at a point where it checks isCancelled.
+
+    class JobCancelledError( Exception )
+
+    class BackgroundJob
+        __init__( self, jobName, jobFunction, jobArgs, onDone=None, onError=None )
+        setProgress( self, progressText )
+        isCancelled( self )
+        checkCancelled( self )
+        _run( self )
+        getElapsedSeconds( self )
+
+    class BackgroundJobScheduler
+        __init__( self, tkWidget, maxWorkers=DEFAULT_JOB_WORKERS )
+        submit( self, jobName, jobFunction, *jobArgs, onDone=None, onError=None )
+        cancelJob( self, job )
+        getActiveJobs( self )
+        clearFinishedJobs( self )
+        addWatcher( self, watcherFunction )
+        removeWatcher( self, watcherFunction )
+        _schedulePoll( self )
+        _poll( self )
+        shutdown( self )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Callable, List, Optional
+import os
+import sys
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "BackgroundJobs"
+PROGRAM_NAME = "Biblelator Background Jobs"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+DEFAULT_JOB_WORKERS = 2 # Number of jobs that can run at the same time
+JOB_POLL_INTERVAL = 200 # milliseconds -- how often we check on the running jobs
+
+JOB_WAITING, JOB_RUNNING, JOB_FINISHED, JOB_FAILED, JOB_CANCELLED = 'Waiting', 'Running', 'Finished', 'Failed', 'Cancelled'
+JOB_ACTIVE_STATUSES = ( JOB_WAITING, JOB_RUNNING )
+
+
+
+class JobCancelledError( Exception ):
+    """
+    Raised (by checkCancelled) inside a job function when the user has cancelled the job.
+    """
+    pass
+# end of class JobCancelledError
+
+
+
+class BackgroundJob:
+    """
+    One job for the BackgroundJobScheduler.
+    """
+    def __init__( self, jobName:str, jobFunction:Callable, jobArgs:tuple, onDone:Optional[Callable]=None, onError:Optional[Callable]=None ) -> None:
+        """
+        onDone (if given) is called with this job when the job function has finished (with the result in job.result),
+            and onError (if given) is called with this job if it raised an exception (in job.error).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundJob.__init__( {jobName}, {jobFunction}, {jobArgs}, {onDone}, {onError} )" )
+        self.jobName, self.jobFunction, self.jobArgs, self.onDone, self.onError = jobName, jobFunction, jobArgs, onDone, onError
+        self.status, self.progressText = JOB_WAITING, ''
+        self.result = self.error = None
+        self.cancelEvent = threading.Event()
+        self.future = None
+        self.submitTime, self.startTime, self.endTime = time.monotonic(), None, None
+    # end of BackgroundJob.__init__
+
+    def __repr__( self ) -> str:
+        return f"BackgroundJob({self.jobName!r} {self.status} {self.progressText!r})"
+    # end of BackgroundJob.__repr__
+
+
+    def setProgress( self, progressText:str ) -> None:
+        """
+        Can be called by the job function to say how it's getting on.
+        """
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  {self.jobName}: {progressText}" )
+        self.progressText = progressText
+    # end of BackgroundJob.setProgress
+
+    def isCancelled( self ) -> bool:
+        """
+        Returns True if the user has asked for the job to be cancelled.
+        """
+        return self.cancelEvent.is_set()
+    # end of BackgroundJob.isCancelled
+
+    def checkCancelled( self ) -> None:
+        """
+        Can be called by the job function between steps
+            so that the job stops if the user has cancelled it.
+        """
+        if self.cancelEvent.is_set(): raise JobCancelledError( self.jobName )
+    # end of BackgroundJob.checkCancelled
+
+
+    def _run( self ):
+        """
+        Runs in a worker thread.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundJob._run() for {self.jobName}" )
+        self.checkCancelled()
+        self.status, self.startTime = JOB_RUNNING, time.monotonic()
+        try: return self.jobFunction( self, *self.jobArgs )
+        finally: self.endTime = time.monotonic()
+    # end of BackgroundJob._run
+
+
+    def getElapsedSeconds( self ) -> float:
+        """
+        Returns how long the job has been running (or ran for).
+        """
+        if self.startTime is None: return 0.0
+        return (self.endTime or time.monotonic()) - self.startTime
+    # end of BackgroundJob.getElapsedSeconds
+# end of class BackgroundJob
+
+
+
+class BackgroundJobScheduler:
+    """
+    Runs BackgroundJobs on a pool of worker threads,
+        and polls them (from the Tk main loop) to call the onDone and onError functions.
+    """
+    def __init__( self, tkWidget, maxWorkers:int=DEFAULT_JOB_WORKERS ) -> None:
+        """
+        The tkWidget is used to schedule the polling (with after).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundJobScheduler.__init__( {tkWidget}, {maxWorkers} )" )
+        self.tkWidget, self.maxWorkers = tkWidget, maxWorkers
+        self.executor = None # Only started when the first job is submitted
+        self.jobs:List[BackgroundJob] = [] # Oldest first
+        self.watcherFunctions:List[Callable] = [] # Called after each poll, e.g., to update a job status window
+        self.afterID = None
+    # end of BackgroundJobScheduler.__init__
+
+
+    def submit( self, jobName:str, jobFunction:Callable, *jobArgs, onDone:Optional[Callable]=None, onError:Optional[Callable]=None ) -> BackgroundJob:
+        """
+        Add a job to be run as soon as a worker thread is free.
+
+        Returns the new BackgroundJob.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundJobScheduler.submit( {jobName}, {jobFunction}, {jobArgs}, {onDone}, {onError} )" )
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor( max_workers=self.maxWorkers, thread_name_prefix='BiblelatorJob' )
+        job = BackgroundJob( jobName, jobFunction, jobArgs, onDone, onError )
+        job.future = self.executor.submit( job._run )
+        self.jobs.append( job )
+        self._schedulePoll()
+        return job
+    # end of BackgroundJobScheduler.submit
+
+
+    def cancelJob( self, job:BackgroundJob ) -> None:
+        """
+        Cancel the job if it hasn't started yet,
+            otherwise ask it to stop (at its next checkCancelled).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundJobScheduler.cancelJob( {job} )" )
+        if job.status not in JOB_ACTIVE_STATUSES: return # Too late
+        job.cancelEvent.set()
+        if job.future.cancel(): job.status = JOB_CANCELLED
+        else: job.progressText = _("Cancelling…")
+        self._schedulePoll()
+    # end of BackgroundJobScheduler.cancelJob
+
+
+    def getActiveJobs( self ) -> List[BackgroundJob]:
+        """
+        Returns a list of the jobs that are waiting or running.
+        """
+        return [job for job in self.jobs if job.status in JOB_ACTIVE_STATUSES]
+    # end of BackgroundJobScheduler.getActiveJobs
+
+
+    def clearFinishedJobs( self ) -> None:
+        """
+        Forget about the jobs that have finished (or failed or been cancelled).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BackgroundJobScheduler.clearFinishedJobs()" )
+        self.jobs = self.getActiveJobs()
+        for watcherFunction in self.watcherFunctions: watcherFunction()
+    # end of BackgroundJobScheduler.clearFinishedJobs
+
+
+    def addWatcher( self, watcherFunction:Callable ) -> None:
+        """
+        The watcher function (with no parameters) is called every time that we check on the jobs.
+        """
+        if watcherFunction not in self.watcherFunctions: self.watcherFunctions.append( watcherFunction )
+    # end of BackgroundJobScheduler.addWatcher
+
+    def removeWatcher( self, watcherFunction:Callable ) -> None:
+        try: self.watcherFunctions.remove( watcherFunction )
+        except ValueError: pass
+    # end of BackgroundJobScheduler.removeWatcher
+
+
+    def _schedulePoll( self ) -> None:
+        """
+        Make sure that we'll check on the jobs soon.
+        """
+        if self.afterID is None:
+            self.afterID = self.tkWidget.after( JOB_POLL_INTERVAL, self._poll )
+    # end of BackgroundJobScheduler._schedulePoll
+
+
+    def _poll( self ) -> None:
+        """
+        Called from the Tk main loop to see which jobs have finished,
+            and to call their onDone or onError functions.
+
+        Keeps rescheduling itself while there are any jobs still waiting or running.
+        """
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "BackgroundJobScheduler._poll()" )
+        self.afterID = None
+        for job in self.jobs:
+            if job.status not in JOB_ACTIVE_STATUSES or not job.future.done(): continue
+            try: job.result = job.future.result()
+            except (CancelledError,JobCancelledError):
+                job.status = JOB_CANCELLED
+                continue
+            except Exception as err:
+                job.status, job.error = JOB_FAILED, err
+                logging.error( f"Background job {job.jobName!r} failed: {err!r}" )
+                callbackFunction = job.onError
+            else:
+                job.status = JOB_FINISHED if not job.isCancelled() else JOB_CANCELLED
+                callbackFunction = job.onDone if job.status == JOB_FINISHED else None
+            if callbackFunction is not None:
+                try: callbackFunction( job )
+                except Exception as err: logging.error( f"Background job {job.jobName!r} callback failed: {err!r}" )
+        for watcherFunction in self.watcherFunctions:
+            try: watcherFunction()
+            except Exception as err: logging.error( f"BackgroundJobScheduler watcher failed: {err!r}" )
+        if self.getActiveJobs(): self._schedulePoll()
+    # end of BackgroundJobScheduler._poll
+
+
+    def shutdown( self ) -> None:
+        """
+        Called when the program closes.
+
+        Jobs that haven't started are cancelled,
+            and running jobs are asked to stop.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BackgroundJobScheduler.shutdown()" )
+        for job in self.getActiveJobs(): job.cancelEvent.set()
+        if self.afterID is not None:
+            try: self.tkWidget.after_cancel( self.afterID )
+            except Exception: pass # The Tk window may have already gone
+            self.afterID = None
+        if self.executor is not None:
+            self.executor.shutdown( wait=False, cancel_futures=True )
+            self.executor = None
+    # end of BackgroundJobScheduler.shutdown
+# end of class BackgroundJobScheduler
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    import tkinter as tk
+
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    def slowJob( job:BackgroundJob, numSteps:int ) -> int:
+        for step in range( numSteps ):
+            job.checkCancelled()
+            job.setProgress( f"Step {step+1}/{numSteps}" )
+            time.sleep( 0.1 )
+        return numSteps
+
+    tkRootWindow = tk.Tk()
+    tkRootWindow.title( PROGRAM_NAME_VERSION )
+    scheduler = BackgroundJobScheduler( tkRootWindow )
+    scheduler.addWatcher( lambda: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {scheduler.jobs}" ) )
+    for j in range( 4 ):
+        scheduler.submit( f"Job{j+1}", slowJob, 5+j,
+                            onDone=lambda job: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"{job.jobName} done with {job.result}" ) )
+    scheduler.cancelJob( scheduler.jobs[-1] ) # Cancel the last one before it starts
+    tkRootWindow.after( 3_000, tkRootWindow.destroy ) # Destroy the widget after 3 seconds
+    tkRootWindow.mainloop()
+    scheduler.shutdown()
+# end of BackgroundJobs.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of BackgroundJobs.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BackgroundJobs.py
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BackgroundLogWriter.py
+#
+# Buffered writing of our usage and change log files
+#
+# Copyright (C) 2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Biblelator appends a line to a log file for most menu actions (the usage log)
+    and every time that a Bible book is saved (the project change logs).
+
+Rather than opening and closing the log file each time,
+    the lines are just kept in memory, and a worker thread appends them to the files
+    every few seconds (or sooner if a lot of text is waiting).
+Everything that's still waiting is written when the program closes
+    (or when something needs to read a log file).
+
+    class BackgroundLogWriter
+        __init__( self, flushInterval=LOG_FLUSH_INTERVAL, flushSize=LOG_FLUSH_SIZE )
+        write( self, filepath, text )
+        _takeRecords( self )
+        _writeRecords( self, records )
+        _runWriter( self )
+        flush( self )
+        close( self )
+
+    getLogWriter()
+    flushLogs()
+    closeLogWriter()
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, List
+import os
+import sys
+import logging
+import threading
+import atexit
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "BackgroundLogWriter"
+PROGRAM_NAME = "Biblelator Background Log Writer"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+LOG_FLUSH_INTERVAL = 5 # seconds between writes of the waiting log lines
+LOG_FLUSH_SIZE = 16_384 # characters -- write sooner if this much is waiting
+LOG_CLOSE_TIMEOUT = 5 # seconds to wait for the worker thread when closing
+
+
+
+class BackgroundLogWriter:
+    """
+    Keeps log lines in memory (in the order that they were given for each file)
+        and appends them to their files from a worker thread.
+    """
+    def __init__( self, flushInterval:float=LOG_FLUSH_INTERVAL, flushSize:int=LOG_FLUSH_SIZE ) -> None:
+        """
+        Starts the worker thread.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundLogWriter.__init__( {flushInterval}, {flushSize} )" )
+        self.flushInterval, self.flushSize = flushInterval, flushSize
+        self.recordsLock = threading.Lock() # For the waiting records
+        self.writeLock = threading.Lock() # So that the records are always written in order
+        self.pendingRecords:Dict[str,List[str]] = {} # Keys are filepaths (in the order first used)
+        self.pendingSize = 0
+        self.flushRequested = threading.Event()
+        self.isClosed = False
+        self.writerThread = threading.Thread( target=self._runWriter, name='BackgroundLogWriter', daemon=True )
+        self.writerThread.start()
+    # end of BackgroundLogWriter.__init__
+
+
+    def write( self, filepath, text:str ) -> None:
+        """
+        Queue the text to be appended to the given file.
+
+        Once we're closed, the text is written immediately.
+        """
+        with self.recordsLock:
+            if not self.isClosed:
+                self.pendingRecords.setdefault( str(filepath), [] ).append( text )
+                self.pendingSize += len( text )
+                if self.pendingSize >= self.flushSize: self.flushRequested.set()
+                return
+        with self.writeLock: self._writeRecords( {str(filepath):[text]} )
+    # end of BackgroundLogWriter.write
+
+
+    def _takeRecords( self ) -> Dict[str,List[str]]:
+        """
+        Returns the waiting records (and clears them).
+        """
+        with self.recordsLock:
+            records, self.pendingRecords, self.pendingSize = self.pendingRecords, {}, 0
+        return records
+    # end of BackgroundLogWriter._takeRecords
+
+
+    def _writeRecords( self, records:Dict[str,List[str]] ) -> None:
+        """
+        Append the records to their files (one open per file).
+
+        Must be called with self.writeLock held.
+        """
+        for filepath,texts in records.items():
+            try:
+                with open( filepath, 'at', encoding='utf-8' ) as logFile: # Append puts the file pointer at the end of the file
+                    logFile.write( ''.join( texts ) )
+            except OSError as err: # Don't stop the program just because we can't log something
+                logging.error( f"BackgroundLogWriter: Unable to write {len(texts)} record(s) to {filepath}: {err}" )
+    # end of BackgroundLogWriter._writeRecords
+
+
+    def _runWriter( self ) -> None:
+        """
+        The worker thread which writes the waiting records
+            every flushInterval seconds (or when asked to).
+        """
+        while not self.isClosed:
+            self.flushRequested.wait( self.flushInterval )
+            self.flushRequested.clear()
+            with self.writeLock: self._writeRecords( self._takeRecords() )
+    # end of BackgroundLogWriter._runWriter
+
+
+    def flush( self ) -> None:
+        """
+        Write all the waiting records now (in the calling thread),
+            e.g., before reading one of the log files.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BackgroundLogWriter.flush()" )
+        with self.writeLock: self._writeRecords( self._takeRecords() )
+    # end of BackgroundLogWriter.flush
+
+
+    def close( self ) -> None:
+        """
+        Stop the worker thread and write anything that's still waiting.
+
+        Anything written after this is written immediately.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BackgroundLogWriter.close()" )
+        with self.recordsLock: self.isClosed = True
+        self.flushRequested.set()
+        self.writerThread.join( LOG_CLOSE_TIMEOUT )
+        self.flush()
+    # end of BackgroundLogWriter.close
+# end of class BackgroundLogWriter
+
+
+
+logWriter = None # Shared by everything that writes our log files
+
+def getLogWriter() -> BackgroundLogWriter:
+    """
+    Returns the shared log writer (starting it if necessary).
+
+    It's also closed when the program exits (in case closeLogWriter isn't called).
+    """
+    global logWriter
+    if logWriter is None:
+        logWriter = BackgroundLogWriter()
+        atexit.register( closeLogWriter )
+    return logWriter
+# end of BackgroundLogWriter.getLogWriter
+
+
+def flushLogs() -> None:
+    """
+    Make sure that the log files are up-to-date.
+    """
+    if logWriter is not None: logWriter.flush()
+# end of BackgroundLogWriter.flushLogs
+
+
+def closeLogWriter() -> None:
+    """
+    Write anything that's still waiting and stop the worker thread.
+    """
+    global logWriter
+    if logWriter is not None:
+        logWriter.close()
+        logWriter = None
+# end of BackgroundLogWriter.closeLogWriter
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    import tempfile, time
+    with tempfile.TemporaryDirectory() as tempFolder:
+        filepaths = [os.path.join( tempFolder, f'Test{j}Log.txt' ) for j in range( 2 )]
+        testWriter = BackgroundLogWriter( flushInterval=0.2, flushSize=1_000 )
+        startTime = time.perf_counter()
+        for j in range( 1_000 ):
+            testWriter.write( filepaths[j%2], f"Line {j}\n" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  1,000 writes took {(time.perf_counter()-startTime)*1000:.2f}ms" )
+        time.sleep( 0.5 ) # Let the timer write the rest
+        testWriter.write( filepaths[0], "Last line\n" )
+        testWriter.close()
+        testWriter.write( filepaths[1], "Line after closing\n" )
+        for filepath in filepaths:
+            with open( filepath, 'rt', encoding='utf-8' ) as logFile: lines = logFile.read().split( '\n' )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {os.path.basename(filepath)} has {len(lines)-1} lines: {lines[:2]}…{lines[-3:-1]}" )
+# end of BackgroundLogWriter.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of BackgroundLogWriter.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BackgroundLogWriter.py
@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Benchmarks.py
+#
+# Reproducible timings of some of the hot paths in Biblelator
+#
+# Copyright (C) 2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Times some of the things that Biblelator does often
+    (starting up, moving to a new reference, checking and caching the edited book,
+    autocomplete lookups, and finding text in a Bible)
+    on a synthetic USFM Bible which is generated from a random seed,
+    so that the timings can be compared between program versions.
+
+The results are written as JSON, with the percentiles of the times (in milliseconds)
+    for each benchmark.
+
+The GUI benchmarks need a display. If there isn't one,
+    we try to start a virtual X display (Xvfb) for them,
+    otherwise those benchmarks are just listed as skipped (with the reason).
+They're run with a temporary home folder so that the user's own settings aren't used or changed.
+
+To run it:
+    python3 Biblelator/Helpers/Benchmarks.py --books 5 --chapters 20 --verses 30 --repeats 50 --json Timings.json
+
+    makeSyntheticUSFMBook( BBB, numChapters, getNumVerses, randomGenerator, vocabulary, cumulativeWeights )
+    makeSyntheticCorpus( corpusFolderpath, numBooks, maxChapters, maxVerses, randomSeed )
+    getPercentile( sortedValues, percent )
+    summariseTimings( timings )
+    timeCalls( function, argumentsList )
+    benchmarkUSFMChecks( corpusInfo, numRepeats, randomGenerator, results )
+    benchmarkAutocomplete( corpusInfo, numRepeats, randomGenerator, results )
+    benchmarkBibleFind( corpusInfo, numRepeats, randomGenerator, results )
+    startVirtualDisplay()
+    waitForChildWindowUpdates( theApp )
+    benchmarkGUI( corpusInfo, numRepeats, numFanOutWindows, randomGenerator, results )
+    runBenchmarks( numBooks, maxChapters, maxVerses, numRepeats, numFanOutWindows, randomSeed, includeGUI )
+    writeResults( benchmarkResults, outputFilepath )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple, Optional, Any
+import os
+import sys
+import logging
+import json
+import time
+import random
+import shutil
+import platform
+import subprocess
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.BiblelatorGlobals import APP_NAME_VERSION, DATA_SUBFOLDER_NAME, LOGGING_SUBFOLDER_NAME
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "Benchmarks"
+PROGRAM_NAME = "Biblelator Benchmarks"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+BENCHMARK_RESULTS_VERSION = 1 # Increment this if the layout of the JSON results changes
+BENCHMARK_PERCENTILES = ( 50, 90, 99 )
+BENCHMARK_PROJECT_CODE = 'BMK' # Used in the synthetic Bible
+BENCHMARK_VERSIFICATION_SYSTEM = 'GENERIC-KJV-ENG' # Same as the program uses for navigation
+BENCHMARK_VOCABULARY_SIZE = 5_000
+BENCHMARK_SYLLABLES = ( 'a','ba','be','da','di','el','fa','ga','ha','hi','ka','ke','la','li','ma','me','mo',
+                        'na','ne','no','ra','re','ri','sa','se','so','ta','te','ti','to','va','wa','ya','za','zi' )
+BENCHMARK_INVALID_COMBINATIONS = [',,',' ,','..',' .',';;',' ;','!!',' !'] # Much like the USFM edit window uses
+BENCHMARK_CHECK_FOR_PAIRS = [('(',')'),('[',']')]
+GUI_BENCHMARK_NAMES = ( 'Application.start', 'Application.gotoBCV', 'USFMEditWindow.updateShownBCV',
+                        'USFMEditWindow.cacheBook', 'USFMEditWindow.checkUSFMTextForProblems' )
+GUI_UPDATE_TIMEOUT = 60 # seconds to wait for the child windows to update before giving up
+VIRTUAL_DISPLAY_NUMBERS = range( 99, 120 ) # Tried in turn until we find an unused one
+VIRTUAL_DISPLAY_START_TIMEOUT = 10 # seconds
+
+
+
+def makeSyntheticUSFMBook( BBB:str, numChapters:int, getNumVerses, randomGenerator:random.Random,
+                                vocabulary:List[str], cumulativeWeights:List[float] ) -> str:
+    """
+    Make up the USFM text for a book with the given number of chapters.
+
+    getNumVerses is a function which returns the number of verses for a chapter number.
+
+    The words are chosen with a Zipf-like frequency so that the autocomplete
+        and search indexes see a realistic mix of common and rare words.
+    """
+    USFMAbbreviation = BibleOrgSysGlobals.loadedBibleBooksCodes.getUSFMAbbreviation( BBB ).upper()
+    bookLines = [f'\\id {USFMAbbreviation} Synthetic {BENCHMARK_PROJECT_CODE} benchmark text',
+                    f'\\h {BBB} book', f'\\toc1 The book of {BBB}', f'\\toc2 {BBB} book', f'\\toc3 {BBB}',
+                    f'\\mt1 The book of {BBB}']
+    for C in range( 1, numChapters+1 ):
+        bookLines.append( f'\\c {C}' )
+        for V in range( 1, getNumVerses( C )+1 ):
+            if V == 1 or randomGenerator.random() < 0.08:
+                if V==1 or randomGenerator.random() < 0.5:
+                    bookLines.append( '\\s1 ' + ' '.join( randomGenerator.choices( vocabulary, cum_weights=cumulativeWeights,
+                                                                k=randomGenerator.randint( 2, 6 ) ) ).capitalize() )
+                bookLines.append( '\\p' )
+            words = randomGenerator.choices( vocabulary, cum_weights=cumulativeWeights, k=randomGenerator.randint( 6, 30 ) )
+            for j in range( randomGenerator.randint( 3, 8 ), len(words)-1, randomGenerator.randint( 5, 12 ) ):
+                words[j] += randomGenerator.choice( ',,,;:' )
+            verseText = ' '.join( words ).capitalize() + randomGenerator.choice( '...!?' )
+            if randomGenerator.random() < 0.05:
+                footnoteWords = randomGenerator.choices( vocabulary, cum_weights=cumulativeWeights, k=randomGenerator.randint( 2, 8 ) )
+                verseText += f'\\f + \\fr {C}:{V} \\ft {" ".join( footnoteWords ).capitalize()}.\\f*'
+            bookLines.append( f'\\v {V} {verseText}' )
+    return '\n'.join( bookLines ) + '\n'
+# end of Benchmarks.makeSyntheticUSFMBook
+
+
+def makeSyntheticCorpus( corpusFolderpath:Path, numBooks:int, maxChapters:int, maxVerses:int, randomSeed:int ) -> Dict[str,Any]:
+    """
+    Write a synthetic USFM Bible into the given (empty) folder.
+
+    The books, chapters and verses follow our generic versification system,
+        but each book is cut down to the given maximum numbers of chapters and verses.
+    The same random seed always gives the same Bible.
+
+    Returns a dictionary with information about the corpus (including the text of each book).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"makeSyntheticCorpus( {corpusFolderpath}, {numBooks}, {maxChapters}, {maxVerses}, {randomSeed} )" )
+    from BibleOrgSys.Reference.BibleOrganisationalSystems import BibleOrganisationalSystem
+
+    randomGenerator = random.Random( randomSeed )
+    vocabulary, vocabularySet = [], set()
+    while len(vocabulary) < BENCHMARK_VOCABULARY_SIZE:
+        word = ''.join( randomGenerator.choices( BENCHMARK_SYLLABLES, k=randomGenerator.randint( 1, 4 ) ) )
+        if word not in vocabularySet: vocabulary.append( word ); vocabularySet.add( word )
+    cumulativeWeights, totalWeight = [], 0.0
+    for rank in range( 1, len(vocabulary)+1 ):
+        totalWeight += 1.0 / rank
+        cumulativeWeights.append( totalWeight )
+
+    versificationSystem = BibleOrganisationalSystem( BENCHMARK_VERSIFICATION_SYSTEM )
+    bookList = versificationSystem.getBookList()
+    bookList = bookList[bookList.index('GEN'):] # Skip the front matter
+    os.makedirs( corpusFolderpath, exist_ok=True )
+    bookTexts:Dict[str,str] = {}
+    bookShapes:Dict[str,List[int]] = {} # Number of verses in each chapter
+    for BBB in bookList:
+        if len(bookTexts) >= numBooks: break
+        try: numChapters = min( int( versificationSystem.getNumChapters( BBB ) ), maxChapters )
+        except (KeyError, TypeError, ValueError): continue
+        if numChapters < 1: continue
+        numVersesList = [min( int( versificationSystem.getNumVerses( BBB, str(C) ) ), maxVerses ) for C in range( 1, numChapters+1 )]
+        bookText = makeSyntheticUSFMBook( BBB, numChapters, lambda C: numVersesList[C-1], randomGenerator, vocabulary, cumulativeWeights )
+        USFMAbbreviation = BibleOrgSysGlobals.loadedBibleBooksCodes.getUSFMAbbreviation( BBB ).upper()
+        with open( os.path.join( corpusFolderpath, f'{USFMAbbreviation}.SFM' ), 'wt', encoding='utf-8' ) as bookFile:
+            bookFile.write( bookText )
+        bookTexts[BBB], bookShapes[BBB] = bookText, numVersesList
+
+    return { 'folderpath':corpusFolderpath, 'randomSeed':randomSeed, 'vocabulary':vocabulary,
+            'bookTexts':bookTexts, 'bookShapes':bookShapes }
+# end of Benchmarks.makeSyntheticCorpus
+
+
+
+def getPercentile( sortedValues:List[float], percent:float ) -> float:
+    """
+    Returns the given percentile of the (already sorted) values,
+        interpolating between the two nearest values if necessary.
+    """
+    if len(sortedValues) == 1: return sortedValues[0]
+    position = (len(sortedValues)-1) * percent / 100
+    lowerIndex = int( position )
+    if lowerIndex+1 >= len(sortedValues): return sortedValues[-1]
+    return sortedValues[lowerIndex] + (sortedValues[lowerIndex+1]-sortedValues[lowerIndex]) * (position-lowerIndex)
+# end of Benchmarks.getPercentile
+
+
+def summariseTimings( timings:List[float] ) -> Dict[str,Any]:
+    """
+    Given a list of times (in seconds),
+        returns a dictionary with the count and the statistics (in milliseconds).
+    """
+    sortedTimings = sorted( timing*1000 for timing in timings )
+    summary = { 'count':len(sortedTimings), 'min':round( sortedTimings[0], 4 ),
+                'mean':round( sum(sortedTimings) / len(sortedTimings), 4 ) }
+    for percent in BENCHMARK_PERCENTILES:
+        summary[f'p{percent}'] = round( getPercentile( sortedTimings, percent ), 4 )
+    summary['max'] = round( sortedTimings[-1], 4 )
+    return summary
+# end of Benchmarks.summariseTimings
+
+
+def timeCalls( function, argumentsList:List[tuple] ) -> List[float]:
+    """
+    Call the function once with each set of arguments (after a warm-up call with the first set)
+        and return a list of the times taken (in seconds).
+    """
+    function( *argumentsList[0] ) # Warm-up (so that one-off imports and caches don't affect the results)
+    timings = []
+    for arguments in argumentsList:
+        startTime = time.perf_counter()
+        function( *arguments )
+        timings.append( time.perf_counter() - startTime )
+    return timings
+# end of Benchmarks.timeCalls
+
+
+
+def benchmarkUSFMChecks( corpusInfo:Dict[str,Any], numRepeats:int, randomGenerator:random.Random, results:Dict[str,Any] ) -> None:
+    """
+    Time checking a whole book (like the edit window does in ByBook mode),
+        and checking one chapter after a small edit using the background checker
+        (like the edit window does after each pause in typing).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"benchmarkUSFMChecks( …, {numRepeats}, … )" )
+    from Biblelator.Helpers.USFMTextChecks import checkUSFMText, BackgroundUSFMTextChecker
+
+    bookTexts, bookShapes = corpusInfo['bookTexts'], corpusInfo['bookShapes']
+    argumentsList = []
+    for _n in range( numRepeats ):
+        BBB = randomGenerator.choice( list(bookTexts) )
+        numChapters, numVerses = len(bookShapes[BBB]), sum(bookShapes[BBB])
+        argumentsList.append( (bookTexts[BBB], True, (numChapters,numChapters,numVerses,numVerses),
+                                BENCHMARK_INVALID_COMBINATIONS, BENCHMARK_CHECK_FOR_PAIRS) )
+    results['USFMTextChecks.checkUSFMText'] = summariseTimings( timeCalls( checkUSFMText, argumentsList ) )
+
+    backgroundChecker = BackgroundUSFMTextChecker()
+    def checkInBackground( editedText:str, markerLimits:Tuple[int,int,int,int] ) -> None:
+        backgroundChecker.requestCheck( editedText, False, markerLimits, BENCHMARK_INVALID_COMBINATIONS, BENCHMARK_CHECK_FOR_PAIRS )
+        while backgroundChecker.getLatestResults() is None: time.sleep( 0.0001 )
+    # end of Benchmarks.benchmarkUSFMChecks.checkInBackground
+
+    argumentsList = []
+    for _n in range( numRepeats ):
+        BBB = randomGenerator.choice( list(bookTexts) )
+        chapterTexts = bookTexts[BBB].split( '\n\\c ' )[1:]
+        C = randomGenerator.randrange( len(chapterTexts) )
+        chapterLines = ('\\c ' + chapterTexts[C]).split( '\n' )
+        verseLineIndexes = [j for j,line in enumerate( chapterLines ) if line.startswith( '\\v ' )]
+        editedLineIndex = randomGenerator.choice( verseLineIndexes )
+        chapterLines[editedLineIndex] = chapterLines[editedLineIndex] + ' ' + randomGenerator.choice( corpusInfo['vocabulary'] )
+        argumentsList.append( ('\n'.join( chapterLines ), (1,1,len(verseLineIndexes),len(verseLineIndexes))) )
+    results['USFMTextChecks.BackgroundUSFMTextChecker'] = summariseTimings( timeCalls( checkInBackground, argumentsList ) )
+# end of Benchmarks.benchmarkUSFMChecks
+
+
+def benchmarkAutocomplete( corpusInfo:Dict[str,Any], numRepeats:int, randomGenerator:random.Random, results:Dict[str,Any] ) -> None:
+    """
+    Time setting up the autocomplete index from the word counts of the Bible,
+        and looking up the completions for the start of a word
+        (like the edit window does as each character is typed).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"benchmarkAutocomplete( …, {numRepeats}, … )" )
+    from Biblelator.Helpers.AutocompleteFunctions import AutocompleteIndex, countUSFMWords, getInternalMarkers
+    from Biblelator.Windows.TextEditWindow import MAX_AUTOCOMPLETE_POPUP_WORDS
+
+    wordCounts = None
+    for BBB,bookText in corpusInfo['bookTexts'].items():
+        wordCounts = countUSFMWords( bookText.split( '\n' ), getInternalMarkers(), wordCounts=wordCounts, sourceName=BBB )
+    autocompleteIndex = AutocompleteIndex()
+    results['AutocompleteIndex.setCountedWords'] = summariseTimings( timeCalls( autocompleteIndex.setCountedWords,
+                                                        [(wordCounts, 3, 9)] * max( 1, numRepeats//10 ) ) )
+
+    indexedWords = [word for word in autocompleteIndex if ' ' not in word and len(word) > 3]
+    argumentsList = []
+    for _n in range( numRepeats ):
+        word = randomGenerator.choice( indexedWords )
+        argumentsList.append( (word[:randomGenerator.randint( 3, len(word)-1 )],MAX_AUTOCOMPLETE_POPUP_WORDS) ) # As the edit windows do
+    results['AutocompleteIndex.getCompletions'] = summariseTimings( timeCalls( autocompleteIndex.getCompletions, argumentsList ) )
+    results['AutocompleteIndex.getCompletions']['indexedWords'] = len(autocompleteIndex)
+# end of Benchmarks.benchmarkAutocomplete
+
+
+def benchmarkBibleFind( corpusInfo:Dict[str,Any], numRepeats:int, randomGenerator:random.Random, results:Dict[str,Any] ) -> None:
+    """
+    Time finding a word in the whole Bible
+        the same way as the Bible find from an edit window does it
+        (using the search index to choose the books and verses, and then searching them in parallel).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"benchmarkBibleFind( …, {numRepeats}, … )" )
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    from Biblelator.Helpers.BibleSearchIndex import getBibleSearchIndex
+    from Biblelator.Helpers.ParallelBibleSearch import findTextInParallel, shutdownSearchPool
+
+    uB = USFMBible( corpusInfo['folderpath'] )
+    uB.preload()
+    def findInBible( findText:str ) -> None:
+        optionsDict = { 'givenBible':uB, 'workName':uB.getAName(), 'findText':findText, 'bookList':'ALL',
+                        'chapterList':None, 'markerList':None, 'wordMode':'Whole', 'caselessFlag':True,
+                        'ignoreDiacriticsFlag':False, 'includeIntroFlag':True, 'includeMainTextFlag':True,
+                        'includeMarkerTextFlag':False, 'includeExtrasFlag':False, 'contextLength':30, 'findHistoryList':[] }
+        searchIndex = getBibleSearchIndex( uB )
+        candidateVerses = None if searchIndex is None else searchIndex.getCandidateBookVerses( optionsDict )
+        findTextInParallel( uB, optionsDict, None if candidateVerses is None else list( candidateVerses ), candidateVerses )
+    # end of Benchmarks.benchmarkBibleFind.findInBible
+
+    vocabulary = corpusInfo['vocabulary']
+    # Use the middle of the vocabulary so that we find some verses, but not most of them
+    argumentsList = [(randomGenerator.choice( vocabulary[50:len(vocabulary)//2] ),) for _n in range( numRepeats )]
+    try: results['BibleSearch.findTextInParallel'] = summariseTimings( timeCalls( findInBible, argumentsList ) )
+    finally: shutdownSearchPool()
+# end of Benchmarks.benchmarkBibleFind
+
+
+
+def startVirtualDisplay() -> Optional[subprocess.Popen]:
+    """
+    If we don't have a display, try to start a virtual X display (Xvfb)
+        and set DISPLAY to use it.
+
+    Returns the Xvfb process (which the caller must terminate)
+        or None if we didn't start one.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "startVirtualDisplay()" )
+    if os.environ.get( 'DISPLAY' ) or sys.platform != 'linux': return None
+    XvfbPath = shutil.which( 'Xvfb' )
+    if not XvfbPath: return None
+
+    for displayNumber in VIRTUAL_DISPLAY_NUMBERS:
+        if os.path.exists( f'/tmp/.X{displayNumber}-lock' ): continue # Already in use
+        XvfbProcess = subprocess.Popen( [XvfbPath, f':{displayNumber}', '-screen', '0', '1280x1024x24', '-nolisten', 'tcp'],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL )
+        startTime = time.time()
+        while time.time() - startTime < VIRTUAL_DISPLAY_START_TIMEOUT:
+            if XvfbProcess.poll() is not None: break # it failed
+            if os.path.exists( f'/tmp/.X11-unix/X{displayNumber}' ):
+                os.environ['DISPLAY'] = f':{displayNumber}'
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Started virtual display :{displayNumber}" )
+                return XvfbProcess
+            time.sleep( 0.05 )
+        XvfbProcess.terminate()
+        XvfbProcess.wait()
+    logging.error( "startVirtualDisplay: Unable to start Xvfb" )
+    return None
+# end of Benchmarks.startVirtualDisplay
+
+
+def waitForChildWindowUpdates( theApp ) -> None:
+    """
+    Let tkinter run until the child windows have all been updated
+        to the new Bible reference (they're done one at a time from after_idle).
+    """
+    startTime = time.time()
+    while theApp.childWindows.pendingBCVUpdates:
+        theApp.rootWindow.update()
+        if time.time() - startTime > GUI_UPDATE_TIMEOUT:
+            raise RuntimeError( f"Child windows still not updated after {GUI_UPDATE_TIMEOUT} seconds" )
+# end of Benchmarks.waitForChildWindowUpdates
+
+
+def benchmarkGUI( corpusInfo:Dict[str,Any], numRepeats:int, numFanOutWindows:int,
+                                randomGenerator:random.Random, results:Dict[str,Any] ) -> None:
+    """
+    Time starting the program, and then moving around a USFM edit window
+        which has a number of Bible resource windows (all in the same group) open alongside it.
+
+    The program is started with a temporary home folder,
+        so that it has the default settings (and no saved windows).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"benchmarkGUI( …, {numRepeats}, {numFanOutWindows}, … )" )
+    import tkinter as tk
+    from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+    from Biblelator import BiblelatorGlobals
+    from Biblelator.Biblelator import Application
+
+    try: tkRootWindow = tk.Tk()
+    except tk.TclError as err: # No display
+        for benchmarkName in GUI_BENCHMARK_NAMES:
+            results[benchmarkName] = { 'skipped':f"Unable to open a Tk window: {err}" }
+        return
+    vars( BibleOrgSysGlobals.commandLineArguments ).setdefault( 'override', None ) # Normally a Biblelator command line option
+
+    homeFolderpath = Path( corpusInfo['folderpath'] ).parent.joinpath( 'Home/' )
+    loggingFolderpath = homeFolderpath.joinpath( DATA_SUBFOLDER_NAME, LOGGING_SUBFOLDER_NAME )
+    os.makedirs( loggingFolderpath, exist_ok=True )
+    startTimings = []
+    for n in range( numRepeats ):
+        if n: tkRootWindow = tk.Tk()
+        theApp = Application( tkRootWindow, None )
+        BiblelatorGlobals.setApp( theApp )
+        startTime = time.perf_counter()
+        theApp.start( homeFolderpath, loggingFolderpath )
+        startTimings.append( time.perf_counter() - startTime )
+        tkRootWindow.update()
+        if n < numRepeats-1: tkRootWindow.destroy()
+    results['Application.start'] = summariseTimings( startTimings )
+
+    try:
+        uEW = theApp.openUSFMBibleEditWindow( corpusInfo['folderpath'] )
+        for _n in range( numFanOutWindows ):
+            theApp.openInternalBibleResourceWindow( corpusInfo['folderpath'] )
+        tkRootWindow.update()
+        waitForChildWindowUpdates( theApp )
+
+        bookShapes = corpusInfo['bookShapes']
+        def getRandomBCV() -> Tuple[str,str,str]:
+            BBB = randomGenerator.choice( list(bookShapes) )
+            C = randomGenerator.randrange( len(bookShapes[BBB]) )
+            return BBB, str(C+1), str( randomGenerator.randint( 1, bookShapes[BBB][C] ) )
+        # end of Benchmarks.benchmarkGUI.getRandomBCV
+
+        def gotoBCV( BBB:str, C:str, V:str ) -> None:
+            theApp.gotoBCV( BBB, C, V, 'Benchmarks' )
+            waitForChildWindowUpdates( theApp )
+        # end of Benchmarks.benchmarkGUI.gotoBCV
+        results['Application.gotoBCV'] = summariseTimings( timeCalls( gotoBCV, [getRandomBCV() for _n in range( numRepeats )] ) )
+        results['Application.gotoBCV']['childWindows'] = len( theApp.childWindows )
+
+        results['USFMEditWindow.updateShownBCV'] = summariseTimings( timeCalls( uEW.updateShownBCV,
+                                        [(SimpleVerseKey( *getRandomBCV() ),) for _n in range( numRepeats )] ) )
+
+        results['USFMEditWindow.cacheBook'] = summariseTimings( timeCalls( uEW.cacheBook,
+                                        [(uEW.currentVerseKey.getBBB(),)] * numRepeats ) )
+
+        checkTimings = []
+        for n in range( numRepeats+1 ): # The first one is a warm-up
+            startTime = time.perf_counter()
+            uEW.checkUSFMTextForProblems()
+            # Only wait until the results are ready (not for the next poll from the window)
+            while uEW.USFMTextChecker.resultQueue.empty(): time.sleep( 0.0001 )
+            if n: checkTimings.append( time.perf_counter() - startTime )
+            while uEW.USFMTextCheckPollID is not None: tkRootWindow.update() # Let the window show the results
+        results['USFMEditWindow.checkUSFMTextForProblems'] = summariseTimings( checkTimings )
+    finally:
+        tkRootWindow.destroy()
+        BiblelatorGlobals.setApp( None )
+# end of Benchmarks.benchmarkGUI
+
+
+
+def runBenchmarks( numBooks:int=3, maxChapters:int=10, maxVerses:int=30, numRepeats:int=20,
+                    numFanOutWindows:int=4, randomSeed:int=1, includeGUI:bool=True ) -> Dict[str,Any]:
+    """
+    Make a synthetic Bible of the given size, and run all the benchmarks on it.
+
+    Returns a dictionary (ready to be written as JSON)
+        containing the settings, the environment, and the results of each benchmark.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"runBenchmarks( {numBooks}, {maxChapters}, {maxVerses}, {numRepeats}, {numFanOutWindows}, {randomSeed}, {includeGUI} )" )
+
+    try: commitID = subprocess.run( ['git','rev-parse','--short','HEAD'], cwd=os.path.dirname( os.path.abspath( __file__ ) ),
+                                        capture_output=True, text=True, timeout=10 ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError): commitID = None
+    benchmarkResults = { 'resultsVersion':BENCHMARK_RESULTS_VERSION, 'program':APP_NAME_VERSION, 'commit':commitID,
+                        'BibleOrgSysVersion':BibleOrgSysGlobals.PROGRAM_VERSION, 'python':platform.python_version(),
+                        'platform':platform.platform(), 'timestamp':datetime.now().isoformat( timespec='seconds' ),
+                        'units':'milliseconds',
+                        'settings':{ 'books':numBooks, 'chapters':maxChapters, 'verses':maxVerses, 'repeats':numRepeats,
+                                    'fanOutWindows':numFanOutWindows, 'randomSeed':randomSeed },
+                        'corpus':None, 'benchmarks':{} }
+    results = benchmarkResults['benchmarks']
+
+    with tempfile.TemporaryDirectory( prefix='BiblelatorBenchmarks' ) as tempFolder:
+        corpusInfo = makeSyntheticCorpus( Path( tempFolder ).joinpath( 'Corpus/' ), numBooks, maxChapters, maxVerses, randomSeed )
+        benchmarkResults['corpus'] = { 'books':list( corpusInfo['bookTexts'] ),
+                                        'verses':sum( sum(numVersesList) for numVersesList in corpusInfo['bookShapes'].values() ),
+                                        'characters':sum( len(bookText) for bookText in corpusInfo['bookTexts'].values() ) }
+        randomGenerator = random.Random( randomSeed )
+        for benchmarkFunction in ( benchmarkUSFMChecks, benchmarkAutocomplete, benchmarkBibleFind ):
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Running {benchmarkFunction.__name__}…" )
+            benchmarkFunction( corpusInfo, numRepeats, randomGenerator, results )
+
+        if includeGUI:
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  Running benchmarkGUI…" )
+            XvfbProcess = startVirtualDisplay()
+            try: benchmarkGUI( corpusInfo, numRepeats, numFanOutWindows, randomGenerator, results )
+            finally:
+                if XvfbProcess is not None:
+                    XvfbProcess.terminate()
+                    XvfbProcess.wait()
+                    del os.environ['DISPLAY']
+        else:
+            for benchmarkName in GUI_BENCHMARK_NAMES:
+                results[benchmarkName] = { 'skipped':"GUI benchmarks not requested" }
+
+    return benchmarkResults
+# end of Benchmarks.runBenchmarks
+
+
+def writeResults( benchmarkResults:Dict[str,Any], outputFilepath:Optional[str]=None ) -> None:
+    """
+    Write the results as JSON into the given file (or to stdout if no file is given).
+    """
+    jsonText = json.dumps( benchmarkResults, indent=2 )
+    if outputFilepath:
+        with open( outputFilepath, 'wt', encoding='utf-8' ) as outputFile:
+            outputFile.write( jsonText + '\n' )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Wrote benchmark results to {outputFilepath}" )
+    else: print( jsonText )
+# end of Benchmarks.writeResults
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    benchmarkResults = runBenchmarks( numBooks=2, maxChapters=3, maxVerses=10, numRepeats=5, numFanOutWindows=1, includeGUI=False )
+    for benchmarkName,summary in benchmarkResults['benchmarks'].items():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {benchmarkName}: {summary}" )
+# end of Benchmarks.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Run the benchmarks with the sizes given on the command line.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    commandLineArguments = BibleOrgSysGlobals.commandLineArguments
+    benchmarkResults = runBenchmarks( numBooks=getattr( commandLineArguments, 'books', 3 ),
+                                    maxChapters=getattr( commandLineArguments, 'chapters', 10 ),
+                                    maxVerses=getattr( commandLineArguments, 'verses', 30 ),
+                                    numRepeats=getattr( commandLineArguments, 'repeats', 20 ),
+                                    numFanOutWindows=getattr( commandLineArguments, 'windows', 4 ),
+                                    randomSeed=getattr( commandLineArguments, 'seed', 1 ),
+                                    includeGUI=not getattr( commandLineArguments, 'noGUI', False ) )
+    writeResults( benchmarkResults, getattr( commandLineArguments, 'jsonFilepath', None ) )
+# end of Benchmarks.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--books', type=int, default=3, metavar='NUMBER', help="number of books in the synthetic Bible" )
+    parser.add_argument( '--chapters', type=int, default=10, metavar='NUMBER', help="maximum number of chapters in each book" )
+    parser.add_argument( '--verses', type=int, default=30, metavar='NUMBER', help="maximum number of verses in each chapter" )
+    parser.add_argument( '--repeats', type=int, default=20, metavar='NUMBER', help="number of times to time each benchmark" )
+    parser.add_argument( '--windows', type=int, default=4, metavar='NUMBER', help="number of Bible resource windows to update with each move" )
+    parser.add_argument( '--seed', type=int, default=1, metavar='NUMBER', help="random seed for the synthetic Bible and the references" )
+    parser.add_argument( '--noGUI', action='store_true', help="don't run the benchmarks that need a display" )
+    parser.add_argument( '--json', dest='jsonFilepath', metavar='FILEPATH', help="write the JSON results to this file (rather than to stdout)" )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of Benchmarks.py
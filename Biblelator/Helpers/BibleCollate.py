@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BibleCollate.py
+#
+# Verse-by-verse comparison of two Bibles, one book at a time on worker processes
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Collate two Bibles (e.g., a translation and its back-translation) verse by verse.
+
+Each book is a separate job which loads that book of both Bibles
+    and lines up the verses by their chapter/verse numbers.
+The jobs run on the same pool of worker processes as the parallel Bible search
+    (so the two Bibles are loaded in parallel, book by book),
+    and the differences for each book are given back as soon as they're found.
+
+A verse is reported as different if:
+    it's only in one of the Bibles,
+    or the find text for one Bible is found in it but the find text for the other Bible isn't,
+    or (if asked) the format markers in the verse don't match exactly.
+
+    getBookVerses( bookObject, collateOptionsDict )
+    getCVSortKey( C, V )
+    collateBookVerses( verseList1, verseList2, collateOptionsDict )
+    collateBookInWorker( parameters )
+
+    class BibleCollation
+        __init__( self, internalBible1, internalBible2, bookList, collateOptionsDict )
+        _collateBookLocally( self, BBB )
+        collateBooks( self, waitFlag=False )
+        cancel( self )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import List, Tuple, Optional
+import os
+import sys
+import logging
+import re
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.Helpers.ParallelBibleSearch import getWorkerBook, getSearchPool, canSearchInParallel, getWorkerBookParameters
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "BibleCollate"
+PROGRAM_NAME = "Biblelator Bible Collate"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+# The types of differences found between the two Bibles
+ONLY_IN_BIBLE1, ONLY_IN_BIBLE2 = 'Only1', 'Only2'
+FOUND_IN_BIBLE1, FOUND_IN_BIBLE2 = 'Found1', 'Found2' # Find text only found in the one Bible
+MARKERS_DIFFER = 'Markers'
+
+
+
+def getBookVerses( bookObject, collateOptionsDict:dict ) -> List[tuple]:
+    """
+    Go through the processed lines of the book (in the same way as findText)
+        and put the text together for each verse.
+
+    Returns a list of 4-tuples: C, V, tuple of markers, verseText.
+    """
+    includeIntroFlag, includeExtrasFlag = collateOptionsDict['includeIntroFlag'], collateOptionsDict['includeExtrasFlag']
+
+    verseList = []
+    C, V = '-1', '-1' # So first/id line starts at -1:0
+    markers, texts = [], []
+    def saveVerse() -> None:
+        if (markers or texts) and (C != '-1' or includeIntroFlag):
+            verseList.append( (C, V, tuple(markers), ' '.join( texts )) )
+    # end of getBookVerses.saveVerse
+
+    for lineEntry in bookObject:
+        marker, cleanText = lineEntry.getMarker(), lineEntry.getCleanText()
+        if marker[0] == '¬' or marker in ('intro','chapters','c#'): continue # we always ignore these added lines
+        if marker == 'c':
+            saveVerse(); markers, texts = [], []
+            C, V = cleanText, '0'
+            continue
+        if marker == 'v':
+            saveVerse(); markers, texts = [], []
+            V = cleanText
+            ixHyphen = V.find( '-' )
+            if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
+            continue
+        if C == '-1':
+            saveVerse(); markers, texts = [], []
+            V = str( int(V) + 1 )
+        if marker not in ('v~','p~'): markers.append( marker )
+        text = lineEntry.getFullText() if includeExtrasFlag else cleanText
+        if text: texts.append( text )
+    saveVerse()
+    return verseList
+# end of BibleCollate.getBookVerses
+
+
+def getCVSortKey( C:str, V:str ) -> tuple:
+    """
+    Returns a key that sorts chapter/verse strings (like '3', '12a', '-1') in the right order.
+    """
+    def getNumber( CorV:str ) -> int:
+        match = re.match( r'-?\d+', CorV )
+        return int( match.group() ) if match else 0
+    # end of getCVSortKey.getNumber
+
+    return getNumber( C ), C, getNumber( V ), V
+# end of BibleCollate.getCVSortKey
+
+
+def collateBookVerses( verseList1:List[tuple], verseList2:List[tuple], collateOptionsDict:dict ) -> List[tuple]:
+    """
+    Line up the verses from the two Bibles (as given by getBookVerses) and compare them.
+
+    Returns a list of 5-tuples for the differences found:
+        C, V, differenceType, verseText1, verseText2
+    """
+    def getFindFunction( findText:str ):
+        """
+        Returns a function that tells if the find text is in a verse
+            using the findText options (including the 'regex:' prefix).
+        """
+        if findText.lower().startswith( 'regex:' ):
+            compiledFindText = re.compile( findText[6:], re.IGNORECASE if collateOptionsDict['caselessFlag'] else 0 )
+            return lambda verseText: compiledFindText.search( verseText ) is not None
+        def adjust( text:str ) -> str:
+            if collateOptionsDict['ignoreDiacriticsFlag']: text = BibleOrgSysGlobals.removeAccents( text )
+            if collateOptionsDict['caselessFlag']: text = text.lower()
+            return text
+        ourFindText = adjust( findText )
+        return lambda verseText: ourFindText in adjust( verseText )
+    # end of collateBookVerses.getFindFunction
+
+    findFunction1 = getFindFunction( collateOptionsDict['findText1'] )
+    findFunction2 = getFindFunction( collateOptionsDict['findText2'] )
+    markersMatchFlag = collateOptionsDict['markersMatchFlag']
+
+    differenceList = []
+    ix1 = ix2 = 0
+    while ix1 < len(verseList1) or ix2 < len(verseList2):
+        entry1 = verseList1[ix1] if ix1 < len(verseList1) else None
+        entry2 = verseList2[ix2] if ix2 < len(verseList2) else None
+        if entry2 is None or (entry1 is not None and getCVSortKey( *entry1[:2] ) < getCVSortKey( *entry2[:2] )):
+            differenceList.append( (entry1[0], entry1[1], ONLY_IN_BIBLE1, entry1[3], '') )
+            ix1 += 1; continue
+        if entry1 is None or getCVSortKey( *entry2[:2] ) < getCVSortKey( *entry1[:2] ):
+            differenceList.append( (entry2[0], entry2[1], ONLY_IN_BIBLE2, '', entry2[3]) )
+            ix2 += 1; continue
+        # Both Bibles have this verse
+        C, V, markers1, verseText1 = entry1
+        _C, _V, markers2, verseText2 = entry2
+        found1, found2 = findFunction1( verseText1 ), findFunction2( verseText2 )
+        if found1 and not found2: differenceList.append( (C, V, FOUND_IN_BIBLE1, verseText1, verseText2) )
+        elif found2 and not found1: differenceList.append( (C, V, FOUND_IN_BIBLE2, verseText1, verseText2) )
+        elif markersMatchFlag and markers1 != markers2: differenceList.append( (C, V, MARKERS_DIFFER, verseText1, verseText2) )
+        ix1 += 1; ix2 += 1
+    return differenceList
+# end of BibleCollate.collateBookVerses
+
+
+def collateBookInWorker( parameters:tuple ) -> List[tuple]:
+    """
+    Load the same book of the two Bibles and collate them (in a worker process).
+
+    Returns the list of differences from collateBookVerses.
+    """
+    bookParameters1, bookParameters2, collateOptionsDict = parameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"collateBookInWorker( {bookParameters1[1]}, {bookParameters2[1]}, {bookParameters1[5]} )" )
+
+    BBB = bookParameters1[5]
+    verseLists = []
+    for bookParameters in ( bookParameters1, bookParameters2 ):
+        workerBible = getWorkerBook( *bookParameters )
+        verseLists.append( getBookVerses( workerBible.books[BBB], collateOptionsDict ) )
+    return collateBookVerses( *verseLists, collateOptionsDict )
+# end of BibleCollate.collateBookInWorker
+
+
+
+class BibleCollation:
+    """
+    One collation of the given books of two Bibles,
+        with each book collated by a worker process if possible.
+
+    All the book jobs are submitted straight away,
+        but the results are given back in the original book order.
+    """
+    def __init__( self, internalBible1, internalBible2, bookList:List[str], collateOptionsDict:dict ) -> None:
+        """
+        Start the collation.
+
+        collateOptionsDict contains 'findText1', 'findText2', 'caselessFlag', 'ignoreDiacriticsFlag',
+            'includeIntroFlag', 'includeExtrasFlag', and 'markersMatchFlag'.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleCollation.__init__( {internalBible1.getAName()}, {internalBible2.getAName()}, {bookList}, … )" )
+        self.internalBible1, self.internalBible2 = internalBible1, internalBible2
+        self.bookList, self.collateOptionsDict = bookList, collateOptionsDict
+
+        self.futures = {}
+        pool = getSearchPool() if canSearchInParallel( internalBible1 ) and canSearchInParallel( internalBible2 ) else None
+        if pool is not None:
+            for BBB in bookList:
+                bookParameters1 = getWorkerBookParameters( internalBible1, BBB )
+                bookParameters2 = getWorkerBookParameters( internalBible2, BBB )
+                if bookParameters1 is not None and bookParameters2 is not None:
+                    self.futures[BBB] = pool.submit( collateBookInWorker, (bookParameters1,bookParameters2,collateOptionsDict) )
+    # end of BibleCollation.__init__
+
+
+    def _collateBookLocally( self, BBB:str ) -> List[tuple]:
+        """
+        Collate one book in this process (loading the books first if necessary).
+        """
+        verseLists = []
+        for internalBible in ( self.internalBible1, self.internalBible2 ):
+            internalBible.loadBookIfNecessary( BBB )
+            verseLists.append( getBookVerses( internalBible.books[BBB], self.collateOptionsDict ) if BBB in internalBible.books else [] )
+        return collateBookVerses( *verseLists, self.collateOptionsDict )
+    # end of BibleCollation._collateBookLocally
+
+
+    def collateBooks( self, waitFlag:bool=False ):
+        """
+        This is a generator which yields a 2-tuple for each book collated:
+            BBB, and the list of differences from collateBookVerses
+        or (unless waitFlag is set) None if we're still waiting for the next book from a worker process
+            (so that the caller can do something else rather than blocking).
+
+        Closing the generator cancels any book jobs that haven't been started.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BibleCollation.collateBooks()" )
+        try:
+            for BBB in self.bookList:
+                future = self.futures.pop( BBB, None )
+                if future is None:
+                    yield BBB, self._collateBookLocally( BBB )
+                    continue
+                while not waitFlag and not future.done(): yield None
+                try: differenceList = future.result()
+                except Exception as err: # e.g., the worker couldn't load the book, or a worker died
+                    logging.warning( f"BibleCollation: {BBB} collation in worker process failed ({err!r}) -- collating here instead" )
+                    differenceList = self._collateBookLocally( BBB )
+                yield BBB, differenceList
+        finally: self.cancel()
+    # end of BibleCollation.collateBooks
+
+
+    def cancel( self ) -> None:
+        """
+        Cancel any book jobs that haven't been started yet.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BibleCollation.cancel()" )
+        for future in self.futures.values(): future.cancel()
+        self.futures = {}
+    # end of BibleCollation.cancel
+# end of class BibleCollation
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    from Biblelator.Helpers.ParallelBibleSearch import shutdownSearchPool
+    testFolder1 = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest1/' )
+    testFolder2 = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest2/' )
+    if not os.path.isdir( testFolder1 ) or not os.path.isdir( testFolder2 ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Can't find test folders {testFolder1} and {testFolder2}" ); return
+    collateOptionsDict = { 'findText1':'God', 'findText2':'God', 'caselessFlag':True, 'ignoreDiacriticsFlag':False,
+                            'includeIntroFlag':False, 'includeExtrasFlag':False, 'markersMatchFlag':False }
+    uB1, uB2 = USFMBible( testFolder1 ), USFMBible( testFolder2 )
+    for internalBible in ( uB1, uB2 ): internalBible.preload()
+    bookList = [BBB for BBB,_filename in uB1.maximumPossibleFilenameTuples if BBB in uB2.possibleFilenameDict]
+    for BBB, differenceList in BibleCollation( uB1, uB2, bookList, collateOptionsDict ).collateBooks( waitFlag=True ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {BBB}: {len(differenceList):,} differences" )
+        for C, V, differenceType, verseText1, verseText2 in differenceList[:3]:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    {C}:{V} {differenceType} {verseText1[:30]!r} {verseText2[:30]!r}" )
+    shutdownSearchPool()
+# end of BibleCollate.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of BibleCollate.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BibleCollate.py
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BibleReplace.py
+#
+# Batched find-and-replace in Bible book files
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Find-and-replace in the book files of a USFM (or Paratext) Bible in two steps:
+
+    1/ find all the replacements that could be made in the selected books
+        (in one pass through each book file, without changing anything)
+        so that the user can look through them all (and untick any unwanted ones),
+    2/ then make the accepted replacements with a single write of each book file.
+
+This uses the same options and matching rules as findReplaceText in BibleOrgSys,
+    but without asking the user to confirm each replacement as it goes.
+
+A replacement candidate is a 9-tuple:
+    BBB, C, V, startIndex, endIndex, foundText, replacementText, contextBefore, contextAfter
+where the indexes are into the book text (as read from the file).
+
+    findReplaceCandidates( internalBible, optionsDict )
+    applyReplacements( internalBible, candidateList, bookFiles, doBackups=True )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple
+import os
+import sys
+import logging
+import re
+import tempfile
+from bisect import bisect_right
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator import BiblelatorGlobals
+from Biblelator.Helpers.BibleSearchIndex import USFM_CV_MARKER_RE
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "BibleReplace"
+PROGRAM_NAME = "Biblelator Bible Replace"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+
+def findReplaceCandidates( internalBible, optionsDict:dict ) -> Tuple[dict,dict,List[tuple]]:
+    """
+    Search the Bible book files for the find text (or regex) given in the dictionary of options,
+        and work out what each replacement would be.
+    Nothing is changed on disk.
+
+    Like findReplaceText in BibleOrgSys, missing options are defaulted,
+        and the find and replace history lists are updated.
+
+    Returns the optionsDict, a resultSummaryDict, and the list of replacement candidates.
+        The resultSummaryDict includes 'bookFiles' with the (filepath,size,mtime) of each book file read
+            so that applyReplacements can check that they haven't changed since.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"findReplaceCandidates( {internalBible}, {optionsDict} )" )
+
+    if 'findHistoryList' not in optionsDict: optionsDict['findHistoryList'] = [] # Oldest first
+    if 'replaceHistoryList' not in optionsDict: optionsDict['replaceHistoryList'] = [] # Oldest first
+    if 'wordMode' not in optionsDict: optionsDict['wordMode'] = 'Any' # or 'Whole' or 'EndsWord' or 'Begins' or 'EndsLine'
+    if 'contextLength' not in optionsDict: optionsDict['contextLength'] = 60 # each side
+    if 'bookList' not in optionsDict: optionsDict['bookList'] = 'ALL' # or BBB or a list
+    if 'doBackups' not in optionsDict: optionsDict['doBackups'] = True
+    optionsDict['regexFlag'] = False
+
+    resultSummaryDict = { 'numFinds':0, 'searchedBookList':[], 'foundBookList':[], 'bookFiles':{}, 'hadRegexError':False }
+    candidateList:List[tuple] = []
+
+    ourFindText, ourReplaceText = optionsDict['findText'], optionsDict['replaceText']
+    # Save the search history (with the 'regex:' text still prefixed if applicable)
+    for historyList,historyText in ( (optionsDict['findHistoryList'],ourFindText), (optionsDict['replaceHistoryList'],ourReplaceText) ):
+        try: historyList.remove( historyText )
+        except ValueError: pass
+        historyList.append( historyText ) # Make sure it goes on the end
+
+    if ourFindText.lower().startswith( 'regex:' ):
+        optionsDict['regexFlag'] = True
+        try: compiledFindText = re.compile( ourFindText[6:] )
+        except re.error as err:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Search/Replace regex error: {err}" )
+            resultSummaryDict['hadRegexError'] = True
+            return optionsDict, resultSummaryDict, candidateList
+    elif not ourFindText: return optionsDict, resultSummaryDict, candidateList
+    else: compiledFindText = None
+
+    requestedBooks = optionsDict['bookList']
+    if isinstance( requestedBooks, str ) and requestedBooks != 'ALL': requestedBooks = [requestedBooks]
+    wordMode, contextLength = optionsDict['wordMode'], optionsDict['contextLength']
+
+    if getattr( internalBible, 'preloadDone', True ) is False: internalBible.preload()
+    encoding = getattr( internalBible, 'encoding', None ) or 'utf-8'
+    if not getattr( internalBible, 'maximumPossibleFilenameTuples', None ):
+        logging.critical( _("No book files to search/replace in {}!").format( getattr( internalBible, 'sourceFolder', None ) ) )
+        return optionsDict, resultSummaryDict, candidateList
+
+    for BBB,filename in internalBible.maximumPossibleFilenameTuples:
+        if requestedBooks and requestedBooks != 'ALL' and BBB not in requestedBooks: continue
+        bookFilepath = os.path.join( internalBible.sourceFolder, filename )
+        try:
+            fileStat = os.stat( bookFilepath )
+            with open( bookFilepath, 'rt', encoding=encoding ) as bookFile:
+                bookText = bookFile.read()
+        except (OSError,UnicodeError) as err:
+            logging.error( f"findReplaceCandidates: Unable to read {BBB} file {bookFilepath}: {err}" )
+            continue
+        resultSummaryDict['searchedBookList'].append( BBB )
+        resultSummaryDict['bookFiles'][BBB] = bookFilepath, fileStat.st_size, fileStat.st_mtime_ns
+
+        # Find where each chapter and verse starts so we can give references for the finds
+        CVStartIndexes, CVList = [0], [('-1','0')]
+        C = '-1'
+        for match in USFM_CV_MARKER_RE.finditer( bookText ):
+            if match.group(1) == 'c': C, V = match.group(2), '0'
+            else: V = match.group(2)
+            CVStartIndexes.append( match.start() )
+            CVList.append( (C,V) )
+
+        def addCandidate( ix:int, ixAfter:int, replacementText:str ) -> None:
+            """
+            Add a replacement candidate for bookText[ix:ixAfter] to the list.
+            """
+            resultSummaryDict['numFinds'] += 1
+            if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+            C, V = CVList[bisect_right( CVStartIndexes, ix ) - 1]
+            if contextLength: # Find the context in the original string
+                contextBefore = bookText[max(0,ix-contextLength):ix]
+                contextAfter = bookText[ixAfter:ixAfter+contextLength]
+            else: contextBefore = contextAfter = ''
+            candidateList.append( (BBB, C, V, ix, ixAfter, bookText[ix:ixAfter], replacementText, contextBefore, contextAfter) )
+        # end of addCandidate
+
+        if compiledFindText is not None: # ignores wordMode flag
+            for match in compiledFindText.finditer( bookText ):
+                if match.end() == match.start(): continue # Don't want to replace empty matches
+                try: replacementText = match.expand( ourReplaceText )
+                except (re.error,IndexError) as err:
+                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Search/Replace regex error: {err}" )
+                    resultSummaryDict['hadRegexError'] = True
+                    return optionsDict, resultSummaryDict, []
+                addCandidate( match.start(), match.end(), replacementText )
+        else: # not regex
+            searchLen, bookLen = len(ourFindText), len(bookText)
+            ix = 0
+            while True:
+                ix = bookText.find( ourFindText, ix )
+                if ix == -1: break # none / no more found
+                ixAfter = ix + searchLen
+                if wordMode in ('Whole','Begins') and ix>0 and bookText[ix-1].isalpha(): ix+=1; continue
+                if wordMode in ('Whole','EndsWord') and ixAfter<bookLen and bookText[ixAfter].isalpha(): ix+=1; continue
+                if wordMode == 'EndsLine' and ixAfter<bookLen: ix+=1; continue
+                addCandidate( ix, ixAfter, ourReplaceText )
+                ix = ixAfter # Start searching after this find (as if it was replaced)
+
+    return optionsDict, resultSummaryDict, candidateList
+# end of BibleReplace.findReplaceCandidates
+
+
+def applyReplacements( internalBible, candidateList:List[tuple], bookFiles:Dict[str,tuple], doBackups:bool=True ) -> dict:
+    """
+    Make the given replacements (from findReplaceCandidates) in the book files,
+        writing each changed book file only once.
+
+    Any book file that has changed since it was searched is left untouched
+        (and listed in 'changedBookList').
+
+    If the text files are loaded into the Bible object,
+        the changed books are marked as needing to be reloaded
+        (and any of their verses in the shared verse cache are dropped).
+
+    Returns a resultSummaryDict.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"applyReplacements( {internalBible}, {len(candidateList)}, {list(bookFiles)}, {doBackups} )" )
+    resultSummaryDict = { 'numReplaces':0, 'replacedBookList':[], 'changedBookList':[] }
+
+    encoding = getattr( internalBible, 'encoding', None ) or 'utf-8'
+    bookCandidates:Dict[str,List[tuple]] = {}
+    for candidate in candidateList: bookCandidates.setdefault( candidate[0], [] ).append( candidate )
+
+    for BBB,candidates in bookCandidates.items():
+        bookFilepath, fileSize, fileMTime = bookFiles[BBB]
+        try:
+            fileStat = os.stat( bookFilepath )
+            if (fileStat.st_size,fileStat.st_mtime_ns) != (fileSize,fileMTime): raise FileExistsError
+            with open( bookFilepath, 'rt', encoding=encoding ) as bookFile:
+                bookText = bookFile.read()
+        except (OSError,UnicodeError) as err: # including FileExistsError
+            logging.error( f"applyReplacements: {BBB} file {bookFilepath} has changed since it was searched: {err!r}" )
+            resultSummaryDict['changedBookList'].append( BBB )
+            continue
+
+        # Build the new text from the pieces (rather than repeatedly copying the whole book)
+        newTextPieces, lastIndex = [], 0
+        for _BBB, _C, _V, ix, ixAfter, foundText, replacementText, _contextBefore, _contextAfter in sorted( candidates, key=lambda c: c[3] ):
+            assert bookText[ix:ixAfter] == foundText
+            if ix < lastIndex: continue # Overlaps the last replacement
+            newTextPieces.append( bookText[lastIndex:ix] )
+            newTextPieces.append( replacementText )
+            lastIndex = ixAfter
+            resultSummaryDict['numReplaces'] += 1
+        newTextPieces.append( bookText[lastIndex:] )
+
+        if doBackups:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"Making backup copy of {BBB} file: {bookFilepath}…" )
+            BibleOrgSysGlobals.backupAnyExistingFile( bookFilepath, numBackups=5 )
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"Saving {bookFilepath} with {encoding} encoding" )
+        with open( bookFilepath, 'wt', encoding=encoding, newline='\r\n' ) as bookFile:
+            bookFile.write( ''.join( newTextPieces ) )
+        resultSummaryDict['replacedBookList'].append( BBB )
+        try: internalBible.bookNeedsReloading[BBB] = True
+        except AttributeError: pass
+        if BiblelatorGlobals.theApp is not None:
+            verseCache = BiblelatorGlobals.theApp.verseCache
+            verseCache.removeBook( verseCache.makeResourceID( internalBible ), BBB )
+
+    return resultSummaryDict
+# end of BibleReplace.applyReplacements
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    from types import SimpleNamespace
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    from Biblelator.Helpers.BibleSearchIndex import DEMO_USFM_TEXT
+    with tempfile.TemporaryDirectory() as tempFolderpath:
+        with open( os.path.join( tempFolderpath, 'TST.SFM' ), 'wt', encoding='utf-8' ) as demoFile:
+            demoFile.write( DEMO_USFM_TEXT * 200 )
+        demoBible = SimpleNamespace( sourceFolder=tempFolderpath, encoding='utf-8', bookNeedsReloading={},
+                                    maximumPossibleFilenameTuples=[('TST','TST.SFM')] )
+        for findText, replaceText in ( ('God','Elohim'), ('regex:the (heavens|earth)',r'the \1 (!)'), ('light','lite') ):
+            optionsDict = { 'findText':findText, 'replaceText':replaceText, 'wordMode':'Whole', 'contextLength':20 }
+            optionsDict, resultSummaryDict, candidateList = findReplaceCandidates( demoBible, optionsDict )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {findText!r}: found {resultSummaryDict['numFinds']:,} e.g., {candidateList[:1]}" )
+            acceptedList = candidateList[::2] # Pretend that they didn't want every second one
+            resultSummaryDict = applyReplacements( demoBible, acceptedList, resultSummaryDict['bookFiles'], doBackups=False )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Made {resultSummaryDict['numReplaces']:,} replacements in {resultSummaryDict['replacedBookList']}" )
+# end of BibleReplace.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of BibleReplace.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BibleReplace.py
@@ -0,0 +1,660 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BibleSearchIndex.py
+#
+# A persistent word index to speed up Bible find
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+An on-disk inverted index of the words in each book of a Bible
+    that was loaded from USFM (or Paratext) files.
+
+For each book, we keep a list of the verses (as 'C:V' strings),
+    and postings (arrays of verse indexes) for each word,
+    both as written (NFC normalised) and case-folded.
+The index for each book is kept in a cache file in the project folder
+    and is only rebuilt when the size or modification time of the book file changes.
+
+The index is only used as a filter: it finds the books and verses
+    that could possibly contain the search text,
+    and then the normal (BibleOrgSys) findText is run on only those verses
+    (see ParallelBibleSearch) to find (and format) the actual matches.
+So the index never needs to reproduce the exact findText rules,
+    it only needs to never miss a possible match.
+
+For regular expressions, we extract the literal strings that any match must contain,
+    (rather like trigram indexing does), and filter on those.
+
+Partial words at the start or end of the search text are looked up
+    in sorted lists of the words (and of the reversed words) using binary searches,
+    and a word that could be anywhere inside the indexed words is looked up using a trigram table,
+    so the lookups don't have to scan the whole vocabulary.
+
+    normaliseSearchText( text, caselessFlag )
+    getTrigrams( word )
+    indexUSFMText( USFMText )
+    indexBookFile( filepath, encoding )
+    indexBookFileHelper( parameters )
+    getRequiredRegexLiterals( regexPattern )
+
+    class BibleSearchIndex
+        __init__( self, internalBible )
+        loadBookIndex( self, BBB, fileStamp )
+        saveBookIndex( self, BBB )
+        refresh( self )
+        _addBookToVocabularies( self, BBB )
+        _removeBookFromVocabularies( self, BBB )
+        _getSortedWords( self, caselessFlag, reversedFlag )
+        findMatchingWords( self, word, caselessFlag, startsPartial, endsPartial )
+        getCandidateVerses( self, literals, caselessFlag )
+        getCandidateBookVerses( self, optionsDict )
+
+    getBibleSearchIndex( internalBible )
+
+    checkIndexCandidates( USFMText, numTrials=1000, seed=1 )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, List, Set, Tuple, Optional
+from bisect import bisect_left
+import os
+import sys
+import logging
+import multiprocessing
+import pickle
+import random
+import re
+import time
+import unicodedata
+from array import array
+from collections import defaultdict
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.BiblelatorGlobals import DATA_SUBFOLDER_NAME
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "BibleSearchIndex"
+PROGRAM_NAME = "Biblelator Bible Search Index"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+SEARCH_INDEX_CACHE_SUBFOLDER_NAME = 'Cache/SearchIndex/'
+SEARCH_INDEX_CACHE_VERSION = 1 # Increment this if indexUSFMText changes how it indexes
+
+USFM_CV_MARKER_RE = re.compile( r'\\([cv])\s+([^\s\\]+)' )
+USFM_MARKER_RE = re.compile( r'\\\+?[A-Za-z0-9]+(?:\*|\s?)|//' ) # Includes the space after an opening marker
+USFM_NOTE_RE = re.compile( r'\\(f|fe|x|ef|ex)\s.*?\\\1\*', re.DOTALL )
+WORD_RE = re.compile( r'\w+' )
+PREFIX_END_CHAR = '\U0010FFFF' # Sorts after any character that we expect to find in a word
+
+
+
+def normaliseSearchText( text:str, caselessFlag:bool ) -> str:
+    """
+    Normalise the text in the same way for indexing and for searching.
+    """
+    text = unicodedata.normalize( 'NFC', text )
+    return text.casefold() if caselessFlag else text
+# end of BibleSearchIndex.normaliseSearchText
+
+
+def getTrigrams( word:str ) -> List[str]:
+    """
+    Returns a list of the (three-character) trigrams in the word,
+        or the word itself if it's shorter than that.
+    """
+    return [word[ix:ix+3] for ix in range( len(word)-2 )] if len(word) >= 3 else [word]
+# end of BibleSearchIndex.getTrigrams
+
+
+def indexUSFMText( USFMText:str ) -> Tuple[List[str],Dict[str,array],Dict[str,array]]:
+    """
+    Find all the words in each verse of the USFM text.
+
+    The text is split at each chapter and verse marker (which is where the processed lines are split),
+        and the verse and chapter numbers themselves are included in the text of their verse.
+    Because markers might be removed from the text with or without leaving a space,
+        (and notes might be removed completely), we index the words found each way.
+
+    Returns a 3-tuple with the list of 'C:V' strings,
+        and dictionaries of verse index arrays for each word as written, and case-folded.
+    """
+    verseList:List[str] = []
+    wordPostings, caselessPostings = defaultdict( list ), defaultdict( list )
+
+    def indexVerse( C:str, V:str, verseText:str ) -> None:
+        """
+        Add the words for one verse into the postings.
+        """
+        words, caselessWords = set(), set()
+        for strippedText in ( USFM_MARKER_RE.sub( ' ', verseText ),
+                              USFM_MARKER_RE.sub( '', verseText ),
+                              USFM_MARKER_RE.sub( '', USFM_NOTE_RE.sub( '', verseText ) ) ):
+            words.update( WORD_RE.findall( normaliseSearchText( strippedText, False ) ) )
+            caselessWords.update( WORD_RE.findall( normaliseSearchText( strippedText, True ) ) )
+        if not words: return
+        verseIndex = len( verseList )
+        verseList.append( f'{C}:{V}' )
+        for word in words: wordPostings[word].append( verseIndex )
+        for word in caselessWords: caselessPostings[word].append( verseIndex )
+    # end of indexVerse
+
+    C, V, startIndex = '-1', '0', 0 # Introduction
+    for match in USFM_CV_MARKER_RE.finditer( USFMText ):
+        indexVerse( C, V, USFMText[startIndex:match.start()] )
+        if match.group(1) == 'c': C, V = match.group(2), '0'
+        else: V = match.group(2)
+        startIndex = match.start() # The chapter or verse number is part of the new verse
+    indexVerse( C, V, USFMText[startIndex:] )
+
+    return verseList, { word:array( 'I', indexes ) for word,indexes in wordPostings.items() }, \
+                    { word:array( 'I', indexes ) for word,indexes in caselessPostings.items() }
+# end of BibleSearchIndex.indexUSFMText
+
+
+def indexBookFile( filepath:str, encoding:str ):
+    """
+    Index the USFM book file.
+
+    Returns the 3-tuple from indexUSFMText, or None if the file couldn't be read.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"indexBookFile( {filepath}, {encoding} )" )
+    try:
+        with open( filepath, 'rt', encoding=encoding ) as bookFile:
+            return indexUSFMText( bookFile.read() )
+    except (OSError, UnicodeDecodeError) as err:
+        logging.error( f"indexBookFile: Unable to index {filepath}: {err}" )
+# end of BibleSearchIndex.indexBookFile
+
+
+def indexBookFileHelper( parameters ):
+    """
+    Parameter parameters is a 2-tuple containing the filepath and encoding
+        (because we can only pass a single parameter to map).
+    """
+    return indexBookFile( *parameters )
+# end of BibleSearchIndex.indexBookFileHelper
+
+
+def getRequiredRegexLiterals( regexPattern:str ) -> Optional[List[str]]:
+    """
+    Find the literal strings that any match of the regular expression must contain.
+
+    This is deliberately simple: anything inside groups or character classes,
+        and any character followed by an optional quantifier, is just skipped
+        (which only means that we find more candidates than necessary).
+
+    Returns None if we can't tell anything, e.g., if there are alternatives or inline flags.
+    """
+    if '|' in regexPattern or '(?' in regexPattern: return None
+
+    literals, currentLiteral, groupDepth = [], '', 0
+    def endLiteral() -> None:
+        nonlocal currentLiteral
+        if currentLiteral: literals.append( currentLiteral )
+        currentLiteral = ''
+    # end of endLiteral
+
+    ix = 0
+    while ix < len(regexPattern):
+        char = regexPattern[ix]
+        if char == '\\':
+            nextChar = regexPattern[ix+1:ix+2]
+            ix += 2
+            if not nextChar or nextChar.isalnum(): # \w, \b, \d, back-references, etc.
+                endLiteral(); continue
+            char = nextChar # an escaped punctuation character
+        elif char == '[': # Skip the character class
+            endLiteral()
+            ix += 1
+            if regexPattern[ix:ix+1] == '^': ix += 1
+            if regexPattern[ix:ix+1] == ']': ix += 1 # A literal ] at the start of the class
+            while ix < len(regexPattern) and regexPattern[ix] != ']':
+                ix += 2 if regexPattern[ix] == '\\' else 1
+            ix += 1
+            continue
+        elif char in '*?{': # The previous character (or group, etc.) is optional
+            currentLiteral = currentLiteral[:-1]
+            endLiteral()
+            if char == '{':
+                closeIndex = regexPattern.find( '}', ix )
+                ix = ix+1 if closeIndex == -1 else closeIndex+1
+            else: ix += 1
+            continue
+        elif char in '+.^$()':
+            endLiteral()
+            if char == '(': groupDepth += 1
+            elif char == ')': groupDepth -= 1
+            ix += 1
+            continue
+        else: ix += 1
+        if groupDepth == 0: currentLiteral += char
+        else: endLiteral()
+    endLiteral()
+    return literals
+# end of BibleSearchIndex.getRequiredRegexLiterals
+
+
+
+class BibleSearchIndex:
+    """
+    The word index for a Bible that was loaded from (USFM) book files.
+
+    Each book entry in self.bookIndexes is a 6-tuple:
+        filepath, fileSize, fileModifiedTime, verseList, wordPostings, caselessPostings
+    """
+    def __init__( self, internalBible ) -> None:
+        """
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleSearchIndex.__init__( {internalBible} )" )
+        self.internalBible = internalBible
+        self.indexFolderpath = os.path.join( internalBible.sourceFolder, DATA_SUBFOLDER_NAME, SEARCH_INDEX_CACHE_SUBFOLDER_NAME )
+        self.bookIndexes:Dict[str,tuple] = {}
+        self.vocabularies:Dict[bool,Dict[str,Set[str]]] = { False:defaultdict( set ), True:defaultdict( set ) } # Keyed by caselessFlag
+        self.trigramWords:Dict[bool,Dict[str,Set[str]]] = { False:defaultdict( set ), True:defaultdict( set ) } # Short words are kept whole
+        self.sortedWords:Dict[tuple,Optional[List[str]]] = {} # Keyed by (caselessFlag,reversedFlag) -- made when needed
+    # end of BibleSearchIndex.__init__
+
+
+    def loadBookIndex( self, BBB:str, fileStamp:tuple ) -> bool:
+        """
+        Try to load the index for the book from its cache file.
+
+        Returns True if it was loaded and still matches the book file.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleSearchIndex.loadBookIndex( {BBB}, {fileStamp} )" )
+        cacheFilepath = os.path.join( self.indexFolderpath, f'{BBB}.pickle' )
+        try:
+            with open( cacheFilepath, 'rb' ) as cacheFile:
+                cacheVersion, bookIndex = pickle.load( cacheFile )
+        except FileNotFoundError: return False
+        except Exception as err: # Could be a truncated or out-of-date pickle file
+            logging.warning( f"BibleSearchIndex.loadBookIndex: Ignoring unreadable cache file {cacheFilepath}: {err}" )
+            return False
+        if cacheVersion != SEARCH_INDEX_CACHE_VERSION or bookIndex[:3] != fileStamp: return False
+        self.bookIndexes[BBB] = bookIndex
+        return True
+    # end of BibleSearchIndex.loadBookIndex
+
+
+    def saveBookIndex( self, BBB:str ) -> None:
+        """
+        Save the index for the book into its cache file.
+
+        The file is written under a temporary name and then renamed
+            so that we never leave a partly-written cache file behind.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleSearchIndex.saveBookIndex( {BBB} )" )
+        cacheFilepath = os.path.join( self.indexFolderpath, f'{BBB}.pickle' )
+        try:
+            os.makedirs( self.indexFolderpath, exist_ok=True )
+            tempFilepath = cacheFilepath + '.tmp'
+            with open( tempFilepath, 'wb' ) as cacheFile:
+                pickle.dump( (SEARCH_INDEX_CACHE_VERSION,self.bookIndexes[BBB]), cacheFile, pickle.HIGHEST_PROTOCOL )
+            os.replace( tempFilepath, cacheFilepath )
+        except OSError as err: # e.g., read-only project folder -- we can still continue without the cache
+            logging.warning( f"BibleSearchIndex.saveBookIndex: Unable to save cache file {cacheFilepath}: {err}" )
+    # end of BibleSearchIndex.saveBookIndex
+
+
+    def refresh( self ) -> int:
+        """
+        Make sure that the index is up-to-date with the book files.
+
+        Only the new or changed books are loaded from the cache files or reindexed
+            (using multiprocessing if allowed).
+
+        Returns the number of books that had to be reindexed.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BibleSearchIndex.refresh()" )
+        encoding = getattr( self.internalBible, 'encoding', None ) or 'utf-8'
+
+        fileStamps, booksToIndex = {}, []
+        for BBB,filename in self.internalBible.maximumPossibleFilenameTuples:
+            filepath = os.path.join( self.internalBible.sourceFolder, filename )
+            try: fileStat = os.stat( filepath )
+            except OSError: continue # findText will just search the loaded book (if any)
+            fileStamps[BBB] = filepath, fileStat.st_size, fileStat.st_mtime_ns
+            if BBB in self.bookIndexes:
+                if self.bookIndexes[BBB][:3] == fileStamps[BBB]: continue
+                self._removeBookFromVocabularies( BBB )
+                del self.bookIndexes[BBB]
+            if self.loadBookIndex( BBB, fileStamps[BBB] ): self._addBookToVocabularies( BBB )
+            else: booksToIndex.append( BBB )
+        for BBB in [BBB for BBB in self.bookIndexes if BBB not in fileStamps]: # Books that have gone
+            self._removeBookFromVocabularies( BBB )
+            del self.bookIndexes[BBB]
+
+        if booksToIndex:
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"BibleSearchIndex: indexing {len(booksToIndex)} books…" )
+            parameters = [(fileStamps[BBB][0],encoding) for BBB in booksToIndex] # Can only pass a single parameter to map
+            if BibleOrgSysGlobals.maxProcesses > 1 and len(booksToIndex) > 1 \
+            and not BibleOrgSysGlobals.alreadyMultiprocessing: # Index all the books as quickly as possible
+                BibleOrgSysGlobals.alreadyMultiprocessing = True
+                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
+                    results = pool.map( indexBookFileHelper, parameters ) # have the pool do our indexing
+                BibleOrgSysGlobals.alreadyMultiprocessing = False
+            else: # Just single threaded
+                results = [indexBookFileHelper( parameter ) for parameter in parameters]
+            assert len(results) == len(booksToIndex)
+            for BBB,result in zip( booksToIndex, results ):
+                if result is None: continue # Couldn't read it -- findText will just search the loaded book (if any)
+                self.bookIndexes[BBB] = fileStamps[BBB] + result
+                self._addBookToVocabularies( BBB )
+                self.saveBookIndex( BBB )
+        return len(booksToIndex)
+    # end of BibleSearchIndex.refresh
+
+
+    def _addBookToVocabularies( self, BBB:str ) -> None:
+        """
+        Add the words of the (just loaded or indexed) book into our vocabularies.
+        """
+        for caselessFlag in (False, True):
+            vocabulary, trigramWords = self.vocabularies[caselessFlag], self.trigramWords[caselessFlag]
+            for word in self.bookIndexes[BBB][5 if caselessFlag else 4]:
+                if word not in vocabulary: # A new word
+                    for trigram in getTrigrams( word ): trigramWords[trigram].add( word )
+                vocabulary[word].add( BBB )
+        self.sortedWords.clear() # They'll need to be remade
+    # end of BibleSearchIndex._addBookToVocabularies
+
+
+    def _removeBookFromVocabularies( self, BBB:str ) -> None:
+        """
+        Remove the words of the (about to be replaced) book from our vocabularies.
+        """
+        for caselessFlag in (False, True):
+            vocabulary, trigramWords = self.vocabularies[caselessFlag], self.trigramWords[caselessFlag]
+            for word in self.bookIndexes[BBB][5 if caselessFlag else 4]:
+                bookSet = vocabulary[word]
+                bookSet.discard( BBB )
+                if not bookSet: # That word has gone
+                    del vocabulary[word]
+                    for trigram in getTrigrams( word ):
+                        trigramWords[trigram].discard( word )
+                        if not trigramWords[trigram]: del trigramWords[trigram]
+        self.sortedWords.clear() # They'll need to be remade
+    # end of BibleSearchIndex._removeBookFromVocabularies
+
+
+    def _getSortedWords( self, caselessFlag:bool, reversedFlag:bool ) -> List[str]:
+        """
+        Get the sorted list of the words (or of the reversed words) in the vocabulary,
+            making it if the vocabulary has changed since last time.
+        """
+        try: return self.sortedWords[(caselessFlag,reversedFlag)]
+        except KeyError:
+            vocabulary = self.vocabularies[caselessFlag]
+            sortedWords = sorted( word[::-1] for word in vocabulary ) if reversedFlag else sorted( vocabulary )
+            self.sortedWords[(caselessFlag,reversedFlag)] = sortedWords
+            return sortedWords
+    # end of BibleSearchIndex._getSortedWords
+
+
+    def findMatchingWords( self, word:str, caselessFlag:bool, startsPartial:bool, endsPartial:bool ) -> List[str]:
+        """
+        Find the indexed words which could contain the (normalised) word from the search text.
+
+        If the word might only be the end of an indexed word (startsPartial),
+            or the start of one (endsPartial), or both (i.e., anywhere inside),
+            the indexed words are found with binary searches or the trigram table.
+        """
+        vocabulary = self.vocabularies[caselessFlag]
+        if startsPartial and endsPartial: # The word could be anywhere in the indexed word
+            trigramWords = self.trigramWords[caselessFlag]
+            if len(word) < 3: # Shorter than a trigram, but there's not many trigrams (or short words) to look through
+                return list( { iWord for trigram in trigramWords if word in trigram for iWord in trigramWords[trigram] } )
+            possibleWords = min( (trigramWords.get( trigram, set() ) for trigram in getTrigrams( word )), key=len )
+            return [iWord for iWord in possibleWords if word in iWord]
+        if startsPartial: word, reversedFlag = word[::-1], True # The word could be the end of an indexed word
+        elif endsPartial: reversedFlag = False # The word could be the start of an indexed word
+        else: return [word] if word in vocabulary else []
+        sortedWords = self._getSortedWords( caselessFlag, reversedFlag )
+        startIndex = bisect_left( sortedWords, word )
+        endIndex = bisect_left( sortedWords, word+PREFIX_END_CHAR, startIndex )
+        return [iWord[::-1] for iWord in sortedWords[startIndex:endIndex]] if reversedFlag else sortedWords[startIndex:endIndex]
+    # end of BibleSearchIndex.findMatchingWords
+
+
+    def getCandidateVerses( self, literals:List[str], caselessFlag:bool ) -> Optional[Dict[str,Set[str]]]:
+        """
+        Find the verses which contain all the words of all the literal strings.
+
+        The first and last words of each literal might only be part of a word in the text,
+            so they're matched against the end or the start of the indexed words,
+            (or anywhere in the word if the literal is a single partial word).
+
+        Returns a dictionary with BBB keys and sets of 'C:V' strings,
+            or None if the literals don't contain any words (so we can't tell anything).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleSearchIndex.getCandidateVerses( {literals}, {caselessFlag} )" )
+        vocabulary = self.vocabularies[caselessFlag]
+        postingsIndex = 5 if caselessFlag else 4
+
+        candidateVerses = None # Will be a dictionary with BBB keys and sets of verse indexes
+        for literal in literals:
+            literal = normaliseSearchText( literal, caselessFlag )
+            for match in WORD_RE.finditer( literal ):
+                word = match.group()
+                matchingWords = self.findMatchingWords( word, caselessFlag, match.start()==0, match.end()==len(literal) )
+
+                wordVerses = defaultdict( set )
+                for iWord in matchingWords:
+                    for BBB in vocabulary[iWord]:
+                        wordVerses[BBB].update( self.bookIndexes[BBB][postingsIndex][iWord] )
+                if candidateVerses is None: candidateVerses = wordVerses
+                else:
+                    candidateVerses = { BBB:verseIndexes & wordVerses[BBB] for BBB,verseIndexes in candidateVerses.items()
+                                                                        if BBB in wordVerses }
+                    candidateVerses = { BBB:verseIndexes for BBB,verseIndexes in candidateVerses.items() if verseIndexes }
+                if not candidateVerses: return {} # No need to look any further
+
+        if candidateVerses is None: return None
+        return { BBB:{ self.bookIndexes[BBB][3][verseIndex] for verseIndex in verseIndexes }
+                                            for BBB,verseIndexes in candidateVerses.items() }
+    # end of BibleSearchIndex.getCandidateVerses
+
+
+    def getCandidateBookVerses( self, optionsDict:dict ) -> Optional[Dict[str,Optional[Set[str]]]]:
+        """
+        Given a findText options dictionary,
+            find which verses of the requested books could contain matches.
+
+        Books which aren't indexed (e.g., ones without a file) but are loaded are always included
+            (with None instead of a set of verses, i.e., the whole book needs searching).
+
+        Returns a dictionary (in book order) with BBB keys and sets of 'C:V' strings (which might be empty),
+            or None if the index can't help with this search (so all requested books need searching).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BibleSearchIndex.getCandidateBookVerses( {optionsDict} )" )
+
+        findText = optionsDict.get( 'findText' )
+        if not findText \
+        or optionsDict.get( 'includeMarkerTextFlag' ) \
+        or optionsDict.get( 'ignoreDiacriticsFlag' ): # We don't know exactly how findText removes diacritics
+            return None
+        if findText.lower().startswith( 'regex:' ): # That's how findText is asked to use a regular expression
+            regexPattern = findText[6:]
+            try: re.compile( regexPattern )
+            except re.error: return None # Let findText report the error
+            literals = getRequiredRegexLiterals( regexPattern )
+            if not literals: return None
+        else: literals = [findText]
+
+        startTime = time.time()
+        self.refresh()
+        candidateVerses = self.getCandidateVerses( literals, optionsDict.get( 'caselessFlag', True ) )
+        if candidateVerses is None: return None
+
+        requestedBooks = optionsDict.get( 'bookList', 'ALL' )
+        if requestedBooks is None: requestedBooks = 'ALL'
+        elif isinstance( requestedBooks, str ) and requestedBooks != 'ALL': requestedBooks = [requestedBooks]
+        candidateBookVerses:Dict[str,Optional[Set[str]]] = {}
+        for BBB,_filename in self.internalBible.maximumPossibleFilenameTuples:
+            if (BBB in candidateVerses or BBB not in self.bookIndexes) \
+            and (requestedBooks == 'ALL' or BBB in requestedBooks) \
+            and BBB not in candidateBookVerses:
+                candidateBookVerses[BBB] = candidateVerses.get( BBB ) # None if the book isn't indexed
+        for BBB in getattr( self.internalBible, 'books', {} ): # Loaded books that we don't have files for
+            if BBB not in self.bookIndexes and BBB not in candidateBookVerses \
+            and (requestedBooks == 'ALL' or BBB in requestedBooks):
+                candidateBookVerses[BBB] = None
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"BibleSearchIndex: found {sum( len(CVs) for CVs in candidateBookVerses.values() if CVs ):,} candidate verses in {len(candidateBookVerses)} books for {findText!r} in {time.time()-startTime:.3f} seconds" )
+        return candidateBookVerses
+    # end of BibleSearchIndex.getCandidateBookVerses
+# end of class BibleSearchIndex
+
+
+
+def getBibleSearchIndex( internalBible ) -> Optional[BibleSearchIndex]:
+    """
+    Get the search index for the given Bible
+        (which is kept with the Bible object).
+
+    Returns None if the Bible wasn't loaded from book files.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getBibleSearchIndex( {internalBible} )" )
+    try: return internalBible._BiblelatorSearchIndex
+    except AttributeError: pass
+
+    if getattr( internalBible, 'preloadDone', True ) is False: internalBible.preload()
+    if not getattr( internalBible, 'sourceFolder', None ) \
+    or not getattr( internalBible, 'maximumPossibleFilenameTuples', None ):
+        return None
+    searchIndex = BibleSearchIndex( internalBible )
+    internalBible._BiblelatorSearchIndex = searchIndex
+    return searchIndex
+# end of BibleSearchIndex.getBibleSearchIndex
+
+
+
+def checkIndexCandidates( USFMText:str, numTrials:int=1000, seed:int=1 ) -> int:
+    """
+    Check that the index never misses a verse
+        by searching for random pieces of the (marker-stripped) text of random verses.
+
+    Returns the number of problems found.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"checkIndexCandidates( {len(USFMText)}, {numTrials}, {seed} )" )
+    verseList, wordPostings, caselessPostings = indexUSFMText( USFMText )
+    searchIndex = BibleSearchIndex.__new__( BibleSearchIndex )
+    searchIndex.bookIndexes = { 'TST': ('', 0, 0, verseList, wordPostings, caselessPostings) }
+    searchIndex.vocabularies = { False:defaultdict( set ), True:defaultdict( set ) }
+    searchIndex.trigramWords = { False:defaultdict( set ), True:defaultdict( set ) }
+    searchIndex.sortedWords = {}
+    searchIndex._addBookToVocabularies( 'TST' )
+
+    verseTexts = []
+    C, V, startIndex = '-1', '0', 0
+    for match in list( USFM_CV_MARKER_RE.finditer( USFMText ) ) + [None]:
+        verseText = USFMText[startIndex:match.start() if match else len(USFMText)]
+        verseTexts.append( (f'{C}:{V}', ' '.join( USFM_MARKER_RE.sub( ' ', USFM_NOTE_RE.sub( ' ', verseText ) ).split() )) )
+        if match:
+            if match.group(1) == 'c': C, V = match.group(2), '0'
+            else: V = match.group(2)
+            startIndex = match.start()
+
+    randomGenerator = random.Random( seed )
+    numProblems = 0
+    for _trial in range( numTrials ):
+        CV, verseText = randomGenerator.choice( verseTexts )
+        if not verseText: continue
+        startIndex = randomGenerator.randrange( len(verseText) )
+        findText = verseText[startIndex:startIndex+randomGenerator.randint( 1, 25 )]
+        caselessFlag = randomGenerator.random() < 0.5
+        if caselessFlag and randomGenerator.random() < 0.5: findText = findText.swapcase()
+        candidateVerses = searchIndex.getCandidateVerses( [findText], caselessFlag )
+        if candidateVerses is not None and CV not in candidateVerses.get( 'TST', () ):
+            logging.critical( f"checkIndexCandidates: Missed {CV} for {findText!r} (caseless={caselessFlag})" )
+            numProblems += 1
+    return numProblems
+# end of BibleSearchIndex.checkIndexCandidates
+
+
+DEMO_USFM_TEXT = """\\id TST Demonstration text
+\\h Test
+\\mt1 The Test Book
+\\c 1
+\\s1 The beginning
+\\p
+\\v 1 In the beginning God created the heavens and the earth.
+\\v 2 The earth was formless and empty.\\f + \\fr 1:2 \\ft Or \\fq waste and void\\f* Darkness was on the surface of the deep
+and God’s Spirit was hovering over the surface of the waters.
+\\p
+\\v 3 God said, “Let there be light,” and there was light.
+\\v 4 God saw the light, and saw that it was good. God divided the light from the darkness.
+\\c 2
+\\p
+\\v 1 The heavens, the earth, and all their vast array were fin\\add ish\\add*ed.
+\\v 2 On the seventh day God finished his work which he had done;
+\\q1 and he rested on the seventh day
+\\q2 from all his work which he had done.
+"""
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    verseList, wordPostings, _caselessPostings = indexUSFMText( DEMO_USFM_TEXT )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Indexed {len(wordPostings):,} words in {len(verseList)} verses: {verseList}" )
+    for regexPattern in ( 'the (heavens|earth)', r'God\b.{1,5}saw', r'seventh\s+day', '[Gg]od( said)?,' ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Regex {regexPattern!r} requires {getRequiredRegexLiterals( regexPattern )}" )
+    numProblems = checkIndexCandidates( DEMO_USFM_TEXT, numTrials=2000 )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Index candidate check found {numProblems} problems." )
+# end of BibleSearchIndex.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of BibleSearchIndex.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BibleSearchIndex.py
@@ -28,8 +28,9 @@
     calculateTotalVersesForBook( BBB, getNumChapters, getNumVerses )
     mapReferenceVerseKey( mainVerseKey )
     mapParallelVerseKey( forGroupCode, mainVerseKey )
+    verseDataHasSectionHeading( verseData )
     findCurrentSection( currentVerseKey, getNumChapters, getNumVerses, getVerseData )
-    logChangedFile( userName, loggingFolder, projectName, savedBBB, bookText )
+    logChangedFile( userName, loggingFolder, projectName, savedBBB, bookText, chapterVerseCounts=None )
     parseEnteredBooknameField( bookNameEntry, CEntry, VEntry, BBBfunction )
 
 TODO: Can some of these non-GUI functions be (made more general and) moved to the BOS?
@@ -54,6 +55,7 @@ if __name__ == '__main__':
     if aboveAboveFolderpath not in sys.path:
         sys.path.insert( 0, aboveAboveFolderpath )
 from Biblelator import BiblelatorGlobals
+from Biblelator.Helpers.BackgroundLogWriter import getLogWriter
 
 
 LAST_MODIFIED_DATE = '2020-05-10' # by RJH
@@ -295,6 +297,56 @@ def mapReferencesVerseKey( mainVerseKey ):
 
 
 
+def verseDataHasSectionHeading( verseData ) -> bool:
+    """
+    Given some verse data (a string or an InternalBibleEntryList with context)
+        returns True or False whether a section heading is found in it.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"verseDataHasSectionHeading( {verseData} )" )
+
+    if verseData is None: return False
+
+    elif isinstance( verseData, str ):
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  It's a string!" )
+        if '\\s ' in verseData or '\\s1' in verseData \
+        or '\\s2' in verseData or '\\s3' in verseData:
+            return True
+
+    elif isinstance( verseData, tuple ):
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  It's an InternalBibleEntryList!" )
+        assert len(verseData) == 2
+        verseDataList, context = verseData
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '   dataList', repr(verseDataList) )
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '    context', repr(context) )
+        for verseDataEntry in verseDataList:
+            if isinstance( verseDataEntry, InternalBibleEntry ):
+                marker, cleanText = verseDataEntry.getMarker(), verseDataEntry.getCleanText()
+            elif isinstance( verseDataEntry, tuple ):
+                marker, cleanText = verseDataEntry[0], verseDataEntry[3]
+            elif isinstance( verseDataEntry, str ):
+                if verseDataEntry=='': continue
+                verseDataEntry += '\n'
+                if verseDataEntry[0]=='\\':
+                    marker = ''
+                    for char in verseDataEntry[1:]:
+                        if char!='¬' and not char.isalnum(): break
+                        marker += char
+                    cleanText = verseDataEntry[len(marker)+1:].lstrip()
+                else:
+                    marker, cleanText = None, verseDataEntry
+            elif BibleOrgSysGlobals.debugFlag: halt
+            if marker in ( 's','s1','s2','s3','s4' ): return True
+
+    else:
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Ooops', repr(verseData) )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, verseData.__type__ )
+        halt # Programming error
+
+    return False
+# end of BiblelatorHelpers.verseDataHasSectionHeading
+
+
+
 def findCurrentSection( currentVerseKey, getNumChapters, getNumVerses, getVerseData ):
     """
     Given the current verseKey
@@ -310,55 +362,6 @@ def findCurrentSection( currentVerseKey, getNumChapters, getNumVerses, getVerseD
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "findCurrentSection( {}, … )".format( currentVerseKey.getShortText() ) )
 
-    def sectionFoundIn( verseData ):
-        """
-        Given some verse data (a string or an InternalBibleEntryList
-            returns True or False whether a section heading is found in it
-        """
-        fnPrint( DEBUGGING_THIS_MODULE, f"sectionFoundIn( {verseData} )" )
-
-        if verseData is None: return False
-
-        elif isinstance( verseData, str ):
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  It's a string!" )
-            if '\\s ' in thisVerseData or '\\s1' in thisVerseData \
-            or '\\s2' in thisVerseData or '\\s3' in thisVerseData:
-                return True
-
-        elif isinstance( verseData, tuple ):
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  It's an InternalBibleEntryList!" )
-            assert len(verseData) == 2
-            verseDataList, context = verseData
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '   dataList', repr(verseDataList) )
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '    context', repr(context) )
-            for verseDataEntry in verseDataList:
-                if isinstance( verseDataEntry, InternalBibleEntry ):
-                    marker, cleanText = verseDataEntry.getMarker(), verseDataEntry.getCleanText()
-                elif isinstance( verseDataEntry, tuple ):
-                    marker, cleanText = verseDataEntry[0], verseDataEntry[3]
-                elif isinstance( verseDataEntry, str ):
-                    if verseDataEntry=='': continue
-                    verseDataEntry += '\n'
-                    if verseDataEntry[0]=='\\':
-                        marker = ''
-                        for char in verseDataEntry[1:]:
-                            if char!='¬' and not char.isalnum(): break
-                            marker += char
-                        cleanText = verseDataEntry[len(marker)+1:].lstrip()
-                    else:
-                        marker, cleanText = None, verseDataEntry
-                elif BibleOrgSysGlobals.debugFlag: halt
-                if marker in ( 's','s1','s2','s3','s4' ): return True
-
-        else:
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'Ooops', repr(verseData) )
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, verseData.__type__ )
-            halt # Programming error
-
-        return False
-    # end of sectionFoundIn
-
-    # Start of main section of findCurrentSection
     BBB, C, V = currentVerseKey.getBCV()
     intC, intV = currentVerseKey.getChapterNumberInt(), currentVerseKey.getVerseNumberInt()
     #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'fCS at', BBB, C, intC, V, intV )
@@ -377,7 +380,7 @@ def findCurrentSection( currentVerseKey, getNumChapters, getNumVerses, getVerseD
             thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
             thisVerseData = getVerseData( thisVerseKey )
             if DEBUGGING_THIS_MODULE: ( ' ', thisC, thisV, repr(thisVerseData) )
-            if sectionFoundIn( thisVerseData ):
+            if verseDataHasSectionHeading( thisVerseData ):
                 found = thisC, thisV; break
         if found: break
     if not found: found = firstC, 0
@@ -396,7 +399,7 @@ def findCurrentSection( currentVerseKey, getNumChapters, getNumVerses, getVerseD
             thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
             thisVerseData = getVerseData( thisVerseKey )
             if DEBUGGING_THIS_MODULE: ( ' ', thisC, thisV, repr(thisVerseData) )
-            if sectionFoundIn( thisVerseData ):
+            if verseDataHasSectionHeading( thisVerseData ):
                 found = thisC, thisV; break
         if found: break
     if not found: found = lastC, numVerses
@@ -477,9 +480,14 @@ def getChangeLogFilepath( loggingFolder, projectName ):
 # end of BiblelatorHelpers.getChangeLogFilepath
 
 
-def logChangedFile( userName, loggingFolder, projectName, savedBBB, bookText ):
+def logChangedFile( userName, loggingFolder, projectName, savedBBB, bookText, chapterVerseCounts=None ):
     """
     Just logs some info about the recently changed book to a log file for the project.
+
+    chapterVerseCounts can be a 2-tuple with the numbers of chapters and verses
+        (if the caller already knows them) so that we don't have to count the markers in the text.
+
+    The line is written to the file later by the BackgroundLogWriter.
     """
     #if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "logChangedFile( {}, {!r}, {}, {} )".format( loggingFolder, projectName, savedBBB, len(bookText) ) )
@@ -490,11 +498,12 @@ def logChangedFile( userName, loggingFolder, projectName, savedBBB, bookText ):
     #try: logText = open( filepath, 'rt', encoding='utf-8' ).read()
     #except FileNotFoundError: logText = ''
 
+    if chapterVerseCounts is None: chapterVerseCounts = bookText.count( '\\c ' ), bookText.count( '\\v ' )
+    numChapters, numVerses = chapterVerseCounts
     logText = '{} {} {:,} characters ({} chapters, {:,} verses) saved by {}\n' \
                 .format( datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    savedBBB, len(bookText), bookText.count( '\\c ' ), bookText.count( '\\v ' ), userName )
-    with open( filepath, 'at', encoding='utf-8' ) as logFile: # Append puts the file pointer at the end of the file
-        logFile.write( logText )
+                    savedBBB, len(bookText), numChapters, numVerses, userName )
+    getLogWriter().write( filepath, logText )
 # end of BiblelatorHelpers.logChangedFile
 
 
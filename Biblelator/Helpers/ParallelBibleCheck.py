@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# ParallelBibleCheck.py
+#
+# Check the books of a Bible in parallel, caching the results for unchanged books
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Split a (BibleOrgSys) Bible check into one check per book
+    and run them on the same pool of worker processes as the parallel Bible search.
+
+The check results (and the discovery results) for each book are saved in cache files in the project folder
+    keyed by a hash of the book file contents
+    (and the check results also by the few Bible-wide discovery results that the book checks use).
+So when only one book has been edited, only that book has to be loaded and checked again
+    and the cached results for the other books are just put back into the Bible
+    ready for the usual makeErrorHTML report.
+
+    class CheckedBibleBook
+        __init__( self, BBB, checkResultsDictionary )
+        getCheckResults( self )
+
+    checkBookInWorker( parameters )
+    getAvailableBookList( internalBible )
+    getBookContentHash( internalBible, BBB )
+    aggregateDiscoveryResults( bookDiscoveryResults )
+    getDiscoverySignature( discoveryDict )
+    loadCachedResults( cacheFolderpath, cacheName )
+    saveCachedResults( cacheFolderpath, cacheName, cacheKey, results )
+    checkBibleInParallel( internalBible, bookList=None, job=None )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple, Optional
+import os
+import sys
+import logging
+import hashlib
+import pickle
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.BiblelatorGlobals import DATA_SUBFOLDER_NAME
+from Biblelator.Helpers.ParallelBibleSearch import getWorkerBible, getSearchPool, canSearchInParallel
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "ParallelBibleCheck"
+PROGRAM_NAME = "Biblelator Parallel Bible Check"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+CHECK_CACHE_SUBFOLDER_NAME = 'Cache/CheckResults/'
+CHECK_CACHE_VERSION = 2 # Increment this if the way that we check books (or what we save) changes
+
+# These are the only Bible-wide discovery results that InternalBibleBook.checkBook looks at
+#   along with the comparisons that are made on them.
+# NOTE: This mirrors the discoveryDict tests in InternalBibleBook.doCheckSFMs, doCheckHeadings and doCheckNotes
+#   in BibleOrgSys InternalBibleBook v0.97 (2020-05-12) -- check it again whenever those functions change.
+#   (The BibleOrgSys version is also part of the cache keys, so a new version doesn't reuse old results.)
+DISCOVERY_KEYS_USED_BY_CHECKS = { 'partlyDone':lambda value: value>0, 'notStarted':lambda value: value>0,
+                                'percentageProgress':lambda value: value>95, 'seemsFinished':bool,
+                                'haveMainHeadings':bool, 'haveIntroductoryText':bool,
+                                'haveFootnoteOrigins':lambda value: value>0, 'haveCrossReferenceOrigins':lambda value: value>0,
+                                'sectionReferencesParenthesisFlag':lambda value: value,
+                                'footnotesPeriodFlag':lambda value: value, 'crossReferencesPeriodFlag':lambda value: value, }
+
+
+
+class CheckedBibleBook:
+    """
+    Holds the (cached or worker process) check results for a book that isn't loaded in this process,
+        i.e., just enough of a Bible book for InternalBible.getCheckResults and makeErrorHTML.
+    """
+    def __init__( self, BBB:str, checkResultsDictionary:dict ) -> None:
+        """
+        """
+        self.BBB, self.checkResultsDictionary = BBB, checkResultsDictionary
+    # end of CheckedBibleBook.__init__
+
+    def getCheckResults( self ) -> dict:
+        """
+        Returns the checklist dictionary for the book (like InternalBibleBook.getCheckResults).
+        """
+        if 'Priority Errors' in self.checkResultsDictionary and not self.checkResultsDictionary['Priority Errors']:
+            self.checkResultsDictionary.pop( 'Priority Errors' ) # Remove empty dictionary entry if unused
+        return self.checkResultsDictionary
+    # end of CheckedBibleBook.getCheckResults
+# end of class CheckedBibleBook
+
+
+
+def checkBookInWorker( parameters:tuple ) -> Tuple[Optional[dict],Optional[dict]]:
+    """
+    Load one book of a Bible (in a worker process),
+        and then do the discovery for it (if discoverFlag is set)
+        and/or check it (if a discoveryDict is given).
+
+    The book is always freshly loaded from its file
+        (because checking a book adds to the errors collected while it was loaded)
+        and then forgotten again afterwards.
+
+    Returns the discovery results and the check results dictionary for the book
+        (either of which can be None if it wasn't asked for, or if the book was blank).
+    """
+    bibleType, sourceFolder, name, abbreviation, encoding, BBB, filename, discoverFlag, discoveryDict = parameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"checkBookInWorker( {bibleType.__name__}, {sourceFolder}, {BBB}, {filename}, {discoverFlag} )" )
+
+    workerBible, loadedBookStamps = getWorkerBible( bibleType, sourceFolder, name, abbreviation, encoding )
+    loadedBookStamps.pop( BBB, None ) # We don't want a book that was loaded for searching
+    workerBible.books.pop( BBB, None )
+    workerBible.triedLoadingBook.pop( BBB, None )
+    try:
+        workerBible.loadBook( BBB, filename )
+        if BBB not in workerBible.books: return None, None # It was blank
+        bookObject = workerBible.books[BBB]
+        bookDiscoveryResults = bookObject._discover() if discoverFlag else None
+        checkResults = None
+        if discoveryDict is not None:
+            bookObject.checkBook( discoveryDict )
+            checkResults = bookObject.getCheckResults()
+        return bookDiscoveryResults, checkResults
+    finally:
+        workerBible.books.pop( BBB, None )
+        workerBible.triedLoadingBook.pop( BBB, None )
+# end of ParallelBibleCheck.checkBookInWorker
+
+
+def getAvailableBookList( internalBible ) -> List[str]:
+    """
+    Returns the list of books that the Bible has (in the usual order),
+        including the books that aren't loaded yet.
+    """
+    availableBBBs = set( internalBible.books ) | set( getattr( internalBible, 'availableBBBs', () ) )
+    return [BBB for BBB in BibleOrgSysGlobals.loadedBibleBooksCodes.getSequenceList() if BBB in availableBBBs]
+# end of ParallelBibleCheck.getAvailableBookList
+
+
+def getBookContentHash( internalBible, BBB:str ) -> Optional[str]:
+    """
+    Returns a hash of the contents of the book file,
+        or None if the book doesn't have a file that we can read.
+    """
+    filename = (getattr( internalBible, 'possibleFilenameDict', None ) or {}).get( BBB )
+    if not filename or not getattr( internalBible, 'sourceFolder', None ): return None
+    try:
+        with open( os.path.join( internalBible.sourceFolder, filename ), 'rb' ) as bookFile:
+            return hashlib.sha1( bookFile.read() ).hexdigest()
+    except OSError: return None
+# end of ParallelBibleCheck.getBookContentHash
+
+
+def aggregateDiscoveryResults( bookDiscoveryResults:Dict[str,dict] ) -> dict:
+    """
+    Combine the discovery results for each book into the Bible-wide discovery results that the book checks use
+        (so that we don't need to have all of the books loaded to run InternalBible.discover).
+
+    NOTE: This mirrors the parts of InternalBible.__aggregateDiscoveryResults
+        in BibleOrgSys InternalBible v0.84 (2020-05-23) that make the DISCOVERY_KEYS_USED_BY_CHECKS,
+        i.e., the integer (and boolean) results are totalled, and the average of each ratio gives a flag.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"aggregateDiscoveryResults( {len(bookDiscoveryResults)} )" )
+    aggregateResults, ratioLists = {}, {}
+    for results in bookDiscoveryResults.values():
+        for key,value in results.items():
+            if isinstance( value, float ): # e.g., footnotesPeriodRatio
+                if 0.0 <= value <= 1.0 and key.endswith( 'Ratio' ): ratioLists.setdefault( key[:-5]+'Flag', [] ).append( value )
+            elif isinstance( value, int ) and key in DISCOVERY_KEYS_USED_BY_CHECKS \
+            and key != 'percentageProgress': # That one only goes into percentageProgressByBook
+                aggregateResults[key] = aggregateResults.get( key, 0 ) + value
+    for flagKey,ratioList in ratioLists.items():
+        if flagKey in DISCOVERY_KEYS_USED_BY_CHECKS:
+            aggregateRatio = round( sum( ratioList ) / len( ratioList ), 2 )
+            aggregateResults[flagKey] = True if aggregateRatio > 0.6 else False if aggregateRatio < 0.4 else None
+    return aggregateResults
+# end of ParallelBibleCheck.aggregateDiscoveryResults
+
+
+def getDiscoverySignature( discoveryDict:dict ) -> tuple:
+    """
+    Reduce the discovery results to just the outcomes of the comparisons that the book checks make,
+        so that (for example) a small change in the overall percentage progress
+        doesn't make all of the cached book check results out-of-date.
+    """
+    return tuple( (key,DISCOVERY_KEYS_USED_BY_CHECKS[key](value)) for key,value in sorted( discoveryDict.items() ) )
+# end of ParallelBibleCheck.getDiscoverySignature
+
+
+def loadCachedResults( cacheFolderpath:str, cacheName:str ) -> Optional[tuple]:
+    """
+    Try to load the results from the given cache file.
+
+    Returns None if there's no (usable) cache file,
+        otherwise returns the cache key that the results were saved with, and the results.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadCachedResults( {cacheFolderpath}, {cacheName} )" )
+    cacheFilepath = os.path.join( cacheFolderpath, f'{cacheName}.pickle' )
+    try:
+        with open( cacheFilepath, 'rb' ) as cacheFile:
+            cacheVersion, cachedKey, results = pickle.load( cacheFile )
+    except FileNotFoundError: return None
+    except Exception as err: # Could be a truncated or out-of-date pickle file
+        logging.warning( f"loadCachedResults: Ignoring unreadable cache file {cacheFilepath}: {err}" )
+        return None
+    if cacheVersion != CHECK_CACHE_VERSION: return None
+    return cachedKey, results
+# end of ParallelBibleCheck.loadCachedResults
+
+
+def saveCachedResults( cacheFolderpath:str, cacheName:str, cacheKey:tuple, results:dict ) -> None:
+    """
+    Save the results into the given cache file.
+
+    The file is written under a temporary name and then renamed
+        so that we never leave a partly-written cache file behind.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveCachedResults( {cacheFolderpath}, {cacheName}, … )" )
+    cacheFilepath = os.path.join( cacheFolderpath, f'{cacheName}.pickle' )
+    try:
+        os.makedirs( cacheFolderpath, exist_ok=True )
+        tempFilepath = cacheFilepath + '.tmp'
+        with open( tempFilepath, 'wb' ) as cacheFile:
+            pickle.dump( (CHECK_CACHE_VERSION,cacheKey,results), cacheFile, pickle.HIGHEST_PROTOCOL )
+        os.replace( tempFilepath, cacheFilepath )
+    except (OSError, pickle.PicklingError) as err: # e.g., read-only project folder -- we can still continue without the cache
+        logging.warning( f"saveCachedResults: Unable to save cache file {cacheFilepath}: {err}" )
+# end of ParallelBibleCheck.saveCachedResults
+
+
+def checkBibleInParallel( internalBible, bookList:Optional[List[str]]=None, job=None ) -> Tuple[int,int]:
+    """
+    Like the check function for the Bible, but only checking the books that have changed
+        since they were last checked, and checking those in parallel if possible.
+
+    Only the books that have changed have to be loaded (either in a worker process or in this one),
+        so the Bible only needs to be preloaded (see ParallelBibleSearch.loadPrivateBible).
+    The Bible-wide discovery results are put together from the (cached) results for each book.
+
+    The check results for each book are put into the book
+        (or into a CheckedBibleBook if the book isn't loaded in this process,
+        so this should be a private copy of the Bible unless all of the books are already loaded),
+        so makeErrorHTML can be called afterwards as usual.
+
+    If a BackgroundJob is given, its progress is updated,
+        and the checks are stopped if it's cancelled.
+
+    Returns the number of books that had to be checked, and the number that came from the cache.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"checkBibleInParallel( {internalBible.getAName()}, {bookList}, {job} )" )
+    availableBookList = getAvailableBookList( internalBible )
+    if bookList is None: bookList = availableBookList
+    for BBB in bookList:
+        if BBB not in availableBookList:
+            logging.warning( f"checkBibleInParallel: {internalBible.getAName()} has no {BBB} book to check" )
+    bookList = [BBB for BBB in bookList if BBB in availableBookList]
+
+    sourceFolder = getattr( internalBible, 'sourceFolder', None )
+    cacheFolderpath = os.path.join( sourceFolder, DATA_SUBFOLDER_NAME, CHECK_CACHE_SUBFOLDER_NAME ) if sourceFolder else None
+    contentHashes = { BBB:getBookContentHash( internalBible, BBB ) for BBB in availableBookList } if cacheFolderpath else {}
+    pool = getSearchPool() if canSearchInParallel( internalBible ) else None
+
+    def setProgress( progressText:str ) -> None:
+        if job is not None:
+            job.checkCancelled()
+            job.setProgress( progressText )
+    # end of checkBibleInParallel.setProgress
+
+    def isLoadedHere( BBB:str ) -> bool:
+        return BBB in internalBible.books and not isinstance( internalBible.books[BBB], CheckedBibleBook ) \
+            and not getattr( internalBible, 'bookNeedsReloading', {} ).get( BBB )
+    # end of checkBibleInParallel.isLoadedHere
+
+    def getLoadedBook( BBB:str ):
+        """
+        Load the book into this process (if it's not already loaded and up-to-date).
+
+        Returns the book object, or None if the book was blank.
+        """
+        if not isLoadedHere( BBB ):
+            internalBible.books.pop( BBB, None ) # Otherwise reloading it gives a warning
+            internalBible.loadBook( BBB )
+        return internalBible.books.get( BBB )
+    # end of checkBibleInParallel.getLoadedBook
+
+    def submitToWorkers( BBBs:List[str], discoverFlag:bool, discoveryDict:Optional[dict] ) -> dict:
+        """
+        Get the worker processes to load (and discover and/or check) any of the books that aren't loaded here
+            (so that each of those books only has to be loaded once).
+        """
+        futures = {}
+        if pool is not None:
+            for BBB in BBBs:
+                filename = internalBible.possibleFilenameDict.get( BBB )
+                if filename and not isLoadedHere( BBB ):
+                    parameters = (type(internalBible), sourceFolder,
+                                    getattr( internalBible, 'givenName', None ), getattr( internalBible, 'abbreviation', None ),
+                                    getattr( internalBible, 'encoding', None ), BBB, filename,
+                                    discoverFlag, discoveryDict if BBB in bookList else None)
+                    futures[BBB] = pool.submit( checkBookInWorker, parameters )
+        return futures
+    # end of checkBibleInParallel.submitToWorkers
+
+    def getWorkerResults( futures:dict, BBB:str ) -> Optional[tuple]:
+        future = futures.pop( BBB, None )
+        if future is not None:
+            try: return future.result()
+            except Exception as err: # e.g., the worker couldn't load the book, or a worker died
+                logging.warning( f"checkBibleInParallel: {BBB} check in worker process failed ({err!r}) -- checking here instead" )
+        return None
+    # end of checkBibleInParallel.getWorkerResults
+
+    def storeCheckResults( BBB:str, checkResults:dict ) -> None:
+        if BBB in internalBible.books: internalBible.books[BBB].checkResultsDictionary = checkResults
+        else: internalBible.books[BBB] = CheckedBibleBook( BBB, checkResults )
+    # end of checkBibleInParallel.storeCheckResults
+
+    # Find which books we already have (still valid) discovery results for
+    #   (keeping the out-of-date ones to guess the new Bible-wide discovery results)
+    bookDiscoveryResults, oldBookDiscoveryResults = {}, {}
+    for BBB in availableBookList:
+        if contentHashes.get( BBB ) is not None:
+            cachedResults = loadCachedResults( cacheFolderpath, f'{BBB}.discovery' )
+            if cachedResults is not None:
+                cachedKey, results = cachedResults
+                if cachedKey == (contentHashes[BBB], BibleOrgSysGlobals.PROGRAM_VERSION):
+                    bookDiscoveryResults[BBB] = results
+                else: oldBookDiscoveryResults[BBB] = results
+    booksToDiscover = [BBB for BBB in availableBookList if BBB not in bookDiscoveryResults]
+
+    # Do the discovery for the changed books
+    #   (the workers also check the changed books while they're loaded, using the guessed discovery results,
+    #       and those check results are kept if the guess turns out to be right)
+    workerCheckResults:Dict[str,tuple] = {}
+    blankBooks = set()
+    if booksToDiscover:
+        guessedDiscoveryDict = aggregateDiscoveryResults( { **oldBookDiscoveryResults, **bookDiscoveryResults } )
+        guessedSignature = getDiscoverySignature( guessedDiscoveryDict )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Discovering {len(booksToDiscover)} {internalBible.getAName()} books…" )
+        futures = submitToWorkers( booksToDiscover, True, guessedDiscoveryDict )
+        try:
+            for j,BBB in enumerate( booksToDiscover ):
+                setProgress( _("Discovering {} ({}/{})…").format( BBB, j+1, len(booksToDiscover) ) )
+                workerResults = getWorkerResults( futures, BBB )
+                if workerResults is not None:
+                    results, checkResults = workerResults
+                    if checkResults is not None: workerCheckResults[BBB] = guessedSignature, checkResults
+                else:
+                    bookObject = getLoadedBook( BBB )
+                    results = None if bookObject is None else bookObject._discover()
+                if results is None: blankBooks.add( BBB ); continue
+                bookDiscoveryResults[BBB] = results
+                if contentHashes.get( BBB ) is not None:
+                    saveCachedResults( cacheFolderpath, f'{BBB}.discovery', (contentHashes[BBB],BibleOrgSysGlobals.PROGRAM_VERSION), results )
+        finally:
+            for future in futures.values(): future.cancel()
+    discoveryDict = aggregateDiscoveryResults( bookDiscoveryResults )
+    discoverySignature = getDiscoverySignature( discoveryDict )
+
+    # Find which books we already have (still valid) check results for
+    checkCacheKeys:Dict[str,tuple] = {}
+    booksToCheck, numChecked, numCached = [], 0, 0
+    for BBB in bookList:
+        if BBB in blankBooks: continue
+        if contentHashes.get( BBB ) is not None:
+            checkCacheKeys[BBB] = contentHashes[BBB], discoverySignature, BibleOrgSysGlobals.PROGRAM_VERSION
+        if BBB in workerCheckResults and workerCheckResults[BBB][0] == discoverySignature: # The guess was right
+            checkResults = workerCheckResults[BBB][1]
+            storeCheckResults( BBB, checkResults )
+            if BBB in checkCacheKeys: saveCachedResults( cacheFolderpath, BBB, checkCacheKeys[BBB], checkResults )
+            numChecked += 1
+            continue
+        if BBB in checkCacheKeys:
+            cachedResults = loadCachedResults( cacheFolderpath, BBB )
+            if cachedResults is not None and cachedResults[0] == checkCacheKeys[BBB]:
+                storeCheckResults( BBB, cachedResults[1] )
+                numCached += 1
+                continue
+        booksToCheck.append( BBB )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Checking {len(booksToCheck)} {internalBible.getAName()} books ({numChecked} already checked, {numCached} unchanged)…" )
+
+    futures = submitToWorkers( booksToCheck, False, discoveryDict )
+    try:
+        for j,BBB in enumerate( booksToCheck ):
+            setProgress( _("Checking {} ({}/{})…").format( BBB, j+1, len(booksToCheck) ) )
+            workerResults = getWorkerResults( futures, BBB )
+            if workerResults is not None: checkResults = workerResults[1]
+            else: # Check it in this process
+                bookObject = getLoadedBook( BBB )
+                if bookObject is None: checkResults = None
+                else:
+                    bookObject.checkBook( discoveryDict )
+                    checkResults = bookObject.getCheckResults()
+            if checkResults is None: continue # The book was blank
+            storeCheckResults( BBB, checkResults )
+            if BBB in checkCacheKeys: saveCachedResults( cacheFolderpath, BBB, checkCacheKeys[BBB], checkResults )
+            numChecked += 1
+    finally:
+        for future in futures.values(): future.cancel()
+    return numChecked, numCached
+# end of ParallelBibleCheck.checkBibleInParallel
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    import tempfile, shutil
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    from Biblelator.Helpers.ParallelBibleSearch import shutdownSearchPool
+    testFolder = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest1/' )
+    if not os.path.isdir( testFolder ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Can't find test folder {testFolder}" ); return
+    with tempfile.TemporaryDirectory() as tempFolder:
+        projectFolder = os.path.join( tempFolder, 'Project/' )
+        shutil.copytree( testFolder, projectFolder )
+        for attempt in ( 'first', 'second' ):
+            uB = USFMBible( projectFolder )
+            uB.preload() # Only the changed books need to be loaded
+            numChecked, numCached = checkBibleInParallel( uB )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {attempt} check: {numChecked} books checked, {numCached} from cache" )
+        errorDictionary = uB.getCheckResults()
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Got results for {len(errorDictionary['ByBook'])-1} books" )
+    shutdownSearchPool()
+# end of ParallelBibleCheck.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of ParallelBibleCheck.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of ParallelBibleCheck.py
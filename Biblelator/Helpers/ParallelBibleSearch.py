@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# ParallelBibleSearch.py
+#
+# Search the books of a Bible in parallel on a pool of worker processes
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Split a (BibleOrgSys) findText search into one job per book
+    and run the jobs on a persistent pool of worker processes.
+
+Each worker only loads the books that it's asked to search
+    (directly from the book files, so this only works for Bibles loaded from USFM files),
+    and keeps a few of them loaded for the next search.
+The results are passed back as compact tuples of strings
+    and the verse keys are only rebuilt in the main process.
+
+Books that are already loaded (and up-to-date) in the main process (e.g., the book being edited),
+    or that can't be loaded by a worker, are just searched in the main process.
+Books that have been changed on disk since they were loaded (e.g., just saved by an edit window)
+    are searched by a worker, or else reloaded before they're searched in the main process.
+
+If the search index has found which verses of a book could contain matches,
+    only the lines of those verses are given to findText (see CandidateVersesBible).
+
+    initialiseSearchWorker( verbosityLevel, debugFlag, strictCheckingFlag )
+    getWorkerBible( bibleType, sourceFolder, name, abbreviation, encoding )
+    getWorkerBook( bibleType, sourceFolder, name, abbreviation, encoding, BBB, filename, fileStamp )
+    iterateCandidateVerseLines( bookObject, candidateCVs )
+
+    class CandidateVersesBible
+        __init__( self, internalBible, BBB, candidateCVs )
+        getAName( self, abbrevFirst=False )
+
+    findTextInBook( internalBible, searchOptionsDict, BBB, candidateCVs )
+    searchBookInWorker( parameters )
+    getSearchPool()
+    shutdownSearchPool()
+    canSearchInParallel( internalBible )
+    canLoadPrivateBible( internalBible )
+    loadPrivateBible( internalBible, loadBooksFlag=True )
+    getWorkerBookParameters( internalBible, BBB )
+    combineFindSummaries( resultSummaryDict, bookSummaryDict )
+
+    class ParallelBibleSearch
+        __init__( self, internalBible, optionsDict, bookList, candidateVerses=None )
+        _bookNeedsReloading( self, BBB )
+        _submitBook( self, BBB )
+        _searchBookLocally( self, BBB )
+        searchBooks( self, waitFlag=False )
+        cancel( self )
+
+    findTextInParallel( internalBible, optionsDict, bookList=None, candidateVerses=None )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, List, Set, Tuple, Optional
+import os
+import sys
+import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+from BibleOrgSys.Internals.InternalBible import InternalBible
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "ParallelBibleSearch"
+PROGRAM_NAME = "Biblelator Parallel Bible Search"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+PARALLEL_SEARCH_BIBLE_TYPES = ( 'USFMBible', 'PTX8Bible', 'ESFMBible' ) # Bibles that a worker can load one book at a time
+PRIVATE_COPY_BIBLE_TYPES = PARALLEL_SEARCH_BIBLE_TYPES + ( 'uWNotesBible', ) # Bibles that can be reloaded from their source folder
+FIND_OPTIONS_NOT_SENT = ( 'parentWindow', 'parentBox', 'givenBible' ) # These can't be (or needn't be) pickled
+MAX_WORKER_BOOKS = 20 # per Bible -- so that each worker doesn't end up holding the whole Bible
+
+searchPool:Optional[ProcessPoolExecutor] = None # Only used in the main process
+workerBibles:Dict[tuple,tuple] = {} # Only used in the worker processes
+
+
+
+def initialiseSearchWorker( verbosityLevel:int, debugFlag:bool, strictCheckingFlag:bool ) -> None:
+    """
+    Called once when each worker process is started
+        (which might be a fresh Python interpreter, i.e., with nothing loaded).
+    """
+    BibleOrgSysGlobals.verbosityLevel = verbosityLevel
+    BibleOrgSysGlobals.debugFlag, BibleOrgSysGlobals.strictCheckingFlag = debugFlag, strictCheckingFlag
+    BibleOrgSysGlobals.alreadyMultiprocessing = True # Don't let the book loading start more processes
+    if BibleOrgSysGlobals.loadedUSFMMarkers is None: BibleOrgSysGlobals.preloadCommonData()
+# end of ParallelBibleSearch.initialiseSearchWorker
+
+
+def getWorkerBible( bibleType, sourceFolder, name:Optional[str], abbreviation:Optional[str], encoding:Optional[str] ) -> tuple:
+    """
+    Get the Bible object for the given Bible folder (in a worker process),
+        creating and preloading it the first time.
+
+    Returns the Bible object, and the OrderedDict of file stamps for its loaded books
+        (with the least recently used book first).
+    """
+    bibleKey = bibleType, sourceFolder
+    try: return workerBibles[bibleKey]
+    except KeyError:
+        workerBible = bibleType( sourceFolder, name, abbreviation )
+        if encoding and hasattr( workerBible, 'encoding' ): workerBible.encoding = encoding
+        workerBible.preload()
+        workerBibles[bibleKey] = workerBible, OrderedDict()
+        return workerBibles[bibleKey]
+# end of ParallelBibleSearch.getWorkerBible
+
+
+def getWorkerBook( bibleType, sourceFolder, name:Optional[str], abbreviation:Optional[str], encoding:Optional[str],
+                                BBB:str, filename:str, fileStamp:tuple ):
+    """
+    Make sure that the given book is loaded into the worker Bible object (in a worker process).
+
+    A book is kept loaded for the next job,
+        but it's reloaded if its file has changed since it was loaded.
+
+    Returns the worker Bible object.
+    """
+    workerBible, loadedBookStamps = getWorkerBible( bibleType, sourceFolder, name, abbreviation, encoding )
+    if BBB in loadedBookStamps and loadedBookStamps[BBB] != fileStamp: # The book file has been changed
+        del loadedBookStamps[BBB]
+        workerBible.books.pop( BBB, None )
+        workerBible.triedLoadingBook.pop( BBB, None )
+    if BBB not in workerBible.books:
+        workerBible.loadBook( BBB, filename )
+        while len(loadedBookStamps) >= MAX_WORKER_BOOKS: # Forget the least recently used book
+            oldBBB, _oldStamp = loadedBookStamps.popitem( last=False )
+            workerBible.books.pop( oldBBB, None )
+            workerBible.triedLoadingBook.pop( oldBBB, None )
+    loadedBookStamps[BBB] = fileStamp
+    loadedBookStamps.move_to_end( BBB )
+    return workerBible
+# end of ParallelBibleSearch.getWorkerBook
+
+
+def iterateCandidateVerseLines( bookObject, candidateCVs:Set[str] ):
+    """
+    A generator which yields the processed lines of the loaded book
+        which are in the given verses (the 'C:V' strings from the search index).
+
+    The chapter and verse lines are always given (so that findText can keep track of where it is),
+        as are all of the introduction lines if it's a candidate
+        (because findText gives each introduction line its own verse number).
+    """
+    C, V = '-1', '0'
+    for lineEntry in bookObject:
+        marker = lineEntry.getMarker()
+        if marker == 'c': C, V = lineEntry.getCleanText(), '0'
+        elif marker == 'v': V = lineEntry.getCleanText()
+        elif f'{C}:{V}' not in candidateCVs: continue
+        yield lineEntry
+# end of ParallelBibleSearch.iterateCandidateVerseLines
+
+
+class CandidateVersesBible:
+    """
+    Looks enough like the Bible for findText to search,
+        but only has the one book, and only the lines of the candidate verses of that book.
+    """
+    findText = InternalBible.findText # Only uses our books and getAName
+
+    def __init__( self, internalBible, BBB:str, candidateCVs:Set[str] ) -> None:
+        """
+        """
+        self.internalBible = internalBible
+        self.books = { BBB: list( iterateCandidateVerseLines( internalBible.books[BBB], candidateCVs ) ) }
+    # end of CandidateVersesBible.__init__
+
+    def getAName( self, abbrevFirst:bool=False ) -> str:
+        return self.internalBible.getAName( abbrevFirst=abbrevFirst )
+# end of class CandidateVersesBible
+
+
+def findTextInBook( internalBible, searchOptionsDict:dict, BBB:str, candidateCVs:Optional[Set[str]] ) -> Tuple[dict,dict,list]:
+    """
+    Run findText on the (already loaded) book of the Bible,
+        only searching the candidate verses (from the search index) if we have them.
+
+    Returns the 3-tuple from findText.
+    """
+    if candidateCVs is None or BBB not in internalBible.books:
+        return internalBible.findText( searchOptionsDict )
+    return CandidateVersesBible( internalBible, BBB, candidateCVs ).findText( searchOptionsDict )
+# end of ParallelBibleSearch.findTextInBook
+
+
+def searchBookInWorker( parameters:tuple ) -> Tuple[dict,List[tuple]]:
+    """
+    Search one book of a Bible (in a worker process).
+
+    The Bible objects (and their loaded books) are kept for the next search,
+        but a book is reloaded if its file has changed since it was loaded.
+
+    Returns the resultSummaryDict, and a list of compact result tuples
+        which are the findText result tuples with the verse key replaced by C, V, I (the line index).
+    """
+    bibleType, sourceFolder, name, abbreviation, encoding, BBB, filename, fileStamp, searchOptionsDict, candidateCVs = parameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"searchBookInWorker( {bibleType.__name__}, {sourceFolder}, {BBB}, {filename} )" )
+
+    workerBible = getWorkerBook( bibleType, sourceFolder, name, abbreviation, encoding, BBB, filename, fileStamp )
+    _resultOptionsDict, resultSummaryDict, resultList = findTextInBook( workerBible, searchOptionsDict, BBB, candidateCVs )
+    return resultSummaryDict, [resultEntry[0].getCVI() + tuple(resultEntry[1:]) for resultEntry in resultList]
+# end of ParallelBibleSearch.searchBookInWorker
+
+
+def getSearchPool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the pool of search worker processes (starting it the first time).
+
+    The workers are started fresh (rather than forked from the GUI process)
+        so that they don't inherit Tk or our other threads.
+
+    Returns None if we're not allowed to use multiprocessing.
+    """
+    global searchPool
+    if searchPool is None:
+        if BibleOrgSysGlobals.maxProcesses < 2 or BibleOrgSysGlobals.alreadyMultiprocessing:
+            return None
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"Starting {BibleOrgSysGlobals.maxProcesses} search worker processes…" )
+        searchPool = ProcessPoolExecutor( max_workers=BibleOrgSysGlobals.maxProcesses,
+                                mp_context=multiprocessing.get_context( 'spawn' ),
+                                initializer=initialiseSearchWorker,
+                                initargs=(BibleOrgSysGlobals.verbosityLevel,BibleOrgSysGlobals.debugFlag,BibleOrgSysGlobals.strictCheckingFlag) )
+    return searchPool
+# end of ParallelBibleSearch.getSearchPool
+
+
+def shutdownSearchPool() -> None:
+    """
+    Stop the search worker processes (if they were ever started).
+
+    Called when the program closes.
+    """
+    global searchPool
+    if searchPool is not None:
+        searchPool.shutdown( wait=False, cancel_futures=True )
+        searchPool = None
+# end of ParallelBibleSearch.shutdownSearchPool
+
+
+def canSearchInParallel( internalBible ) -> bool:
+    """
+    Returns True if the worker processes can load the books of this Bible for themselves.
+    """
+    return type(internalBible).__name__ in PARALLEL_SEARCH_BIBLE_TYPES \
+        and bool( getattr( internalBible, 'sourceFolder', None ) ) \
+        and bool( getattr( internalBible, 'possibleFilenameDict', None ) )
+# end of ParallelBibleSearch.canSearchInParallel
+
+
+def canLoadPrivateBible( internalBible ) -> bool:
+    """
+    Returns True if a new copy of this Bible can be loaded from its source folder
+        (see loadPrivateBible).
+    """
+    return type(internalBible).__name__ in PRIVATE_COPY_BIBLE_TYPES \
+        and bool( getattr( internalBible, 'sourceFolder', None ) )
+# end of ParallelBibleSearch.canLoadPrivateBible
+
+
+def loadPrivateBible( internalBible, loadBooksFlag:bool=True ):
+    """
+    Make and load a new Bible object from the same book files as the given Bible,
+        e.g., so that a background job can work on its own copy of the books
+        while the GUI keeps using (and reloading books into) the original.
+
+    If loadBooksFlag is False, the new Bible is only preloaded
+        (so the caller can just load the books that it needs).
+
+    Can only be used if canLoadPrivateBible( internalBible ) is True.
+    The books are loaded from the saved files, so save any edits first.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadPrivateBible( {internalBible.getAName()}, {loadBooksFlag} )" )
+    assert canLoadPrivateBible( internalBible )
+    privateBible = type(internalBible)( internalBible.sourceFolder,
+                        getattr( internalBible, 'givenName', None ), getattr( internalBible, 'abbreviation', None ) )
+    encoding = getattr( internalBible, 'encoding', None )
+    if encoding and hasattr( privateBible, 'encoding' ): privateBible.encoding = encoding
+    privateBible.preload()
+    if loadBooksFlag: privateBible.loadBooks() # Not all Bible types have a load() method
+    return privateBible
+# end of ParallelBibleSearch.loadPrivateBible
+
+
+def getWorkerBookParameters( internalBible, BBB:str ) -> Optional[tuple]:
+    """
+    Get the parameters that a worker process needs to load the book for itself
+        (i.e., the parameters for getWorkerBook).
+
+    Returns None if the book doesn't have a file.
+    """
+    filename = internalBible.possibleFilenameDict.get( BBB )
+    if filename is None: return None
+    try: fileStat = os.stat( os.path.join( internalBible.sourceFolder, filename ) )
+    except OSError: return None
+    return (type(internalBible), internalBible.sourceFolder,
+            getattr( internalBible, 'givenName', None ), getattr( internalBible, 'abbreviation', None ),
+            getattr( internalBible, 'encoding', None ),
+            BBB, filename, (fileStat.st_size,fileStat.st_mtime_ns))
+# end of ParallelBibleSearch.getWorkerBookParameters
+
+
+def combineFindSummaries( resultSummaryDict:dict, bookSummaryDict:dict ) -> None:
+    """
+    Add the findText summary for another book into the summary that we already have.
+
+    Lists (e.g., of books searched) are combined, and counts are added.
+    """
+    for key,value in bookSummaryDict.items():
+        if key not in resultSummaryDict:
+            resultSummaryDict[key] = list( value ) if isinstance( value, list ) else value
+        elif isinstance( value, list ):
+            resultSummaryDict[key].extend( item for item in value if item not in resultSummaryDict[key] )
+        elif isinstance( value, int ) and not isinstance( value, bool ):
+            resultSummaryDict[key] += value
+        else: resultSummaryDict[key] = value
+# end of ParallelBibleSearch.combineFindSummaries
+
+
+
+class ParallelBibleSearch:
+    """
+    One findText search of the given books of a Bible,
+        with each book searched by a worker process if possible.
+
+    All the book jobs are submitted straight away,
+        but the results are given back in the original book order.
+    """
+    def __init__( self, internalBible, optionsDict:dict, bookList:List[str], candidateVerses:Optional[Dict[str,Optional[Set[str]]]]=None ) -> None:
+        """
+        Start the search.
+
+        candidateVerses (from BibleSearchIndex.getCandidateBookVerses) can give the set of 'C:V' strings
+            for the only verses of a book which need to be searched (or None for the whole book).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ParallelBibleSearch.__init__( {internalBible.getAName()}, …, {bookList} )" )
+        self.internalBible, self.optionsDict, self.bookList = internalBible, optionsDict, bookList
+        self.candidateVerses = candidateVerses or {}
+
+        self.workerOptionsDict = { key:value for key,value in optionsDict.items() if key not in FIND_OPTIONS_NOT_SENT }
+        self.futures = {}
+        pool = getSearchPool() if canSearchInParallel( internalBible ) else None
+        if pool is not None:
+            for BBB in bookList:
+                if BBB not in internalBible.books or self._bookNeedsReloading( BBB ): # Books that are already loaded are quicker to search here
+                    self._submitBook( pool, BBB )
+    # end of ParallelBibleSearch.__init__
+
+
+    def _bookNeedsReloading( self, BBB:str ) -> bool:
+        """
+        Returns True if the loaded book is out-of-date, e.g., it's been saved since it was loaded.
+        """
+        return bool( getattr( self.internalBible, 'bookNeedsReloading', {} ).get( BBB ) )
+    # end of ParallelBibleSearch._bookNeedsReloading
+
+
+    def _submitBook( self, pool:ProcessPoolExecutor, BBB:str ) -> None:
+        """
+        Give the search for one book to the worker processes.
+        """
+        bookParameters = getWorkerBookParameters( self.internalBible, BBB )
+        if bookParameters is None: return # No file, so can only be searched here (if it's loaded)
+        searchOptionsDict = self.workerOptionsDict.copy()
+        searchOptionsDict['bookList'] = [BBB]
+        self.futures[BBB] = pool.submit( searchBookInWorker, bookParameters + (searchOptionsDict,self.candidateVerses.get( BBB )) )
+    # end of ParallelBibleSearch._submitBook
+
+
+    def _searchBookLocally( self, BBB:str ) -> Tuple[dict,dict,list]:
+        """
+        Search one book in this process (loading or reloading it first if necessary).
+        """
+        if self._bookNeedsReloading( BBB ):
+            self.internalBible.books.pop( BBB, None ) # So that it's not stashed twice
+        if BBB not in self.internalBible.books: self.internalBible.loadBook( BBB ) # Also reloads it if bookNeedsReloading is set
+        searchOptionsDict = self.optionsDict.copy()
+        searchOptionsDict['bookList'] = [BBB]
+        # We search the loaded Bible processed lines
+        resultOptionsDict, resultSummaryDict, resultList = findTextInBook( self.internalBible, searchOptionsDict, BBB, self.candidateVerses.get( BBB ) )
+        resultOptionsDict['bookList'] = self.optionsDict['bookList'] # What they asked for (not just the book we searched)
+        return resultOptionsDict, resultSummaryDict, resultList
+    # end of ParallelBibleSearch._searchBookLocally
+
+
+    def searchBooks( self, waitFlag:bool=False ):
+        """
+        This is a generator which yields a 4-tuple for each book searched:
+            BBB, and the optionsDict, resultSummaryDict, and resultList from findText
+        or (unless waitFlag is set) None if we're still waiting for the next book from a worker process
+            (so that the caller can do something else rather than blocking).
+
+        Closing the generator cancels any book jobs that haven't been started.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "ParallelBibleSearch.searchBooks()" )
+        try:
+            for BBB in self.bookList:
+                future = self.futures.pop( BBB, None )
+                if future is None:
+                    yield (BBB,) + self._searchBookLocally( BBB )
+                    continue
+                while not waitFlag and not future.done(): yield None
+                try: resultSummaryDict, compactResultList = future.result()
+                except Exception as err: # e.g., the worker couldn't load the book, or a worker died
+                    logging.warning( f"ParallelBibleSearch: {BBB} search in worker process failed ({err!r}) -- searching here instead" )
+                    yield (BBB,) + self._searchBookLocally( BBB )
+                    continue
+                resultList = [(SimpleVerseKey( BBB, *resultEntry[:3] ),) + resultEntry[3:] for resultEntry in compactResultList]
+                yield BBB, self.optionsDict, resultSummaryDict, resultList
+        finally: self.cancel()
+    # end of ParallelBibleSearch.searchBooks
+
+
+    def cancel( self ) -> None:
+        """
+        Cancel any book jobs that haven't been started yet.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "ParallelBibleSearch.cancel()" )
+        for future in self.futures.values(): future.cancel()
+        self.futures = {}
+    # end of ParallelBibleSearch.cancel
+# end of class ParallelBibleSearch
+
+
+
+def findTextInParallel( internalBible, optionsDict:dict, bookList:Optional[List[str]]=None,
+                        candidateVerses:Optional[Dict[str,Optional[Set[str]]]]=None ) -> Tuple[dict,dict,list]:
+    """
+    Like the findText function for the Bible, but searching the books in parallel.
+
+    If no bookList is given, it's taken from optionsDict['bookList'] ('ALL' or a single BBB or a list).
+    If candidateVerses are given (from BibleSearchIndex.getCandidateBookVerses),
+        only those verses are searched.
+
+    Blocks until the search is finished, and returns the same 3-tuple as findText:
+        the optionsDict, resultSummaryDict, and resultList.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"findTextInParallel( {internalBible.getAName()}, …, {bookList} )" )
+    if bookList is None:
+        if getattr( internalBible, 'preloadDone', True ) is False: internalBible.preload()
+        bookList = [BBB for BBB,_filename in getattr( internalBible, 'maximumPossibleFilenameTuples', None ) or ()]
+        bookList += [BBB for BBB in internalBible.books if BBB not in bookList]
+        requestedBooks = optionsDict['bookList']
+        if isinstance( requestedBooks, str ) and requestedBooks != 'ALL': requestedBooks = [requestedBooks]
+        if requestedBooks and requestedBooks != 'ALL':
+            bookList = [BBB for BBB in requestedBooks if BBB in bookList or BBB in internalBible.books]
+
+    resultSummaryDict, resultList = {}, []
+    for _BBB, optionsDict, bookSummaryDict, bookResultList in ParallelBibleSearch( internalBible, optionsDict, bookList, candidateVerses ).searchBooks( waitFlag=True ):
+        combineFindSummaries( resultSummaryDict, bookSummaryDict )
+        resultList.extend( bookResultList )
+    return optionsDict, resultSummaryDict, resultList
+# end of ParallelBibleSearch.findTextInParallel
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    from BibleOrgSys.Formats.USFMBible import USFMBible
+    testFolder = BibleOrgSysGlobals.BOS_TEST_DATA_FOLDERPATH.joinpath( 'USFMTest1/' )
+    if not os.path.isdir( testFolder ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Can't find test folder {testFolder}" ); return
+    for findText in ( 'God', 'regex:the (heavens|earth)' ):
+        searchResults = []
+        for searchMode in ( 'Normal', 'Parallel', 'Indexed' ):
+            uB = USFMBible( testFolder )
+            uB.preload()
+            optionsDict = { 'givenBible':uB, 'workName':uB.getAName(), 'findText':findText, 'bookList':'ALL',
+                            'chapterList':None, 'markerList':None, 'wordMode':'Any', 'caselessFlag':True,
+                            'ignoreDiacriticsFlag':False, 'includeIntroFlag':True, 'includeMainTextFlag':True,
+                            'includeMarkerTextFlag':False, 'includeExtrasFlag':False, 'contextLength':30, 'findHistoryList':[] }
+            if searchMode == 'Indexed': # Only search the verses that the index says could match
+                from Biblelator.Helpers.BibleSearchIndex import getBibleSearchIndex
+                candidateVerses = getBibleSearchIndex( uB ).getCandidateBookVerses( optionsDict )
+                _optionsDict, _resultSummaryDict, resultList = findTextInParallel( uB, optionsDict,
+                                        None if candidateVerses is None else list( candidateVerses ), candidateVerses )
+            elif searchMode == 'Parallel': _optionsDict, _resultSummaryDict, resultList = findTextInParallel( uB, optionsDict )
+            else: uB.load(); _optionsDict, _resultSummaryDict, resultList = uB.findText( optionsDict )
+            searchResults.append( [(entry[0].getBCVI(),)+tuple(entry[1:]) for entry in resultList] )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {findText!r}: {len(searchResults[0]):,} results, parallel search {'agrees' if searchResults[0]==searchResults[1] else 'DISAGREES'}, indexed search {'agrees' if searchResults[0]==searchResults[2] else 'DISAGREES'}" )
+    shutdownSearchPool()
+# end of ParallelBibleSearch.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of ParallelBibleSearch.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of ParallelBibleSearch.py
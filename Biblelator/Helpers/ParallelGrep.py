@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# ParallelGrep.py
+#
+# Search the files in a folder tree for a string on a pool of worker processes
+#
+# Copyright (C) 2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Used by the 'Search files…' (grep) tool.
+
+A thread walks the folder tree and gives the matching files
+    to the (shared) search worker processes in small batches.
+The matches from each batch are put onto a queue as soon as the batch is finished
+    so that the GUI can display them while the rest of the tree is still being searched.
+
+Each file is read (or memory-mapped if it's large) and searched with a compiled bytes regex
+    (so most files are never decoded at all).
+The encoding of each file is worked out from its BOM or its first few kilobytes
+    (using the given encoding unless the sample has non-ASCII text that's clearly UTF-8).
+Files that don't seem to be in either are just skipped.
+
+    findMatchingFilepaths( folderpath, filenamePattern )
+    sniffEncoding( sample, encoding )
+    isByteSearchable( encoding )
+    getBytesPattern( grepKey, encoding )
+    findLinesInText( fileText, grepKey )
+    grepBuffer( filepath, fileBuffer, grepKey, encoding )
+    grepFile( filepath, grepKey, encoding )
+    grepFiles( filepaths, grepKey, encoding )
+
+    class ParallelGrep
+        __init__( self, folderpath, filenamePattern, grepKey, encoding )
+        _walkTree( self )
+        _submitBatch( self, pool, filepaths )
+        _batchDone( self, future )
+        _addResults( self, filepaths, matches, problems )
+        getNewMatches( self )
+        cancel( self )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import List, Tuple, Optional
+import os
+import sys
+import logging
+import fnmatch
+import re
+import mmap
+import codecs
+from functools import lru_cache
+import threading
+import queue
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.Helpers.ParallelBibleSearch import getSearchPool
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "ParallelGrep"
+PROGRAM_NAME = "Biblelator Parallel Grep"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+GREP_FILES_PER_BATCH = 16 # files given to a worker process at a time
+GREP_MAX_WAITING_BATCHES = 32 # so that the tree walk doesn't get too far ahead of the workers
+GREP_MMAP_MIN_SIZE = 256 * 1024 # bytes -- smaller files are quicker to just read
+GREP_SNIFF_SIZE = 4_096 # bytes used to guess the encoding of a file (if it has no BOM)
+BOM_ENCODINGS = ( (codecs.BOM_UTF32_LE,'utf-32-le'), (codecs.BOM_UTF32_BE,'utf-32-be'), # Must be before UTF-16
+                (codecs.BOM_UTF8,'utf-8'), (codecs.BOM_UTF16_LE,'utf-16-le'), (codecs.BOM_UTF16_BE,'utf-16-be') )
+
+
+
+def findMatchingFilepaths( folderpath, filenamePattern:str ):
+    """
+    A generator which yields the path of each file in the folder tree
+        with a name that matches the (fnmatch) pattern.
+    """
+    for thisFolderpath, _subfolderNames, filenames in os.walk( folderpath ):
+        for filename in filenames:
+            if fnmatch.fnmatch( filename, filenamePattern ):
+                yield os.path.join( thisFolderpath, filename )
+# end of ParallelGrep.findMatchingFilepaths
+
+
+def sniffEncoding( sample:bytes, encoding:str ) -> Tuple[Optional[str],int]:
+    """
+    Work out the encoding of a file from its first few bytes.
+
+    A BOM is believed, and a sample with NUL bytes is taken to be UTF-16 (without a BOM).
+    A pure ASCII sample (e.g., just the USFM headers) tells us nothing, so is taken to be in the given encoding.
+    Otherwise it's UTF-8 if the non-ASCII bytes decode as that
+        (which non-ASCII text in other encodings hardly ever does), or else the given encoding.
+
+    Returns the encoding (or None if we can't tell) and the length of the BOM.
+    """
+    for BOM, BOMEncoding in BOM_ENCODINGS:
+        if sample.startswith( BOM ): return BOMEncoding, len( BOM )
+    if b'\x00' in sample: # Probably UTF-16 -- English text has the NULs after the ASCII bytes for little-endian
+        return ('utf-16-be' if sample[0::2].count( 0 ) > sample[1::2].count( 0 ) else 'utf-16-le'), 0
+    if sample.isascii(): return encoding, 0 # Could be anything, so go with what the user told us
+    for tryEncoding in ('utf-8', encoding): # Non-ASCII text that decodes as UTF-8 almost always is UTF-8
+        try: codecs.getincrementaldecoder( tryEncoding )().decode( sample, final=False ) # Sample might end part way through a character
+        except (UnicodeError, LookupError): continue
+        return tryEncoding, 0
+    return None, 0
+# end of ParallelGrep.sniffEncoding
+
+
+@lru_cache( maxsize=32 )
+def isByteSearchable( encoding:str ) -> bool:
+    """
+    Returns True if the encoded search string can be found directly in the file bytes
+        and the lines are separated by b'\\n',
+        i.e., for UTF-8 and the one-byte-per-character encodings.
+    """
+    try: codecInfo = codecs.lookup( encoding )
+    except LookupError: return False
+    return codecInfo.name == 'utf-8' \
+        or len( bytes( range( 256 ) ).decode( codecInfo.name, errors='replace' ) ) == 256
+# end of ParallelGrep.isByteSearchable
+
+
+@lru_cache( maxsize=32 )
+def getBytesPattern( grepKey:str, encoding:str ):
+    """
+    Returns a compiled bytes regex for the encoded search string
+        (or None if the string can't be written in that encoding).
+    """
+    try: return re.compile( re.escape( grepKey.encode( encoding ) ) )
+    except UnicodeEncodeError: return None
+# end of ParallelGrep.getBytesPattern
+
+
+def findLinesInText( fileText:str, grepKey:str ) -> List[Tuple[int,str]]:
+    """
+    Search the (decoded) file text for lines containing grepKey.
+
+    Returns a list of (lineNumber, line) tuples.
+    """
+    foundLines = []
+    ix = fileText.find( grepKey )
+    lineNumber, lineStart = 1, 0
+    while ix != -1: # Only one match per line
+        lineNumber += fileText.count( '\n', lineStart, ix )
+        lineStart = fileText.rfind( '\n', 0, ix ) + 1
+        lineEnd = fileText.find( '\n', ix )
+        if lineEnd == -1: lineEnd = len( fileText )
+        foundLines.append( (lineNumber, fileText[lineStart:lineEnd]) )
+        ix = fileText.find( grepKey, lineEnd+1 )
+    return foundLines
+# end of ParallelGrep.findLinesInText
+
+
+def grepBuffer( filepath:str, fileBuffer, grepKey:str, encoding:str ) -> List[tuple]:
+    """
+    Search the (bytes or memory-mapped) file contents for lines containing grepKey.
+
+    For UTF-8 and similar encodings, the buffer is searched with a bytes regex
+        without decoding it at all,
+        and line numbers are only counted (and lines decoded) for the actual matches.
+
+    Returns a list of (filepath, lineNumber, line) match tuples.
+    Raises UnicodeError if the encoding can't be worked out.
+    """
+    fileEncoding, BOMLength = sniffEncoding( fileBuffer[:GREP_SNIFF_SIZE], encoding )
+    if fileEncoding is None:
+        raise UnicodeError( f"Doesn't seem to be UTF-8 or {encoding}" )
+    if not isByteSearchable( fileEncoding ): # e.g., UTF-16 -- so decode it all and search the text
+        fileText = fileBuffer[BOMLength:].decode( fileEncoding ).replace( '\r\n', '\n' )
+        return [(filepath,)+foundLine for foundLine in findLinesInText( fileText, grepKey )]
+    bytesPattern = getBytesPattern( grepKey, fileEncoding )
+    if bytesPattern is None: return [] # The search string can't be in this file
+
+    if isinstance( fileBuffer, bytes ): countNewlines = fileBuffer.count
+    else: countNewlines = lambda newline, start, end: fileBuffer[start:end].count( newline ) # mmap has no count()
+    matches = []
+    match = bytesPattern.search( fileBuffer )
+    lineNumber, lineStart = 1, 0
+    while match is not None: # Only one match per line
+        ix = match.start()
+        lineNumber += countNewlines( b'\n', lineStart, ix )
+        lineStart = fileBuffer.rfind( b'\n', 0, ix ) + 1
+        lineEnd = fileBuffer.find( b'\n', ix )
+        if lineEnd == -1: lineEnd = len( fileBuffer )
+        line = fileBuffer[max(lineStart,BOMLength):lineEnd].decode( fileEncoding, errors='replace' )
+        matches.append( (filepath, lineNumber, line.rstrip( '\r' )) )
+        match = bytesPattern.search( fileBuffer, lineEnd+1 )
+    return matches
+# end of ParallelGrep.grepBuffer
+
+
+def grepFile( filepath:str, grepKey:str, encoding:str ) -> List[tuple]:
+    """
+    Search one file for lines containing grepKey.
+
+    Large files are memory-mapped (rather than read)
+        but small ones are quicker to just read.
+
+    Returns a list of (filepath, lineNumber, line) match tuples.
+    Raises OSError or UnicodeError if the file can't be read.
+    """
+    with open( filepath, 'rb' ) as binaryFile:
+        fileSize = os.fstat( binaryFile.fileno() ).st_size
+        if fileSize == 0: return [] # Can't map an empty file anyway
+        if fileSize < GREP_MMAP_MIN_SIZE:
+            return grepBuffer( filepath, binaryFile.read(), grepKey, encoding )
+        with mmap.mmap( binaryFile.fileno(), 0, access=mmap.ACCESS_READ ) as fileBuffer:
+            return grepBuffer( filepath, fileBuffer, grepKey, encoding )
+# end of ParallelGrep.grepFile
+
+
+def grepFiles( filepaths:List[str], grepKey:str, encoding:str ) -> Tuple[List[tuple],List[str]]:
+    """
+    Search the given files for lines containing grepKey.
+
+    This runs in a worker process (or in our thread if there's no process pool).
+
+    Returns a list of (filepath, lineNumber, line) match tuples
+        and a list of problem strings (for files that couldn't be read).
+    """
+    matches, problems = [], []
+    for filepath in filepaths:
+        try: matches.extend( grepFile( filepath, grepKey, encoding ) )
+        except UnicodeError as err: # e.g., decode, BOM
+            problems.append( f"Unicode error in: {filepath} {err}" )
+        except (OSError, ValueError) as err: # e.g., permissions, or not a regular file
+            problems.append( f"IO error in: {filepath} {err}" )
+    return matches, problems
+# end of ParallelGrep.grepFiles
+
+
+
+class ParallelGrep:
+    """
+    One search of a folder tree (started as soon as the object is created).
+
+    The GUI should call getNewMatches() every now and again (until isFinished is set).
+    """
+    def __init__( self, folderpath, filenamePattern:str, grepKey:str, encoding:str ) -> None:
+        """
+        Start the thread which walks the folder tree.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ParallelGrep.__init__( {folderpath}, {filenamePattern!r}, {grepKey!r}, {encoding} )" )
+        assert grepKey
+        self.folderpath, self.filenamePattern, self.grepKey, self.encoding = folderpath, filenamePattern, grepKey, encoding
+
+        self.matchQueue = queue.Queue() # Each entry is a list of match tuples
+        self.numFilesSearched = 0
+        self.isCancelled = self.isFinished = False
+        self.futuresLock = threading.Lock()
+        self.futures = {} # Keys are futures, values are the list of filepaths
+        self.batchSlots = threading.BoundedSemaphore( GREP_MAX_WAITING_BATCHES )
+        threading.Thread( target=self._walkTree, name='ParallelGrep', daemon=True ).start()
+    # end of ParallelGrep.__init__
+
+
+    def _walkTree( self ) -> None:
+        """
+        Runs in our own thread -- walks the folder tree and submits the files in batches.
+
+        Sets isFinished once all the batches have finished (or been cancelled).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "ParallelGrep._walkTree()" )
+        try:
+            pool = getSearchPool()
+            filepaths = []
+            for filepath in findMatchingFilepaths( self.folderpath, self.filenamePattern ):
+                if self.isCancelled: break
+                filepaths.append( filepath )
+                if len( filepaths ) >= GREP_FILES_PER_BATCH:
+                    self._submitBatch( pool, filepaths )
+                    filepaths = []
+            if filepaths and not self.isCancelled:
+                self._submitBatch( pool, filepaths )
+            for _n in range( GREP_MAX_WAITING_BATCHES ): # Wait until all the batches are done
+                self.batchSlots.acquire()
+        except Exception as err: # e.g., filenames that can't be decoded
+            logging.error( f"ParallelGrep: Search of {self.folderpath} failed: {err!r}" )
+        finally: self.isFinished = True
+    # end of ParallelGrep._walkTree
+
+
+    def _submitBatch( self, pool, filepaths:List[str] ) -> None:
+        """
+        Give one batch of files to the worker processes
+            (or search them here if we have no process pool).
+        """
+        if pool is None:
+            self._addResults( filepaths, *grepFiles( filepaths, self.grepKey, self.encoding ) )
+            return
+        self.batchSlots.acquire() # Blocks if the workers are too far behind
+        with self.futuresLock:
+            if self.isCancelled:
+                self.batchSlots.release(); return
+            future = pool.submit( grepFiles, filepaths, self.grepKey, self.encoding )
+            self.futures[future] = filepaths
+        future.add_done_callback( self._batchDone )
+    # end of ParallelGrep._submitBatch
+
+
+    def _batchDone( self, future ) -> None:
+        """
+        Called (in another thread) when a batch is finished or cancelled.
+        """
+        with self.futuresLock: filepaths = self.futures.pop( future )
+        try:
+            if not future.cancelled():
+                try: matches, problems = future.result()
+                except Exception as err: # e.g., a worker died
+                    logging.warning( f"ParallelGrep: Batch in worker process failed ({err!r}) -- searching here instead" )
+                    matches, problems = grepFiles( filepaths, self.grepKey, self.encoding )
+                self._addResults( filepaths, matches, problems )
+        finally: self.batchSlots.release()
+    # end of ParallelGrep._batchDone
+
+
+    def _addResults( self, filepaths:List[str], matches:List[tuple], problems:List[str] ) -> None:
+        """
+        Queue the matches for the GUI.
+        """
+        for problem in problems:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, problem )
+        with self.futuresLock: self.numFilesSearched += len( filepaths )
+        if matches: self.matchQueue.put( matches )
+    # end of ParallelGrep._addResults
+
+
+    def getNewMatches( self ) -> List[tuple]:
+        """
+        Returns all the (filepath, lineNumber, line) matches found since the last call
+            (without waiting).
+
+        If isFinished was set before the call, then these are the last matches.
+        """
+        newMatches = []
+        try:
+            while True: newMatches.extend( self.matchQueue.get_nowait() )
+        except queue.Empty: pass
+        return newMatches
+    # end of ParallelGrep.getNewMatches
+
+
+    def cancel( self ) -> None:
+        """
+        Stop walking the tree and cancel any batches that haven't been started yet.
+
+        isFinished is still set once the running batches are done.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "ParallelGrep.cancel()" )
+        with self.futuresLock:
+            self.isCancelled = True
+            futures = list( self.futures )
+        for future in futures: future.cancel()
+    # end of ParallelGrep.cancel
+# end of class ParallelGrep
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    import time
+    from Biblelator.Helpers.ParallelBibleSearch import shutdownSearchPool
+    folderpath = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) # Our Biblelator source folder
+    for grepKey in ( 'def ', 'vPrint(' ):
+        startTime = time.perf_counter()
+        grepSearch = ParallelGrep( folderpath, '*.py', grepKey, 'utf-8' )
+        numBatches, matches = 0, []
+        while True:
+            finished = grepSearch.isFinished # Must be checked before getting the matches
+            newMatches = grepSearch.getNewMatches()
+            if newMatches: numBatches += 1; matches.extend( newMatches )
+            if finished: break
+            time.sleep( 0.01 )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {grepKey!r}: {len(matches):,} matches in {grepSearch.numFilesSearched:,} files (received {numBatches:,} times) took {time.perf_counter()-startTime:.2f}s" )
+        expectedMatches = []
+        for filepath in findMatchingFilepaths( folderpath, '*.py' ):
+            with open( filepath, 'rt', encoding='utf-8' ) as textFile:
+                for lineNumber, line in enumerate( textFile, start=1 ):
+                    if grepKey in line: expectedMatches.append( (filepath, lineNumber, line.rstrip( '\n' )) )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Line by line search {'agrees' if sorted(matches)==sorted(expectedMatches) else 'DISAGREES'}" )
+    shutdownSearchPool()
+
+    import tempfile
+    testText = "\\id GEN\r\n\\c 1\r\n\\v 1 In the beginning Élohim created…\r\n\\v 2 Élohim again\r\n"
+    with tempfile.TemporaryDirectory() as tempFolder:
+        for testEncoding in ( 'utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be', 'cp1252', 'utf-32' ):
+            filepath = os.path.join( tempFolder, f'{testEncoding}.SFM' )
+            with open( filepath, 'wb' ) as binaryFile: binaryFile.write( testText.encode( testEncoding, errors='replace' ) )
+            matches, problems = grepFiles( [filepath], 'Élohim', 'cp1252' )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {testEncoding} file: {[(lineNumber,line) for _filepath,lineNumber,line in matches]} {problems}" )
+        # Now a cp1252 file where the first non-ASCII character is well past the sniffed sample
+        filepath = os.path.join( tempFolder, 'longASCII.SFM' )
+        with open( filepath, 'wb' ) as binaryFile:
+            binaryFile.write( ''.join( f"\\v {v} Some plain ASCII text\r\n" for v in range( 1, 500 ) ).encode( 'cp1252' ) )
+            binaryFile.write( testText.encode( 'cp1252' ) )
+        matches, problems = grepFiles( [filepath], 'Élohim', 'cp1252' )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Long ASCII prefix cp1252 file: {[(lineNumber,line) for _filepath,lineNumber,line in matches]} {problems}" )
+# end of ParallelGrep.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of ParallelGrep.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of ParallelGrep.py
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# USFMTextChecks.py
+#
+# Functions to check USFM text in the editor for possible problems
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Checks the USFM text in an edit window for some common problems.
+
+checkUSFMText does a complete check of the text.
+
+USFMTextChecker gives exactly the same results,
+    but remembers a summary of each line
+    so that only new or changed lines have to be checked again.
+
+BackgroundUSFMTextChecker runs a USFMTextChecker in a worker thread
+    so that the edit window isn't slowed down while the user is typing.
+    (The window polls for the results using after().)
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple, Optional
+import os
+import logging
+import threading
+import queue
+import random
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    import sys
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "USFMTextChecks"
+PROGRAM_NAME = "Biblelator USFM Text Checks"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+PAIR_SEARCH_END_INDEX = 99_999 # The backwards search for unmatched pairs only looks at the text before this
+
+
+
+def checkUSFMText( editedText:str, includeFormatting:bool, markerLimits:Tuple[int,int,int,int],
+                    invalidCombinations:List[str], checkForPairs:List[Tuple[str,str]] ) -> Tuple[Optional[str],Optional[str],Optional[str]]:
+    """
+    Checks the USFM text for some types of errors.
+
+    markerLimits is a 4-tuple with the minimum and maximum number of chapter markers,
+        then the minimum and maximum number of verse markers expected in the text.
+
+    Returns a 3-tuple with an error message, a warning message, and a suggestion message
+        (any or all of which might be None).
+    """
+    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "checkUSFMText", len(editedText), includeFormatting, markerLimits )
+    minChapterMarkers, maxChapterMarkers, minVerseMarkers, maxVerseMarkers = markerLimits
+
+    # Check counts of USFM chapter and verse markers
+    numChaps = editedText.count( '\\c ' )
+    numVerses = editedText.count( '\\v ' )
+
+    errorMessage = warningMessage = suggestionMessage = None
+    if numChaps > maxChapterMarkers:
+        errorMessage = _("Too many USFM chapter markers (max of {} expected)").format( maxChapterMarkers )
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, errorMessage )
+    elif numChaps < minChapterMarkers:
+        warningMessage = _("May have missing USFM chapter markers (expected {}, found {})").format( maxChapterMarkers, numChaps )
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, warningMessage )
+    if numVerses > maxVerseMarkers:
+        errorMessage = _("Too many USFM verse markers (max of {} expected)").format( maxVerseMarkers )
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, errorMessage )
+    elif numVerses < minVerseMarkers:
+        warningMessage = _("May have missing USFM verse markers (expected {}, found {})").format( maxVerseMarkers, numVerses )
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, warningMessage )
+    if '  ' in editedText:
+        warningMessage = _("No good reason to have multiple spaces in a USFM book")
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, warningMessage )
+    elif includeFormatting and ' \n' in editedText:
+        suggestionMessage = _("No good reason to have a line ending with a space in a USFM book")
+
+    if not errorMessage and not warningMessage: # and not suggestionMessage:
+        adjText = editedText
+        if adjText and adjText[-1] in ('\n','\r',): adjText = adjText[:-1] # Remove the final newline character
+        for line in adjText.split( '\n' ):
+            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "checkUSFMText got line: {!r}".format( line ) )
+            if not line:
+                warningMessage = _("No good reason to have a blank line in a USFM book")
+            if line:
+                if line[0] == '\\':
+                    marker = line.split( None, 1)[0][1:] # First token, but without the first (backslash) character
+                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Found marker: {!r}".format( marker ) )
+                    if marker not in BibleOrgSysGlobals.loadedUSFMMarkers:
+                        errorMessage = _("Not a recognized USFM marker {!r}").format( marker )
+                        break
+                else:
+                    errorMessage = _("Line should start with backslash, not '{}{}'").format( line[:8], '…' if len(line)>8 else '' )
+                    break
+
+    if not errorMessage and not warningMessage: # and not suggestionMessage:
+        for segment in invalidCombinations:
+            if segment in editedText:
+                warningMessage = _("Found {!r} invalid character(s) in USFM text").format( segment ); break
+
+    if not errorMessage and not warningMessage and not suggestionMessage:
+        for pairStart,pairEnd in checkForPairs:
+            if editedText.count( pairStart ) != editedText.count( pairEnd ):
+                warningMessage = _("Counts of {!r} and {!r} differ in USFM text").format( pairStart, pairEnd ); break
+            # NOTE: Code below doesn't give error with ( ( ) -- that's why we have the counts above
+            ixl = -1
+            while True:
+                ixl = editedText.find( pairStart, ixl+1 )
+                if ixl == -1: break # none / no more found
+                ixr = editedText.find( pairEnd, ixl+len(pairStart) )
+                if ixr == -1: # no matching pair
+                    warningMessage = _("Found {!r} without matching {!r} in USFM text").format( pairStart, pairEnd ); break
+            if warningMessage: break # from outer loop
+            ixr = PAIR_SEARCH_END_INDEX # Now work backwards
+            while True:
+                ixr = editedText.rfind( pairEnd, 0, ixr )
+                if ixr == -1: break
+                ixl = editedText.rfind( pairStart, 0, ixr )
+                if ixl == -1:
+                    warningMessage = _("Found {!r} without previous {!r} in USFM text").format( pairEnd, pairStart ); break
+            if warningMessage: break # from outer loop
+
+    return errorMessage, warningMessage, suggestionMessage
+# end of USFMTextChecks.checkUSFMText
+
+
+
+def canSelfOverlap( pattern:str ) -> bool:
+    """
+    Returns True if two copies of the pattern can overlap, e.g., 'aa' in 'aaa'.
+    """
+    return any( pattern[:j] == pattern[-j:] for j in range( 1, len(pattern) ) )
+# end of USFMTextChecks.canSelfOverlap
+
+
+class USFMTextChecker:
+    """
+    Checks USFM text giving exactly the same results as checkUSFMText,
+        but keeps a summary of each line that it's checked
+        so that only the new or changed lines need to be checked next time.
+
+    The summary contains everything that checkUSFMText needs to know about the line
+        (marker counts, invalid segments, positions of pair starts and ends, etc.)
+        and then the results for the whole text are worked out from the line summaries.
+    """
+    def __init__( self ) -> None:
+        """
+        """
+        self.checkSettings = None # So we know if the invalid combinations or pairs are changed
+        self.lineSummaries:Dict[str,tuple] = {}
+        self.canUseLineSummaries = True
+    # end of USFMTextChecker.__init__
+
+
+    def setCheckSettings( self, invalidCombinations:List[str], checkForPairs:List[Tuple[str,str]] ) -> None:
+        """
+        Throw away our line summaries if the settings have changed.
+        """
+        checkSettings = tuple( invalidCombinations ), tuple( checkForPairs )
+        if checkSettings == self.checkSettings: return
+        self.checkSettings = checkSettings
+        self.invalidCombinations, self.checkForPairs = list( invalidCombinations ), list( checkForPairs )
+        self.lineSummaries = {}
+        # If any of these can cross lines (or overlap), we can't work them out from the line summaries
+        self.canUseLineSummaries = not any( not segment or '\n' in segment for segment in invalidCombinations ) \
+                            and not any( not pairStart or not pairEnd or '\n' in pairStart+pairEnd or canSelfOverlap( pairEnd )
+                                            for pairStart,pairEnd in checkForPairs )
+    # end of USFMTextChecker.setCheckSettings
+
+
+    def summariseLine( self, line:str ) -> tuple:
+        """
+        Returns the summary for a single line (without the newline character).
+        """
+        try: return self.lineSummaries[line]
+        except KeyError: pass
+
+        lineError = None
+        if line:
+            if line[0] == '\\':
+                marker = line.split( None, 1)[0][1:] # First token, but without the first (backslash) character
+                if marker not in BibleOrgSysGlobals.loadedUSFMMarkers:
+                    lineError = _("Not a recognized USFM marker {!r}").format( marker )
+            else:
+                lineError = _("Line should start with backslash, not '{}{}'").format( line[:8], '…' if len(line)>8 else '' )
+        invalidIndexes = tuple( j for j,segment in enumerate( self.invalidCombinations ) if segment in line )
+        pairInfo = tuple( (line.count( pairStart ), line.count( pairEnd ),
+                            line.find( pairStart ), line.rfind( pairStart ), line.find( pairEnd ), line.rfind( pairEnd ))
+                                for pairStart,pairEnd in self.checkForPairs )
+        lineSummary = line.count( '\\c ' ), line.count( '\\v ' ), '  ' in line, line.endswith( ' ' ), \
+                        not line, lineError, invalidIndexes, pairInfo
+        self.lineSummaries[line] = lineSummary
+        return lineSummary
+    # end of USFMTextChecker.summariseLine
+
+
+    def check( self, editedText:str, includeFormatting:bool, markerLimits:Tuple[int,int,int,int],
+                    invalidCombinations:List[str], checkForPairs:List[Tuple[str,str]] ) -> Tuple[Optional[str],Optional[str],Optional[str]]:
+        """
+        Checks the USFM text for some types of errors.
+
+        Returns the same 3-tuple as checkUSFMText.
+        """
+        self.setCheckSettings( invalidCombinations, checkForPairs )
+        if not self.canUseLineSummaries:
+            return checkUSFMText( editedText, includeFormatting, markerLimits, invalidCombinations, checkForPairs )
+        minChapterMarkers, maxChapterMarkers, minVerseMarkers, maxVerseMarkers = markerLimits
+
+        lines = editedText.split( '\n' )
+        oldLineSummaries, self.lineSummaries = self.lineSummaries, {}
+        summaries = []
+        for line in lines:
+            try: lineSummary = oldLineSummaries[line]
+            except KeyError: lineSummary = self.summariseLine( line )
+            else: self.lineSummaries[line] = lineSummary # Only keep the ones that we're still using
+            summaries.append( lineSummary )
+
+        # Check counts of USFM chapter and verse markers
+        numChaps = sum( lineSummary[0] for lineSummary in summaries )
+        numVerses = sum( lineSummary[1] for lineSummary in summaries )
+
+        errorMessage = warningMessage = suggestionMessage = None
+        if numChaps > maxChapterMarkers:
+            errorMessage = _("Too many USFM chapter markers (max of {} expected)").format( maxChapterMarkers )
+        elif numChaps < minChapterMarkers:
+            warningMessage = _("May have missing USFM chapter markers (expected {}, found {})").format( maxChapterMarkers, numChaps )
+        if numVerses > maxVerseMarkers:
+            errorMessage = _("Too many USFM verse markers (max of {} expected)").format( maxVerseMarkers )
+        elif numVerses < minVerseMarkers:
+            warningMessage = _("May have missing USFM verse markers (expected {}, found {})").format( maxVerseMarkers, numVerses )
+        if any( lineSummary[2] for lineSummary in summaries ):
+            warningMessage = _("No good reason to have multiple spaces in a USFM book")
+        elif includeFormatting and any( lineSummary[3] for lineSummary in summaries[:-1] ): # The last line has no newline after it
+            suggestionMessage = _("No good reason to have a line ending with a space in a USFM book")
+
+        if not errorMessage and not warningMessage:
+            loopSummaries = summaries
+            if editedText.endswith( '\n' ): loopSummaries = summaries[:-1] # The final newline character is ignored
+            elif editedText.endswith( '\r' ): loopSummaries = summaries[:-1] + [self.summariseLine( lines[-1][:-1] )]
+            for lineSummary in loopSummaries:
+                if lineSummary[4]: # it's blank
+                    warningMessage = _("No good reason to have a blank line in a USFM book")
+                elif lineSummary[5]:
+                    errorMessage = lineSummary[5]
+                    break
+
+        if not errorMessage and not warningMessage:
+            invalidIndexes = [lineSummary[6][0] for lineSummary in summaries if lineSummary[6]]
+            if invalidIndexes:
+                segment = self.invalidCombinations[min( invalidIndexes )]
+                warningMessage = _("Found {!r} invalid character(s) in USFM text").format( segment )
+
+        if not errorMessage and not warningMessage and not suggestionMessage and self.checkForPairs:
+            lineOffsets, offset = [], 0
+            for line in lines:
+                lineOffsets.append( offset )
+                offset += len(line) + 1
+            for k,(pairStart,pairEnd) in enumerate( self.checkForPairs ):
+                startCount = endCount = 0
+                firstStart = lastStart = firstEnd = lastEnd = -1
+                for lineOffset,lineSummary in zip( lineOffsets, summaries ):
+                    lineStartCount, lineEndCount, lineFirstStart, lineLastStart, lineFirstEnd, lineLastEnd = lineSummary[7][k]
+                    if lineStartCount:
+                        startCount += lineStartCount
+                        if firstStart == -1: firstStart = lineOffset + lineFirstStart
+                        lastStart = lineOffset + lineLastStart
+                    if lineEndCount:
+                        endCount += lineEndCount
+                        if firstEnd == -1: firstEnd = lineOffset + lineFirstEnd
+                        lastEnd = lineOffset + lineLastEnd
+                if startCount != endCount:
+                    warningMessage = _("Counts of {!r} and {!r} differ in USFM text").format( pairStart, pairEnd ); break
+                # Every start must have an end somewhere after it (so check the last start)
+                if lastStart != -1 and lastEnd < lastStart + len(pairStart):
+                    warningMessage = _("Found {!r} without matching {!r} in USFM text").format( pairStart, pairEnd ); break
+                # Every end (before PAIR_SEARCH_END_INDEX) must have a start somewhere before it (so check the first end)
+                if firstEnd != -1 and firstEnd + len(pairEnd) <= PAIR_SEARCH_END_INDEX \
+                and (firstStart == -1 or firstStart + len(pairStart) > firstEnd):
+                    warningMessage = _("Found {!r} without previous {!r} in USFM text").format( pairEnd, pairStart ); break
+
+        return errorMessage, warningMessage, suggestionMessage
+    # end of USFMTextChecker.check
+# end of class USFMTextChecker
+
+
+
+checkRequestQueue = None # Shared by all the BackgroundUSFMTextCheckers
+
+def checkRequestWorker() -> None:
+    """
+    Runs (forever) in a worker thread doing the checks requested by BackgroundUSFMTextCheckers.
+
+    Requests which have already been replaced by a newer request aren't checked.
+    """
+    while True:
+        backgroundChecker, requestNumber, checkParameters = checkRequestQueue.get()
+        if requestNumber != backgroundChecker.lastRequestNumber: continue # There's a newer request so don't bother with this one
+        try: checkResults = backgroundChecker.checker.check( *checkParameters )
+        except Exception as err: # Don't let one bad check stop the thread
+            logging.error( f"USFMTextChecks: check failed: {err}" )
+            checkResults = None, None, None
+        backgroundChecker.resultQueue.put( (requestNumber, checkResults) )
+# end of USFMTextChecks.checkRequestWorker
+
+
+class BackgroundUSFMTextChecker:
+    """
+    Does USFM text checks (for one edit window) in a worker thread.
+
+    The caller requests a check with a copy of the text,
+        and then polls (e.g., using after()) for the results.
+    Only the results for the latest request are returned.
+    """
+    def __init__( self ) -> None:
+        """
+        """
+        global checkRequestQueue
+        if checkRequestQueue is None: # Start the (single) worker thread
+            checkRequestQueue = queue.Queue()
+            threading.Thread( target=checkRequestWorker, name='USFMTextChecker', daemon=True ).start()
+        self.checker = USFMTextChecker() # Only used by the worker thread
+        self.resultQueue = queue.Queue()
+        self.lastRequestNumber = 0
+    # end of BackgroundUSFMTextChecker.__init__
+
+
+    def requestCheck( self, editedText:str, includeFormatting:bool, markerLimits:Tuple[int,int,int,int],
+                    invalidCombinations:List[str], checkForPairs:List[Tuple[str,str]] ) -> int:
+        """
+        Queue the text to be checked.
+
+        Returns the request number.
+        """
+        self.lastRequestNumber += 1
+        checkRequestQueue.put( (self, self.lastRequestNumber,
+                (editedText, includeFormatting, markerLimits, tuple( invalidCombinations ), tuple( checkForPairs ))) )
+        return self.lastRequestNumber
+    # end of BackgroundUSFMTextChecker.requestCheck
+
+
+    def cancelChecks( self ) -> None:
+        """
+        Make sure that the results of any outstanding requests are never returned.
+        """
+        self.lastRequestNumber += 1
+    # end of BackgroundUSFMTextChecker.cancelChecks
+
+
+    def getLatestResults( self ) -> Optional[Tuple[Optional[str],Optional[str],Optional[str]]]:
+        """
+        Returns the 3-tuple (like checkUSFMText) for the latest request
+            or None if it's not finished yet.
+
+        Results for any earlier requests are discarded.
+        """
+        while True:
+            try: requestNumber, checkResults = self.resultQueue.get_nowait()
+            except queue.Empty: return None
+            if requestNumber == self.lastRequestNumber: return checkResults
+    # end of BackgroundUSFMTextChecker.getLatestResults
+# end of class BackgroundUSFMTextChecker
+
+
+
+def runDifferentialCheck( numTrials:int=2000, randomSeed:int=1 ) -> int:
+    """
+    Check that USFMTextChecker gives exactly the same results as checkUSFMText
+        as a random sample of USFM text is repeatedly edited.
+
+    Returns the number of differences found (which should be zero).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"runDifferentialCheck( {numTrials}, {randomSeed} )" )
+    randomGenerator = random.Random( randomSeed )
+    invalidCombinations = ['__',',,',' ,','..',' .',';;',' ;','!!',' !', '"', ' –','– ', ' —','— ',
+                            '\\f*,','\\f*.','\\f*:','\\f*;','\\f*?','\\f*!', '\\x*,','\\x*.','\\x* ', ]
+    checkForPairs = [ ('(',')'), ('[',']'), ('_ ',' _'), ('\\f ','\\f*'), ('\\x ','\\x*'), ('\\add ','\\add*'), ('\\nd ','\\nd*'), ]
+    sampleLines = [ '\\c 3', '\\s1 The heading', '\\r (Mat 3:4)', '\\p', '\\q1', '\\m', '\\b', '',
+                    '\\v 1 In the beginning God (Elohim) created', '\\v 2 The \\nd LORD\\nd* said,', '\\v 3 text\\f + \\fr 3:3 \\ft note\\f* more.',
+                    'continuation line', '\\zz unknown marker', '\\v 4 a [bracket', 'closed] here ', '\\v 5 double  space',
+                    '\\v 6 the \\add added\\add* words', '\\v 7 bad ,, punctuation', '\\v 8 ) before (', '\\v 9 \\x - \\xo 1 \\xt Gen 1\\x*.', ]
+    checker = USFMTextChecker()
+    numDifferences = 0
+    textLines = [randomGenerator.choice( sampleLines ) for _j in range( 12 )]
+    for trial in range( numTrials ):
+        # Make a random edit
+        editType = randomGenerator.randrange( 5 )
+        lineIndex = randomGenerator.randrange( len(textLines)+1 )
+        if editType == 0 or not textLines: textLines.insert( lineIndex, randomGenerator.choice( sampleLines ) )
+        elif lineIndex < len(textLines):
+            if editType == 1: del textLines[lineIndex]
+            elif editType == 2: textLines[lineIndex] = textLines[lineIndex][:-1] # Delete a character
+            elif editType == 3: textLines[lineIndex] += randomGenerator.choice( ' (),.\\*_"' )
+            else: textLines[lineIndex] = randomGenerator.choice( sampleLines )
+        editedText = '\n'.join( textLines ) + randomGenerator.choice( ('','\n','\n','\r') )
+        includeFormatting = randomGenerator.random() < 0.5
+        markerLimits = randomGenerator.choice( ((0,1,1,30), (0,1,3,3), (1,1,1,1), (0,0,0,0), (0,2,0,99)) )
+        expectedResults = checkUSFMText( editedText, includeFormatting, markerLimits, invalidCombinations, checkForPairs )
+        checkerResults = checker.check( editedText, includeFormatting, markerLimits, invalidCombinations, checkForPairs )
+        if checkerResults != expectedResults:
+            numDifferences += 1
+            logging.critical( f"runDifferentialCheck: Trial {trial} gave {checkerResults} instead of {expectedResults} for {editedText!r}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"USFMTextChecker differential check: {numTrials:,} trials with {numDifferences:,} differences" )
+    return numDifferences
+# end of USFMTextChecks.runDifferentialCheck
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    runDifferentialCheck( 200 )
+# end of USFMTextChecks.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    for randomSeed in range( 1, 6 ):
+        runDifferentialCheck( 5_000, randomSeed )
+# end of USFMTextChecks.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of USFMTextChecks.py
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# VerseCache.py
+#
+# A verse cache shared by all the Bible resource windows and boxes
+#
+# Copyright (C) 2016-2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+A single (process-wide) cache of verse data
+    which is owned by the Application (as theApp.verseCache).
+
+Entries are keyed by a resource ID and the verse key hash,
+    so that if the same Sword module, DBP resource, or internal Bible
+    is open in several windows and/or resource collection boxes,
+    the verse is only fetched (and stored) once.
+
+The cache has a memory budget (in bytes) rather than a maximum number of verses,
+    and drops the least recently used entries when it goes over budget
+    (but never the verses that each window or box is currently showing).
+
+The VersePrefetcher (owned by the Application as theApp.versePrefetcher)
+    uses idle time to load the next section, and the next and previous chapters,
+    of each resource into the cache after it's displayed a new reference.
+    All the resources together only prefetch up to a fraction of the cache size.
+
+    estimateDataSize( data, seenIDs=None, depth=0 )
+
+    class SharedVerseCache
+        __init__( self, maxBytes=DEFAULT_VERSE_CACHE_MEGABYTES*1_000_000 )
+        __len__( self )
+        setMaxBytes( self, maxBytes )
+        makeResourceID( self, resourceObject )
+        hasVerseData( self, resourceID, verseKey )
+        getVerseData( self, resourceID, verseKey, fetchFunction, shownBy=None )
+        finishShowing( self, shownBy )
+        storeVerseData( self, resourceID, verseKey, verseData )
+        prefetchVerseData( self, resourceID, verseKey, fetchFunction )
+        _evict( self )
+        removeResource( self, resourceID )
+        removeBook( self, resourceID, BBB )
+        clear( self )
+        getStats( self )
+        getStatsText( self )
+
+    prefetchVerses( verseCache, resource, verseKey, maxBytes )
+
+    class VersePrefetcher
+        __init__( self, verseCache, tkWidget, maxBytes=DEFAULT_PREFETCH_MEGABYTES*1_000_000 )
+        getTotalMaxBytes( self )
+        requestPrefetch( self, resource, verseKey )
+        cancelPrefetch( self, resource=None )
+        _startPrefetchSlice( self )
+        _doPrefetchSlice( self )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import Dict, Tuple, Any, Callable, Hashable, Optional
+import os
+import sys
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.Helpers.BiblelatorHelpers import verseDataHasSectionHeading
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "VerseCache"
+PROGRAM_NAME = "Biblelator Verse Cache"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+DEFAULT_VERSE_CACHE_MEGABYTES = 32 # Shared by all Bible resource windows and boxes
+MAX_SIZE_ESTIMATE_DEPTH = 8 # Don't follow links any deeper than this when estimating memory use
+
+DEFAULT_PREFETCH_MEGABYTES = 4 # Maximum to prefetch for each resource after each navigation
+PREFETCH_CACHE_FRACTION = 0.25 # Maximum part of the verse cache to prefetch for all the resources together
+PREFETCH_DELAY = 200 # milliseconds -- after navigation before we start prefetching
+PREFETCH_INTERVAL = 20 # milliseconds -- between slices of prefetching
+PREFETCH_SLICE_TIME = 0.015 # seconds -- maximum prefetching time before we let Tk handle user input
+
+
+
+def estimateDataSize( data, seenIDs:Optional[set]=None, depth:int=0 ) -> int:
+    """
+    Returns an estimate of the number of bytes of memory used by the (verse) data,
+        including the strings, lists, tuples, etc. that it contains.
+
+    Objects that are referenced more than once are only counted once.
+    """
+    if seenIDs is None: seenIDs = set()
+    if id(data) in seenIDs or isinstance( data, type ): return 0
+    seenIDs.add( id(data) )
+    numBytes = sys.getsizeof( data )
+    if data is None or isinstance( data, (str,bytes,int,float,bool) ) \
+    or depth >= MAX_SIZE_ESTIMATE_DEPTH:
+        return numBytes
+
+    if isinstance( data, dict ):
+        for key,value in data.items():
+            numBytes += estimateDataSize( key, seenIDs, depth+1 ) + estimateDataSize( value, seenIDs, depth+1 )
+    elif isinstance( data, (list,tuple,set,frozenset) ):
+        for item in data:
+            numBytes += estimateDataSize( item, seenIDs, depth+1 )
+    if hasattr( data, '__dict__' ):
+        numBytes += estimateDataSize( vars(data), seenIDs, depth+1 )
+    for someClass in type(data).__mro__:
+        slotNames = someClass.__dict__.get( '__slots__', () )
+        for slotName in (slotNames,) if isinstance( slotNames, str ) else slotNames:
+            try: numBytes += estimateDataSize( getattr( data, slotName ), seenIDs, depth+1 )
+            except AttributeError: pass # slot not set
+    return numBytes
+# end of VerseCache.estimateDataSize
+
+
+
+class SharedVerseCache:
+    """
+    A least-recently-used cache of verse data (from getContextVerseData functions)
+        with a memory budget.
+
+    The cache keeps the newest or most recently used entries at the end.
+    When it gets too large, it drops entries from the start,
+        except for the entries that are being shown (see finishShowing).
+
+    Can be safely used from more than one thread.
+    """
+    def __init__( self, maxBytes:int=DEFAULT_VERSE_CACHE_MEGABYTES*1_000_000 ) -> None:
+        """
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SharedVerseCache.__init__( {maxBytes:,} )" )
+        self.maxBytes = maxBytes
+        self.entries = OrderedDict() # Keys are (resourceID,verseKeyHash), values are (verseData,numBytes)
+        self.numBytes = 0
+        self.numHits = self.numMisses = self.numEvictions = self.numPrefetched = 0
+        self.lock = threading.RLock()
+        self.nextObjectNumber = 1
+        self.keptResourceObjects = {} # For objects that we can't add an attribute to
+        self.shownCacheKeys = {} # Keys are shownBy IDs, values are sets of cacheKeys which mustn't be dropped
+        self.showingCacheKeys = {} # The same, but for what's being displayed now (before finishShowing)
+    # end of SharedVerseCache.__init__
+
+
+    def __len__( self ) -> int:
+        return len( self.entries )
+    # end of SharedVerseCache.__len__
+
+
+    def setMaxBytes( self, maxBytes:int ) -> None:
+        """
+        Change the memory budget (and drop entries if we're now over it).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SharedVerseCache.setMaxBytes( {maxBytes:,} )" )
+        with self.lock:
+            self.maxBytes = maxBytes
+            self._evict()
+    # end of SharedVerseCache.setMaxBytes
+
+
+    def makeResourceID( self, resourceObject ) -> Hashable:
+        """
+        Makes a resource ID for an object (e.g., an internal Bible, or a window)
+            that doesn't otherwise have a name that's known to be unique.
+
+        The object's entries are removed from the cache when it's deleted.
+        """
+        with self.lock:
+            try: return resourceObject._verseCacheResourceID
+            except AttributeError: pass
+            resourceID = 'object', self.nextObjectNumber
+            self.nextObjectNumber += 1
+            try:
+                resourceObject._verseCacheResourceID = resourceID
+                weakref.finalize( resourceObject, self.removeResource, resourceID )
+            except (AttributeError, TypeError): # Not a normal Python object (e.g., from a C library)
+                try: return self.keptResourceObjects[id(resourceObject)][0]
+                except KeyError: # Keep a reference so that the id() can't be reused
+                    self.keptResourceObjects[id(resourceObject)] = resourceID, resourceObject
+            return resourceID
+    # end of SharedVerseCache.makeResourceID
+
+
+    def hasVerseData( self, resourceID:Hashable, verseKey ) -> bool:
+        """
+        Returns True if the verse is already in the cache
+            (without affecting the hit/miss counts or the order).
+        """
+        return (resourceID,verseKey.makeHash()) in self.entries
+    # end of SharedVerseCache.hasVerseData
+
+
+    def getVerseData( self, resourceID:Hashable, verseKey, fetchFunction:Callable, shownBy:Optional[Hashable]=None ) -> Any:
+        """
+        Checks to see if the requested verse is in our cache,
+            otherwise calls the fetchFunction (usually getContextVerseData) to fetch it.
+
+        shownBy is the ID (from makeResourceID) of the window or box if it's displaying the verse,
+            in which case the verse won't be dropped from the cache until after its next display.
+        """
+        cacheKey = resourceID, verseKey.makeHash()
+        with self.lock:
+            if shownBy is not None: self.showingCacheKeys.setdefault( shownBy, set() ).add( cacheKey )
+            try: verseData, _numBytes = self.entries[cacheKey]
+            except KeyError: self.numMisses += 1
+            else:
+                #dPrint( 'Never', DEBUGGING_THIS_MODULE, "  " + _("Retrieved from shared verse cache") )
+                self.numHits += 1
+                self.entries.move_to_end( cacheKey )
+                return verseData
+        verseData = fetchFunction( verseKey ) # Don't hold the lock while fetching
+        self.storeVerseData( resourceID, verseKey, verseData )
+        return verseData
+    # end of SharedVerseCache.getVerseData
+
+
+    def finishShowing( self, shownBy:Hashable ) -> None:
+        """
+        Called when a window or box has finished displaying a new reference
+            so that only the verses from this display are kept safe from being dropped.
+        """
+        with self.lock:
+            self.shownCacheKeys[shownBy] = self.showingCacheKeys.pop( shownBy, set() )
+    # end of SharedVerseCache.finishShowing
+
+
+    def storeVerseData( self, resourceID:Hashable, verseKey, verseData ) -> None:
+        """
+        Put the verse data into the cache (replacing any existing entry).
+        """
+        cacheKey = resourceID, verseKey.makeHash()
+        numBytes = estimateDataSize( verseData )
+        with self.lock:
+            if cacheKey in self.entries:
+                self.numBytes -= self.entries.pop( cacheKey )[1]
+            if numBytes > self.maxBytes: return # Never going to fit
+            self.entries[cacheKey] = verseData, numBytes
+            self.numBytes += numBytes
+            self._evict()
+    # end of SharedVerseCache.storeVerseData
+
+
+    def prefetchVerseData( self, resourceID:Hashable, verseKey, fetchFunction:Callable ) -> Tuple[Any,int]:
+        """
+        Makes sure that the verse is in the cache
+            without affecting the hit/miss counts.
+
+        Returns the verse data and the number of bytes added to the cache
+            (which is zero if it was already there).
+        """
+        cacheKey = resourceID, verseKey.makeHash()
+        with self.lock:
+            try: return self.entries[cacheKey][0], 0
+            except KeyError: pass
+        verseData = fetchFunction( verseKey )
+        numBytes = estimateDataSize( verseData )
+        with self.lock:
+            if cacheKey not in self.entries and numBytes <= self.maxBytes:
+                self.entries[cacheKey] = verseData, numBytes
+                self.numBytes += numBytes
+                self.numPrefetched += 1
+                self._evict()
+        return verseData, numBytes
+    # end of SharedVerseCache.prefetchVerseData
+
+
+    def _evict( self ) -> None:
+        """
+        Drop the least recently used entries until we're back within our memory budget.
+
+        Entries that are being shown are moved to the end instead,
+            so we can stay over budget if they're all that's left.
+
+        The caller must hold the lock.
+        """
+        if self.numBytes <= self.maxBytes: return
+        protectedCacheKeys = set().union( *self.shownCacheKeys.values(), *self.showingCacheKeys.values() )
+        numToCheck = len( self.entries )
+        while self.numBytes > self.maxBytes and numToCheck > 0:
+            numToCheck -= 1
+            cacheKey = next( iter( self.entries ) )
+            if cacheKey in protectedCacheKeys:
+                self.entries.move_to_end( cacheKey )
+                continue
+            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Removing oldest cached entry", len(self.entries) )
+            _verseData, numBytes = self.entries.pop( cacheKey )
+            self.numBytes -= numBytes
+            self.numEvictions += 1
+    # end of SharedVerseCache._evict
+
+
+    def removeResource( self, resourceID:Hashable ) -> None:
+        """
+        Remove all the entries for the given resource
+            (and forget what it was showing if it was a window or box).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SharedVerseCache.removeResource( {resourceID} )" )
+        with self.lock:
+            self.shownCacheKeys.pop( resourceID, None )
+            self.showingCacheKeys.pop( resourceID, None )
+            for cacheKey in [cacheKey for cacheKey in self.entries if cacheKey[0] == resourceID]:
+                self.numBytes -= self.entries.pop( cacheKey )[1]
+    # end of SharedVerseCache.removeResource
+
+
+    def removeBook( self, resourceID:Hashable, BBB:str ) -> None:
+        """
+        Remove all the entries for the given book of the given resource,
+            e.g., because the book file has been changed on disk.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"SharedVerseCache.removeBook( {resourceID}, {BBB} )" )
+        BBBPrefix = f'{BBB}_' # Verse key hashes start with this
+        with self.lock:
+            for cacheKey in [cacheKey for cacheKey in self.entries if cacheKey[0] == resourceID and cacheKey[1].startswith( BBBPrefix )]:
+                self.numBytes -= self.entries.pop( cacheKey )[1]
+    # end of SharedVerseCache.removeBook
+
+
+    def clear( self ) -> None:
+        """
+        Remove all entries (but leave the statistics).
+        """
+        with self.lock:
+            self.entries.clear()
+            self.numBytes = 0
+    # end of SharedVerseCache.clear
+
+
+    def getStats( self ) -> Dict[str,Any]:
+        """
+        Returns a dictionary containing cache statistics.
+        """
+        with self.lock:
+            numLookups = self.numHits + self.numMisses
+            return { 'numEntries':len(self.entries), 'numBytes':self.numBytes, 'maxBytes':self.maxBytes,
+                    'numHits':self.numHits, 'numMisses':self.numMisses, 'numEvictions':self.numEvictions,
+                    'numPrefetched':self.numPrefetched,
+                    'hitRate':self.numHits/numLookups if numLookups else 0.0,
+                    'missRate':self.numMisses/numLookups if numLookups else 0.0, }
+    # end of SharedVerseCache.getStats
+
+
+    def getStatsText( self ) -> str:
+        """
+        Returns a one-line summary of the cache statistics.
+        """
+        stats = self.getStats()
+        return _("Verse cache: {:,} verses using {:,}/{:,} KB; {:,} hits ({:.0%}), {:,} misses ({:.0%}), {:,} prefetched, {:,} dropped") \
+                    .format( stats['numEntries'], stats['numBytes']//1000, stats['maxBytes']//1000,
+                            stats['numHits'], stats['hitRate'], stats['numMisses'], stats['missRate'],
+                            stats['numPrefetched'], stats['numEvictions'] )
+    # end of SharedVerseCache.getStatsText
+# end of class SharedVerseCache
+
+
+
+def prefetchVerses( verseCache:SharedVerseCache, resource, verseKey, maxBytes:int ):
+    """
+    A generator which loads verses for the resource (window or box) into the verse cache
+        in the order that they're likely to be needed next:
+            the rest of this section and the next section,
+            then the next chapter, then the previous chapter.
+
+    It yields the number of bytes added to the cache after each verse,
+        and stops after adding maxBytes to the cache.
+
+    The resource must provide getVerseCacheResourceID, getContextVerseData,
+        getNumChapters and getNumVerses functions.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"prefetchVerses( {resource}, {verseKey.getShortText()}, {maxBytes:,} )" )
+    BBB, intC, intV = verseKey.getBBB(), verseKey.getChapterNumberInt(), verseKey.getVerseNumberInt()
+    if BBB == 'UNK': return
+    try: numChapters = resource.getNumChapters( BBB )
+    except KeyError: return
+    if not numChapters: return
+    resourceID = resource.getVerseCacheResourceID()
+    numBytes = 0
+
+    def getNumVerses( thisC:int ) -> int:
+        try: return resource.getNumVerses( BBB, thisC ) or 0
+        except KeyError: return 0
+    # end of prefetchVerses.getNumVerses
+
+    # Go forward to the end of the next section (but no more than two chapters)
+    numSectionHeadings = 0
+    for thisC in range( intC, min( intC+2, numChapters ) + 1 ):
+        for thisV in range( intV+1 if thisC==intC else 0, getNumVerses( thisC ) + 1 ):
+            verseData, numNewBytes = verseCache.prefetchVerseData( resourceID, SimpleVerseKey( BBB, thisC, thisV ), resource.getContextVerseData )
+            numBytes += numNewBytes
+            yield numNewBytes
+            if numBytes >= maxBytes: return
+            if verseDataHasSectionHeading( verseData ):
+                numSectionHeadings += 1
+                if numSectionHeadings == 2: break # We've reached the start of the section after next
+        if numSectionHeadings == 2: break
+
+    # Now the next and previous chapters
+    for thisC in ( intC+1, intC-1 ):
+        if 1 <= thisC <= numChapters:
+            for thisV in range( getNumVerses( thisC ) + 1 ):
+                verseData, numNewBytes = verseCache.prefetchVerseData( resourceID, SimpleVerseKey( BBB, thisC, thisV ), resource.getContextVerseData )
+                numBytes += numNewBytes
+                yield numNewBytes
+                if numBytes >= maxBytes: return
+# end of VerseCache.prefetchVerses
+
+
+
+class VersePrefetcher:
+    """
+    Prefetches verses into the verse cache in small slices
+        when Tk is idle, so that it doesn't slow down the user interface.
+
+    Only one prefetch is kept for each resource (window or box),
+        so a new request (i.e., after navigating) stops any earlier one.
+
+    The latest prefetches for all the resources together
+        are limited to a fraction of the verse cache (see getTotalMaxBytes)
+        so that they can't push out what the other resources have just displayed.
+    """
+    def __init__( self, verseCache:SharedVerseCache, tkWidget, maxBytes:int=DEFAULT_PREFETCH_MEGABYTES*1_000_000 ) -> None:
+        """
+        The tkWidget is used to schedule the prefetching (with after and after_idle).
+
+        maxBytes is the maximum to prefetch for each resource each time.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"VersePrefetcher.__init__( {verseCache}, {tkWidget}, {maxBytes:,} )" )
+        self.verseCache, self.tkWidget, self.maxBytes = verseCache, tkWidget, maxBytes
+        self.prefetchJobs = OrderedDict() # Keys are id(resource), values are (resource,generator)
+        self.prefetchedBytes = {} # Keys are id(resource), values are the number of bytes added by the latest request
+        self.afterID = None
+    # end of VersePrefetcher.__init__
+
+
+    def getTotalMaxBytes( self ) -> int:
+        """
+        Returns the maximum number of bytes that the latest prefetches
+            (for all the resources together) can add to the verse cache.
+        """
+        return int( self.verseCache.maxBytes * PREFETCH_CACHE_FRACTION )
+    # end of VersePrefetcher.getTotalMaxBytes
+
+
+    def requestPrefetch( self, resource, verseKey ) -> None:
+        """
+        Called when a resource (window or box) has just displayed a new reference.
+
+        Replaces any earlier prefetch for that resource.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"VersePrefetcher.requestPrefetch( {resource}, {verseKey.getShortText()} )" )
+        self.prefetchJobs.pop( id(resource), None )
+        self.prefetchedBytes[id(resource)] = 0
+        if self.maxBytes > 0:
+            self.prefetchJobs[id(resource)] = resource, prefetchVerses( self.verseCache, resource, verseKey, self.maxBytes )
+            if self.afterID is not None: self.tkWidget.after_cancel( self.afterID ) # Wait until navigation has finished
+            self.afterID = self.tkWidget.after( PREFETCH_DELAY, self._startPrefetchSlice )
+    # end of VersePrefetcher.requestPrefetch
+
+
+    def cancelPrefetch( self, resource=None ) -> None:
+        """
+        Stop prefetching for the given resource, or for all resources if None.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"VersePrefetcher.cancelPrefetch( {resource} )" )
+        if resource is None:
+            self.prefetchJobs.clear()
+            self.prefetchedBytes.clear()
+        else:
+            self.prefetchJobs.pop( id(resource), None )
+            self.prefetchedBytes.pop( id(resource), None )
+    # end of VersePrefetcher.cancelPrefetch
+
+
+    def _startPrefetchSlice( self ) -> None:
+        """
+        Wait until Tk has handled any pending events (like user input).
+        """
+        self.afterID = self.tkWidget.after_idle( self._doPrefetchSlice )
+    # end of VersePrefetcher._startPrefetchSlice
+
+
+    def _doPrefetchSlice( self ) -> None:
+        """
+        Prefetch verses for a short time,
+            taking turns between the resources,
+            then schedule the next slice if there's more to do.
+
+        Stops all the prefetching when the total for the latest requests is reached.
+        """
+        self.afterID = None
+        startTime = time.monotonic()
+        totalMaxBytes = self.getTotalMaxBytes()
+        while self.prefetchJobs and time.monotonic()-startTime < PREFETCH_SLICE_TIME:
+            if sum( self.prefetchedBytes.values() ) >= totalMaxBytes:
+                vPrint( 'Never', DEBUGGING_THIS_MODULE, f"VersePrefetcher stopping {len(self.prefetchJobs)} prefetches at {totalMaxBytes:,} bytes" )
+                self.prefetchJobs.clear()
+                break
+            jobKey, (resource, job) = next( iter( self.prefetchJobs.items() ) )
+            try:
+                if not resource.winfo_exists(): # The window or box has been closed
+                    self.prefetchedBytes.pop( jobKey, None )
+                    raise StopIteration
+                self.prefetchedBytes[jobKey] = self.prefetchedBytes.get( jobKey, 0 ) + next( job )
+            except StopIteration:
+                if self.prefetchJobs.get( jobKey, (None,None) )[1] is job: del self.prefetchJobs[jobKey]
+                continue
+            except Exception as err: # Prefetching is only an optimisation -- it mustn't crash the program
+                logging.error( f"VersePrefetcher: prefetching for {resource} failed: {err!r}" )
+                if self.prefetchJobs.get( jobKey, (None,None) )[1] is job: del self.prefetchJobs[jobKey]
+                continue
+            if jobKey in self.prefetchJobs: self.prefetchJobs.move_to_end( jobKey ) # Let the others have a turn
+        if self.prefetchJobs and self.afterID is None:
+            self.afterID = self.tkWidget.after( PREFETCH_INTERVAL, self._startPrefetchSlice )
+    # end of VersePrefetcher._doPrefetchSlice
+# end of class VersePrefetcher
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
+
+    verseCache = SharedVerseCache( 20_000 )
+    fetchFunction = lambda verseKey: ([f'Text for {verseKey.getShortText()}'], ['c'])
+    for resourceID in ( ('Sword','KJV'), ('Sword','KJV'), ('DBP','ENGESV') ):
+        for V in range( 1, 31 ):
+            verseCache.getVerseData( resourceID, SimpleVerseKey( 'JHN', '3', str(V) ), fetchFunction )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, verseCache.getStatsText() )
+    verseCache.getVerseData( ('Sword','KJV'), SimpleVerseKey( 'JN1', '1', '1' ), fetchFunction )
+    verseCache.removeBook( ('Sword','KJV'), 'JHN' )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  After removing KJV JHN: {verseCache.getStatsText()}" )
+# end of VerseCache.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of VerseCache.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of VerseCache.py
@@ -23,8 +23,13 @@
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
+    retrieveWindowsSettings( windowsSettingsName )
     parseAndApplySettings()
     applyGivenWindowsSettings( givenWindowsSettingsName )
+    getWindowRestorePriority( thisStuff )
+    restoreNextWindow()
+    cancelWindowRestores()
+    restoreWindow( j, thisStuff, showNow=False )
     getCurrentChildWindowSettings()
     saveNewWindowSetup()
     deleteExistingWindowSetup()
@@ -35,6 +40,7 @@
 """
 from gettext import gettext as _
 import os
+import re
 from pathlib import Path
 import logging
 
@@ -58,7 +64,9 @@ from Biblelator.BiblelatorGlobals import APP_NAME, APP_NAME_VERSION, DEFAULT, \
     parseWindowSize, assembleWindowSize
 from Biblelator.Dialogs.BiblelatorSimpleDialogs import showError
 from Biblelator.Dialogs.BiblelatorDialogs import SaveWindowsLayoutNameDialog, DeleteWindowsLayoutNameDialog
-from Biblelator.Windows.TextEditWindow import TextEditWindow
+from Biblelator.Helpers.VerseCache import DEFAULT_VERSE_CACHE_MEGABYTES, DEFAULT_PREFETCH_MEGABYTES
+from Biblelator.Helpers.BackgroundLogWriter import flushLogs
+from Biblelator.Settings.StartupSnapshots import loadSnapshot, saveSnapshot
 
 
 LAST_MODIFIED_DATE = '2022-07-18' # by RJH
@@ -71,6 +79,8 @@ PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 DEBUGGING_THIS_MODULE = False
 
 
+WINDOW_SETTING_KEY_RE = re.compile( r'window(\d+)(.+)' ) # e.g., window12Type
+
 
 def convertTextToPython( text ):
     """
@@ -93,6 +103,34 @@ def convertTextToPython( text ):
 
 
 
+def retrieveWindowsSettings( windowsSettingsName:str ):
+    """
+    Gets a certain windows settings from the settings (INI) file information
+        and puts it into a dictionary.
+
+    Returns the dictionary.
+
+    Called from parseAndApplySettings() and writeSettingsFile().
+    """
+    if BibleOrgSysGlobals.debugFlag:
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "retrieveWindowsSettings( {} )".format( repr(windowsSettingsName) ) )
+        if DEBUGGING_THIS_MODULE: BiblelatorGlobals.theApp.setDebugText( "retrieveWindowsSettings…" )
+    windowsSettingsFields = BiblelatorGlobals.theApp.settings.data['WindowSetting'+windowsSettingsName]
+    windowDicts = {}
+    for keyName,value in windowsSettingsFields.items(): # Just one pass through the keys
+        match = WINDOW_SETTING_KEY_RE.fullmatch( keyName )
+        if match:
+            j = int( match.group(1) )
+            if 1 <= j <= MAX_WINDOWS:
+                if j not in windowDicts: windowDicts[j] = {}
+                windowDicts[j][match.group(2)] = value
+    resultDict = { 'window{}'.format( j ):windowDicts[j] for j in sorted( windowDicts ) }
+    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "retrieveWindowsSettings", resultDict )
+    return resultDict
+# end of retrieveWindowsSettings
+
+
+
 def parseAndApplySettings() -> None:
     """
     Parse the settings out of the .INI file.
@@ -102,31 +140,6 @@ def parseAndApplySettings() -> None:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "parseAndApplySettings()" )
         if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "parseAndApplySettings…" )
 
-    def retrieveWindowsSettings( windowsSettingsName:str ):
-        """
-        Gets a certain windows settings from the settings (INI) file information
-            and puts it into a dictionary.
-
-        Returns the dictionary.
-
-        Called from parseAndApplySettings().
-        """
-        if BibleOrgSysGlobals.debugFlag:
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "retrieveWindowsSettings( {} )".format( repr(windowsSettingsName) ) )
-            if DEBUGGING_THIS_MODULE: BiblelatorGlobals.theApp.setDebugText( "retrieveWindowsSettings…" )
-        windowsSettingsFields = BiblelatorGlobals.theApp.settings.data['WindowSetting'+windowsSettingsName]
-        resultDict = {}
-        for j in range( 1, MAX_WINDOWS+1 ):
-            winNumber = 'window{}'.format( j )
-            for keyName in windowsSettingsFields:
-                if keyName.startswith( winNumber ):
-                    if winNumber not in resultDict: resultDict[winNumber] = {}
-                    resultDict[winNumber][keyName[len(winNumber):]] = windowsSettingsFields[keyName]
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "retrieveWindowsSettings", resultDict )
-        return resultDict
-    # end of retrieveWindowsSettings
-
-
     # Main code for parseAndApplySettings()
     # Parse main app stuff
     #try: BiblelatorGlobals.theApp.rootWindow.geometry( BiblelatorGlobals.theApp.settings.data[APP_NAME]['windowGeometry'] )
@@ -171,6 +184,14 @@ def parseAndApplySettings() -> None:
     try: BiblelatorGlobals.theApp.showDebugMenu = convertTextToPython( BiblelatorGlobals.theApp.settings.data['Interface']['showDebugMenu'] )
     except KeyError: BiblelatorGlobals.theApp.showDebugMenu = False
     if BibleOrgSysGlobals.debugFlag: assert BiblelatorGlobals.theApp.showDebugMenu in ( False, True )
+    try: verseCacheMegabytes = int( BiblelatorGlobals.theApp.settings.data['Interface']['verseCacheMegabytes'] )
+    except (KeyError, ValueError): verseCacheMegabytes = DEFAULT_VERSE_CACHE_MEGABYTES
+    if verseCacheMegabytes < 1: verseCacheMegabytes = DEFAULT_VERSE_CACHE_MEGABYTES # Handle errors in ini file
+    BiblelatorGlobals.theApp.verseCache.setMaxBytes( verseCacheMegabytes * 1_000_000 )
+    try: prefetchMegabytes = int( BiblelatorGlobals.theApp.settings.data['Interface']['prefetchMegabytes'] )
+    except (KeyError, ValueError): prefetchMegabytes = DEFAULT_PREFETCH_MEGABYTES
+    if prefetchMegabytes < 0: prefetchMegabytes = DEFAULT_PREFETCH_MEGABYTES # Handle errors in ini file (but zero turns prefetching off)
+    BiblelatorGlobals.theApp.versePrefetcher.maxBytes = prefetchMegabytes * 1_000_000
 
     # Parse Internet stuff
     try:
@@ -304,9 +325,13 @@ def parseAndApplySettings() -> None:
         if name.startswith( 'WindowSetting' ): windowsSettingsNamesList.append( name[13:] )
         dPrint( 'Verbose', DEBUGGING_THIS_MODULE, "Available windows settings are: {}".format( windowsSettingsNamesList ) )
     if windowsSettingsNamesList: assert 'Current' in windowsSettingsNamesList
-    BiblelatorGlobals.theApp.windowsSettingsDict = {}
-    for windowsSettingsName in windowsSettingsNamesList:
-        BiblelatorGlobals.theApp.windowsSettingsDict[windowsSettingsName] = retrieveWindowsSettings( windowsSettingsName )
+    settings = BiblelatorGlobals.theApp.settings
+    BiblelatorGlobals.theApp.windowsSettingsDict = loadSnapshot( settings.snapshotFolderpath, settings.settingsFilename+'.Windows', [settings.settingsFilepath] )
+    if BiblelatorGlobals.theApp.windowsSettingsDict is None:
+        BiblelatorGlobals.theApp.windowsSettingsDict = {}
+        for windowsSettingsName in windowsSettingsNamesList:
+            BiblelatorGlobals.theApp.windowsSettingsDict[windowsSettingsName] = retrieveWindowsSettings( windowsSettingsName )
+        saveSnapshot( settings.snapshotFolderpath, settings.settingsFilename+'.Windows', [settings.settingsFilepath], BiblelatorGlobals.theApp.windowsSettingsDict )
     if 'Current' in windowsSettingsNamesList: applyGivenWindowsSettings( 'Current' )
     else: logging.critical( "Application.parseAndApplySettings: No current window settings available" )
 # end of parseAndApplySettings
@@ -318,194 +343,271 @@ def applyGivenWindowsSettings( givenWindowsSettingsName ):
     Given the name of windows settings,
         find the settings in our dictionary
         and then apply it by creating the windows.
+
+    Only the window that last had the focus (or else the first editor) is opened immediately.
+        The others are queued to be opened one at a time when Tk is idle (see restoreNextWindow)
+        so that the user can get working without waiting for them all.
     """
     fnPrint( DEBUGGING_THIS_MODULE, "applyGivenWindowsSettings( {} )".format( givenWindowsSettingsName ) )
     if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
         if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "applyGivenWindowsSettings…" )
 
+    cancelWindowRestores()
     BiblelatorGlobals.theApp.doCloseMyChildWindows()
 
     windowsSettingsFields = BiblelatorGlobals.theApp.windowsSettingsDict[givenWindowsSettingsName]
+    windowsToRestore = []
     for j in range( 1, MAX_WINDOWS ):
         winNumber = 'window{}'.format( j )
         if winNumber in windowsSettingsFields:
-            rw = None
-            thisStuff = windowsSettingsFields[winNumber]
-            windowType = thisStuff['Type']
-            #windowGeometry = thisStuff['Geometry'] if 'Geometry' in thisStuff else None
-            windowSize = thisStuff['Size'] if 'Size' in thisStuff else None
-            windowPosition = thisStuff['Position'] if 'Position' in thisStuff else None
-            windowGeometry = windowSize+'+'+windowPosition if windowSize and windowPosition else None
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "applyGivenWindowsSettings", windowType, windowGeometry )
-
-            if windowType == 'SwordBibleResourceWindow':
-                try:
-                    rw = BiblelatorGlobals.theApp.openSwordBibleResourceWindow( thisStuff['ModuleAbbreviation'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'SwordBibleResourceWindow {j}' settings" )
-            elif windowType == 'DBPBibleResourceWindow':
-                try:
-                    rw = BiblelatorGlobals.theApp.openDBPBibleResourceWindow( thisStuff['ModuleAbbreviation'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'DBPBibleResourceWindow {j}' settings" )
-            elif windowType == 'InternalBibleResourceWindow':
-                try:
-                    folderpath = thisStuff['BibleFolderpath']
-                    if folderpath[-1] not in '/\\' \
-                    and not str(folderpath).endswith( ZIPPED_PICKLE_FILENAME_END ):
-                        folderpath = f'{folderpath}/'
-                    rw = BiblelatorGlobals.theApp.openInternalBibleResourceWindow( folderpath, windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'InternalBibleResourceWindow {j}' settings" )
-            elif windowType == 'HebrewBibleResourceWindow':
-                try:
-                    folderpath = thisStuff['BibleFolderpath']
-                    if folderpath[-1] not in '/\\' \
-                    and not str(folderpath).endswith( ZIPPED_PICKLE_FILENAME_END ):
-                        folderpath = f'{folderpath}/'
-                    rw = BiblelatorGlobals.theApp.openHebrewBibleResourceWindow( folderpath, windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'HebrewBibleResourceWindow {j}' settings" )
-
-            #elif windowType == 'HebrewLexiconResourceWindow':
-                #BiblelatorGlobals.theApp.openHebrewLexiconResourceWindow( thisStuff['HebrewLexiconPath'], windowGeometry )
-                ##except: logging.critical( "Unable to read all HebrewLexiconResourceWindow {} settings".format( j ) )
-            #elif windowType == 'GreekLexiconResourceWindow':
-                #BiblelatorGlobals.theApp.openGreekLexiconResourceWindow( thisStuff['GreekLexiconPath'], windowGeometry )
-                ##except: logging.critical( "Unable to read all GreekLexiconResourceWindow {} settings".format( j ) )
-            elif windowType == 'BibleLexiconResourceWindow':
-                rw = BiblelatorGlobals.theApp.openBibleLexiconResourceWindow( windowGeometry )
-                #except: logging.critical( "Unable to read all BibleLexiconResourceWindow {} settings".format( j ) )
-
-            elif windowType == 'BibleResourceCollectionWindow':
-                collectionName = thisStuff['CollectionName']
-                rw = BiblelatorGlobals.theApp.openBibleResourceCollectionWindow( collectionName, windowGeometry )
-                #except: logging.critical( "Unable to read all BibleLexiconResourceWindow {} settings".format( j ) )
-                if 'BibleResourceCollection'+collectionName in BiblelatorGlobals.theApp.settings.data:
-                    collectionSettingsFields = BiblelatorGlobals.theApp.settings.data['BibleResourceCollection'+collectionName]
-                    for k in range( 1, MAX_WINDOWS ):
-                        boxNumber = 'box{}'.format( k )
-                        boxType = boxSource = None
-                        for keyname in collectionSettingsFields:
-                            if keyname.startswith( boxNumber ):
-                                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "found", keyname, "setting for", collectionName, "collection" )
-                                if keyname == boxNumber+'Type': boxType = collectionSettingsFields[keyname]
-                                elif keyname == boxNumber+'Source': boxSource = collectionSettingsFields[keyname]
-                                else:
-                                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Unknown {} collection key: {} = {}".format( repr(collectionName), keyname, collectionSettingsFields[keyname] ) )
-                                    if BibleOrgSysGlobals.debugFlag: halt
-                        if boxType and boxSource:
-                            #if boxType in ( 'Internal', ):
-                                #if boxSource[-1] not in '/\\': boxSource += '/' # Are they all folders -- might be wrong
-                            rw.openBox( boxType, boxSource )
-
-            elif windowType == 'CSVBibleEditWindow':
-                try: filepath = convertTextToPython( thisStuff['CSVFilepath'] )
-                except KeyError: folderpath = None
-                rw = BiblelatorGlobals.theApp.openCSVEditWindow( filepath, windowGeometry )
-            elif windowType == 'TSVBibleEditWindow':
-                try: folderpath = convertTextToPython( thisStuff['TSVFolderpath'] )
-                except KeyError: folderpath = None
-                rw = BiblelatorGlobals.theApp.openTSVEditWindow( folderpath, windowGeometry )
-            elif windowType == 'BibleNotesWindow':
-                try: folderpath = convertTextToPython( thisStuff['NotesFolderpath'] )
-                except KeyError: folderpath = None
-                rw = BiblelatorGlobals.theApp.openBibleNotesWindow( folderpath, windowGeometry )
-
-            elif windowType == 'TranslationManualWindow':
-                try:
-                    try: folderpath = convertTextToPython( thisStuff['TMFolderpath'] )
-                    except KeyError: folderpath = None
-                    rw = BiblelatorGlobals.theApp.openTranslationManualWindow( folderpath, windowGeometry )
-                except:
-                    logging.critical( f"Unable to read all 'TranslationManualWindow {j}' settings" )
-
-            elif windowType == 'BibleReferenceCollectionWindow':
-                xyz = "JustTesting!"
-                rw = BiblelatorGlobals.theApp.openBibleReferenceCollectionWindow( xyz, windowGeometry )
-                #except: logging.critical( "Unable to read all BibleReferenceCollectionWindow {} settings".format( j ) )
-
-            elif windowType == 'PlainTextEditWindow':
-                try: filepath = convertTextToPython( thisStuff['TextFilepath'] )
-                except KeyError: filepath = None
-                #if filepath == 'None': filepath = None
-                rw = BiblelatorGlobals.theApp.openFileTextEditWindow( filepath, windowGeometry )
-                #except: logging.critical( "Unable to read all PlainTextEditWindow {} settings".format( j ) )
-            elif windowType == 'BiblelatorUSFMBibleEditWindow':
-                try:
-                    folderpath = thisStuff['ProjectFolderpath']
-                    if folderpath[-1] not in '/\\': folderpath = f'{folderpath}/'
-                    rw = BiblelatorGlobals.theApp.openBiblelatorBibleEditWindow( folderpath, thisStuff['EditMode'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'BiblelatorUSFMBibleEditWindow {j}' settings" )
-            elif windowType == 'uWUSFMBibleEditWindow':
-                try:
-                    folderpath = thisStuff['ProjectFolderpath']
-                    if folderpath[-1] not in '/\\': folderpath = f'{folderpath}/'
-                    rw = BiblelatorGlobals.theApp.openUWUSFMBibleEditWindow( folderpath, thisStuff['EditMode'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'uWUSFMBibleEditWindow {j}' settings" )
-            elif windowType == 'Paratext8USFMBibleEditWindow':
-                try:
-                    rw = BiblelatorGlobals.theApp.openParatext8BibleEditWindow( thisStuff['ProjectFolder'], thisStuff['EditMode'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'Paratext8USFMBibleEditWindow {j}' settings" )
-            elif windowType == 'Paratext7USFMBibleEditWindow':
-                try:
-                    rw = BiblelatorGlobals.theApp.openParatext7BibleEditWindow( thisStuff['SSFFilepath'], thisStuff['EditMode'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all 'Paratext7USFMBibleEditWindow {j}' settings" )
-            elif windowType == 'ESFMEditWindow':
-                try:
-                    folderpath = thisStuff['ESFMFolder']
-                    if folderpath[-1] not in '/\\': folderpath = f'{folderpath}/'
-                    rw = BiblelatorGlobals.theApp.openESFMEditWindow( folderpath, thisStuff['EditMode'], windowGeometry )
-                except KeyError:
-                    logging.critical( f"Unable to read all ESFMEditWindow {j} settings" )
-
-            else:
-                logging.critical( "applyGivenWindowsSettings: " + _("Unknown {} window type").format( repr(windowType) ) )
-                if BibleOrgSysGlobals.debugFlag: halt
-
-            if rw is None:
-                logging.critical( "applyGivenWindowsSettings: " + _("Failed to reopen '{}' window type!!! How did this happen?").format( windowType ) )
-                showError( BiblelatorGlobals.theApp, "Startup", _("Failed to reopen '{}'! (Program error or bad settings file.)").format( windowType ) )
-            else: # we've opened our child window -- now customize it a bit more
-                minimumSize = thisStuff['MinimumSize'] if 'MinimumSize' in thisStuff else None
-                if minimumSize:
-                    if BibleOrgSysGlobals.debugFlag: assert 'x' in minimumSize
-                    rw.minsize( *parseWindowSize( minimumSize ) )
-                maximumSize = thisStuff['MaximumSize'] if 'MaximumSize' in thisStuff else None
-                if maximumSize:
-                    if BibleOrgSysGlobals.debugFlag: assert 'x' in maximumSize
-                    rw.maxsize( *parseWindowSize( maximumSize ) )
-                groupCode = thisStuff['GroupCode'] if 'GroupCode' in thisStuff else None
-                if groupCode:
-                    if BibleOrgSysGlobals.debugFlag: assert groupCode in BIBLE_GROUP_CODES
-                    rw.setWindowGroup( groupCode )
-                contextViewMode = thisStuff['ContextViewMode'] if 'ContextViewMode' in thisStuff else None
-                if contextViewMode:
-                    if BibleOrgSysGlobals.debugFlag: assert contextViewMode in BIBLE_CONTEXT_VIEW_MODES
-                    rw.setContextViewMode( contextViewMode )
-                    #rw._createMenuBar() # in order to show the correct contextViewMode
-                formatViewMode = thisStuff['FormatViewMode'] if 'FormatViewMode' in thisStuff else None
-                if formatViewMode:
-                    if BibleOrgSysGlobals.debugFlag: assert formatViewMode in BIBLE_FORMAT_VIEW_MODES
-                    rw.setFormatViewMode( formatViewMode )
-                    #rw._createMenuBar() # in order to show the correct contextViewMode
-                autocompleteMode = convertTextToPython( thisStuff['AutocompleteMode'] ) if 'AutocompleteMode' in thisStuff else None
-                #if autocompleteMode == 'None': autocompleteMode = None
-                if autocompleteMode:
-                    if BibleOrgSysGlobals.debugFlag: assert windowType.endswith( 'EditWindow' )
-                    rw.autocompleteMode = autocompleteMode
-                    rw.prepareAutocomplete()
-                statusBarMode = thisStuff['StatusBar'] if 'StatusBar' in thisStuff else None
-                if statusBarMode:
-                    statusBarOn = statusBarMode.lower() in ('on', 'true' ,'yes', 'enabled',)
-                    rw.doToggleStatusBar( statusBarOn )
+            windowsToRestore.append( (j,windowsSettingsFields[winNumber]) )
+    if not windowsToRestore: return
+    windowsToRestore.sort( key=lambda jStuff: getWindowRestorePriority( jStuff[1] ) ) # Stable sort keeps the saved order otherwise
+
+    j, thisStuff = windowsToRestore.pop( 0 )
+    rw = restoreWindow( j, thisStuff, showNow=True )
+    if rw is not None: rw.focus_set()
+    BiblelatorGlobals.theApp.windowsToRestore = windowsToRestore
+    if windowsToRestore:
+        BiblelatorGlobals.theApp.restoreWindowsAfterID = BiblelatorGlobals.theApp.after_idle( restoreNextWindow )
 # end of applyGivenWindowsSettings
 
 
+def getWindowRestorePriority( thisStuff:dict ) -> int:
+    """
+    Returns a sort key for restoring saved windows, with the most wanted first,
+        i.e., the editor that last had the focus, then other editors,
+        then any other focused window, then the resources.
+    """
+    isEditor = thisStuff['Type'].endswith( 'EditWindow' )
+    hadFocus = thisStuff.get( 'Focused' ) == 'Yes'
+    if isEditor: return 0 if hadFocus else 1
+    return 2 if hadFocus else 3
+# end of getWindowRestorePriority
+
+
+def restoreNextWindow() -> None:
+    """
+    Open the next saved window that's waiting to be restored,
+        then give Tk a chance to handle user input before doing the next one.
+    """
+    BiblelatorGlobals.theApp.restoreWindowsAfterID = None
+    if not BiblelatorGlobals.theApp.windowsToRestore: return
+    j, thisStuff = BiblelatorGlobals.theApp.windowsToRestore.pop( 0 )
+    fnPrint( DEBUGGING_THIS_MODULE, f"restoreNextWindow() for {j} {thisStuff['Type']} ({len(BiblelatorGlobals.theApp.windowsToRestore)} more waiting)" )
+    try: restoreWindow( j, thisStuff )
+    finally:
+        if BiblelatorGlobals.theApp.windowsToRestore and BiblelatorGlobals.theApp.restoreWindowsAfterID is None:
+            BiblelatorGlobals.theApp.restoreWindowsAfterID = BiblelatorGlobals.theApp.after_idle( restoreNextWindow )
+# end of restoreNextWindow
+
+
+def cancelWindowRestores() -> None:
+    """
+    Drop any saved windows that haven't been reopened yet.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "cancelWindowRestores()" )
+    if BiblelatorGlobals.theApp.restoreWindowsAfterID is not None:
+        BiblelatorGlobals.theApp.after_cancel( BiblelatorGlobals.theApp.restoreWindowsAfterID )
+        BiblelatorGlobals.theApp.restoreWindowsAfterID = None
+    BiblelatorGlobals.theApp.windowsToRestore = []
+# end of cancelWindowRestores
+
+
+def restoreWindow( j:int, thisStuff:dict, showNow:bool=False ):
+    """
+    Open the jth saved window and customise it from the given settings.
+
+    If showNow is False, Bible windows don't display their reference
+        until they're actually shown on the screen.
+
+    Returns the new window (or None).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"restoreWindow( {j}, {thisStuff['Type']}, {showNow} )" )
+
+    BiblelatorGlobals.theApp.isRestoringWindows = True # Tells the open… functions to leave out the initial updateShownBCV
+    try:
+        rw = None
+        windowType = thisStuff['Type']
+        #windowGeometry = thisStuff['Geometry'] if 'Geometry' in thisStuff else None
+        windowSize = thisStuff['Size'] if 'Size' in thisStuff else None
+        windowPosition = thisStuff['Position'] if 'Position' in thisStuff else None
+        windowGeometry = windowSize+'+'+windowPosition if windowSize and windowPosition else None
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "restoreWindow", windowType, windowGeometry )
+
+        if windowType == 'SwordBibleResourceWindow':
+            try:
+                rw = BiblelatorGlobals.theApp.openSwordBibleResourceWindow( thisStuff['ModuleAbbreviation'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'SwordBibleResourceWindow {j}' settings" )
+        elif windowType == 'DBPBibleResourceWindow':
+            try:
+                rw = BiblelatorGlobals.theApp.openDBPBibleResourceWindow( thisStuff['ModuleAbbreviation'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'DBPBibleResourceWindow {j}' settings" )
+        elif windowType == 'InternalBibleResourceWindow':
+            try:
+                folderpath = thisStuff['BibleFolderpath']
+                if folderpath[-1] not in '/\\' \
+                and not str(folderpath).endswith( ZIPPED_PICKLE_FILENAME_END ):
+                    folderpath = f'{folderpath}/'
+                rw = BiblelatorGlobals.theApp.openInternalBibleResourceWindow( folderpath, windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'InternalBibleResourceWindow {j}' settings" )
+        elif windowType == 'HebrewBibleResourceWindow':
+            try:
+                folderpath = thisStuff['BibleFolderpath']
+                if folderpath[-1] not in '/\\' \
+                and not str(folderpath).endswith( ZIPPED_PICKLE_FILENAME_END ):
+                    folderpath = f'{folderpath}/'
+                rw = BiblelatorGlobals.theApp.openHebrewBibleResourceWindow( folderpath, windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'HebrewBibleResourceWindow {j}' settings" )
+
+        #elif windowType == 'HebrewLexiconResourceWindow':
+            #BiblelatorGlobals.theApp.openHebrewLexiconResourceWindow( thisStuff['HebrewLexiconPath'], windowGeometry )
+            ##except: logging.critical( "Unable to read all HebrewLexiconResourceWindow {} settings".format( j ) )
+        #elif windowType == 'GreekLexiconResourceWindow':
+            #BiblelatorGlobals.theApp.openGreekLexiconResourceWindow( thisStuff['GreekLexiconPath'], windowGeometry )
+            ##except: logging.critical( "Unable to read all GreekLexiconResourceWindow {} settings".format( j ) )
+        elif windowType == 'BibleLexiconResourceWindow':
+            rw = BiblelatorGlobals.theApp.openBibleLexiconResourceWindow( windowGeometry )
+            #except: logging.critical( "Unable to read all BibleLexiconResourceWindow {} settings".format( j ) )
+
+        elif windowType == 'BibleResourceCollectionWindow':
+            collectionName = thisStuff['CollectionName']
+            rw = BiblelatorGlobals.theApp.openBibleResourceCollectionWindow( collectionName, windowGeometry )
+            #except: logging.critical( "Unable to read all BibleLexiconResourceWindow {} settings".format( j ) )
+            if 'BibleResourceCollection'+collectionName in BiblelatorGlobals.theApp.settings.data:
+                collectionSettingsFields = BiblelatorGlobals.theApp.settings.data['BibleResourceCollection'+collectionName]
+                for k in range( 1, MAX_WINDOWS ):
+                    boxNumber = 'box{}'.format( k )
+                    boxType = boxSource = None
+                    for keyname in collectionSettingsFields:
+                        if keyname.startswith( boxNumber ):
+                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "found", keyname, "setting for", collectionName, "collection" )
+                            if keyname == boxNumber+'Type': boxType = collectionSettingsFields[keyname]
+                            elif keyname == boxNumber+'Source': boxSource = collectionSettingsFields[keyname]
+                            else:
+                                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Unknown {} collection key: {} = {}".format( repr(collectionName), keyname, collectionSettingsFields[keyname] ) )
+                                if BibleOrgSysGlobals.debugFlag: halt
+                    if boxType and boxSource:
+                        #if boxType in ( 'Internal', ):
+                            #if boxSource[-1] not in '/\\': boxSource += '/' # Are they all folders -- might be wrong
+                        rw.openBox( boxType, boxSource )
+
+        elif windowType == 'CSVBibleEditWindow':
+            try: filepath = convertTextToPython( thisStuff['CSVFilepath'] )
+            except KeyError: folderpath = None
+            rw = BiblelatorGlobals.theApp.openCSVEditWindow( filepath, windowGeometry )
+        elif windowType == 'TSVBibleEditWindow':
+            try: folderpath = convertTextToPython( thisStuff['TSVFolderpath'] )
+            except KeyError: folderpath = None
+            rw = BiblelatorGlobals.theApp.openTSVEditWindow( folderpath, windowGeometry )
+        elif windowType == 'BibleNotesWindow':
+            try: folderpath = convertTextToPython( thisStuff['NotesFolderpath'] )
+            except KeyError: folderpath = None
+            rw = BiblelatorGlobals.theApp.openBibleNotesWindow( folderpath, windowGeometry )
+
+        elif windowType == 'TranslationManualWindow':
+            try:
+                try: folderpath = convertTextToPython( thisStuff['TMFolderpath'] )
+                except KeyError: folderpath = None
+                rw = BiblelatorGlobals.theApp.openTranslationManualWindow( folderpath, windowGeometry )
+            except:
+                logging.critical( f"Unable to read all 'TranslationManualWindow {j}' settings" )
+
+        elif windowType == 'BibleReferenceCollectionWindow':
+            xyz = "JustTesting!"
+            rw = BiblelatorGlobals.theApp.openBibleReferenceCollectionWindow( xyz, windowGeometry )
+            #except: logging.critical( "Unable to read all BibleReferenceCollectionWindow {} settings".format( j ) )
+
+        elif windowType == 'PlainTextEditWindow':
+            try: filepath = convertTextToPython( thisStuff['TextFilepath'] )
+            except KeyError: filepath = None
+            #if filepath == 'None': filepath = None
+            rw = BiblelatorGlobals.theApp.openFileTextEditWindow( filepath, windowGeometry )
+            #except: logging.critical( "Unable to read all PlainTextEditWindow {} settings".format( j ) )
+        elif windowType == 'BiblelatorUSFMBibleEditWindow':
+            try:
+                folderpath = thisStuff['ProjectFolderpath']
+                if folderpath[-1] not in '/\\': folderpath = f'{folderpath}/'
+                rw = BiblelatorGlobals.theApp.openBiblelatorBibleEditWindow( folderpath, thisStuff['EditMode'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'BiblelatorUSFMBibleEditWindow {j}' settings" )
+        elif windowType == 'uWUSFMBibleEditWindow':
+            try:
+                folderpath = thisStuff['ProjectFolderpath']
+                if folderpath[-1] not in '/\\': folderpath = f'{folderpath}/'
+                rw = BiblelatorGlobals.theApp.openUWUSFMBibleEditWindow( folderpath, thisStuff['EditMode'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'uWUSFMBibleEditWindow {j}' settings" )
+        elif windowType == 'Paratext8USFMBibleEditWindow':
+            try:
+                rw = BiblelatorGlobals.theApp.openParatext8BibleEditWindow( thisStuff['ProjectFolder'], thisStuff['EditMode'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'Paratext8USFMBibleEditWindow {j}' settings" )
+        elif windowType == 'Paratext7USFMBibleEditWindow':
+            try:
+                rw = BiblelatorGlobals.theApp.openParatext7BibleEditWindow( thisStuff['SSFFilepath'], thisStuff['EditMode'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all 'Paratext7USFMBibleEditWindow {j}' settings" )
+        elif windowType == 'ESFMEditWindow':
+            try:
+                folderpath = thisStuff['ESFMFolder']
+                if folderpath[-1] not in '/\\': folderpath = f'{folderpath}/'
+                rw = BiblelatorGlobals.theApp.openESFMEditWindow( folderpath, thisStuff['EditMode'], windowGeometry )
+            except KeyError:
+                logging.critical( f"Unable to read all ESFMEditWindow {j} settings" )
+
+        else:
+            logging.critical( "restoreWindow: " + _("Unknown {} window type").format( repr(windowType) ) )
+            if BibleOrgSysGlobals.debugFlag: halt
+    finally: BiblelatorGlobals.theApp.isRestoringWindows = False
+
+    if rw is None:
+        logging.critical( "restoreWindow: " + _("Failed to reopen '{}' window type!!! How did this happen?").format( windowType ) )
+        showError( BiblelatorGlobals.theApp, "Startup", _("Failed to reopen '{}'! (Program error or bad settings file.)").format( windowType ) )
+    else: # we've opened our child window -- now customize it a bit more
+        minimumSize = thisStuff['MinimumSize'] if 'MinimumSize' in thisStuff else None
+        if minimumSize:
+            if BibleOrgSysGlobals.debugFlag: assert 'x' in minimumSize
+            rw.minsize( *parseWindowSize( minimumSize ) )
+        maximumSize = thisStuff['MaximumSize'] if 'MaximumSize' in thisStuff else None
+        if maximumSize:
+            if BibleOrgSysGlobals.debugFlag: assert 'x' in maximumSize
+            rw.maxsize( *parseWindowSize( maximumSize ) )
+        groupCode = thisStuff['GroupCode'] if 'GroupCode' in thisStuff else None
+        if groupCode:
+            if BibleOrgSysGlobals.debugFlag: assert groupCode in BIBLE_GROUP_CODES
+            rw.setWindowGroup( groupCode )
+        contextViewMode = thisStuff['ContextViewMode'] if 'ContextViewMode' in thisStuff else None
+        if contextViewMode:
+            if BibleOrgSysGlobals.debugFlag: assert contextViewMode in BIBLE_CONTEXT_VIEW_MODES
+            rw.setContextViewMode( contextViewMode )
+            #rw._createMenuBar() # in order to show the correct contextViewMode
+        formatViewMode = thisStuff['FormatViewMode'] if 'FormatViewMode' in thisStuff else None
+        if formatViewMode:
+            if BibleOrgSysGlobals.debugFlag: assert formatViewMode in BIBLE_FORMAT_VIEW_MODES
+            rw.setFormatViewMode( formatViewMode )
+            #rw._createMenuBar() # in order to show the correct contextViewMode
+        autocompleteMode = convertTextToPython( thisStuff['AutocompleteMode'] ) if 'AutocompleteMode' in thisStuff else None
+        #if autocompleteMode == 'None': autocompleteMode = None
+        if autocompleteMode:
+            if BibleOrgSysGlobals.debugFlag: assert windowType.endswith( 'EditWindow' )
+            rw.autocompleteMode = autocompleteMode
+            rw.prepareAutocomplete()
+        statusBarMode = thisStuff['StatusBar'] if 'StatusBar' in thisStuff else None
+        if statusBarMode:
+            statusBarOn = statusBarMode.lower() in ('on', 'true' ,'yes', 'enabled',)
+            rw.doToggleStatusBar( statusBarOn )
+        if 'Bible' in rw.genericWindowType:
+            if showNow: rw.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( rw._groupCode ) )
+            else: BiblelatorGlobals.theApp.childWindows.scheduleFirstBCVUpdate( rw )
+    return rw
+# end of restoreWindow
+
+
 
 def getCurrentChildWindowSettings():
     """
@@ -519,7 +621,7 @@ def getCurrentChildWindowSettings():
     if 'Current' in BiblelatorGlobals.theApp.windowsSettingsDict: del BiblelatorGlobals.theApp.windowsSettingsDict['Current']
     BiblelatorGlobals.theApp.windowsSettingsDict['Current'] = {}
     for j, appWin in enumerate( BiblelatorGlobals.theApp.childWindows ):
-        if appWin.windowType in ( 'HTMLWindow', 'FindResultWindow' ):
+        if appWin.windowType in ( 'HTMLWindow', 'FindResultWindow', 'JobStatusWindow' ):
             continue # We don't save these
 
         winNumber = "window{}".format( j+1 )
@@ -609,6 +711,13 @@ def getCurrentChildWindowSettings():
 
         if appWin.windowType.endswith( 'EditWindow' ):
             thisOne['AutocompleteMode'] = appWin.autocompleteMode
+        if appWin is BiblelatorGlobals.theApp.childWindows.lastFocusedWindow:
+            thisOne['Focused'] = 'Yes'
+
+    # Don't lose any saved windows that haven't been reopened yet
+    for k, (_j,thisStuff) in enumerate( BiblelatorGlobals.theApp.windowsToRestore, start=len(BiblelatorGlobals.theApp.childWindows)+1 ):
+        BiblelatorGlobals.theApp.windowsSettingsDict['Current']['window{}'.format( k )] = \
+                { key:value for key,value in thisStuff.items() if key != 'Focused' }
 # end of getCurrentChildWindowSettings
 
 
@@ -662,6 +771,7 @@ def viewSettings():
     if BibleOrgSysGlobals.debugFlag:
         if DEBUGGING_THIS_MODULE: BiblelatorGlobals.theApp.setDebugText( "viewSettings" )
 
+    from Biblelator.Windows.TextEditWindow import TextEditWindow
     tEW = TextEditWindow()
     #if windowGeometry: tEW.geometry( windowGeometry )
     if not tEW.setFilepath( BiblelatorGlobals.theApp.settings.settingsFilepath ) \
@@ -729,6 +839,8 @@ def writeSettingsFile():
     interface['touchMode'] = convertToString( BiblelatorGlobals.theApp.touchMode )
     interface['tabletMode'] = convertToString( BiblelatorGlobals.theApp.tabletMode )
     interface['showDebugMenu'] = convertToString( BiblelatorGlobals.theApp.showDebugMenu )
+    interface['verseCacheMegabytes'] = str( BiblelatorGlobals.theApp.verseCache.maxBytes // 1_000_000 )
+    interface['prefetchMegabytes'] = str( BiblelatorGlobals.theApp.versePrefetcher.maxBytes // 1_000_000 )
 
     # Save the Internet access controls
     BiblelatorGlobals.theApp.settings.data['Internet'] = {}
@@ -833,6 +945,10 @@ def writeSettingsFile():
                     thisOne[windowNumber+windowSettingName] = convertToString( value )
         except UnicodeEncodeError: logging.error( "writeSettingsFile: " + _("unable to write {} windows set-up").format( repr(windowsSettingName) ) )
     BiblelatorGlobals.theApp.settings.saveINI()
+    # Snapshot the window set-ups as they'll be read back from the INI file next time
+    settings = BiblelatorGlobals.theApp.settings
+    saveSnapshot( settings.snapshotFolderpath, settings.settingsFilename+'.Windows', [settings.settingsFilepath],
+                    { name[13:]:retrieveWindowsSettings( name[13:] ) for name in settings.data if name.startswith( 'WindowSetting' ) } )
 # end of writeSettingsFile
 
 
@@ -872,6 +988,7 @@ def doSendUsageStatistics():
             zf.write( filepath, filename+extension )
 
     # Add usage file(s)
+    flushLogs()
     zf.write( BiblelatorGlobals.theApp.usageLogPath, BiblelatorGlobals.theApp.usageFilename )
 
     # Add settings file(s)
@@ -28,8 +28,10 @@ Settings class
     __str__()
     __repr__()
     reset()
-    load()
-    save()
+    loadINI()
+    saveINI()
+    saveSnapshot()
+    loadYAML( yamlFilepath=None )
 
 ApplicationSettings class (Settings)
     __init__( homeFolderName, dataFolderName, settingsFolderName, settingsFilename )
@@ -67,6 +69,7 @@ if __name__ == '__main__':
         sys.path.insert( 0, aboveAboveFolderpath )
 from Biblelator.BiblelatorGlobals import APP_NAME
 from Biblelator.Settings.BiblelatorSettingsFunctions import SettingsVersion
+from Biblelator.Settings.StartupSnapshots import SNAPSHOT_SUBFOLDER_NAME, loadSnapshot, saveSnapshot
 
 
 LAST_MODIFIED_DATE = '2020-05-08' # by RJH
@@ -89,7 +92,10 @@ class Settings:
             over more complex and less readable formats like XML.
 
     Super class must set self.settingsFilepath
+        and can set self.snapshotFolderpath if the parsed settings should be snapshotted.
     """
+    snapshotFolderpath = None # No snapshots by default
+
     def __init__( self ):
         """
         """
@@ -127,10 +133,17 @@ class Settings:
         """
         fnPrint( DEBUGGING_THIS_MODULE, "Settings.loadINI() from {!r}".format( self.settingsFilepath ) )
 
-        self.reset() # Creates self.data
-        assert self.data
-        if self.settingsFilepath and os.path.isfile( self.settingsFilepath ) and os.access( self.settingsFilepath, os.R_OK ):
-            self.data.read( self.settingsFilepath )
+        snapshotData = loadSnapshot( self.snapshotFolderpath, self.settingsFilename, [self.settingsFilepath] ) \
+                            if self.settingsFilepath else None
+        if snapshotData is not None: # Saves parsing the INI file again
+            self.data = snapshotData
+            self.data.optionxform = lambda option: option # (not saved in the snapshot)
+        else:
+            self.reset() # Creates self.data
+            assert self.data
+            if self.settingsFilepath and os.path.isfile( self.settingsFilepath ) and os.access( self.settingsFilepath, os.R_OK ):
+                self.data.read( self.settingsFilepath )
+                self.saveSnapshot()
         if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
             for section in self.data:
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Settings.loadINI: s.d main section = {section}" )
@@ -155,9 +168,23 @@ class Settings:
                 .format( datetime.now().strftime('%Y-%m-%d %H:%M:%S'), self.settingsFilepath ) + '\n\n' )
 
             self.data.write( settingsFile )
+        self.saveSnapshot()
     # end of Settings.saveINI
 
 
+    def saveSnapshot( self ) -> None:
+        """
+        Save the parsed settings so that loadINI can use them next time
+            (as long as the INI file doesn't get changed in the meantime).
+        """
+        if not self.snapshotFolderpath: return
+        fnPrint( DEBUGGING_THIS_MODULE, "Settings.saveSnapshot() for {!r}".format( self.settingsFilepath ) )
+        del self.data.optionxform # Lambdas can't be pickled
+        try: saveSnapshot( self.snapshotFolderpath, self.settingsFilename, [self.settingsFilepath], self.data )
+        finally: self.data.optionxform = lambda option: option
+    # end of Settings.saveSnapshot
+
+
     def loadYAML( self, yamlFilepath=None ) -> None:
         """
         Load the settings file (if we found it).
@@ -230,6 +257,8 @@ class ApplicationSettings( Settings ):
         if not self.settingsFilepath:
             logging.info( "ApplicationSettings.__init__ " + _("No settings file found") )
             self.settingsFilepath = os.path.join( self.settingsFolder, self.settingsFilename )
+        if self.dataFolderpath:
+            self.snapshotFolderpath = os.path.join( self.dataFolderpath, SNAPSHOT_SUBFOLDER_NAME )
     # end of ApplicationSettings.__init__
 # end of class ApplicationSettings
 
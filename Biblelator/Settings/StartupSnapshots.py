@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# StartupSnapshots.py
+#
+# Binary snapshots of things that are parsed at every program start-up
+#
+# Copyright (C) 2022 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+Biblelator@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Every time that Biblelator starts, it parses the settings (INI) file,
+    sorts out the saved window set-ups from it, and builds the default stylesheet.
+
+This module saves the results of those as pickle files in our data folder
+    so that they can just be reloaded on the next start-up.
+Each snapshot remembers the modification time and size of the files that it was made from
+    (along with the program versions), and is ignored if any of those have changed.
+
+    getSnapshotFolderpath( homeFolderpath )
+    getSourceStamps( sourceFilepaths )
+    getSnapshotKey( sourceFilepaths )
+    loadSnapshot( snapshotFolderpath, snapshotName, sourceFilepaths )
+    saveSnapshot( snapshotFolderpath, snapshotName, sourceFilepaths, snapshotData )
+    loadDefaultStylesheet( snapshotFolderpath=None )
+
+    briefDemo()
+    fullDemo()
+"""
+from gettext import gettext as _
+from typing import List, Tuple, Optional, Any
+import os
+import sys
+import logging
+import pickle
+
+# BibleOrgSys imports
+from BibleOrgSys import BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+# Biblelator imports
+if __name__ == '__main__':
+    aboveAboveFolderpath = os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+    if aboveAboveFolderpath not in sys.path:
+        sys.path.insert( 0, aboveAboveFolderpath )
+from Biblelator.BiblelatorGlobals import APP_NAME_VERSION, DATA_SUBFOLDER_NAME
+
+
+LAST_MODIFIED_DATE = '2022-07-03' # by RJH
+SHORT_PROGRAM_NAME = "StartupSnapshots"
+PROGRAM_NAME = "Biblelator Start-up Snapshots"
+PROGRAM_VERSION = '0.46'
+PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+SNAPSHOT_SUBFOLDER_NAME = 'Cache/StartupSnapshots/'
+SNAPSHOT_VERSION = 1 # Increment this if the contents of any of the snapshots change
+
+
+
+def getSnapshotFolderpath( homeFolderpath ) -> str:
+    """
+    Returns the folder where we keep our snapshot files.
+    """
+    return os.path.join( homeFolderpath, DATA_SUBFOLDER_NAME, SNAPSHOT_SUBFOLDER_NAME )
+# end of StartupSnapshots.getSnapshotFolderpath
+
+
+def getSourceStamps( sourceFilepaths:List[str] ) -> Tuple[tuple,...]:
+    """
+    Returns a tuple containing the modification time and size of each given file
+        (or None for any file that doesn't exist).
+    """
+    sourceStamps = []
+    for sourceFilepath in sourceFilepaths:
+        try: fileStat = os.stat( sourceFilepath )
+        except OSError: sourceStamps.append( (str(sourceFilepath),None) )
+        else: sourceStamps.append( (str(sourceFilepath),fileStat.st_mtime_ns,fileStat.st_size) )
+    return tuple( sourceStamps )
+# end of StartupSnapshots.getSourceStamps
+
+
+def getSnapshotKey( sourceFilepaths:List[str] ) -> tuple:
+    """
+    Everything that has to match for a snapshot to still be usable.
+    """
+    return SNAPSHOT_VERSION, APP_NAME_VERSION, BibleOrgSysGlobals.PROGRAM_VERSION, sys.version_info[:2], \
+            getSourceStamps( sourceFilepaths )
+# end of StartupSnapshots.getSnapshotKey
+
+
+def loadSnapshot( snapshotFolderpath:Optional[str], snapshotName:str, sourceFilepaths:List[str] ) -> Optional[Any]:
+    """
+    Try to load the named snapshot.
+
+    Returns None if there's no (usable) snapshot file,
+        or if it was made from different source files or by a different program version.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadSnapshot( {snapshotFolderpath}, {snapshotName}, {sourceFilepaths} )" )
+    if not snapshotFolderpath: return None
+    snapshotFilepath = os.path.join( snapshotFolderpath, f'{snapshotName}.pickle' )
+    try:
+        with open( snapshotFilepath, 'rb' ) as snapshotFile:
+            snapshotKey, snapshotData = pickle.load( snapshotFile )
+    except FileNotFoundError: return None
+    except Exception as err: # Could be a truncated or out-of-date pickle file
+        logging.warning( f"loadSnapshot: Ignoring unreadable snapshot file {snapshotFilepath}: {err}" )
+        return None
+    if snapshotKey != getSnapshotKey( sourceFilepaths ):
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  {snapshotName} snapshot is out-of-date" )
+        return None
+    vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Using {snapshotName} snapshot" )
+    return snapshotData
+# end of StartupSnapshots.loadSnapshot
+
+
+def saveSnapshot( snapshotFolderpath:Optional[str], snapshotName:str, sourceFilepaths:List[str], snapshotData:Any ) -> None:
+    """
+    Save the given data as the named snapshot.
+
+    The source files must already be written
+        (so that we save their final modification times).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveSnapshot( {snapshotFolderpath}, {snapshotName}, {sourceFilepaths}, … )" )
+    if not snapshotFolderpath: return
+    snapshotFilepath = os.path.join( snapshotFolderpath, f'{snapshotName}.pickle' )
+    try:
+        os.makedirs( snapshotFolderpath, exist_ok=True )
+        tempFilepath = snapshotFilepath + '.tmp'
+        with open( tempFilepath, 'wb' ) as snapshotFile:
+            pickle.dump( (getSnapshotKey( sourceFilepaths ),snapshotData), snapshotFile, pickle.HIGHEST_PROTOCOL )
+        os.replace( tempFilepath, snapshotFilepath )
+    except (OSError, pickle.PicklingError, AttributeError, TypeError) as err: # We can still continue without the snapshot
+        logging.warning( f"saveSnapshot: Unable to save snapshot file {snapshotFilepath}: {err}" )
+# end of StartupSnapshots.saveSnapshot
+
+
+def loadDefaultStylesheet( snapshotFolderpath:Optional[str]=None ):
+    """
+    Returns the same as BibleStylesheet().loadDefault()
+        but from the snapshot if we can.
+
+    The default styles are in the BibleStylesheets module, so that's our source file.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadDefaultStylesheet( {snapshotFolderpath} )" )
+    from BibleOrgSys.Reference import BibleStylesheets
+
+    sourceFilepaths = [BibleStylesheets.__file__]
+    stylesheet = loadSnapshot( snapshotFolderpath, 'DefaultStylesheet', sourceFilepaths )
+    if stylesheet is None:
+        stylesheet = BibleStylesheets.BibleStylesheet().loadDefault()
+        saveSnapshot( snapshotFolderpath, 'DefaultStylesheet', sourceFilepaths, stylesheet )
+    return stylesheet
+# end of StartupSnapshots.loadDefaultStylesheet
+
+
+
+def briefDemo() -> None:
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Running demo…" )
+
+    import tempfile, time
+    with tempfile.TemporaryDirectory() as tempFolder:
+        for attempt in ( 'first', 'second' ):
+            startTime = time.perf_counter()
+            stylesheet = loadDefaultStylesheet( tempFolder )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {attempt} default stylesheet load took {time.perf_counter()-startTime:.4f}s for {len(stylesheet.dataDict):,} styles" )
+        sourceFilepath = os.path.join( tempFolder, 'Test.ini' )
+        with open( sourceFilepath, 'wt', encoding='utf-8' ) as sourceFile: sourceFile.write( '[Test]\n' )
+        saveSnapshot( tempFolder, 'Test', [sourceFilepath], 'Some data' )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Unchanged source file gave {loadSnapshot( tempFolder, 'Test', [sourceFilepath] )!r}" )
+        with open( sourceFilepath, 'at', encoding='utf-8' ) as sourceFile: sourceFile.write( 'key = value\n' )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Changed source file gave {loadSnapshot( tempFolder, 'Test', [sourceFilepath] )!r}" )
+# end of StartupSnapshots.briefDemo
+
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of StartupSnapshots.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of StartupSnapshots.py
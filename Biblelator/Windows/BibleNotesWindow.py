@@ -26,7 +26,7 @@
 Windows and frames to allow display and manipulation of
     (non-editable) Bible resource windows.
 
-    class BibleNotesWindowAddon( BibleResourceWindowAddon )
+    class BibleNotesWindowAddon( BibleResourceWindowAddon, InternalBibleJobsAddon )
                                             --used by BibleNotesWindow, HebrewBibleResourceWindow, USFMEditWindow
         __init__( self, modulePath, defaultContextViewMode=BIBLE_CONTEXT_VIEW_MODES[0], defaultFormatViewMode=BIBLE_FORMAT_VIEW_MODES[0] )
         #_createMenuBar( self )
@@ -34,14 +34,6 @@ Windows and frames to allow display and manipulation of
         createContextMenu( self )
         getContextVerseData( self, verseKey )
         doShowInfo( self, event=None )
-        _prepareForExports( self )
-        doMostExports( self )
-        doPhotoBibleExport( self )
-        doODFsExport( self )
-        doPDFsExport( self )
-        doAllExports( self )
-        _doneExports( self )
-        doCheckProject( self )
         #_doHelp( self, event=None )
         #_doAbout( self, event=None )
         #doClose( self, event=None )
@@ -55,12 +47,14 @@ Windows and frames to allow display and manipulation of
         #getContextVerseData( self, verseKey )
         #doShowInfo( self, event=None )
         #_prepareForExports( self )
+        #_startExportJob( self, jobName, *exportFunctions )
         #doMostExports( self )
         #doPhotoBibleExport( self )
         #doODFsExport( self )
         #doPDFsExport( self )
         #doAllExports( self )
-        #_doneExports( self )
+        #_doneExports( self, job=None )
+        #_failedExports( self, job )
         #doCheckProject( self )
         #_doHelp( self, event=None )
         #_doAbout( self, event=None )
@@ -99,7 +93,7 @@ from Biblelator.BiblelatorGlobals import APP_NAME, \
                         BIBLE_GROUP_CODES, BIBLE_CONTEXT_VIEW_MODES, BIBLE_FORMAT_VIEW_MODES, \
                         MAXIMUM_LARGE_RESOURCE_SIZE, parseWindowSize
 from Biblelator.Windows.ChildWindows import ChildWindow, BibleWindowAddon, HTMLWindow
-from Biblelator.Windows.BibleResourceWindows import BibleResourceWindowAddon
+from Biblelator.Windows.BibleResourceWindows import BibleResourceWindowAddon, InternalBibleJobsAddon
 from Biblelator.Windows.TextBoxes import BibleBoxAddon, HebrewInterlinearBibleBoxAddon
 from Biblelator.Helpers.BiblelatorHelpers import findCurrentSection, handleInternalBibles
 from Biblelator.Dialogs.BiblelatorSimpleDialogs import showInfo, showError
@@ -119,7 +113,7 @@ MAX_CACHED_VERSES = 300 # Per Bible resource window
 
 
 
-class BibleNotesWindowAddon( BibleResourceWindowAddon ):
+class BibleNotesWindowAddon( BibleResourceWindowAddon, InternalBibleJobsAddon ):
     """
     A window displaying one internal (on-disk) Bible.
     """
@@ -486,133 +480,6 @@ class BibleNotesWindowAddon( BibleResourceWindowAddon ):
     # end of BibleNotesWindowAddon.doShowInfo
 
 
-    def _prepareForExports( self ):
-        """
-        Prepare to do some of the exports available in BibleOrgSysGlobals.
-        """
-        logging.info( _("BibleNotesWindowAddon.prepareForExports()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.prepareForExports()…") )
-
-        self._prepareInternalBible()
-        if self.internalBible is not None:
-            BiblelatorGlobals.theApp.setWaitStatus( _("Preparing for export…") )
-            if self.exportFolderpath is None:
-                fp = self.folderpath
-                if fp and fp[-1] in '/\\': fp = fp[:-1] # Removing trailing slash
-                self.exportFolderpath = fp + 'Export/'
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "eFolder", repr(self.exportFolderpath) )
-                if not os.path.exists( self.exportFolderpath ):
-                    os.mkdir( self.exportFolderpath )
-            setDefaultControlFolderpath( '../BibleOrgSys/ControlFiles/' )
-            BiblelatorGlobals.theApp.setWaitStatus( _("Export in process…") )
-    # end of BibleNotesWindowAddon._prepareForExports
-
-    def doMostExports( self ):
-        """
-        Do most of the quicker exports available in BibleOrgSysGlobals.
-        """
-        logging.info( _("BibleNotesWindowAddon.doMostExports()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.doMostExports()…") )
-
-        self._prepareForExports()
-        self.internalBible.doAllExports( self.exportFolderpath )
-        self._doneExports()
-    # end of BibleNotesWindowAddon.doMostExports
-
-    def doPhotoBibleExport( self ):
-        """
-        Do the BibleOrgSys PhotoBible export.
-        """
-        logging.info( _("BibleNotesWindowAddon.doPhotoBibleExport()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.doPhotoBibleExport()…") )
-
-        self._prepareForExports()
-        self.internalBible.toPhotoBible( os.path.join( self.exportFolderpath, 'BOS_PhotoBible_Export/' ) )
-        self._doneExports()
-    # end of BibleNotesWindowAddon.doPhotoBibleExport
-
-    def doODFsExport( self ):
-        """
-        Do the BibleOrgSys ODFsExport export.
-        """
-        logging.info( _("BibleNotesWindowAddon.doODFsExport()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.doODFsExport()…") )
-
-        self._prepareForExports()
-        self.internalBible.toODF( os.path.join( self.exportFolderpath, 'BOS_ODF_Export/' ) )
-        self._doneExports()
-    # end of BibleNotesWindowAddon.doODFsExport
-
-    def doPDFsExport( self ):
-        """
-        Do the BibleOrgSys PDFsExport export.
-        """
-        logging.info( _("BibleNotesWindowAddon.doPDFsExport()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.doPDFsExport()…") )
-
-        self._prepareForExports()
-        self.internalBible.toTeX( os.path.join( self.exportFolderpath, 'BOS_PDF(TeX)_Export/' ) )
-        self._doneExports()
-    # end of BibleNotesWindowAddon.doPDFsExport
-
-    def doAllExports( self ):
-        """
-        Do all exports available in BibleOrgSysGlobals.
-        """
-        logging.info( _("BibleNotesWindowAddon.doAllExports()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.doAllExports()…") )
-
-        self._prepareForExports()
-        self.internalBible.doAllExports( self.exportFolderpath, wantPhotoBible=True, wantODFs=True, wantPDFs=True )
-        self._doneExports()
-    # end of BibleNotesWindowAddon.doAllExports
-
-
-    def _doneExports( self ):
-        """
-        """
-        BiblelatorGlobals.theApp.setStatus( _("Waiting for user input…") )
-        infoString = _("Results should be in {}").format( self.exportFolderpath )
-        showInfo( self, 'Folder Information', infoString )
-        BiblelatorGlobals.theApp.setReadyStatus()
-    # end of BibleNotesWindowAddon.doAllExports
-
-
-    def doCheckProject( self ):
-        """
-        Run the BibleOrgSys checks on the project.
-        """
-        logging.info( _("BibleNotesWindowAddon.doCheckProject()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("BibleNotesWindowAddon.doCheckProject()…") )
-
-        self._prepareInternalBible() # Slow but must be called before the dialog
-        currentBBB = self.currentVerseKey.getBBB()
-        gBBRD = GetBibleBookRangeDialog( self, self.internalBible, currentBBB, None, title=_('Books to be checked') )
-        #if BibleOrgSysGlobals.debugFlag: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "gBBRDResult", repr(gBBRD.result) )
-        if gBBRD.result:
-            if BibleOrgSysGlobals.debugFlag: assert isinstance( gBBRD.result, list )
-            #if len(gBBRD.result)==1 and gBBRD.result[0]==currentBBB:
-                ## It's just the current book to check
-                #if self.modified(): self.doSave()
-                #self.internalBible.loadBookIfNecessary( currentBBB )
-            #else: # load all books
-                #self._prepareInternalBible()
-            BiblelatorGlobals.theApp.setWaitStatus( _("Doing Bible checks…") )
-            self.internalBible.check( gBBRD.result )
-            displayExternally = False
-            if displayExternally: # Call up a browser window
-                import webbrowser
-                indexFile = self.internalBible.makeErrorHTML( self.folderpath, gBBRD.result )
-                webbrowser.open( indexFile )
-            else: # display internally in our HTMLWindow
-                indexFile = self.internalBible.makeErrorHTML( self.folderpath, gBBRD.result )
-                hW = HTMLWindow( self, indexFile )
-                BiblelatorGlobals.theApp.childWindows.append( hW )
-                if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "Finished openCheckWindow" )
-        BiblelatorGlobals.theApp.setReadyStatus()
-    # end of BibleNotesWindowAddon.doCheckProject
-
-
     #def _doHelp( self, event=None ):
         #"""
         #Display a help box.
@@ -37,6 +37,7 @@ A Bible resource collection is a collection of different Bible resources
         createStandardBoxKeyboardBindings( self )
         gotoBCV( self, BBB:str, C, V )
         getSwordVerseKey( self, verseKey )
+        getVerseCacheResourceID( self )
         getCachedVerseData( self, verseKey )
         #BibleResourceBoxXXXdisplayAppendVerse( self, firstFlag, verseKey, verseContextData, currentVerseFlag=False )
         #getBeforeAndAfterBibleData( self, newVerseKey )
@@ -47,14 +48,17 @@ A Bible resource collection is a collection of different Bible resources
 
     class SwordBibleResourceBox( BibleResourceBox )
         __init__( self, parentWindow, moduleAbbreviation )
+        getVerseCacheResourceID( self )
         getContextVerseData( self, verseKey )
 
     class DBPBibleResourceBox( BibleResourceBox )
         __init__( self, parentWindow, moduleAbbreviation )
+        getVerseCacheResourceID( self )
         getContextVerseData( self, verseKey )
 
     class InternalBibleResourceBox( BibleResourceBox )
         __init__( self, parentWindow, modulePath )
+        getVerseCacheResourceID( self )
         getContextVerseData( self, verseKey )
 
     class BibleResourceCollectionWindow( BibleResourceWindow )
@@ -76,7 +80,6 @@ A Bible resource collection is a collection of different Bible resources
 from gettext import gettext as _
 import os
 import logging
-from collections import OrderedDict
 
 import tkinter as tk
 from tkinter.filedialog import Directory #, SaveAs
@@ -121,8 +124,6 @@ PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
 DEBUGGING_THIS_MODULE = False
 
 
-MAX_CACHED_VERSES = 30 # Per Bible resource window
-
 
 
 class BibleResourceBoxesList( list ):
@@ -274,8 +275,6 @@ class BibleResourceBox( Frame, ChildBoxAddon, BibleBoxAddon ):
         self.getBookName = self.BibleOrganisationalSystem.getBookName
         self.getBookList = self.BibleOrganisationalSystem.getBookList
         self.maxChaptersThisBook, self.maxVersesThisChapter = 150, 150 # temp
-
-        self.verseCache = OrderedDict()
     # end of BibleResourceBox.__init__
 
 
@@ -314,26 +313,26 @@ class BibleResourceBox( Frame, ChildBoxAddon, BibleBoxAddon ):
     # end of BibleResourceBox.getSwordVerseKey
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Returns the ID for our verses in the Application's shared verse cache.
+
+        Subclasses can override this so that all the boxes (and windows)
+            displaying the same resource share the cached verses.
+        """
+        return BiblelatorGlobals.theApp.verseCache.makeResourceID( self )
+    # end of BibleResourceBox.getVerseCacheResourceID
+
+
     def getCachedVerseData( self, verseKey ):
         """
-        Checks to see if the requested verse is in our cache,
+        Checks to see if the requested verse is in the Application's shared verse cache,
             otherwise calls getContextVerseData (from the superclass) to fetch it.
-
-        The cache keeps the newest or most recently used entries at the end.
-        When it gets too large, it drops the first entry.
         """
         #dPrint( 'Never', DEBUGGING_THIS_MODULE, _("getCachedVerseData( {} )").format( verseKey ) )
-        verseKeyHash = verseKey.makeHash()
-        if verseKeyHash in self.verseCache:
-            #dPrint( 'Never', DEBUGGING_THIS_MODULE, "  " + _("Retrieved from BibleResourceBox cache") )
-            self.verseCache.move_to_end( verseKeyHash )
-            return self.verseCache[verseKeyHash]
-        verseContextData = self.getContextVerseData( verseKey )
-        self.verseCache[verseKeyHash] = verseContextData
-        if len(self.verseCache) > MAX_CACHED_VERSES:
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Removing oldest cached entry", len(self.verseCache) )
-            self.verseCache.popitem( last=False )
-        return verseContextData
+        verseCache = BiblelatorGlobals.theApp.verseCache
+        return verseCache.getVerseData( self.getVerseCacheResourceID(), verseKey, self.getContextVerseData,
+                                        shownBy=verseCache.makeResourceID( self ) ) # So what we're showing isn't dropped
     # end of BibleResourceBox.getCachedVerseData
 
 
@@ -457,6 +456,12 @@ class BibleResourceBox( Frame, ChildBoxAddon, BibleBoxAddon ):
         try: self.textBox.see( desiredMark )
         except tk.TclError: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("USFMEditWindow.updateShownBCV couldn't find {}").format( repr( desiredMark ) ) )
         self.lastCVMark = desiredMark
+
+        BiblelatorGlobals.theApp.verseCache.finishShowing( BiblelatorGlobals.theApp.verseCache.makeResourceID( self ) )
+
+        # Get the verses that we're likely to want next while the user is reading these ones
+        if 'DBP' not in self.boxType: # Don't want excessive online use
+            BiblelatorGlobals.theApp.versePrefetcher.requestPrefetch( self, newVerseKey )
     # end of BibleResourceBox.updateShownBCV
 
 
@@ -534,6 +539,15 @@ class SwordBibleResourceBox( BibleResourceBox ):
     # end of SwordBibleResourceBox.__init__
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Share cached verses with any other boxes or windows using the same Sword module.
+        """
+        if self.SwordModule is None: return BibleResourceBox.getVerseCacheResourceID( self )
+        return 'Sword', self.moduleAbbreviation
+    # end of SwordBibleResourceBox.getVerseCacheResourceID
+
+
     def getContextVerseData( self, verseKey ):
         """
         Fetches and returns the internal Bible data for the given reference.
@@ -599,6 +613,15 @@ class DBPBibleResourceBox( BibleResourceBox ):
     # end of DBPBibleResourceBox.__init__
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Share cached verses with any other boxes or windows using the same online resource.
+        """
+        if self.DBPModule is None: return BibleResourceBox.getVerseCacheResourceID( self )
+        return 'DBP', self.moduleAbbreviation
+    # end of DBPBibleResourceBox.getVerseCacheResourceID
+
+
     def getContextVerseData( self, verseKey ):
         """
         Fetches and returns the internal Bible data for the given reference.
@@ -649,6 +672,15 @@ class InternalBibleResourceBox( BibleResourceBox ):
     # end of InternalBibleResourceBox.__init__
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Share cached verses with any other boxes or windows using the same internal Bible.
+        """
+        if self.internalBible is None: return BibleResourceBox.getVerseCacheResourceID( self )
+        return BiblelatorGlobals.theApp.verseCache.makeResourceID( self.internalBible )
+    # end of InternalBibleResourceBox.getVerseCacheResourceID
+
+
     def getContextVerseData( self, verseKey ):
         """
         Fetches and returns the internal Bible data for the given reference.
@@ -931,7 +963,7 @@ class BibleResourceCollectionWindow( ChildWindow, BibleResourceWindowAddon ):
             BiblelatorGlobals.theApp.setReadyStatus()
             return None
         else:
-            dBRB.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( self._groupCode ) )
+            if not BiblelatorGlobals.theApp.isRestoringWindows: dBRB.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( self._groupCode ) )
             self.resourceBoxesList.append( dBRB )
             if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "Finished openDBPBibleResourceBox" )
             BiblelatorGlobals.theApp.setReadyStatus()
@@ -993,7 +1025,7 @@ class BibleResourceCollectionWindow( ChildWindow, BibleResourceWindowAddon ):
         #tk.Label( self, text=moduleAbbreviation ).pack( side=tk.TOP, fill=tk.X )
         swBRB = SwordBibleResourceBox( self, moduleAbbreviation )
         if windowGeometry: halt; swBRB.geometry( windowGeometry )
-        swBRB.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( self._groupCode ) )
+        if not BiblelatorGlobals.theApp.isRestoringWindows: swBRB.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( self._groupCode ) )
         self.resourceBoxesList.append( swBRB )
         if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "Finished openSwordBibleResourceBox" )
         BiblelatorGlobals.theApp.setReadyStatus()
@@ -1067,7 +1099,7 @@ class BibleResourceCollectionWindow( ChildWindow, BibleResourceWindowAddon ):
             BiblelatorGlobals.theApp.setReadyStatus()
             return None
         else:
-            iBRB.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( self._groupCode ) )
+            if not BiblelatorGlobals.theApp.isRestoringWindows: iBRB.updateShownBCV( BiblelatorGlobals.theApp.getVerseKey( self._groupCode ) )
             self.resourceBoxesList.append( iBRB )
             if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "Finished openInternalBibleResourceBox" )
             BiblelatorGlobals.theApp.setReadyStatus()
@@ -48,6 +48,7 @@ Windows and frames to allow display and manipulation of
         doGotoBook( self )
         gotoBCV( self, BBB:str, C, V )
         getSwordVerseKey( self, verseKey )
+        getVerseCacheResourceID( self )
         getCachedVerseData( self, verseKey )
         setCurrentVerseKey( self, newVerseKey )
         updateShownBCV( self, newReferenceVerseKey, originator=None )
@@ -86,6 +87,7 @@ Windows and frames to allow display and manipulation of
                                             -- used by the main app
         __init__( self, moduleAbbreviation, defaultContextViewMode=BIBLE_CONTEXT_VIEW_MODES[0], defaultFormatViewMode=BIBLE_FORMAT_VIEW_MODES[0] )
         refreshTitle( self )
+        getVerseCacheResourceID( self )
         getContextVerseData( self, verseKey )
         doShowInfo( self, event=None )
 
@@ -93,25 +95,32 @@ Windows and frames to allow display and manipulation of
                                             -- used by the main app
         __init__( self, moduleAbbreviation, defaultContextViewMode=BIBLE_CONTEXT_VIEW_MODES[0], defaultFormatViewMode=BIBLE_FORMAT_VIEW_MODES[0] )
         refreshTitle( self )
+        getVerseCacheResourceID( self )
         getContextVerseData( self, verseKey )
         doShowInfo( self, event=None )
 
-    class InternalBibleResourceWindowAddon( BibleResourceWindowAddon )
-                                            --used by InternalBibleResourceWindow, HebrewBibleResourceWindow, USFMEditWindow
-        __init__( self, modulePath, defaultContextViewMode=BIBLE_CONTEXT_VIEW_MODES[0], defaultFormatViewMode=BIBLE_FORMAT_VIEW_MODES[0] )
-        #_createMenuBar( self )
-        refreshTitle( self )
-        createContextMenu( self )
-        getContextVerseData( self, verseKey )
-        doShowInfo( self, event=None )
+    class InternalBibleJobsAddon
+                                            --used by InternalBibleResourceWindowAddon, BibleNotesWindowAddon
         _prepareForExports( self )
+        _startExportJob( self, jobName, *exportFunctions )
         doMostExports( self )
         doPhotoBibleExport( self )
         doODFsExport( self )
         doPDFsExport( self )
         doAllExports( self )
-        _doneExports( self )
+        _doneExports( self, job=None )
+        _failedExports( self, job )
         doCheckProject( self )
+
+    class InternalBibleResourceWindowAddon( BibleResourceWindowAddon, InternalBibleJobsAddon )
+                                            --used by InternalBibleResourceWindow, HebrewBibleResourceWindow, USFMEditWindow
+        __init__( self, modulePath, defaultContextViewMode=BIBLE_CONTEXT_VIEW_MODES[0], defaultFormatViewMode=BIBLE_FORMAT_VIEW_MODES[0] )
+        #_createMenuBar( self )
+        refreshTitle( self )
+        createContextMenu( self )
+        getVerseCacheResourceID( self )
+        getContextVerseData( self, verseKey )
+        doShowInfo( self, event=None )
         #_doHelp( self, event=None )
         #_doAbout( self, event=None )
         #doClose( self, event=None )
@@ -125,12 +134,14 @@ Windows and frames to allow display and manipulation of
         #getContextVerseData( self, verseKey )
         #doShowInfo( self, event=None )
         #_prepareForExports( self )
+        #_startExportJob( self, jobName, *exportFunctions )
         #doMostExports( self )
         #doPhotoBibleExport( self )
         #doODFsExport( self )
         #doPDFsExport( self )
         #doAllExports( self )
-        #_doneExports( self )
+        #_doneExports( self, job=None )
+        #_failedExports( self, job )
         #doCheckProject( self )
         #_doHelp( self, event=None )
         #_doAbout( self, event=None )
@@ -145,12 +156,14 @@ Windows and frames to allow display and manipulation of
         #getContextVerseData( self, verseKey )
         #doShowInfo( self, event=None )
         #_prepareForExports( self )
+        #_startExportJob( self, jobName, *exportFunctions )
         #doMostExports( self )
         #doPhotoBibleExport( self )
         #doODFsExport( self )
         #doPDFsExport( self )
         #doAllExports( self )
-        #_doneExports( self )
+        #_doneExports( self, job=None )
+        #_failedExports( self, job )
         #doCheckProject( self )
         #_doHelp( self, event=None )
         #_doAbout( self, event=None )
@@ -161,7 +174,6 @@ Windows and frames to allow display and manipulation of
 from gettext import gettext as _
 import os
 import logging
-from collections import OrderedDict
 import tkinter as tk
 
 # BibleOrgSys imports
@@ -192,6 +204,8 @@ from Biblelator.BiblelatorGlobals import APP_NAME, \
 from Biblelator.Windows.ChildWindows import ChildWindow, BibleWindowAddon, HTMLWindow
 from Biblelator.Windows.TextBoxes import BibleBoxAddon, HebrewInterlinearBibleBoxAddon
 from Biblelator.Helpers.BiblelatorHelpers import findCurrentSection, handleInternalBibles
+from Biblelator.Helpers.ParallelBibleCheck import checkBibleInParallel, getAvailableBookList
+from Biblelator.Helpers.ParallelBibleSearch import canLoadPrivateBible, loadPrivateBible
 from Biblelator.Dialogs.BiblelatorSimpleDialogs import showInfo, showError
 from Biblelator.Dialogs.BiblelatorDialogs import GetBibleBookRangeDialog
 
@@ -205,9 +219,6 @@ PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
 DEBUGGING_THIS_MODULE = False
 
 
-MAX_CACHED_VERSES = 300 # Per Bible resource window
-
-
 
 class BibleResourceWindowAddon( BibleWindowAddon ):
     """
@@ -271,7 +282,6 @@ class BibleResourceWindowAddon( BibleWindowAddon ):
         self.maxChaptersThisBook, self.maxVersesThisChapter = 150, 150 # temp
 
         self.BibleFindOptionsDict, self.BibleReplaceOptionsDict = {}, {}
-        self.verseCache = OrderedDict()
 
         dPrint( 'Never', DEBUGGING_THIS_MODULE, "BibleResourceWindowAddon.__init__ finished." )
     # end of BibleResourceWindowAddon.__init__
@@ -685,28 +695,28 @@ class BibleResourceWindowAddon( BibleWindowAddon ):
     # end of BibleResourceWindowAddon.getSwordVerseKey
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Returns the ID for our verses in the Application's shared verse cache.
+
+        Subclasses can override this so that all the windows (and boxes)
+            displaying the same resource share the cached verses.
+        """
+        return BiblelatorGlobals.theApp.verseCache.makeResourceID( self )
+    # end of BibleResourceWindowAddon.getVerseCacheResourceID
+
+
     def getCachedVerseData( self, verseKey ):
         """
-        Checks to see if the requested verse is in our cache,
+        Checks to see if the requested verse is in the Application's shared verse cache,
             otherwise calls getContextVerseData (from the superclass) to fetch it.
-
-        The cache keeps the newest or most recently used entries at the end.
-        When it gets too large, it drops the first entry.
         """
         #if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, _("getCachedVerseData( {} )").format( verseKey ) )
 
-        verseKeyHash = verseKey.makeHash()
-        if verseKeyHash in self.verseCache:
-            #dPrint( 'Never', DEBUGGING_THIS_MODULE, "  " + _("Retrieved from BibleResourceWindowAddon cache") )
-            self.verseCache.move_to_end( verseKeyHash )
-            return self.verseCache[verseKeyHash]
-        verseData = self.getContextVerseData( verseKey )
-        self.verseCache[verseKeyHash] = verseData
-        if len(self.verseCache) > MAX_CACHED_VERSES:
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Removing oldest cached entry", len(self.verseCache) )
-            self.verseCache.popitem( last=False )
-        return verseData
+        verseCache = BiblelatorGlobals.theApp.verseCache
+        return verseCache.getVerseData( self.getVerseCacheResourceID(), verseKey, self.getContextVerseData,
+                                        shownBy=verseCache.makeResourceID( self ) ) # So what we're showing isn't dropped
     # end of BibleResourceWindowAddon.getCachedVerseData
 
 
@@ -842,6 +852,12 @@ class BibleResourceWindowAddon( BibleWindowAddon ):
         self.lastCVMark = desiredMark
 
         self.refreshTitle()
+
+        BiblelatorGlobals.theApp.verseCache.finishShowing( BiblelatorGlobals.theApp.verseCache.makeResourceID( self ) )
+
+        # Get the verses that we're likely to want next while the user is reading these ones
+        if 'DBP' not in self.windowType: # Don't want excessive online use
+            BiblelatorGlobals.theApp.versePrefetcher.requestPrefetch( self, newVerseKey )
     # end of BibleResourceWindowAddon.updateShownBCV
 
 
@@ -1598,6 +1614,15 @@ class SwordBibleResourceWindow( ChildWindow, BibleResourceWindowAddon ):
     # end if SwordBibleResourceWindow.refreshTitle
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Share cached verses with any other windows or boxes using the same Sword module.
+        """
+        if self.SwordModule is None: return BibleResourceWindowAddon.getVerseCacheResourceID( self )
+        return 'Sword', self.moduleAbbreviation
+    # end of SwordBibleResourceWindow.getVerseCacheResourceID
+
+
     def getContextVerseData( self, verseKey ):
         """
         Fetches and returns the internal Bible data for the given reference.
@@ -1692,6 +1717,15 @@ class DBPBibleResourceWindow( ChildWindow, BibleResourceWindowAddon ):
     # end if DBPBibleResourceWindow.refreshTitle
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Share cached verses with any other windows or boxes using the same online resource.
+        """
+        if self.DBPModule is None: return BibleResourceWindowAddon.getVerseCacheResourceID( self )
+        return 'DBP', self.moduleAbbreviation
+    # end of DBPBibleResourceWindow.getVerseCacheResourceID
+
+
     def getContextVerseData( self, verseKey ):
         """
         Fetches and returns the internal Bible data for the given reference.
@@ -1718,7 +1752,203 @@ class DBPBibleResourceWindow( ChildWindow, BibleResourceWindowAddon ):
 
 
 
-class InternalBibleResourceWindowAddon( BibleResourceWindowAddon ):
+class InternalBibleJobsAddon:
+    """
+    The (background) exports and checks for a window displaying one internal (on-disk) Bible,
+        i.e., shared by InternalBibleResourceWindowAddon and BibleNotesWindowAddon.
+
+    Expects the window to have internalBible, folderpath, exportFolderpath, currentVerseKey,
+        modified(), doSave() and _prepareInternalBible().
+    """
+    def _prepareForExports( self ):
+        """
+        Prepare to do some of the exports available in BibleOrgSysGlobals.
+        """
+        logging.info( _("InternalBibleJobsAddon.prepareForExports()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.prepareForExports()…") )
+
+        if self.modified(): self.doSave() # The export (in the background) loads the books from the saved files
+        if self.internalBible is not None:
+            if self.exportFolderpath is None:
+                fp = self.folderpath
+                if fp and fp[-1] in '/\\': fp = fp[:-1] # Removing trailing slash
+                self.exportFolderpath = fp + 'Export/'
+                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "eFolder", repr(self.exportFolderpath) )
+                if not os.path.exists( self.exportFolderpath ):
+                    os.mkdir( self.exportFolderpath )
+            setDefaultControlFolderpath( '../BibleOrgSys/ControlFiles/' )
+    # end of InternalBibleJobsAddon._prepareForExports
+
+    def _startExportJob( self, jobName:str, *exportFunctions ) -> None:
+        """
+        Load the Bible and do the export(s) in the background (see BackgroundJobs)
+            so that the user can keep working.
+
+        The Bible objects aren't thread-safe, so if possible, the job loads its own private copy of the Bible
+            (rather than using the one that the GUI keeps loading books into).
+        Otherwise (i.e., if the Bible wasn't loaded from book files), the Bible is loaded here first.
+
+        Each exportFunction is called in turn (in a worker thread) with the internal Bible and the export folder,
+            and the job can be cancelled between them.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"InternalBibleJobsAddon._startExportJob( {jobName}, {len(exportFunctions)} )" )
+
+        self._prepareForExports()
+        if self.internalBible is None: return
+        internalBible, exportFolderpath = self.internalBible, self.exportFolderpath
+        privateFlag = canLoadPrivateBible( internalBible )
+        if not privateFlag: self._prepareInternalBible() # Slow
+
+        def doExportJob( job ):
+            exportBible = internalBible
+            if privateFlag:
+                job.setProgress( _("Loading…") )
+                exportBible = loadPrivateBible( internalBible )
+            for j,exportFunction in enumerate( exportFunctions ):
+                job.checkCancelled()
+                job.setProgress( _("Exporting…") if len(exportFunctions)==1
+                                    else _("Exporting ({}/{})…").format( j+1, len(exportFunctions) ) )
+                exportFunction( exportBible, exportFolderpath )
+        # end of doExportJob
+
+        BiblelatorGlobals.theApp.jobScheduler.submit( '{} {}'.format( internalBible.getAName(), jobName ), doExportJob,
+                                                    onDone=self._doneExports, onError=self._failedExports )
+        BiblelatorGlobals.theApp.setStatus( _("{} started in the background").format( jobName ) )
+    # end of InternalBibleJobsAddon._startExportJob
+
+    def doMostExports( self ):
+        """
+        Do most of the quicker exports available in BibleOrgSysGlobals.
+        """
+        logging.info( _("InternalBibleJobsAddon.doMostExports()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.doMostExports()…") )
+
+        self._startExportJob( _('Quick exports'), lambda iB, eF: iB.doAllExports( eF ) )
+    # end of InternalBibleJobsAddon.doMostExports
+
+    def doPhotoBibleExport( self ):
+        """
+        Do the BibleOrgSys PhotoBible export.
+        """
+        logging.info( _("InternalBibleJobsAddon.doPhotoBibleExport()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.doPhotoBibleExport()…") )
+
+        self._startExportJob( _('PhotoBible export'), lambda iB, eF: iB.toPhotoBible( os.path.join( eF, 'BOS_PhotoBible_Export/' ) ) )
+    # end of InternalBibleJobsAddon.doPhotoBibleExport
+
+    def doODFsExport( self ):
+        """
+        Do the BibleOrgSys ODFsExport export.
+        """
+        logging.info( _("InternalBibleJobsAddon.doODFsExport()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.doODFsExport()…") )
+
+        self._startExportJob( _('ODF export'), lambda iB, eF: iB.toODF( os.path.join( eF, 'BOS_ODF_Export/' ) ) )
+    # end of InternalBibleJobsAddon.doODFsExport
+
+    def doPDFsExport( self ):
+        """
+        Do the BibleOrgSys PDFsExport export.
+        """
+        logging.info( _("InternalBibleJobsAddon.doPDFsExport()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.doPDFsExport()…") )
+
+        self._startExportJob( _('PDF export'), lambda iB, eF: iB.toTeX( os.path.join( eF, 'BOS_PDF(TeX)_Export/' ) ) )
+    # end of InternalBibleJobsAddon.doPDFsExport
+
+    def doAllExports( self ):
+        """
+        Do all exports available in BibleOrgSysGlobals.
+
+        The slow exports are done as separate steps (into the same folders that
+            BibleWriter.doAllExports uses) so that the job can be cancelled between them.
+        """
+        logging.info( _("InternalBibleJobsAddon.doAllExports()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.doAllExports()…") )
+
+        self._startExportJob( _('All exports'),
+                    lambda iB, eF: iB.doAllExports( eF ),
+                    lambda iB, eF: iB.toPhotoBible( os.path.join( eF, 'BOS_PhotoBible_Export/' ) ),
+                    lambda iB, eF: iB.toODF( os.path.join( eF, 'BOS_ODF_Export/' ) ),
+                    lambda iB, eF: iB.toTeX( os.path.join( eF, 'BOS_TeX_Export/' ) ) ) # Put this last since it's slowest
+    # end of InternalBibleJobsAddon.doAllExports
+
+
+    def _doneExports( self, job=None ):
+        """
+        Called (from the Tk main loop) when a background export has finished.
+        """
+        BiblelatorGlobals.theApp.setStatus( _("Waiting for user input…") )
+        infoString = _("Results should be in {}").format( self.exportFolderpath )
+        showInfo( self if self.winfo_exists() else BiblelatorGlobals.theApp.rootWindow, 'Folder Information', infoString )
+        BiblelatorGlobals.theApp.setReadyStatus()
+    # end of InternalBibleJobsAddon._doneExports
+
+    def _failedExports( self, job ):
+        """
+        Called (from the Tk main loop) if a background export failed.
+        """
+        showError( self if self.winfo_exists() else BiblelatorGlobals.theApp.rootWindow, APP_NAME,
+                                        _("{} failed: {}").format( job.jobName, job.error ) )
+        BiblelatorGlobals.theApp.setReadyStatus()
+    # end of InternalBibleJobsAddon._failedExports
+
+
+    def doCheckProject( self ):
+        """
+        Run the BibleOrgSys checks on the project.
+        """
+        logging.info( _("InternalBibleJobsAddon.doCheckProject()…") )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleJobsAddon.doCheckProject()…") )
+
+        if self.internalBible is None: return
+        privateFlag = canLoadPrivateBible( self.internalBible )
+        if privateFlag: # The checks are done on a private copy of the Bible (loaded in the background)
+            if self.modified(): self.doSave() # The copy is loaded from the saved files
+        else: self._prepareInternalBible() # Slow but must be called before the dialog
+        currentBBB = self.currentVerseKey.getBBB()
+        gBBRD = GetBibleBookRangeDialog( self, self.internalBible, currentBBB, None, title=_('Books to be checked'),
+                                        availableBookList=getAvailableBookList( self.internalBible ) )
+        #if BibleOrgSysGlobals.debugFlag: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "gBBRDResult", repr(gBBRD.result) )
+        if gBBRD.result:
+            if BibleOrgSysGlobals.debugFlag: assert isinstance( gBBRD.result, list )
+            internalBible, folderpath, bookList = self.internalBible, self.folderpath, gBBRD.result
+
+            def doCheckJob( job ):
+                checkBible = internalBible
+                if privateFlag: # Only the books that have changed since they were last checked get loaded
+                    job.setProgress( _("Loading…") )
+                    checkBible = loadPrivateBible( internalBible, loadBooksFlag=False )
+                numChecked, numCached = checkBibleInParallel( checkBible, bookList, job )
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"doCheckProject: {numChecked} books checked, {numCached} unchanged" )
+                job.checkCancelled()
+                job.setProgress( _("Making error pages…") )
+                return checkBible.makeErrorHTML( folderpath, bookList )
+            # end of doCheckJob
+
+            def doneCheckJob( job ):
+                indexFile = job.result
+                displayExternally = False
+                if displayExternally: # Call up a browser window
+                    import webbrowser
+                    webbrowser.open( indexFile )
+                else: # display internally in our HTMLWindow
+                    hW = HTMLWindow( self if self.winfo_exists() else BiblelatorGlobals.theApp.rootWindow, indexFile )
+                    BiblelatorGlobals.theApp.childWindows.append( hW )
+                    if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "Finished openCheckWindow" )
+            # end of doneCheckJob
+
+            BiblelatorGlobals.theApp.jobScheduler.submit( _("{} checks").format( internalBible.getAName() ), doCheckJob,
+                                                        onDone=doneCheckJob, onError=self._failedExports )
+            BiblelatorGlobals.theApp.setStatus( _("Bible checks started in the background") )
+            return
+        BiblelatorGlobals.theApp.setReadyStatus()
+    # end of InternalBibleJobsAddon.doCheckProject
+# end of InternalBibleJobsAddon class
+
+
+
+class InternalBibleResourceWindowAddon( BibleResourceWindowAddon, InternalBibleJobsAddon ):
     """
     A window displaying one internal (on-disk) Bible.
     """
@@ -1891,6 +2121,17 @@ class InternalBibleResourceWindowAddon( BibleResourceWindowAddon ):
     # end of InternalBibleResourceWindowAddon.createContextMenu
 
 
+    def getVerseCacheResourceID( self ):
+        """
+        Share cached verses with any other windows or boxes using the same internal Bible.
+
+        (handleInternalBibles makes sure that there's only one copy of each internal Bible.)
+        """
+        if self.internalBible is None: return BibleResourceWindowAddon.getVerseCacheResourceID( self )
+        return BiblelatorGlobals.theApp.verseCache.makeResourceID( self.internalBible )
+    # end of InternalBibleResourceWindowAddon.getVerseCacheResourceID
+
+
     def getContextVerseData( self, verseKey ):
         """
         Fetches and returns the internal Bible data for the given reference.
@@ -1920,133 +2161,6 @@ class InternalBibleResourceWindowAddon( BibleResourceWindowAddon ):
     # end of InternalBibleResourceWindowAddon.doShowInfo
 
 
-    def _prepareForExports( self ):
-        """
-        Prepare to do some of the exports available in BibleOrgSysGlobals.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.prepareForExports()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.prepareForExports()…") )
-
-        self._prepareInternalBible()
-        if self.internalBible is not None:
-            BiblelatorGlobals.theApp.setWaitStatus( _("Preparing for export…") )
-            if self.exportFolderpath is None:
-                fp = self.folderpath
-                if fp and fp[-1] in '/\\': fp = fp[:-1] # Removing trailing slash
-                self.exportFolderpath = fp + 'Export/'
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "eFolder", repr(self.exportFolderpath) )
-                if not os.path.exists( self.exportFolderpath ):
-                    os.mkdir( self.exportFolderpath )
-            setDefaultControlFolderpath( '../BibleOrgSys/ControlFiles/' )
-            BiblelatorGlobals.theApp.setWaitStatus( _("Export in process…") )
-    # end of InternalBibleResourceWindowAddon._prepareForExports
-
-    def doMostExports( self ):
-        """
-        Do most of the quicker exports available in BibleOrgSysGlobals.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.doMostExports()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.doMostExports()…") )
-
-        self._prepareForExports()
-        self.internalBible.doAllExports( self.exportFolderpath )
-        self._doneExports()
-    # end of InternalBibleResourceWindowAddon.doMostExports
-
-    def doPhotoBibleExport( self ):
-        """
-        Do the BibleOrgSys PhotoBible export.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.doPhotoBibleExport()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.doPhotoBibleExport()…") )
-
-        self._prepareForExports()
-        self.internalBible.toPhotoBible( os.path.join( self.exportFolderpath, 'BOS_PhotoBible_Export/' ) )
-        self._doneExports()
-    # end of InternalBibleResourceWindowAddon.doPhotoBibleExport
-
-    def doODFsExport( self ):
-        """
-        Do the BibleOrgSys ODFsExport export.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.doODFsExport()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.doODFsExport()…") )
-
-        self._prepareForExports()
-        self.internalBible.toODF( os.path.join( self.exportFolderpath, 'BOS_ODF_Export/' ) )
-        self._doneExports()
-    # end of InternalBibleResourceWindowAddon.doODFsExport
-
-    def doPDFsExport( self ):
-        """
-        Do the BibleOrgSys PDFsExport export.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.doPDFsExport()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.doPDFsExport()…") )
-
-        self._prepareForExports()
-        self.internalBible.toTeX( os.path.join( self.exportFolderpath, 'BOS_PDF(TeX)_Export/' ) )
-        self._doneExports()
-    # end of InternalBibleResourceWindowAddon.doPDFsExport
-
-    def doAllExports( self ):
-        """
-        Do all exports available in BibleOrgSysGlobals.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.doAllExports()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.doAllExports()…") )
-
-        self._prepareForExports()
-        self.internalBible.doAllExports( self.exportFolderpath, wantPhotoBible=True, wantODFs=True, wantPDFs=True )
-        self._doneExports()
-    # end of InternalBibleResourceWindowAddon.doAllExports
-
-
-    def _doneExports( self ):
-        """
-        """
-        BiblelatorGlobals.theApp.setStatus( _("Waiting for user input…") )
-        infoString = _("Results should be in {}").format( self.exportFolderpath )
-        showInfo( self, 'Folder Information', infoString )
-        BiblelatorGlobals.theApp.setReadyStatus()
-    # end of InternalBibleResourceWindowAddon.doAllExports
-
-
-    def doCheckProject( self ):
-        """
-        Run the BibleOrgSys checks on the project.
-        """
-        logging.info( _("InternalBibleResourceWindowAddon.doCheckProject()…") )
-        vPrint( 'Never', DEBUGGING_THIS_MODULE, _("InternalBibleResourceWindowAddon.doCheckProject()…") )
-
-        self._prepareInternalBible() # Slow but must be called before the dialog
-        currentBBB = self.currentVerseKey.getBBB()
-        gBBRD = GetBibleBookRangeDialog( self, self.internalBible, currentBBB, None, title=_('Books to be checked') )
-        #if BibleOrgSysGlobals.debugFlag: vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "gBBRDResult", repr(gBBRD.result) )
-        if gBBRD.result:
-            if BibleOrgSysGlobals.debugFlag: assert isinstance( gBBRD.result, list )
-            #if len(gBBRD.result)==1 and gBBRD.result[0]==currentBBB:
-                ## It's just the current book to check
-                #if self.modified(): self.doSave()
-                #self.internalBible.loadBookIfNecessary( currentBBB )
-            #else: # load all books
-                #self._prepareInternalBible()
-            BiblelatorGlobals.theApp.setWaitStatus( _("Doing Bible checks…") )
-            self.internalBible.check( gBBRD.result )
-            displayExternally = False
-            if displayExternally: # Call up a browser window
-                import webbrowser
-                indexFile = self.internalBible.makeErrorHTML( self.folderpath, gBBRD.result )
-                webbrowser.open( indexFile )
-            else: # display internally in our HTMLWindow
-                indexFile = self.internalBible.makeErrorHTML( self.folderpath, gBBRD.result )
-                hW = HTMLWindow( self, indexFile )
-                BiblelatorGlobals.theApp.childWindows.append( hW )
-                if BibleOrgSysGlobals.debugFlag: BiblelatorGlobals.theApp.setDebugText( "Finished openCheckWindow" )
-        BiblelatorGlobals.theApp.setReadyStatus()
-    # end of InternalBibleResourceWindowAddon.doCheckProject
-
-
     #def _doHelp( self, event=None ):
         #"""
         #Display a help box.
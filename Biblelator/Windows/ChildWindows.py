@@ -33,11 +33,17 @@ Base windows to allow display and manipulation of
         deiconifyAll( self, childWindowType=None )
         saveAll( self )
         updateThisBibleGroup( self, groupCode, newVerseKey, originator=None )
+        cancelBibleGroupUpdates( self, groupCode=None )
+        scheduleFirstBCVUpdate( self, appWin )
+        _doFirstMappedBCVUpdate( self, appWin, event )
+        _queueFirstBCVUpdate( self, appWin )
+        _doNextBCVUpdate( self )
         updateLexicons( self, newLexiconWord )
 
     class ChildWindow( tk.Toplevel, ChildBoxAddon ) -- used in BibleWindow, BibleResourceWindow, TextWindow, HTMLWindow
         __init__( self, genericWindowType )
         geometry( self, *args, **kwargs )
+        _noteFocusIn( self, event=None )
         _createStandardWindowKeyboardBinding( self, name, command )
         createStandardWindowKeyboardBindings( self, reset=False )
         notWrittenYet( self )
@@ -102,7 +108,7 @@ Base windows to allow display and manipulation of
         doClose( self, event=None )
 
     class FindResultWindow( tk.Toplevel ) -- used in BibleBoxAddon.doActualBibleFind
-        __init__( self, parentWindow, optionDict, resultSummaryDict, resultList, findFunction, refindFunction, replaceFunction, extendTo=None )
+        __init__( self, parentWindow, optionDict, resultSummaryDict, resultList, findFunction, refindFunction, replaceFunction, extendTo=None, stopFunction=None )
         notWrittenYet( self )
         _createMenuBar( self )
         createContextMenu( self )
@@ -113,6 +119,10 @@ Base windows to allow display and manipulation of
         #setWaitStatus( self, newStatusText )
         setReadyStatus( self )
         makeTreeView( self )
+        _insertResultRows( self, startIndex )
+        addResults( self, resultSummaryDict, newResultList, currentBBB=None )
+        finishSearch( self, stopped=False )
+        doStop( self, event=None )
         itemSelected( self, event=None )
         doExtend( self, event=None )
         doActualExtend( self )
@@ -142,9 +152,12 @@ Base windows to allow display and manipulation of
         selectBible2( self, event=None )
         doNext( self, event=None )
         doPrevious( self, event=None )
+        showDifference( self, differenceIndex )
         disableButtons( self )
         checkEnables( self, finalFlag=False )
         doGoCollate( self, event=None )
+        _doCollateSlice( self )
+        stopCollation( self )
         doShowInfo( self, event=None )
         _doHelp( self, event=None )
         _doAbout( self, event=None )
@@ -152,13 +165,22 @@ Base windows to allow display and manipulation of
         doRefresh( self )
         doRefind( self )
 
+    class JobStatusWindow( tk.Toplevel ) -- used in Biblelator.py
+        __init__( self, parentWindow )
+        refreshJobs( self )
+        doCancelJob( self, event=None )
+        doClearFinished( self, event=None )
+        doClose( self, event=None )
+
     fullDemo()
 """
 from gettext import gettext as _
+from typing import Optional
 import sys
 import os.path
 import logging
 import re
+from collections import OrderedDict
 
 import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
@@ -174,7 +196,7 @@ if __name__ == '__main__':
     if aboveAboveFolderpath not in sys.path:
         sys.path.insert( 0, aboveAboveFolderpath )
 from Biblelator import BiblelatorGlobals
-from Biblelator.BiblelatorGlobals import APP_NAME, DEFAULT, tkBREAK, \
+from Biblelator.BiblelatorGlobals import APP_NAME, DEFAULT, tkSTART, tkBREAK, \
                             BIBLE_GROUP_CODES, BIBLE_CONTEXT_VIEW_MODES, BIBLE_FORMAT_VIEW_MODES, \
                             parseWindowGeometry, parseWindowSize, assembleWindowGeometry, errorBeep, \
                             INITIAL_RESOURCE_SIZE, MINIMUM_RESOURCE_SIZE, MAXIMUM_RESOURCE_SIZE, \
@@ -183,6 +205,8 @@ from Biblelator.BiblelatorGlobals import APP_NAME, DEFAULT, tkBREAK, \
 from Biblelator.Dialogs.BiblelatorSimpleDialogs import showError, showInfo
 from Biblelator.Dialogs.BiblelatorDialogs import SelectInternalBibleDialog
 from Biblelator.Helpers.BiblelatorHelpers import mapReferenceVerseKey, mapParallelVerseKey #, mapReferencesVerseKey
+from Biblelator.Helpers.ParallelBibleSearch import combineFindSummaries
+from Biblelator.Helpers.BibleCollate import BibleCollation
 from Biblelator.Windows.TextBoxes import BText, BCombobox, HTMLTextBox, ChildBoxAddon, BibleBoxAddon
 
 
@@ -195,6 +219,9 @@ PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
 DEBUGGING_THIS_MODULE = False
 
 
+COLLATE_POLL_TIME = 20 # milliseconds -- how often we check if the next book has been collated by a worker process
+
+
 
 
 class ChildWindows( list ):
@@ -208,6 +235,10 @@ class ChildWindows( list ):
     def __init__( self, ChildWindowsParent ) -> None:
         self.ChildWindowsParent = ChildWindowsParent
         list.__init__( self )
+        self.pendingBCVUpdates = OrderedDict() # Keys are id(appWin), values are (appWin,newVerseKey,originator,groupCode)
+        self.BCVUpdateAfterID = None
+        self.awaitingFirstBCVUpdate = {} # Keys are id(appWin), values are appWin (windows restored but not yet shown)
+        self.lastFocusedWindow = None # Saved in the settings so that it can be reopened first next time
 
 
     def iconifyAll( self, childWindowType=None ) -> None:
@@ -248,29 +279,119 @@ class ChildWindows( list ):
         Called when we probably need to update some resource windows with a new Bible reference.
 
         Note that this new verse key is in the reference versification system.
+
+        The windows aren't updated immediately: each update is scheduled separately
+            (with the focused window first) so that the main window stays responsive.
+        Any updates that haven't been done yet are dropped if the user navigates again.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "ChildWindows.updateThisBibleGroup( {}, {}, {} )".format( groupCode, newVerseKey.getShortText(), originator ) )
 
+        try: focusedWindow = self.ChildWindowsParent.focus_get().winfo_toplevel()
+        except (AttributeError, KeyError, tk.TclError): focusedWindow = None # Nothing (or a popdown) has focus
+
+        self.cancelBibleGroupUpdates( groupCode ) # They're now out-of-date
         for appWin in self:
             if 'Bible' in appWin.genericWindowType: # e.g., BibleResource, BibleEditor
+                if id(appWin) in self.awaitingFirstBCVUpdate: continue # It'll get the latest reference when it's first shown
                 if appWin.BCVUpdateType==DEFAULT and appWin._groupCode==groupCode:
-                    # The following line doesn't work coz it only updates ONE window
-                    #self.ChildWindowsParent.after_idle( lambda: appWin.updateShownBCV( newVerseKey ) )
-                    appWin.updateShownBCV( newVerseKey, originator=originator )
+                    windowVerseKey = newVerseKey
                     #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '  Normal', appWin._groupCode, newVerseKey, appWin.moduleID )
                 elif groupCode == BIBLE_GROUP_CODES[0]:
                     if appWin.BCVUpdateType=='ReferenceMode' and appWin._groupCode==BIBLE_GROUP_CODES[1]:
-                        appWin.updateShownBCV( mapReferenceVerseKey( newVerseKey ), originator=originator )
+                        windowVerseKey = mapReferenceVerseKey( newVerseKey )
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '  Reference', appWin._groupCode, mapReferenceVerseKey( newVerseKey ), appWin.moduleID )
                     elif appWin.BCVUpdateType=='ParallelMode' and appWin._groupCode!=BIBLE_GROUP_CODES[0]:
-                        appWin.updateShownBCV( mapParallelVerseKey( appWin._groupCode, newVerseKey ), originator=originator )
+                        windowVerseKey = mapParallelVerseKey( appWin._groupCode, newVerseKey )
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '  Parallel', appWin._groupCode, mapParallelVerseKey( appWin._groupCode, newVerseKey ), appWin.moduleID )
                     #elif appWin.BCVUpdateType=='ReferencesMode':
                         #appWin.updateShownReferences( mapReferencesVerseKey( newVerseKey ) )
                         ##dPrint( 'Quiet', DEBUGGING_THIS_MODULE, '  Parallel', appWin._groupCode, mapParallelVerseKey( appWin._groupCode, newVerseKey ), appWin.moduleID )
+                    else: continue
+                else: continue
+                self.pendingBCVUpdates.pop( id(appWin), None ) # Drop any older update for this window
+                self.pendingBCVUpdates[id(appWin)] = appWin, windowVerseKey, originator, groupCode
+                if appWin is focusedWindow: self.pendingBCVUpdates.move_to_end( id(appWin), last=False )
+
+        if self.pendingBCVUpdates and self.BCVUpdateAfterID is None:
+            self.BCVUpdateAfterID = self.ChildWindowsParent.after_idle( self._doNextBCVUpdate )
     # end of ChildWindows.updateThisBibleGroup
 
 
+    def cancelBibleGroupUpdates( self, groupCode=None ) -> None:
+        """
+        Drop any scheduled window updates that were caused by navigation in the given group
+            (or all of them if groupCode is None).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ChildWindows.cancelBibleGroupUpdates( {groupCode} )" )
+        for windowKey,(_appWin,_verseKey,_originator,updateGroupCode) in list( self.pendingBCVUpdates.items() ):
+            if groupCode is None or updateGroupCode == groupCode:
+                del self.pendingBCVUpdates[windowKey]
+    # end of ChildWindows.cancelBibleGroupUpdates
+
+
+    def scheduleFirstBCVUpdate( self, appWin ) -> None:
+        """
+        Used for Bible windows that are being restored from the settings.
+
+        Rather than displaying the reference straight away,
+            wait until the window is actually shown on the screen
+            and then queue its update like any other (so it's done in an idle slice).
+
+        If the window has already been mapped (e.g., something called update() while it was being set up),
+            its update is queued straight away.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ChildWindows.scheduleFirstBCVUpdate( {appWin.windowType} )" )
+        self.awaitingFirstBCVUpdate[id(appWin)] = appWin
+        appWin.bind( '<Map>', lambda event: self._doFirstMappedBCVUpdate( appWin, event ), add='+' )
+        if appWin.winfo_ismapped(): # Too late to get the <Map> event
+            self._queueFirstBCVUpdate( appWin )
+    # end of ChildWindows.scheduleFirstBCVUpdate
+
+
+    def _doFirstMappedBCVUpdate( self, appWin, event ) -> None:
+        """
+        Called when the window (or any of its widgets) is mapped.
+        """
+        if event.widget is not appWin: return # Not the toplevel window itself
+        self._queueFirstBCVUpdate( appWin )
+    # end of ChildWindows._doFirstMappedBCVUpdate
+
+
+    def _queueFirstBCVUpdate( self, appWin ) -> None:
+        """
+        Queues the window to show the current reference for its group
+            if it hasn't been updated yet.
+        """
+        if self.awaitingFirstBCVUpdate.pop( id(appWin), None ) is None: return # Already done
+        fnPrint( DEBUGGING_THIS_MODULE, f"ChildWindows._queueFirstBCVUpdate( {appWin.windowType} )" )
+
+        groupCode = appWin._groupCode
+        self.pendingBCVUpdates.pop( id(appWin), None )
+        self.pendingBCVUpdates[id(appWin)] = appWin, self.ChildWindowsParent.getVerseKey( groupCode ), None, groupCode
+        if self.BCVUpdateAfterID is None:
+            self.BCVUpdateAfterID = self.ChildWindowsParent.after_idle( self._doNextBCVUpdate )
+    # end of ChildWindows._queueFirstBCVUpdate
+
+
+    def _doNextBCVUpdate( self ) -> None:
+        """
+        Update the next window that's waiting to show a new Bible reference,
+            then give Tk a chance to handle user input before doing the next one.
+        """
+        self.BCVUpdateAfterID = None
+        if not self.pendingBCVUpdates: return
+        _windowKey, (appWin, windowVerseKey, originator, _groupCode) = self.pendingBCVUpdates.popitem( last=False )
+        try:
+            if appWin in self: # it might have been closed in the meantime
+                appWin.updateShownBCV( windowVerseKey, originator=originator )
+        finally:
+            if self.BCVUpdateAfterID is None: # (an update might have caused more navigation)
+                if self.pendingBCVUpdates:
+                    self.BCVUpdateAfterID = self.ChildWindowsParent.after_idle( self._doNextBCVUpdate )
+                else: self.ChildWindowsParent.setReadyStatus()
+    # end of ChildWindows._doNextBCVUpdate
+
+
     def updateLexicons( self, newLexiconWord:str ) -> None:
         """
         Called when we probably need to update some resource windows with a new word.
@@ -341,6 +462,7 @@ class ChildWindow( tk.Toplevel, ChildBoxAddon ):
 
         self.createStandardWindowKeyboardBindings()
         self.textBox.bind( '<Button-1>', self.setFocus ) # So disabled text box can still do select and copy functions
+        self.bind( '<FocusIn>', self._noteFocusIn, add='+' )
 
         # Options for find, etc.
         self.optionsDict = {}
@@ -370,6 +492,14 @@ class ChildWindow( tk.Toplevel, ChildBoxAddon ):
     # end of ChildWindow.geometry
 
 
+    def _noteFocusIn( self, event=None ) -> None:
+        """
+        Remember which of our child windows last had the focus.
+        """
+        BiblelatorGlobals.theApp.childWindows.lastFocusedWindow = self
+    # end of ChildWindow._noteFocusIn
+
+
     def _createStandardWindowKeyboardBinding( self, name:str, command ) -> None:
         """
         Called from createStandardKeyboardBindings to do the actual work.
@@ -633,6 +763,9 @@ class ChildWindow( tk.Toplevel, ChildBoxAddon ):
 
         if self in BiblelatorGlobals.theApp.childWindows:
             BiblelatorGlobals.theApp.childWindows.remove( self )
+            BiblelatorGlobals.theApp.childWindows.awaitingFirstBCVUpdate.pop( id(self), None )
+            if BiblelatorGlobals.theApp.childWindows.lastFocusedWindow is self:
+                BiblelatorGlobals.theApp.childWindows.lastFocusedWindow = None
             self.destroy()
         else: # we might not have finished making our window yet
             if BibleOrgSysGlobals.debugFlag:
@@ -1588,7 +1721,7 @@ class FindResultWindow( tk.Toplevel ):
     """
     Displays the find results.
     """
-    def __init__( self, parentWindow, optionDict, resultSummaryDict, resultList, findFunction, refindFunction, replaceFunction, extendTo=None ) -> None:
+    def __init__( self, parentWindow, optionDict, resultSummaryDict, resultList, findFunction, refindFunction, replaceFunction, extendTo=None, stopFunction=None ) -> None:
         """
         optionDict is the dictionary of options that were given to the find function.
         resultSummaryDict is the dictionary containing summary entries (counts) for each Bible book.
@@ -1600,16 +1733,19 @@ class FindResultWindow( tk.Toplevel ):
                 SimpleVerseKey, marker (none if v~), contextBefore, foundWordForm, contextAfter
         findFunction is the function that was called to create this window
             (which is used to refresh the window)
+        stopFunction is given if the search is still going,
+            in which case the results are added later (by calling addResults and then finishSearch)
+            and the function is called if the user stops the search (or closes the window).
         """
         fnPrint( DEBUGGING_THIS_MODULE, "FindResultWindow.__init__( {}, {}, {}, {} )".format( parentWindow, optionDict, resultSummaryDict, len(resultList) ) )
         if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.strictCheckingFlag:
             assert parentWindow
             assert optionDict and isinstance( optionDict, dict )
-            assert resultSummaryDict and isinstance( resultSummaryDict, dict )
-            assert resultList and isinstance( resultList, list )
+            assert isinstance( resultSummaryDict, dict ) and (resultSummaryDict or stopFunction is not None)
+            assert isinstance( resultList, list ) and (resultList or stopFunction is not None)
 
-        self.parentWindow, self.optionDict, self.resultSummaryDict, self.resultList, self.findFunction, self.refindFunction, self.replaceFunction, self.extendedTo = \
-            parentWindow, optionDict, resultSummaryDict, resultList, findFunction, refindFunction, replaceFunction, extendTo
+        self.parentWindow, self.optionDict, self.resultSummaryDict, self.resultList, self.findFunction, self.refindFunction, self.replaceFunction, self.extendedTo, self.stopFunction = \
+            parentWindow, optionDict, resultSummaryDict, resultList, findFunction, refindFunction, replaceFunction, extendTo, stopFunction
         tk.Toplevel.__init__( self, self.parentWindow )
         self.protocol( 'WM_DELETE_WINDOW', self.doClose )
         self.title( '{} Search Results'.format( self.optionDict['workName'] ) )
@@ -1652,9 +1788,9 @@ class FindResultWindow( tk.Toplevel ):
         #modeCb.pack( in_=top, side=tk.LEFT )
         modeCb.grid( in_=top, row=0, column=0, padx=20, pady=5, sticky=tk.W )
 
-        infoLabel = Label( self, text='( {:,} entries for {!r} )'.format( len(self.resultList), self.optionDict['findText'] ) )
+        self.infoLabel = Label( self, text='( {:,} entries for {!r} )'.format( len(self.resultList), self.optionDict['findText'] ) )
         #infoLabel.pack( in_=top, side=tk.TOP, anchor=tk0.CENTER, padx=2, pady=2 )
-        infoLabel.grid( in_=top, row=0, column=1, padx=2, pady=5 )
+        self.infoLabel.grid( in_=top, row=0, column=1, padx=2, pady=5 )
 
         if len(self.availableInternalBibles) == 1:
             extendText = _(" to {}").format( self.availableInternalBibles[0].getAName() )
@@ -1684,6 +1820,11 @@ class FindResultWindow( tk.Toplevel ):
         #closeButton.pack( in_=top, side=tk.RIGHT, padx=2, pady=2 )
         closeButton.grid( in_=top, row=1, column=3, padx=5, pady=5, sticky=tk.E )
 
+        if self.stopFunction is not None: # The search is still going
+            self.stopButton = Button( self, text=_('Stop'), command=self.doStop )
+            self.stopButton.grid( in_=top, row=0, column=3, padx=5, pady=5, sticky=tk.E )
+            self.infoLabel.configure( text=_("Searching for {!r}…").format( self.optionDict['findText'] ) )
+
         # Create a scroll bar to fill the right-hand side of the window
         self.vScrollbar = Scrollbar( self )
         self.vScrollbar.pack( side=tk.RIGHT, fill=tk.Y )
@@ -1891,7 +2032,7 @@ class FindResultWindow( tk.Toplevel ):
             Text after
         """
         fnPrint( DEBUGGING_THIS_MODULE, "FindResultWindow.makeTreeView()" )
-        if DEBUGGING_THIS_MODULE: assert self.resultList
+        if DEBUGGING_THIS_MODULE: assert self.resultList or self.stopFunction is not None
 
         self.lineMode = not self.modeVar.get()
 
@@ -1932,8 +2073,20 @@ class FindResultWindow( tk.Toplevel ):
             extendName = self.extendedTo.abbreviation if self.extendedTo.abbreviation else self.extendedTo.name
             self.findResultsTreeview.heading( 'extend', text=extendName )
 
-        lastBBB = None
-        for j,resultEntry in enumerate(self.resultList):
+        self._insertResultRows( 0 )
+        self.findResultsTreeview.tag_bind( 'BCV', '<Double-Button-1>', self.itemSelected )
+    # end of FindResultWindow.makeTreeView
+
+
+    def _insertResultRows( self, startIndex:int ) -> None:
+        """
+        Insert the result list entries from startIndex onwards into the TreeView
+            (adding book headings as necessary).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"FindResultWindow._insertResultRows( {startIndex} )" )
+
+        lastBBB = self.resultList[startIndex-1][0].getBBB() if startIndex else None
+        for j,resultEntry in enumerate( self.resultList[startIndex:], start=startIndex ):
             if len(resultEntry) == 5:
                 ref,marker,before,fText,after = resultEntry
             elif len(resultEntry) == 4:
@@ -1960,9 +2113,52 @@ class FindResultWindow( tk.Toplevel ):
                 else: # column mode
                     self.findResultsTreeview.insert( BBB, 'end', j, tags='BCV',
                         values=('{} {}:{}'.format(BBB,C,V), marker if marker else '', before, fText, after, extend) )
+    # end of FindResultWindow._insertResultRows
 
-        self.findResultsTreeview.tag_bind( 'BCV', '<Double-Button-1>', self.itemSelected )
-    # end of FindResultWindow.makeTreeView
+
+    def addResults( self, resultSummaryDict:dict, newResultList:list, currentBBB:Optional[str]=None ) -> None:
+        """
+        Add some more results (e.g., from the next book searched) while the search is still going.
+
+        The summary counts and lists are combined with what we already have,
+            and the new entries are added to the end of the TreeView.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"FindResultWindow.addResults( {resultSummaryDict}, {len(newResultList)}, {currentBBB} )" )
+
+        combineFindSummaries( self.resultSummaryDict, resultSummaryDict )
+
+        startIndex = len( self.resultList )
+        self.resultList.extend( newResultList )
+        if newResultList: self._insertResultRows( startIndex )
+        self.infoLabel.configure( text=_("Searching {}… ({:,} entries for {!r})").format( currentBBB if currentBBB else '', len(self.resultList), self.optionDict['findText'] ) )
+    # end of FindResultWindow.addResults
+
+
+    def finishSearch( self, stopped:bool=False ) -> None:
+        """
+        Called when the search has finished (or been stopped).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"FindResultWindow.finishSearch( {stopped} )" )
+
+        self.stopFunction = None
+        try: self.stopButton.destroy(); del self.stopButton
+        except AttributeError: pass # we weren't searching
+        infoText = '( {:,} entries for {!r} )'.format( len(self.resultList), self.optionDict['findText'] )
+        if stopped: infoText = _("{} -- search stopped").format( infoText )
+        self.infoLabel.configure( text=infoText )
+    # end of FindResultWindow.finishSearch
+
+
+    def doStop( self, event=None ) -> None:
+        """
+        Stop the search that's still going (leaving the results found so far).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"FindResultWindow.doStop( {event} )" )
+
+        stopFunction = self.stopFunction
+        self.finishSearch( stopped=True )
+        if stopFunction is not None: stopFunction()
+    # end of FindResultWindow.doStop
 
 
     def itemSelected( self, event=None ):
@@ -2100,6 +2296,9 @@ class FindResultWindow( tk.Toplevel ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "FindResultWindow.doClose( {} )".format( event ) )
 
+        if self.stopFunction is not None: # The search is still going
+            stopFunction, self.stopFunction = self.stopFunction, None
+            stopFunction()
         try: cWs = BiblelatorGlobals.theApp.childWindows
         except AttributeError: cWs = BiblelatorGlobals.theApp.childWindows
         if self in cWs:
@@ -2218,6 +2417,8 @@ class CollateProjectsWindow( tk.Toplevel ):
         self.internalBible1 = self.internalBible2 = None
 
         self.compareFunction = 'and'
+        self.collation = self.collationGenerator = self.collationAfterID = None
+        self.differenceList, self.currentDifferenceIndex = [], -1
 
         # Make a frame at the top and then put our options inside it
         top = Frame( self )
@@ -2438,6 +2639,8 @@ class CollateProjectsWindow( tk.Toplevel ):
         self.textBox2.pack( side=tk.TOP, fill=tk.BOTH ) #, expand=tk.YES )
         #self.textBox2.grid( row=2, column=0, columnspan=2, padx=2, pady=2, sticky=tk.W )
         self.vScrollbar2.configure( command=self.textBox2.yview ) # link the scrollbar to the text box
+        for textBox in ( self.textBox1, self.textBox2 ):
+            textBox.tag_configure( 'currentDifference', background='yellow' )
 
         self.createStandardWindowKeyboardBindings()
     # end of CollateProjectsWindow.__init__
@@ -2715,17 +2918,42 @@ class CollateProjectsWindow( tk.Toplevel ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "CollateProjectsWindow.doNext( {} )".format( event ) )
 
+        if self.currentDifferenceIndex+1 < len(self.differenceList):
+            self.showDifference( self.currentDifferenceIndex + 1 )
     # end of CollateProjectsWindow.doNext
 
     def doPrevious( self, event=None ):
         """
-        Process Next button.
+        Process Previous button.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "CollateProjectsWindow.doPrevious( {} )".format( event ) )
 
+        if self.currentDifferenceIndex > 0:
+            self.showDifference( self.currentDifferenceIndex - 1 )
     # end of CollateProjectsWindow.doPrevious
 
 
+    def showDifference( self, differenceIndex:int ) -> None:
+        """
+        Highlight the given difference in both text boxes
+            and go to that verse (if Auto Goto is set).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"CollateProjectsWindow.showDifference( {differenceIndex} )" )
+
+        self.currentDifferenceIndex = differenceIndex
+        lineStart, lineEnd = f'{differenceIndex+1}.0', f'{differenceIndex+1}.end'
+        for textBox in ( self.textBox1, self.textBox2 ):
+            textBox.tag_remove( 'currentDifference', tkSTART, tk.END )
+            textBox.tag_add( 'currentDifference', lineStart, lineEnd )
+            textBox.see( lineStart )
+        self.previousButton.configure( state=tk.NORMAL if differenceIndex>0 else tk.DISABLED )
+        self.nextButton.configure( state=tk.NORMAL if differenceIndex+1<len(self.differenceList) else tk.DISABLED )
+        if self.autoGotoVar.get():
+            BBB, C, V = self.differenceList[differenceIndex][:3]
+            BiblelatorGlobals.theApp.gotoBCV( BBB, C,V, 'CollateProjectsWindow.showDifference' )
+    # end of CollateProjectsWindow.showDifference
+
+
     def disableButtons( self ):
         """
         Disable all buttons.
@@ -2785,49 +3013,115 @@ class CollateProjectsWindow( tk.Toplevel ):
     def doGoCollate( self, event=None ):
         """
         Process Go button.
+
+        The books of both Bibles are loaded and compared verse by verse at the same time
+            (by worker processes if possible)
+            and the differences are shown as each book is finished.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "CollateProjectsWindow.doGoCollate( {} )".format( event ) )
 
-        # Prepare the final parameters
-        self.optionsDict1['bookList'] = self.BBB if self.thisBookOnlyVar.get() else 'ALL'
-        self.optionsDict2['bookList'] = self.optionsDict1['bookList']
-
-        # Prepare the appropriate internal Bibles
-        BiblelatorGlobals.theApp.setWaitStatus( _("Preparing internal Bible1…") )
-        if self.optionsDict1['bookList'] == 'ALL':
-            BiblelatorGlobals.theApp.setWaitStatus( _("Loading/Preparing internal Bible1…") )
-            self.internalBible1.load()
-        else:
-            BiblelatorGlobals.theApp.setWaitStatus( _("Loading/Preparing internal Bible1 book…") )
-            self.internalBible1.loadBook( self.optionsDict1['bookList'] )
-        BiblelatorGlobals.theApp.setWaitStatus( _("Preparing internal Bible2…") )
-        if self.optionsDict2['bookList'] == 'ALL':
-            BiblelatorGlobals.theApp.setWaitStatus( _("Loading/Preparing internal Bible2…") )
-            self.internalBible2.load()
-        else:
-            BiblelatorGlobals.theApp.setWaitStatus( _("Loading/Preparing internal Bible2 book…") )
-            self.internalBible2.loadBook( self.optionsDict2['bookList'] )
+        self.checkEnables( finalFlag=True )
+        if str( self.goButton['state'] ) == tk.DISABLED: return
+        self.stopCollation()
 
-        # Do the finds
-        self.optionsDict1, resultSummaryDict1, findResultList1 = self.optionsDict1['givenBible'].findText( self.optionsDict1 )
-        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Got findResultList1", findResultList1 )
-        if len(findResultList1) == 0: # nothing found
-            errorBeep()
-            key = self.optionsDict1['findText']
-            showError( self, APP_NAME, _("String {!r} not found").format( key if len(key)<20 else (key[:18]+'…') ) )
-            self.disableButtons()
-            return
-        self.optionsDict2, resultSummaryDict2, findResultList2 = self.optionsDict2['givenBible'].findText( self.optionsDict2 )
-        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Got findResultList2", findResultList2 )
-        if len(findResultList2) == 0: # nothing found
+        # Prepare the final parameters
+        for optionsDict,searchStringBox in ( (self.optionsDict1,self.searchString1Box), (self.optionsDict2,self.searchString2Box) ):
+            try: optionsDict['findHistoryList'].remove( optionsDict['findText'] )
+            except ValueError: pass
+            optionsDict['findHistoryList'].append( optionsDict['findText'] ) # Make sure it goes on the end
+            searchStringBox['values'] = optionsDict['findHistoryList']
+        collateOptionsDict = { 'findText1':self.optionsDict1['findText'], 'findText2':self.optionsDict2['findText'],
+                                'caselessFlag':self.optionsDict1['caselessFlag'], 'ignoreDiacriticsFlag':self.optionsDict1['ignoreDiacriticsFlag'],
+                                'includeIntroFlag':self.optionsDict1['includeIntroFlag'], 'includeExtrasFlag':self.optionsDict1['includeExtrasFlag'],
+                                'markersMatchFlag':self.markersMatchVar.get() }
+        for findText in ( collateOptionsDict['findText1'], collateOptionsDict['findText2'] ):
+            if findText.lower().startswith( 'regex:' ):
+                try: re.compile( findText[6:] )
+                except re.error as err:
+                    errorBeep()
+                    showError( self, _("Collate Projects error"), _("Bad regular expression {!r}: {}").format( findText[6:], err ) )
+                    return
+
+        # Work out which books are in both Bibles
+        bookLists = []
+        for internalBible in ( self.internalBible1, self.internalBible2 ):
+            if getattr( internalBible, 'preloadDone', True ) is False: internalBible.preload()
+            bookList = [BBB for BBB,_filename in getattr( internalBible, 'maximumPossibleFilenameTuples', None ) or ()]
+            if not bookList: internalBible.load() # Not loaded from book files
+            bookList += [BBB for BBB in internalBible.books if BBB not in bookList]
+            bookLists.append( bookList )
+        bookList = [BBB for BBB in bookLists[0] if BBB in bookLists[1]]
+        if self.thisBookOnlyVar.get(): bookList = [BBB for BBB in bookList if BBB==self.BBB]
+        if not bookList:
             errorBeep()
-            key = self.optionsDict2['findText']
-            showError( self, APP_NAME, _("String {!r} not found").format( key if len(key)<20 else (key[:28]+'…') ) )
-            self.disableButtons()
+            showError( self, _("Collate Projects error"), _("No books in common to collate") )
             return
+
+        self.differenceList = []
+        self.currentDifferenceIndex = -1
+        for textBox in ( self.textBox1, self.textBox2 ):
+            textBox.configure( state=tk.NORMAL )
+            textBox.delete( tkSTART, tk.END )
+            textBox.configure( state=tk.DISABLED )
+        self.setStatus( _("Collating {} books…").format( len(bookList) ) )
+        self.collation = BibleCollation( self.internalBible1, self.internalBible2, bookList, collateOptionsDict )
+        self.collationGenerator = self.collation.collateBooks()
+        self.collationAfterID = self.after_idle( self._doCollateSlice )
     # end of CollateProjectsWindow.doGoCollate
 
 
+    def _doCollateSlice( self ) -> None:
+        """
+        Get the differences for the next book (if it's ready)
+            and add them into the two text boxes.
+
+        Reschedules itself until all the books are done.
+        """
+        self.collationAfterID = None
+        if self.collationGenerator is None: return # They've stopped it
+        try: bookResult = next( self.collationGenerator )
+        except StopIteration:
+            self.collationGenerator = self.collation = None
+            self.setStatus( _("Found {:,} differences").format( len(self.differenceList) ) )
+            if not self.differenceList: showInfo( self, APP_NAME, _("No differences found") )
+            return
+
+        if bookResult is not None: # None means that we're still waiting for a worker process
+            BBB, bookDifferenceList = bookResult
+            self.setStatus( _("Collated {} ({:,} differences so far)…").format( BBB, len(self.differenceList)+len(bookDifferenceList) ) )
+            if bookDifferenceList:
+                differenceTexts1, differenceTexts2 = [], []
+                for C, V, differenceType, verseText1, verseText2 in bookDifferenceList:
+                    self.differenceList.append( (BBB, C, V, differenceType) )
+                    # Each difference must stay on one line in each box (so the line numbers match the list)
+                    differenceTexts1.append( f"{BBB} {C}:{V} ({differenceType}) {' '.join( verseText1.splitlines() )}\n" )
+                    differenceTexts2.append( f"{BBB} {C}:{V} ({differenceType}) {' '.join( verseText2.splitlines() )}\n" )
+                for textBox,differenceTexts in ( (self.textBox1,differenceTexts1), (self.textBox2,differenceTexts2) ):
+                    textBox.configure( state=tk.NORMAL )
+                    textBox.insert( tk.END, ''.join( differenceTexts ) )
+                    textBox.configure( state=tk.DISABLED )
+                if self.currentDifferenceIndex < 0: self.showDifference( 0 ) # Show the first one straight away
+                else: self.nextButton.configure( state=tk.NORMAL if self.currentDifferenceIndex+1<len(self.differenceList) else tk.DISABLED )
+        self.collationAfterID = self.after( 1 if bookResult is not None else COLLATE_POLL_TIME, self._doCollateSlice )
+    # end of CollateProjectsWindow._doCollateSlice
+
+
+    def stopCollation( self ) -> None:
+        """
+        Stop any collation that's still going
+            (cancelling any book jobs that haven't been started).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "CollateProjectsWindow.stopCollation()" )
+
+        if self.collationAfterID is not None:
+            self.after_cancel( self.collationAfterID )
+            self.collationAfterID = None
+        if self.collationGenerator is not None:
+            self.collationGenerator.close() # Cancels the remaining book jobs
+            self.collationGenerator = self.collation = None
+    # end of CollateProjectsWindow.stopCollation
+
+
     def doShowInfo( self, event=None ):
         """
         Pop-up dialog giving find info
@@ -2906,6 +3200,8 @@ class CollateProjectsWindow( tk.Toplevel ):
         """
         fnPrint( DEBUGGING_THIS_MODULE, "CollateProjectsWindow.doClose( {} )".format( event ) )
 
+        self.stopCollation()
+
         try: cWs = BiblelatorGlobals.theApp.childWindows
         except AttributeError: cWs = BiblelatorGlobals.theApp.childWindows
         if self in cWs:
@@ -2944,6 +3240,116 @@ class CollateProjectsWindow( tk.Toplevel ):
 # end of class CollateProjectsWindow
 
 
+class JobStatusWindow( tk.Toplevel ):
+    """
+    Displays the background jobs (e.g., exports and checks)
+        from BiblelatorGlobals.theApp.jobScheduler
+        and allows the user to cancel them.
+    """
+    def __init__( self, parentWindow ) -> None:
+        """
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "JobStatusWindow.__init__( {} )".format( parentWindow ) )
+        self.parentWindow = parentWindow
+        tk.Toplevel.__init__( self, self.parentWindow )
+        self.protocol( 'WM_DELETE_WINDOW', self.doClose )
+        self.title( _("Background Jobs") )
+        self.genericWindowType = 'JobStatusWindow'
+        self.windowType = 'JobStatusWindow'
+
+        self.geometry( INITIAL_RESULT_WINDOW_SIZE )
+        self.minimumSize, self.maximumSize = MINIMUM_RESULT_WINDOW_SIZE, MAXIMUM_RESULT_WINDOW_SIZE
+        self.minsize( *parseWindowSize( self.minimumSize ) )
+        self.maxsize( *parseWindowSize( self.maximumSize ) )
+        self.settings = None
+
+        top = Frame( self )
+        top.pack( side=tk.TOP, fill=tk.X )
+        self.cancelButton = Button( self, text=_('Cancel job'), command=self.doCancelJob )
+        self.cancelButton.grid( in_=top, row=0, column=0, padx=5, pady=5, sticky=tk.W )
+        clearButton = Button( self, text=_('Clear finished'), command=self.doClearFinished )
+        clearButton.grid( in_=top, row=0, column=1, padx=5, pady=5, sticky=tk.W )
+        closeButton = Button( self, text=_('Close'), command=self.doClose )
+        closeButton.grid( in_=top, row=0, column=2, padx=5, pady=5, sticky=tk.E )
+
+        self.vScrollbar = Scrollbar( self )
+        self.vScrollbar.pack( side=tk.RIGHT, fill=tk.Y )
+        self.jobsTreeview = Treeview( self, yscrollcommand=self.vScrollbar.set, show='headings',
+                                        columns=('job','status','progress','time') )
+        self.jobsTreeview.pack( expand=tk.YES, fill=tk.BOTH )
+        self.vScrollbar.configure( command=self.jobsTreeview.yview ) # link the scrollbar to the treeview
+        self.jobsTreeview.column( 'job', width=250, anchor='w' )
+        self.jobsTreeview.heading( 'job', text=_("Job") )
+        self.jobsTreeview.column( 'status', width=75, stretch=False, anchor='w' )
+        self.jobsTreeview.heading( 'status', text=_("Status") )
+        self.jobsTreeview.column( 'progress', width=200, anchor='w' )
+        self.jobsTreeview.heading( 'progress', text=_("Progress") )
+        self.jobsTreeview.column( 'time', width=60, stretch=False, anchor='e' )
+        self.jobsTreeview.heading( 'time', text=_("Time") )
+
+        BiblelatorGlobals.theApp.jobScheduler.addWatcher( self.refreshJobs )
+        self.refreshJobs()
+    # end of JobStatusWindow.__init__
+
+
+    def refreshJobs( self ) -> None:
+        """
+        Update the TreeView from the list of jobs (keeping the selection).
+
+        Called by the job scheduler every time that it checks on the jobs.
+        """
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "JobStatusWindow.refreshJobs()" )
+        jobs = BiblelatorGlobals.theApp.jobScheduler.jobs
+        jobIDs = [str(id(job)) for job in jobs]
+        for rowID in self.jobsTreeview.get_children():
+            if rowID not in jobIDs: self.jobsTreeview.delete( rowID )
+        for job,jobID in zip( jobs, jobIDs ):
+            elapsedSeconds = job.getElapsedSeconds()
+            values = (job.jobName, _(job.status),
+                        str(job.error) if job.error is not None else job.progressText,
+                        '{}:{:02}'.format( int(elapsedSeconds)//60, int(elapsedSeconds)%60 ) if job.startTime else '')
+            if self.jobsTreeview.exists( jobID ): self.jobsTreeview.item( jobID, values=values )
+            else: self.jobsTreeview.insert( '', 'end', jobID, values=values )
+    # end of JobStatusWindow.refreshJobs
+
+
+    def doCancelJob( self, event=None ) -> None:
+        """
+        Cancel the selected job(s).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "JobStatusWindow.doCancelJob( {} )".format( event ) )
+        selectedIDs = self.jobsTreeview.selection()
+        for job in BiblelatorGlobals.theApp.jobScheduler.jobs:
+            if str(id(job)) in selectedIDs:
+                BiblelatorGlobals.theApp.jobScheduler.cancelJob( job )
+        self.refreshJobs()
+    # end of JobStatusWindow.doCancelJob
+
+
+    def doClearFinished( self, event=None ) -> None:
+        """
+        Remove the finished jobs from the list.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "JobStatusWindow.doClearFinished( {} )".format( event ) )
+        BiblelatorGlobals.theApp.jobScheduler.clearFinishedJobs()
+    # end of JobStatusWindow.doClearFinished
+
+
+    def doClose( self, event=None ) -> None:
+        """
+        Called from the GUI.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "JobStatusWindow.doClose( {} )".format( event ) )
+
+        BiblelatorGlobals.theApp.jobScheduler.removeWatcher( self.refreshJobs )
+        if self in BiblelatorGlobals.theApp.childWindows:
+            BiblelatorGlobals.theApp.childWindows.remove( self )
+        try: self.destroy()
+        except tk.TclError: pass # never mind
+    # end of JobStatusWindow.doClose
+# end of class JobStatusWindow
+
+
 
 def briefDemo() -> None:
     """
@@ -29,12 +29,13 @@ A general window with one text box that has full editing functions,
 The add-on can be used to build other editing windows.
 """
 from gettext import gettext as _
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import os.path
 import logging
 import shutil
 from datetime import datetime
 import random
+from bisect import insort
 
 import tkinter as tk
 from tkinter import font
@@ -64,7 +65,8 @@ from Biblelator.Windows.ChildWindows import ChildWindow, BibleWindowAddon
 from Biblelator.Helpers.AutocorrectFunctions import setDefaultAutocorrectEntries # setAutocorrectEntries
 from Biblelator.Helpers.AutocompleteFunctions import getCharactersBeforeCursor, \
                                 getWordCharactersBeforeCursor, getCharactersAndWordBeforeCursor, \
-                                getWordBeforeSpace, addNewAutocompleteWord, acceptAutocompleteSelection
+                                getWordBeforeSpace, addNewAutocompleteWord, acceptAutocompleteSelection, \
+                                AutocompleteIndex
 
 
 LAST_MODIFIED_DATE = '2022-07-18' # by RJH
@@ -80,6 +82,7 @@ REFRESH_TITLE_TIME = 500 # msecs
 CHECK_DISK_CHANGES_TIME = 33333 # msecs
 NO_TYPE_TIME = 6000 # msecs
 NUM_AUTOCOMPLETE_POPUP_LINES = 6
+MAX_AUTOCOMPLETE_POPUP_WORDS = 60 # Only the best ranked words are put into the (scrolling) pop-up box
 MAX_PSEUDOVERSES = 200 # In non-books or non-chapters (like introductions) -- what should this really be?
 
 
@@ -167,6 +170,10 @@ class TSVEditWindowAddon:
         self.hadBOM = False
         self.tsvHeaders:List[str] = []
         self.tsvTable:List[List] = []
+        self.verseRowIndex:Dict[Tuple[str,str],List[int]] = {} # (C,V) → sorted row numbers
+        self.tsvLines:List[Optional[str]] = [] # The file line for each row as last loaded or saved
+        self.dirtyRowFlags:List[bool] = [] # True for rows changed (or inserted) since then
+        self.changeCount = self.savedChangeCount = 0 # Incremented for every change to the table
 
         self.onTextNoChangeID = None
         self.editStatus = 'Editable'
@@ -205,7 +212,7 @@ class TSVEditWindowAddon:
         setDefaultAutocorrectEntries( self )
         #setAutocorrectEntries( self, ourAutocorrectEntries )
 
-        self.autocompleteBox, self.autocompleteWords, self.existingAutocompleteWordText = None, {}, ''
+        self.autocompleteBox, self.autocompleteWords, self.existingAutocompleteWordText = None, AutocompleteIndex(), ''
         self.autocompleteWordChars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_'
         # Note: I guess we could have used non-word chars instead (to stop the backwards word search)
         self.autocompleteMinLength = 3 # Show the normal window after this many characters have been typed
@@ -294,18 +301,14 @@ class TSVEditWindowAddon:
             self._buildWidgets() # again coz columns could be different now???
             self._validateTSVTable() # _gotoRow() sets self.thisBookUSFMCode needed by _validateTSVTable()
 
-        # Go through all our rows to find if this verse occurs in the table
+        # Look up the (first) row for this verse in the table
         # NOTE: The present code doesn't change the row if there's no entry for that BCV ref
         #       What would the user want here?
-        for j, row in enumerate( self.tsvTable ):
-            if (row[self.chapterColumn] == newReferenceVerseKey.C
-              or (row[self.chapterColumn]=='front' and newReferenceVerseKey.C in ('-1','0',))) \
-            and (row[self.verseColumnNumber] == newReferenceVerseKey.V
-              or (row[self.verseColumnNumber]=='intro' and newReferenceVerseKey.V=='0')):
-                self.rowNumberVar.set( j )
-                self._gotoRow( notifyMain=False ) # Don't notify up or it gets recursive
-                break
-        else: dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Unable to find row(s) for {BBB} {C}:{V}" )
+        rowNumber = self._findVerseRow( newReferenceVerseKey.C, newReferenceVerseKey.V )
+        if rowNumber is None: dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Unable to find row(s) for {BBB} {C}:{V}" )
+        else:
+            self.rowNumberVar.set( rowNumber )
+            self._gotoRow( notifyMain=False ) # Don't notify up or it gets recursive
     # end of TSVEditWindowAddon.updateShownBCV function
 
 
@@ -499,8 +502,10 @@ class TSVEditWindowAddon:
         vPrint( 'Verbose', DEBUGGING_THIS_MODULE, "Checking loaded TSV table…" )
         self.numColumns = None
         self.tsvTable = []
+        self.tsvLines = []
         for j, line in enumerate( fileLines, start=1 ):
             line = line.rstrip( '\n\r' ) # Remove trailing nl
+            self.tsvLines.append( line )
             if not self.columnSeparator:
                 if line.count( '\t' ) >= 1: self.columnSeparator = '\t'
                 elif line.count( ',' ) >= 1: self.columnSeparator = ','
@@ -515,10 +520,135 @@ class TSVEditWindowAddon:
         dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Have table headers ({self.numColumns}): {self.tsvHeaders}" )
         self.numDataRows = len(self.tsvTable) - 1
         dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Have {self.numDataRows:,} {BBB} rows" )
+        self.dirtyRowFlags = [False] * len(self.tsvTable)
+        self.savedChangeCount = self.changeCount
+        # _buildWidgets() also sets these, but we need them now for the index
+        self.chapterColumn = self.tsvHeaders.index( 'Chapter' ) if 'Chapter' in self.tsvHeaders else None
+        self.verseColumnNumber = self.tsvHeaders.index( 'Verse' ) if 'Verse' in self.tsvHeaders else None
+        self._buildVerseRowIndex()
         return True
     # end of TSVEditWindowAddon._loadBookDataFromDisk
 
 
+    def _getVerseRowIndexKey( self, rowData:List[str] ) -> Optional[Tuple[str,str]]:
+        """
+        Returns the (C,V) key for the row (as they are in the table, e.g., 'front','intro')
+            or None if we don't know the chapter and verse columns
+            or if the row is too short to have them (e.g., a blank line).
+        """
+        if self.chapterColumn is None or self.verseColumnNumber is None: return None
+        if len(rowData) <= max( self.chapterColumn, self.verseColumnNumber ): return None
+        return rowData[self.chapterColumn], rowData[self.verseColumnNumber]
+    # end of TSVEditWindowAddon._getVerseRowIndexKey
+
+
+    def _buildVerseRowIndex( self ) -> None:
+        """
+        Make the (C,V) → row numbers index for the data rows of the table
+            so that we don't have to search the whole table on every verse change.
+
+        After this, the table must only be changed with
+            _setTableRow, _insertTableRow, and _popTableRow
+            (which keep the index and the dirty row flags up-to-date).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"TSVEditWindowAddon._buildVerseRowIndex() for {self.BBB}" )
+        self.verseRowIndex = {}
+        for rowNumber in range( 1, len(self.tsvTable) ): # Row 0 is the headers
+            if self.chapterColumn is not None and self.verseColumnNumber is not None \
+            and self._getVerseRowIndexKey( self.tsvTable[rowNumber] ) is None:
+                logging.error( f"Skipped indexing short row {rowNumber} ({len(self.tsvTable[rowNumber])} columns) of {self.BBB} {self.filepath}" )
+                continue
+            self._indexTableRow( rowNumber, addFlag=True )
+        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Indexed {self.numDataRows:,} {self.BBB} rows for {len(self.verseRowIndex):,} verses" )
+    # end of TSVEditWindowAddon._buildVerseRowIndex
+
+
+    def _indexTableRow( self, rowNumber:int, addFlag:bool ) -> None:
+        """
+        Add the row number to (or remove it from) the verse row index
+            using the C,V of the row that's currently in the table.
+        """
+        key = self._getVerseRowIndexKey( self.tsvTable[rowNumber] )
+        if key is None: return
+        if addFlag: insort( self.verseRowIndex.setdefault( key, [] ), rowNumber )
+        else:
+            rowNumbers = self.verseRowIndex[key]
+            rowNumbers.remove( rowNumber )
+            if not rowNumbers: del self.verseRowIndex[key]
+    # end of TSVEditWindowAddon._indexTableRow
+
+
+    def _shiftVerseRowIndex( self, fromRowNumber:int, shift:int ) -> None:
+        """
+        Adjust the row numbers in the index (from fromRowNumber onwards)
+            after rows are inserted or deleted.
+        """
+        for rowNumbers in self.verseRowIndex.values():
+            for j, rowNumber in enumerate( rowNumbers ):
+                if rowNumber >= fromRowNumber: rowNumbers[j] = rowNumber + shift
+    # end of TSVEditWindowAddon._shiftVerseRowIndex
+
+
+    def _findVerseRow( self, C:str, V:str ) -> Optional[int]:
+        """
+        Returns the first row number for the given chapter and verse (or None if there isn't one).
+
+        A 'front' chapter is found for chapter -1 or 0, and an 'intro' verse for verse 0.
+        """
+        rowNumbers = []
+        for tableC in (C,'front') if C in ('-1','0') else (C,):
+            for tableV in (V,'intro') if V=='0' else (V,):
+                rowNumbers.extend( self.verseRowIndex.get( (tableC,tableV), () ) )
+        return min( rowNumbers ) if rowNumbers else None
+    # end of TSVEditWindowAddon._findVerseRow
+
+
+    def _setTableRow( self, rowNumber:int, rowData:List[str] ) -> None:
+        """
+        Replace a row in the table (and update the verse row index if the C or V changed).
+
+        Marks the row as dirty (unless it's unchanged).
+        """
+        if rowData == self.tsvTable[rowNumber]: return # Nothing to do
+        self.dirtyRowFlags[rowNumber] = True
+        self.changeCount += 1
+        if self._getVerseRowIndexKey( rowData ) == self._getVerseRowIndexKey( self.tsvTable[rowNumber] ):
+            self.tsvTable[rowNumber] = rowData
+        else:
+            self._indexTableRow( rowNumber, addFlag=False )
+            self.tsvTable[rowNumber] = rowData
+            self._indexTableRow( rowNumber, addFlag=True )
+    # end of TSVEditWindowAddon._setTableRow
+
+
+    def _insertTableRow( self, rowNumber:int, rowData:List[str] ) -> None:
+        """
+        Insert a new row into the table (and the verse row index).
+        """
+        self._shiftVerseRowIndex( rowNumber, +1 )
+        self.tsvTable.insert( rowNumber, rowData )
+        self.tsvLines.insert( rowNumber, None )
+        self.dirtyRowFlags.insert( rowNumber, True )
+        self._indexTableRow( rowNumber, addFlag=True )
+        self.numDataRows += 1
+        self.changeCount += 1
+    # end of TSVEditWindowAddon._insertTableRow
+
+
+    def _popTableRow( self, rowNumber:int ) -> List[str]:
+        """
+        Remove a row from the table (and the verse row index) and return it.
+        """
+        self._indexTableRow( rowNumber, addFlag=False )
+        rowData = self.tsvTable.pop( rowNumber )
+        self.tsvLines.pop( rowNumber ); self.dirtyRowFlags.pop( rowNumber )
+        self._shiftVerseRowIndex( rowNumber+1, -1 )
+        self.numDataRows -= 1
+        self.changeCount += 1
+        return rowData
+    # end of TSVEditWindowAddon._popTableRow
+
+
     def _buildWidgets( self ):
         """
         """
@@ -853,7 +983,9 @@ class TSVEditWindowAddon:
         fnPrint( DEBUGGING_THIS_MODULE, f"_doMoveUp( {event} )" )
         assert self.currentRowNumber > 1
         currentRowData = self._retrieveCurrentRowData( updateTable=False ) # in case current row was edited
-        self.tsvTable[self.currentRowNumber-1], self.tsvTable[self.currentRowNumber] = currentRowData, self.tsvTable[self.currentRowNumber-1]
+        previousRowData = self.tsvTable[self.currentRowNumber-1]
+        self._setTableRow( self.currentRowNumber-1, currentRowData )
+        self._setTableRow( self.currentRowNumber, previousRowData )
         self.rowNumberVar.set( self.currentRowNumber - 1 ) # Stay on the same (moved-up) row
         self._gotoRow() # Refresh
     # end of TSVEditWindowAddon._doMoveUp function
@@ -864,7 +996,9 @@ class TSVEditWindowAddon:
         fnPrint( DEBUGGING_THIS_MODULE, f"_doMoveDown( {event} )" )
         assert self.currentRowNumber < self.numDataRows
         currentRowData = self._retrieveCurrentRowData( updateTable=False ) # in case current row was edited
-        self.tsvTable[self.currentRowNumber], self.tsvTable[self.currentRowNumber+1] = self.tsvTable[self.currentRowNumber+1], currentRowData
+        nextRowData = self.tsvTable[self.currentRowNumber+1]
+        self._setTableRow( self.currentRowNumber+1, currentRowData )
+        self._setTableRow( self.currentRowNumber, nextRowData )
         self.rowNumberVar.set( self.currentRowNumber + 1 ) # Stay on the same (moved-up) row
         self._gotoRow() # Refresh
     # end of TSVEditWindowAddon._doMoveDown function
@@ -879,8 +1013,7 @@ class TSVEditWindowAddon:
         newRowData[self.occurenceColumnNumber] = '1'
         newRowData[self.supportReferenceColumnNumber] = newRowData[self.origQuoteColumnNumber] = ''
         newRowData[self.GLQuoteColumnNumber] = newRowData[self.occurrenceNoteColumnNumber] = ''
-        self.tsvTable.insert( self.currentRowNumber, newRowData )
-        self.numDataRows += 1
+        self._insertTableRow( self.currentRowNumber, newRowData )
         assert len(self.tsvTable) == self.numDataRows + 1
         self._gotoRow( force=True ) # Stay on the same row number (which is the new row), but cause refresh
     # end of TSVEditWindowAddon._doAddBefore function
@@ -895,8 +1028,7 @@ class TSVEditWindowAddon:
         newRowData[self.occurenceColumnNumber] = '1'
         newRowData[self.supportReferenceColumnNumber] = newRowData[self.origQuoteColumnNumber] = ''
         newRowData[self.GLQuoteColumnNumber] = newRowData[self.occurrenceNoteColumnNumber] = ''
-        self.tsvTable.insert( self.currentRowNumber+1, newRowData )
-        self.numDataRows += 1
+        self._insertTableRow( self.currentRowNumber+1, newRowData )
         assert len(self.tsvTable) == self.numDataRows + 1
         self.rowNumberVar.set( self.currentRowNumber + 1 ) # Go to the new (=next) row
         self._gotoRow() # Refresh
@@ -907,8 +1039,7 @@ class TSVEditWindowAddon:
         """
         fnPrint( DEBUGGING_THIS_MODULE, f"TSVEditWindowAddon._doDeleteRow( {event} )" )
         assert self.numDataRows
-        self.deletedRow = self.tsvTable.pop( self.currentRowNumber )
-        self.numDataRows -= 1
+        self.deletedRow = self._popTableRow( self.currentRowNumber )
         assert len(self.tsvTable) == self.numDataRows + 1
         self._gotoRow( force=True ) # Stay on the same row, but cause refresh
     # end of TSVEditWindowAddon._doDeleteRow function
@@ -942,7 +1073,7 @@ class TSVEditWindowAddon:
         vPrint( 'Never', DEBUGGING_THIS_MODULE, f"  Row {self.currentRowNumber} has changed: {retrievedRowData != self.tsvTable[self.currentRowNumber]}" )
         if updateTable and retrievedRowData != self.tsvTable[self.currentRowNumber]:
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nRow {self.currentRowNumber}: replace {self.tsvTable[self.currentRowNumber]}\n   with {retrievedRowData}" )
-            self.tsvTable[self.currentRowNumber] = retrievedRowData
+            self._setTableRow( self.currentRowNumber, retrievedRowData )
 
         return retrievedRowData
     # end of TSVEditWindowAddon._retrieveCurrentRowData
@@ -1677,11 +1808,7 @@ class TSVEditWindowAddon:
                     if len(self.existingAutocompleteWordText) >= self.autocompleteMinLength:
                         # See if we have any words that start with the already typed letters
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Handle autocomplete1A with {!r}".format( self.existingAutocompleteWordText ) )
-                        firstLetter, remainder = self.existingAutocompleteWordText[0], self.existingAutocompleteWordText[1:]
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "firstletter={!r} remainder={!r}".format( firstLetter, remainder ) )
-                        try: possibleWords = [firstLetter+thisBit for thisBit in self.autocompleteWords[firstLetter] \
-                                                            if thisBit.startswith(remainder) and thisBit != remainder]
-                        except KeyError: pass
+                        possibleWords = self.autocompleteWords.getCompletions( self.existingAutocompleteWordText, MAX_AUTOCOMPLETE_POPUP_WORDS )
                         self.autocompleteOverlap = self.existingAutocompleteWordText
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'possibleWordsA', possibleWords )
 
@@ -1689,13 +1816,8 @@ class TSVEditWindowAddon:
                     if not possibleWords:
                         previousStuff = getCharactersAndWordBeforeCursor( self, self.autocompleteMaxLength )
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Handle autocomplete1B with {!r}".format( previousStuff ) )
-                        firstLetter, remainder = previousStuff[0], previousStuff[1:]
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "firstletter={!r} remainder={!r}".format( firstLetter, remainder ) )
-                        self.autocompleteOverlap = previousStuff
-                        #try: possibleWords = [thisBit[remainderLength:] for thisBit in self.autocompleteWords[firstLetter] \
-                        try: possibleWords = [firstLetter+thisBit for thisBit in self.autocompleteWords[firstLetter] \
-                                                            if thisBit.startswith(remainder) and thisBit != remainder]
-                        except KeyError: pass
+                        if previousStuff: # Can't look up an empty prefix (it would match everything)
+                            possibleWords = self.autocompleteWords.getCompletions( previousStuff, MAX_AUTOCOMPLETE_POPUP_WORDS )
                         self.autocompleteOverlap = previousStuff
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'possibleWordsB', possibleWords )
 
@@ -1774,10 +1896,7 @@ class TSVEditWindowAddon:
         # index = self.textBox.index( tk.INSERT )
         # atLine, atColumn = index.split('.')
 
-        grandtotal = 0
-        for firstLetter in self.autocompleteWords:
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "fL", firstLetter )
-            grandtotal += len( self.autocompleteWords[firstLetter] )
+        grandtotal = len( self.autocompleteWords )
 
         infoString = 'Current location:\n' \
             + '  Row: {}\n'.format( self.currentRowNumber ) \
@@ -2149,6 +2268,10 @@ class TSVEditWindowAddon:
                 print( "Deleting final blank line" )
                 fileLines = fileLines[:-1]
                 self.hadTrailingNL = True
+
+        Only the dirty rows need to be joined up again.
+
+        Only called when saving or autosaving.
         """
         fnPrint( DEBUGGING_THIS_MODULE, "TSVEditWindowAddon._doReassembleFile()" )
         if 'tsvTable' not in self.__dict__ or not self.tsvTable:
@@ -2156,21 +2279,42 @@ class TSVEditWindowAddon:
 
         self._retrieveCurrentRowData( updateTable=True ) # in case current row was edited
 
-        fileLines = [self.columnSeparator.join( rowData ) for rowData in self.tsvTable]
-        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Reassembled {len(fileLines):,} table lines (incl. header) cf. {self.numOriginalLines:,} lines read" )
+        fileLines = [self.columnSeparator.join( rowData ) if dirtyFlag else line
+                        for rowData, line, dirtyFlag in zip( self.tsvTable, self.tsvLines, self.dirtyRowFlags )]
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Reassembled {len(fileLines):,} table lines (incl. header) with {sum(self.dirtyRowFlags):,} changed rows cf. {self.numOriginalLines:,} lines read" )
+        self.newFileLines = fileLines
         self.newText = '\n'.join( fileLines )
         if self.hadTrailingNL: self.newText = f'{self.newText}\n'
         vPrint( 'Never', DEBUGGING_THIS_MODULE, f"  New text is {len(self.newText):,} characters cf. {len(self.originalText):,} characters read" )
     # end of TSVEditWindowAddon._doReassembleFile
 
 
+    def _setTableSaved( self ) -> None:
+        """
+        Called after the text from _doReassembleFile has been saved
+            so that all the rows are clean again.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "TSVEditWindowAddon._setTableSaved()" )
+        self.originalText, self.tsvLines = self.newText, self.newFileLines
+        self.numOriginalLines = len( self.tsvLines )
+        self.dirtyRowFlags = [False] * len(self.tsvTable)
+        self.savedChangeCount = self.changeCount
+    # end of TSVEditWindowAddon._setTableSaved
+
+
     def modified( self ) -> bool:
         """
         Overrides the ChildWindows one, which only works from the one TextBox
+
+        This is called often (e.g., for the title refresh)
+            so it only checks the displayed row and the table change counter
+            (rather than reassembling the whole file).
+        Note that a row that's been changed back to what it was still counts as modified.
         """
-        self._doReassembleFile()
-        if 'newText' not in self.__dict__: return False
-        return self.newText != self.originalText
+        if 'tsvTable' not in self.__dict__ or not self.tsvTable:
+            return False
+        self._retrieveCurrentRowData( updateTable=True ) # in case current row was edited
+        return self.changeCount != self.savedChangeCount
     # end of TSVEditWindowAddon.modified
 
 
@@ -2202,6 +2346,7 @@ class TSVEditWindowAddon:
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Writing {len(allText):,} characters to {filepath}" )
                 with open( filepath, mode='wt', encoding='utf-8' ) as theFile:
                     theFile.write( allText )
+                self._setTableSaved()
                 self._rememberFileTimeAndSize()
                 # self.textBox.edit_modified( tk.FALSE ) # clear Tkinter modified flag
                 #self.bookTextModified = False
@@ -90,6 +90,9 @@ Base widgets to allow display and manipulation of
         getBeforeAndAfterBibleData( self, newVerseKey )
         doBibleFind( self, event=None )
         doActualBibleFind( self, extendTo=None )
+        _doBibleFindSlice( self )
+        _stopBibleFind( self )
+        _findInInternalBibleBooks( self, optionsDict )
         _prepareInternalBible( self, bookCode=None, givenBible=None )
 
 
@@ -107,6 +110,7 @@ Base widgets to allow display and manipulation of
 from gettext import gettext as _
 from typing import Optional
 import logging
+import time
 
 import tkinter as tk
 import tkinter.font as tkFont
@@ -134,6 +138,8 @@ if __name__ == '__main__':
 from Biblelator import BiblelatorGlobals
 from Biblelator.BiblelatorGlobals import APP_NAME, tkSTART, DEFAULT, errorBeep, BIBLE_FORMAT_VIEW_MODES
 from Biblelator.Dialogs.BiblelatorSimpleDialogs import showError, showInfo
+from Biblelator.Helpers.BibleSearchIndex import getBibleSearchIndex
+from Biblelator.Helpers.ParallelBibleSearch import ParallelBibleSearch
 
 
 LAST_MODIFIED_DATE = '2022-07-17' # by RJH
@@ -157,6 +163,9 @@ TRAILING_SPACE_LINE = ' \n'
 TRAILING_SPACE_LINE_SUBSTITUTE = TRAILING_SPACE_SUBSTITUTE + '\n'
 ALL_POSSIBLE_SPACE_CHARS = ' ' + TRAILING_SPACE_SUBSTITUTE + MULTIPLE_SPACE_SUBSTITUTE
 
+BIBLE_FIND_SLICE_TIME = 0.03 # seconds -- maximum Bible find time before we let Tk handle user input
+BIBLE_FIND_POLL_TIME = 20 # milliseconds -- how often we check for results from the search worker processes
+
 
 
 class BEntry( Entry ):
@@ -1574,6 +1583,10 @@ class BibleBoxAddon():
         This function (called by the above doBibleFind),
             invokes the actual search (or redoes the search)
             assuming that the search parameters are already defined.
+
+        The result window is opened straight away,
+            and then the books are searched one at a time in idle time
+            (see _doBibleFindSlice) with the results added to the window as they're found.
         """
         from ChildWindows import FindResultWindow
 
@@ -1586,27 +1599,129 @@ class BibleBoxAddon():
         #self.lastfind = key
         BiblelatorGlobals.theApp.logUsage( PROGRAM_NAME, DEBUGGING_THIS_MODULE, ' doActualBibleFind {}'.format( self.BibleFindOptionsDict ) )
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "bookList", repr(self.BibleFindOptionsDict['bookList']) )
-        bookCode = None
-        if isinstance( self.BibleFindOptionsDict['bookList'], str ) \
-        and self.BibleFindOptionsDict['bookList'] != 'ALL':
-            bookCode = self.BibleFindOptionsDict['bookList']
-        self._prepareInternalBible( bookCode, self.BibleFindOptionsDict['givenBible'] ) # Make sure that all books are loaded
-        # We search the loaded Bible processed lines
-        self.BibleFindOptionsDict, resultSummaryDict, findResultList = self.BibleFindOptionsDict['givenBible'].findText( self.BibleFindOptionsDict )
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Got findResultList", findResultList )
-        if len(findResultList) == 0: # nothing found
+        self._stopBibleFind() # We only do one search at a time from each box or window
+
+        try: replaceFunction = self.doBibleReplace
+        except AttributeError: replaceFunction = None # Read-only Bible boxes don't have a replace function
+        findResultWindow = FindResultWindow( self, self.BibleFindOptionsDict, {}, [],
+                                findFunction=self.doBibleFind, refindFunction=self.doActualBibleFind,
+                                replaceFunction=replaceFunction, extendTo=extendTo, stopFunction=self._stopBibleFind )
+        BiblelatorGlobals.theApp.childWindows.append( findResultWindow )
+        self.BibleFindJob = self._findInInternalBibleBooks( self.BibleFindOptionsDict ), findResultWindow
+        self.BibleFindAfterID = BiblelatorGlobals.theApp.after_idle( self._doBibleFindSlice )
+    # end of BibleBoxAddon.doActualBibleFind
+
+
+    def _doBibleFindSlice( self ) -> None:
+        """
+        Search the next book(s) until our time slice is used up,
+            adding the results to the result window.
+
+        Then either reschedules itself, or finishes the search.
+        """
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "BibleBoxAddon._doBibleFindSlice()" )
+        self.BibleFindAfterID = None
+        job = self.BibleFindJob
+        if job is None: return # The search has been stopped
+        bookSearches, findResultWindow = job
+
+        startTime = time.monotonic()
+        stopped = False
+        try:
+            while time.monotonic()-startTime < BIBLE_FIND_SLICE_TIME:
+                bookResult = next( bookSearches )
+                if self.BibleFindJob is not job or not findResultWindow.winfo_exists(): # Stopped while we were searching
+                    bookSearches.close()
+                    return
+                if bookResult is None: # Waiting for a worker process -- check again soon
+                    self.BibleFindAfterID = BiblelatorGlobals.theApp.after( BIBLE_FIND_POLL_TIME, self._doBibleFindSlice )
+                    return
+                BBB, resultOptionsDict, resultSummaryDict, bookResultList = bookResult
+                self.BibleFindOptionsDict = resultOptionsDict
+                findResultWindow.addResults( resultSummaryDict, bookResultList, BBB )
+        except StopIteration: pass # We've finished
+        except Exception as err: # Don't leave the result window saying that we're still searching
+            logging.critical( "BibleBoxAddon._doBibleFindSlice: search failed: {!r}".format( err ) )
+            stopped = True
+        else: # More to do -- give Tk a chance to handle user input first
+            self.BibleFindAfterID = BiblelatorGlobals.theApp.after_idle( self._doBibleFindSlice )
+            return
+
+        self.BibleFindJob = None
+        if findResultWindow.resultList or stopped:
+            findResultWindow.finishSearch( stopped=stopped )
+        else: # nothing found
+            findResultWindow.finishSearch()
+            findResultWindow.doClose()
             errorBeep()
             key = self.BibleFindOptionsDict['findText']
             showError( self, APP_NAME, _("String {!r} not found").format( key if len(key)<20 else (key[:18]+'…') ) )
-        else:
-            try: replaceFunction = self.doBibleReplace
-            except AttributeError: replaceFunction = None # Read-only Bible boxes don't have a replace function
-            findResultWindow = FindResultWindow( self, self.BibleFindOptionsDict, resultSummaryDict, findResultList,
-                                    findFunction=self.doBibleFind, refindFunction=self.doActualBibleFind,
-                                    replaceFunction=replaceFunction, extendTo=extendTo )
-            BiblelatorGlobals.theApp.childWindows.append( findResultWindow )
         BiblelatorGlobals.theApp.setReadyStatus()
-    # end of BibleBoxAddon.doActualBibleFind
+    # end of BibleBoxAddon._doBibleFindSlice
+
+
+    def _stopBibleFind( self ) -> None:
+        """
+        Stop any Bible find that's still going from this box or window
+            (leaving its result window with the results found so far).
+        """
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "BibleBoxAddon._stopBibleFind()" )
+        try: job, afterID = self.BibleFindJob, self.BibleFindAfterID
+        except AttributeError: return # We haven't done any searches
+        if afterID is not None:
+            BiblelatorGlobals.theApp.after_cancel( afterID )
+            self.BibleFindAfterID = None
+        if job is not None:
+            self.BibleFindJob = None
+            bookSearches, findResultWindow = job
+            if not bookSearches.gi_running: bookSearches.close() # otherwise _doBibleFindSlice will notice
+            if findResultWindow.stopFunction is not None and findResultWindow.winfo_exists():
+                findResultWindow.finishSearch( stopped=True )
+            BiblelatorGlobals.theApp.setReadyStatus()
+    # end of BibleBoxAddon._stopBibleFind
+
+
+    def _findInInternalBibleBooks( self, optionsDict ):
+        """
+        Search the internal Bible given in the find options dictionary one book at a time.
+
+        If the Bible was loaded from book files, the search index is used
+            to find which verses of which books could possibly contain the search text,
+            so only those books need to be loaded, and only those verses searched.
+        Otherwise (or if the index can't help with this search),
+            all the requested books are searched.
+
+        The books are searched in parallel by worker processes where possible
+            (see ParallelBibleSearch).
+
+        This is a generator which yields a 4-tuple for each book searched:
+            BBB, and the optionsDict, resultSummaryDict, and resultList from findText
+        or None if we're still waiting for a worker process.
+        """
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, "BibleBoxAddon._findInInternalBibleBooks( {} )".format( optionsDict ) )
+        givenBible = optionsDict['givenBible']
+
+        if self.modified(): self.doSave() # So that the index and the loaded books have the latest text
+        searchIndex = getBibleSearchIndex( givenBible )
+        candidateVerses = None if searchIndex is None else searchIndex.getCandidateBookVerses( optionsDict )
+        bookList = None if candidateVerses is None else list( candidateVerses )
+        if bookList is None: # We have to search all the requested books
+            requestedBooks = optionsDict['bookList']
+            if searchIndex is not None: # We can still load the books one at a time as we go
+                bookList = [BBB for BBB,_filename in givenBible.maximumPossibleFilenameTuples]
+                bookList += [BBB for BBB in givenBible.books if BBB not in bookList]
+            else:
+                bookCode = None
+                if isinstance( requestedBooks, str ) and requestedBooks != 'ALL':
+                    bookCode = requestedBooks
+                self._prepareInternalBible( bookCode, givenBible ) # Make sure that all books are loaded
+                bookList = list( givenBible.books )
+            if isinstance( requestedBooks, str ) and requestedBooks != 'ALL': requestedBooks = [requestedBooks]
+            if requestedBooks and requestedBooks != 'ALL':
+                bookList = [BBB for BBB in bookList if BBB in requestedBooks]
+
+        yield from ParallelBibleSearch( givenBible, optionsDict, bookList, candidateVerses ).searchBooks()
+    # end of BibleBoxAddon._findInInternalBibleBooks
 
 
     def _prepareInternalBible( self, bookCode=None, givenBible=None ):
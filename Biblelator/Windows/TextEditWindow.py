@@ -59,7 +59,8 @@ from Biblelator.Windows.ChildWindows import ChildWindow
 from Biblelator.Helpers.AutocorrectFunctions import setDefaultAutocorrectEntries # setAutocorrectEntries
 from Biblelator.Helpers.AutocompleteFunctions import getCharactersBeforeCursor, \
                                 getWordCharactersBeforeCursor, getCharactersAndWordBeforeCursor, \
-                                getWordBeforeSpace, addNewAutocompleteWord, acceptAutocompleteSelection
+                                getWordBeforeSpace, addNewAutocompleteWord, acceptAutocompleteSelection, \
+                                AutocompleteIndex
 
 
 LAST_MODIFIED_DATE = '2020-04-29' # by RJH
@@ -75,6 +76,7 @@ REFRESH_TITLE_TIME = 500 # msecs
 CHECK_DISK_CHANGES_TIME = 33333 # msecs
 NO_TYPE_TIME = 6000 # msecs
 NUM_AUTOCOMPLETE_POPUP_LINES = 6
+MAX_AUTOCOMPLETE_POPUP_WORDS = 60 # Only the best ranked words are put into the (scrolling) pop-up box
 
 
 
@@ -130,7 +132,7 @@ class TextEditWindowAddon:
         setDefaultAutocorrectEntries( self )
         #setAutocorrectEntries( self, ourAutocorrectEntries )
 
-        self.autocompleteBox, self.autocompleteWords, self.existingAutocompleteWordText = None, {}, ''
+        self.autocompleteBox, self.autocompleteWords, self.existingAutocompleteWordText = None, AutocompleteIndex(), ''
         self.autocompleteWordChars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_'
         # Note: I guess we could have used non-word chars instead (to stop the backwards word search)
         self.autocompleteMinLength = 3 # Show the normal window after this many characters have been typed
@@ -638,11 +640,7 @@ class TextEditWindowAddon:
                     if len(self.existingAutocompleteWordText) >= self.autocompleteMinLength:
                         # See if we have any words that start with the already typed letters
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Handle autocomplete1A with {!r}".format( self.existingAutocompleteWordText ) )
-                        firstLetter, remainder = self.existingAutocompleteWordText[0], self.existingAutocompleteWordText[1:]
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "firstletter={!r} remainder={!r}".format( firstLetter, remainder ) )
-                        try: possibleWords = [firstLetter+thisBit for thisBit in self.autocompleteWords[firstLetter] \
-                                                            if thisBit.startswith(remainder) and thisBit != remainder]
-                        except KeyError: pass
+                        possibleWords = self.autocompleteWords.getCompletions( self.existingAutocompleteWordText, MAX_AUTOCOMPLETE_POPUP_WORDS )
                         self.autocompleteOverlap = self.existingAutocompleteWordText
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'possibleWordsA', possibleWords )
 
@@ -650,13 +648,8 @@ class TextEditWindowAddon:
                     if not possibleWords:
                         previousStuff = getCharactersAndWordBeforeCursor( self, self.autocompleteMaxLength )
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Handle autocomplete1B with {!r}".format( previousStuff ) )
-                        firstLetter, remainder = previousStuff[0], previousStuff[1:]
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "firstletter={!r} remainder={!r}".format( firstLetter, remainder ) )
-                        self.autocompleteOverlap = previousStuff
-                        #try: possibleWords = [thisBit[remainderLength:] for thisBit in self.autocompleteWords[firstLetter] \
-                        try: possibleWords = [firstLetter+thisBit for thisBit in self.autocompleteWords[firstLetter] \
-                                                            if thisBit.startswith(remainder) and thisBit != remainder]
-                        except KeyError: pass
+                        if previousStuff: # Can't look up an empty prefix (it would match everything)
+                            possibleWords = self.autocompleteWords.getCompletions( previousStuff, MAX_AUTOCOMPLETE_POPUP_WORDS )
                         self.autocompleteOverlap = previousStuff
                         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'possibleWordsB', possibleWords )
 
@@ -735,10 +728,7 @@ class TextEditWindowAddon:
         index = self.textBox.index( tk.INSERT )
         atLine, atColumn = index.split('.')
 
-        grandtotal = 0
-        for firstLetter in self.autocompleteWords:
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "fL", firstLetter )
-            grandtotal += len( self.autocompleteWords[firstLetter] )
+        grandtotal = len( self.autocompleteWords )
 
         infoString = 'Current location:\n' \
             + '  Line, column: {}, {}\n'.format( atLine, atColumn ) \
@@ -30,15 +30,15 @@ from typing import Dict, List, Tuple, Optional
 import os.path
 import logging
 from collections import OrderedDict
+from bisect import bisect_left, bisect_right
 
 import tkinter as tk
 from tkinter.ttk import Style, Notebook, Frame, Label, Radiobutton
 
 # BibleOrgSys imports
 from BibleOrgSys import BibleOrgSysGlobals
-from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint, LARGE_DUMMY_VALUE
 from BibleOrgSys.Reference.VerseReferences import SimpleVerseKey
-from BibleOrgSys.Formats.USFMBible import findReplaceText
 
 # Biblelator imports
 if __name__ == '__main__':
@@ -51,7 +51,7 @@ from Biblelator.BiblelatorGlobals import APP_NAME, tkSTART, DEFAULT, BIBLE_GROUP
                                 errorBeep
 from Biblelator.Dialogs.ModalDialog import ModalDialog
 from Biblelator.Dialogs.BiblelatorSimpleDialogs import showError, showWarning, showInfo
-from Biblelator.Dialogs.BiblelatorDialogs import OkCancelDialog, YesNoDialog, GetBibleReplaceTextDialog, ReplaceConfirmDialog
+from Biblelator.Dialogs.BiblelatorDialogs import OkCancelDialog, YesNoDialog, GetBibleReplaceTextDialog, ReplacePreviewDialog
 from Biblelator.Helpers.BiblelatorHelpers import createEmptyUSFMBookText, calculateTotalVersesForBook, \
                                 mapReferenceVerseKey, mapParallelVerseKey, findCurrentSection, \
                                 handleInternalBibles, getChangeLogFilepath, logChangedFile
@@ -59,8 +59,12 @@ from Biblelator.Windows.BibleResourceWindows import InternalBibleResourceWindowA
 from Biblelator.Windows.BibleReferenceCollection import BibleReferenceCollectionWindow
 from Biblelator.Windows.ChildWindows import ChildWindow
 from Biblelator.Windows.TextEditWindow import TextEditWindow, TextEditWindowAddon #, NO_TYPE_TIME
+from Biblelator.Helpers.USFMTextChecks import BackgroundUSFMTextChecker
+from Biblelator.Helpers.BackgroundLogWriter import flushLogs
+from Biblelator.Helpers.BibleReplace import findReplaceCandidates, applyReplacements
 from Biblelator.Helpers.AutocompleteFunctions import loadBibleAutocompleteWords, loadBibleBookAutocompleteWords, \
-                                    loadHunspellAutocompleteWords, loadILEXAutocompleteWords
+                                    loadHunspellAutocompleteWords, loadILEXAutocompleteWords, \
+                                    updateAutocompleteWordsFromVerses
 
 
 LAST_MODIFIED_DATE = '2020-05-01' # by RJH
@@ -72,6 +76,8 @@ PROGRAM_NAME_VERSION = f'{PROGRAM_NAME} v{PROGRAM_VERSION}'
 DEBUGGING_THIS_MODULE = False
 
 
+USFM_CHECK_POLL_TIME = 50 # msecs between checking for the results of the background USFM text check
+
 class ToolsOptionsDialog( ModalDialog ):
     """
     """
@@ -154,6 +160,87 @@ class ToolsOptionsDialog( ModalDialog ):
 
 
 
+class USFMBookVerses:
+    """
+    The text of a USFM book held as one piece per verse (in versification order)
+        along with the range of verses which are currently shown in the edit box.
+
+    The entire book text is then the verses before the shown range,
+        plus the (possibly edited) text from the edit box,
+        plus the verses after the shown range.
+
+    So moving around the book only changes the shown range and loads the newly shown verses,
+        and the book text is only joined back together when it's actually needed.
+    """
+    def __init__( self, BBB:str, getNumChapters, getNumVerses ) -> None:
+        """
+        Make the (C,V) list for the book from the versification.
+        """
+        self.BBB = BBB
+        self.CVs:List[Tuple[int,int]] = [] # (intC,intV) 2-tuples in order (so they can be bisected)
+        numChaps = getNumChapters( BBB )
+        if numChaps is None: numChaps = 0
+        for C in range( -1, numChaps+1 ):
+            try: numVerses = getNumVerses( BBB, C )
+            except KeyError: numVerses = 0
+            if numVerses is None: numVerses = 0
+            for V in range( numVerses+1 ):
+                self.CVs.append( (C,V) )
+        self.verseKeyHashes = [SimpleVerseKey( BBB, C, V ).makeHash() for C,V in self.CVs]
+        self.verseIndexes = { verseKeyHash:j for j,verseKeyHash in enumerate( self.verseKeyHashes ) }
+        self.verseTexts:List[str] = [''] * len( self.CVs )
+        self.shownStart = self.shownEnd = 0
+    # end of USFMBookVerses.__init__
+
+    def __len__( self ) -> int: return len( self.CVs )
+
+
+    def loadVerseTexts( self, verseCache:Dict[str,str] ) -> None:
+        """
+        Take the text for each verse from the (USFMEditWindow.cacheBook) verse cache.
+
+        Note that the strings are shared, not copied.
+        """
+        self.verseTexts = [verseCache.get( verseKeyHash, '' ) for verseKeyHash in self.verseKeyHashes]
+    # end of USFMBookVerses.loadVerseTexts
+
+
+    def getIndexRange( self, startCV:Tuple[int,int], endCV:Tuple[int,int] ) -> Tuple[int,int]:
+        """
+        Returns the start and end (exclusive) indexes for the given (inclusive) range of (C,V) 2-tuples.
+        """
+        startIndex = bisect_left( self.CVs, startCV )
+        return startIndex, max( startIndex, bisect_right( self.CVs, endCV ) )
+    # end of USFMBookVerses.getIndexRange
+
+
+    def setShownRange( self, startIndex:int, endIndex:int ) -> None:
+        """
+        Set the (exclusive) range of verses which are displayed in the edit box.
+        """
+        self.shownStart, self.shownEnd = startIndex, endIndex
+    # end of USFMBookVerses.setShownRange
+
+
+    def getShownCVs( self ):
+        """
+        Generator which yields (intC,intV) 2-tuples for the verses to be displayed.
+        """
+        for j in range( self.shownStart, self.shownEnd ):
+            yield self.CVs[j]
+    # end of USFMBookVerses.getShownCVs
+
+
+    def getEntireText( self, shownText:str ) -> str:
+        """
+        Returns the complete book text using shownText for the displayed verses.
+        """
+        return ''.join( self.verseTexts[:self.shownStart] ) + shownText + ''.join( self.verseTexts[self.shownEnd:] )
+    # end of USFMBookVerses.getEntireText
+# end of class USFMBookVerses
+
+
+
 class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, ChildWindow ):
     """
     self.genericWindowType will be BibleEditor
@@ -261,9 +348,15 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
 
         self.folderpath = self.filename = self.filepath = None
         self.lastBBB = None
-        self.bookTextBefore = self.bookText = self.bookTextAfter = None # The current text for this book
+        self.bookText = None # The current text for this book
+        self.bookVerses = None # The verse-by-verse text for this book (including which verses are displayed)
+        self.bookVersesNeedLoading = False
+        self.editedVerseRange = None # Range of self.bookVerses indexes that have been edited since cacheBook
+        self.USFMTextChecker = self.USFMTextCheckPollID = None
         self.bookTextModified = False
         self.exportFolderpath = None
+        self.autocompleteCountFactors = None # Used to update Bible autocomplete words as we edit
+        self.autocompleteWordsNeedUpdating = False # Set when edited since updateAutocompleteWords
 
         self.saveChangesAutomatically = True # different from AutoSave (which is in different files in different folders)
 
@@ -616,6 +709,11 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
 
         if self.textBox.edit_modified():
             self.bookTextModified = True
+            if self.bookVerses is not None: # Remember which verses need recaching
+                if self.editedVerseRange is None: self.editedVerseRange = self.bookVerses.shownStart, self.bookVerses.shownEnd
+                else: self.editedVerseRange = min( self.editedVerseRange[0], self.bookVerses.shownStart ), \
+                                                max( self.editedVerseRange[1], self.bookVerses.shownEnd )
+                self.autocompleteWordsNeedUpdating = True
 
             # Check the text for USFM errors
             try: self.checkUSFMTextForProblems()
@@ -656,6 +754,9 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         """
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "USFMEditWindow._onTextNoChange" )
 
+        # Add (and remove) Bible autocomplete words from what they've typed
+        self.updateAutocompleteWords()
+
         # Check the text for formatting errors
         try: self.checkUSFMTextForProblems( includeFormatting=True )
         except KeyboardInterrupt:
@@ -669,14 +770,27 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         Called whenever the text box HASN'T CHANGED for NO_TYPE_TIME msecs.
 
         Checks for some types of formatting errors.
+
+        The checking is done in a worker thread (so that typing isn't slowed down)
+            and the results are displayed by _pollUSFMTextCheck.
         """
         #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "USFMEditWindow.checkUSFMTextForProblems", includeFormatting )
 
         editedText = self.getAllText()
+        if self.USFMTextChecker is None: self.USFMTextChecker = BackgroundUSFMTextChecker()
+        self.USFMTextChecker.requestCheck( editedText, includeFormatting, self.getUSFMMarkerLimits(),
+                                            self.invalidCombinations, self.checkForPairs )
+        if self.USFMTextCheckPollID is None:
+            self.USFMTextCheckPollID = self.after( USFM_CHECK_POLL_TIME, self._pollUSFMTextCheck )
+    # end of USFMEditWindow.checkUSFMTextForProblems
+
 
-        # Check counts of USFM chapter and verse markers
-        numChaps = editedText.count( '\\c ' )
-        numVerses = editedText.count( '\\v ' )
+    def getUSFMMarkerLimits( self ) -> Tuple[int,int,int,int]:
+        """
+        Returns a 4-tuple with the minimum and maximum numbers of chapter markers,
+            then the minimum and maximum numbers of verse markers
+            that we expect to find in the edit box (depending on the contextViewMode).
+        """
         BBB, C, V = self.currentVerseKey.getBCV()
         #intC, intV = newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
 
@@ -701,69 +815,22 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
             minVerseMarkers = maxVerseMarkers = 0 if C=='-1' else self.getNumVerses( BBB, C )
         else: halt
 
-        errorMessage = warningMessage = suggestionMessage = None
-        if numChaps > maxChapterMarkers:
-            errorMessage = _("Too many USFM chapter markers (max of {} expected)").format( maxChapterMarkers )
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, errorMessage )
-        elif numChaps < minChapterMarkers:
-            warningMessage = _("May have missing USFM chapter markers (expected {}, found {})").format( maxChapterMarkers, numChaps )
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, warningMessage )
-        if numVerses > maxVerseMarkers:
-            errorMessage = _("Too many USFM verse markers (max of {} expected)").format( maxVerseMarkers )
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, errorMessage )
-        elif numVerses < minVerseMarkers:
-            warningMessage = _("May have missing USFM verse markers (expected {}, found {})").format( maxVerseMarkers, numVerses )
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, warningMessage )
-        if '  ' in editedText:
-            warningMessage = _("No good reason to have multiple spaces in a USFM book")
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, warningMessage )
-        elif includeFormatting and ' \n' in editedText:
-            suggestionMessage = _("No good reason to have a line ending with a space in a USFM book")
-
-        if not errorMessage and not warningMessage: # and not suggestionMessage:
-            adjText = editedText
-            if adjText and adjText[-1] in ('\n','\r',): adjText = adjText[:-1] # Remove the final newline character
-            for line in adjText.split( '\n' ):
-                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "checkUSFMTextForProblems got line: {!r}".format( line ) )
-                if not line:
-                    warningMessage = _("No good reason to have a blank line in a USFM book")
-                if line:
-                    if line[0] == '\\':
-                        marker = line.split( None, 1)[0][1:] # First token, but without the first (backslash) character
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Found marker: {!r}".format( marker ) )
-                        if marker not in BibleOrgSysGlobals.loadedUSFMMarkers:
-                            errorMessage = _("Not a recognized USFM marker {!r}").format( marker )
-                            break
-                    else:
-                        errorMessage = _("Line should start with backslash, not '{}{}'").format( line[:8], '…' if len(line)>8 else '' )
-                        break
-
-        if not errorMessage and not warningMessage: # and not suggestionMessage:
-            for segment in self.invalidCombinations:
-                if segment in editedText:
-                    warningMessage = _("Found {!r} invalid character(s) in USFM text").format( segment ); break
-
-        if not errorMessage and not warningMessage and not suggestionMessage:
-            for pairStart,pairEnd in self.checkForPairs:
-                if editedText.count( pairStart ) != editedText.count( pairEnd ):
-                    warningMessage = _("Counts of {!r} and {!r} differ in USFM text").format( pairStart, pairEnd ); break
-                # NOTE: Code below doesn't give error with ( ( ) -- that's why we have the counts above
-                ixl = -1
-                while True:
-                    ixl = editedText.find( pairStart, ixl+1 )
-                    if ixl == -1: break # none / no more found
-                    ixr = editedText.find( pairEnd, ixl+len(pairStart) )
-                    if ixr == -1: # no matching pair
-                        warningMessage = _("Found {!r} without matching {!r} in USFM text").format( pairStart, pairEnd ); break
-                if warningMessage: break # from outer loop
-                ixr = 99999 # Now work backwards
-                while True:
-                    ixr = editedText.rfind( pairEnd, 0, ixr )
-                    if ixr == -1: break
-                    ixl = editedText.rfind( pairStart, 0, ixr )
-                    if ixl == -1:
-                        warningMessage = _("Found {!r} without previous {!r} in USFM text").format( pairEnd, pairStart ); break
-                if warningMessage: break # from outer loop
+        return minChapterMarkers, maxChapterMarkers, minVerseMarkers, maxVerseMarkers
+    # end of USFMEditWindow.getUSFMMarkerLimits
+
+
+    def _pollUSFMTextCheck( self ) -> None:
+        """
+        Called by after() to see if the background check of the USFM text has finished.
+
+        Keeps polling until it has, and then displays any problems found.
+        """
+        self.USFMTextCheckPollID = None
+        checkResults = self.USFMTextChecker.getLatestResults()
+        if checkResults is None: # still checking
+            self.USFMTextCheckPollID = self.after( USFM_CHECK_POLL_TIME, self._pollUSFMTextCheck )
+            return
+        errorMessage, warningMessage, suggestionMessage = checkResults
 
         haveOwnStatusBar = self._showStatusBarVar.get()
         if errorMessage:
@@ -785,7 +852,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
             self.textBox.configure( background=self.defaultBackgroundColour )
             if haveOwnStatusBar: self.setReadyStatus()
             else: BiblelatorGlobals.theApp.setReadyStatus()
-    # end of USFMEditWindow.checkUSFMTextForProblems
+    # end of USFMEditWindow._pollUSFMTextCheck
 
 
     def doShowInfo( self, event=None ):
@@ -810,9 +877,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         numVerses = text.count( '\\v ' )
         numSectionHeadings = text.count('\\s ')+text.count('\\s1 ')+text.count('\\s2 ')+text.count('\\s3 ')+text.count('\\s4 ')
 
-        grandtotal = 0
-        for firstLetter in self.autocompleteWords:
-            grandtotal += len( self.autocompleteWords[firstLetter] )
+        grandtotal = len( self.autocompleteWords )
 
         infoString = 'Current location:\n' \
             + '  BCV: {} {}:{}\n'.format( BBB, C, V ) \
@@ -890,16 +955,133 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
 
         Normally clears the cache before starting,
             to prevent duplicate entries.
+
+        If the only changes are the edits in the displayed verses,
+            only the chapters containing those verses are recached.
         """
         logging.debug( "USFMEditWindow.cacheBook( {}, {} ) for {}".format( BBB, clearFirst, self.projectName ) )
         if BibleOrgSysGlobals.debugFlag:
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "USFMEditWindow.cacheBook( {}, {} ) for {}".format( BBB, clearFirst, self.projectName ) )
             assert isinstance( BBB, str )
 
+        editedVerseRange, self.editedVerseRange = self.editedVerseRange, None
+        if clearFirst and editedVerseRange is not None \
+        and self.cacheEditedChapters( BBB, editedVerseRange ):
+            return # Only had to update part of the cache
+
         if clearFirst:
             vPrint( 'Never', DEBUGGING_THIS_MODULE, "  Clearing cache first!" )
             self.verseCache = OrderedDict()
+        self.bookVersesNeedLoading = True # self.bookVerses gets updated next time we display
+        self.splitVerses( BBB, self.bookText.split( '\n' ), self.verseCache )
+    # end of USFMEditWindow.cacheBook
+
+
+    def getBookChapterVerseCounts( self, BBB:str ) -> Optional[Tuple[int,int]]:
+        """
+        Returns the number of chapters and verses in the cached book
+            (from the verse keys that cacheBook and cacheEditedChapters maintain
+            rather than by counting the markers in the text),
+            or None if we don't have that book cached.
+
+        Verses which aren't in our versification are still counted.
+        """
+        BBBPrefix = f'{BBB}_' # Verse key hashes are like 'GEN_1:1!'
+        chapterNumbers, numVerses = set(), 0
+        for verseKeyHash in self.verseCache:
+            if not verseKeyHash.startswith( BBBPrefix ): continue
+            C, V = verseKeyHash[len(BBBPrefix):].split( '!', 1 )[0].split( ':', 1 )
+            if C.isdigit() and C != '0': # Not the book introduction
+                chapterNumbers.add( C )
+                if V != '0': numVerses += 1
+        return (len(chapterNumbers), numVerses) if chapterNumbers or numVerses else None
+    # end of USFMEditWindow.getBookChapterVerseCounts
+
+
+    def cacheEditedChapters( self, BBB:str, editedVerseRange:Tuple[int,int] ) -> bool:
+        """
+        Update the self.verseCache dictionary (and self.bookVerses)
+            for only the chapters containing the edited verses.
+
+        Each chapter (from its \\c line) is split exactly the same way as in the whole book,
+            so the other chapters don't need to be done again.
 
+        Returns False (with nothing changed) if it can't be done this way,
+            e.g., if the user has changed chapter numbers.
+        """
+        bookVerses = self.bookVerses
+        if bookVerses is None or bookVerses.BBB != BBB or self.bookVersesNeedLoading: return False
+        editedStart, editedEnd = editedVerseRange
+        if editedStart < bookVerses.shownStart or editedEnd > bookVerses.shownEnd \
+        or bookVerses.shownStart >= bookVerses.shownEnd:
+            return False # Should never happen
+
+        # Find the chapters containing the edited verses
+        firstC, lastC = bookVerses.CVs[bookVerses.shownStart][0], bookVerses.CVs[bookVerses.shownEnd-1][0]
+        chunkStart = 0 if firstC < 1 else bisect_left( bookVerses.CVs, (firstC,-1) )
+        chunkEnd = bisect_left( bookVerses.CVs, (lastC+1,-1) )
+        verseTexts = bookVerses.verseTexts
+        if chunkStart > 0 and not verseTexts[chunkStart].startswith( ('\\c ','\\C ') ):
+            return False
+        chunkText = ''.join( verseTexts[chunkStart:bookVerses.shownStart] ) + self.getAllText() \
+                    + ''.join( verseTexts[bookVerses.shownEnd:chunkEnd] )
+        if chunkEnd < len(bookVerses):
+            if not verseTexts[chunkEnd].startswith( ('\\c ','\\C ') ) or not chunkText.endswith( '\n' ):
+                return False
+            chunkText = chunkText[:-1] # Otherwise we get an extra blank line
+        chunkVerseCache = OrderedDict()
+        self.splitVerses( BBB, chunkText.split( '\n' ), chunkVerseCache )
+        for verseKeyHash in chunkVerseCache:
+            if not chunkStart <= bookVerses.verseIndexes.get( verseKeyHash, -1 ) < chunkEnd:
+                vPrint( 'Never', DEBUGGING_THIS_MODULE, f"cacheEditedChapters: {verseKeyHash} moved outside {BBB} chapters {firstC}-{lastC}" )
+                return False
+
+        # Now patch the cache
+        for j in range( chunkStart, chunkEnd ):
+            self.verseCache.pop( bookVerses.verseKeyHashes[j], None )
+        self.verseCache.update( chunkVerseCache )
+        for j in range( chunkStart, chunkEnd ):
+            verseTexts[j] = self.verseCache.get( bookVerses.verseKeyHashes[j], '' )
+        vPrint( 'Never', DEBUGGING_THIS_MODULE, f"cacheEditedChapters recached {BBB} chapters {firstC}-{lastC} ({chunkEnd-chunkStart} verses)" )
+        return True
+    # end of USFMEditWindow.cacheEditedChapters
+
+
+    def updateAutocompleteWords( self ) -> None:
+        """
+        Add (and remove) Bible autocomplete words from what they've typed.
+
+        The edited chapters are recached first (so the verse cache is our baseline)
+            and then only the verses whose text changed are recounted.
+        """
+        if not self.autocompleteWordsNeedUpdating: return
+        self.autocompleteWordsNeedUpdating = False
+        if self.autocompleteCountFactors is None or self.bookVerses is None or self.editedVerseRange is None:
+            return # Nothing to compare against, or the words didn't come from a Bible
+        BBB = self.bookVerses.BBB
+
+        oldVerseTexts = list( self.bookVerses.verseTexts )
+        if self.cacheEditedChapters( BBB, self.editedVerseRange ): # editedVerseRange is still needed by cacheBook
+            changedVerses = [(oldVerseText,newVerseText) for oldVerseText,newVerseText in zip( oldVerseTexts, self.bookVerses.verseTexts )
+                                                                if oldVerseText != newVerseText]
+        else: # Have to recache the entire book, e.g., they changed a chapter number
+            oldVerseCache = self.verseCache
+            self.bookText = self._getEntireText()
+            self.cacheBook( BBB )
+            changedVerses = []
+            for verseKeyHash in set( oldVerseCache ) | set( self.verseCache ):
+                oldVerseText, newVerseText = oldVerseCache.get( verseKeyHash, '' ), self.verseCache.get( verseKeyHash, '' )
+                if oldVerseText != newVerseText: changedVerses.append( (oldVerseText,newVerseText) )
+        updateAutocompleteWordsFromVerses( self, BBB, changedVerses )
+    # end of USFMEditWindow.updateAutocompleteWords
+
+
+    def splitVerses( self, BBB:str, bookLines:List[str], verseCache:Dict[str,str] ) -> None:
+        """
+        Split the USFM book lines into verses (accessible by verse key hash) in verseCache.
+
+        The lines must start at the beginning of the book or at a chapter marker.
+        """
         def addCacheEntry( BBB, C, V, data ):
             """
             Check for duplicates before
@@ -908,22 +1090,23 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
             #dPrint( 'Never', DEBUGGING_THIS_MODULE, "addCacheEntry", BBB, C, V, data )
             assert BBB and C and V and data
             verseKeyHash = SimpleVerseKey( BBB, C, V ).makeHash()
-            if verseKeyHash in self.verseCache: # Oh, how come we already have this key???
-                if data == self.verseCache[verseKeyHash]:
+            if verseKeyHash in verseCache: # Oh, how come we already have this key???
+                if data == verseCache[verseKeyHash]:
                     logging.critical( "cacheBook: We have an identical duplicate {} {}: {!r}" \
                             .format( self.projectAbbreviation, verseKeyHash, data ) )
                 else:
                     logging.critical( "cacheBook: We have a duplicate {} {} -- already had {!r} and now appending {!r}" \
-                            .format( self.projectAbbreviation, verseKeyHash, self.verseCache[verseKeyHash], data ) )
-                    data = self.verseCache[verseKeyHash] + '\n' + data
-            self.verseCache[verseKeyHash] = data.replace( '\n\n', '\n' ) # Weed out blank lines
-        # end of USFMEditWindow.cacheBook.addCacheEntry
+                            .format( self.projectAbbreviation, verseKeyHash, verseCache[verseKeyHash], data ) )
+                    data = verseCache[verseKeyHash] + '\n' + data
+            verseCache[verseKeyHash] = data.replace( '\n\n', '\n' ) # Weed out blank lines
+        # end of USFMEditWindow.splitVerses.addCacheEntry
 
         def getMarkerText( blIndex ):
             """
             Given an index to (nonlocal) bookLines,
                 get that line and break into 2-tuple (marker,text).
             """
+            if blIndex >= numLines: return None, '' # Can happen at the end of a chapter
             gmtLine = bookLines[blIndex]
             #marker = text = None
             if gmtLine and gmtLine[0] == '\\':
@@ -931,14 +1114,13 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
                 except ValueError: marker, text = gmtLine[1:].split( None, 1 )[0], ''
             else: marker, text = None, gmtLine
             return marker, text
-        # end of USFMEditWindow.cacheBook.getMarkerText
+        # end of USFMEditWindow.splitVerses.getMarkerText
 
-        # Main code for cacheBook
+        # Main code for splitVerses
         sectionHeadings = ( 's', 's1', 's2', 's3', 's4', )
         C, V = '-1', '0' # So first/id line starts at -1:0
         startedVerseEarly = False
         currentEntry = ''
-        bookLines = self.bookText.split( '\n' )
         numLines = len( bookLines )
         for j in range( numLines): # Do it this way to make it easy to look-ahead
             line = bookLines[j]
@@ -1018,8 +1200,8 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         if currentEntry: # cache the final verse
             addCacheEntry( BBB, C, V, currentEntry )
         #from itertools import islice
-        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "USFMEditWindow.cacheBook", BBB, "verseCache:", list( islice( self.verseCache, 0, 20 ) ) )
-    # end of USFMEditWindow.cacheBook
+        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "USFMEditWindow.splitVerses", BBB, "verseCache:", list( islice( verseCache, 0, 20 ) ) )
+    # end of USFMEditWindow.splitVerses
 
 
     def getCachedVerseData( self, verseKey ):
@@ -1183,6 +1365,10 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
             #assert self._formatViewMode == 'Unformatted' # Only option done so far
 
         if self.autocompleteBox is not None: self.removeAutocompleteBox()
+        if self.USFMTextCheckPollID is not None: # Don't want the results of checking the old text
+            self.after_cancel( self.USFMTextCheckPollID )
+            self.USFMTextCheckPollID = None
+            self.USFMTextChecker.cancelChecks()
         self.textBox.configure( background=self.defaultBackgroundColour ) # Go back to default background
         if self._formatViewMode != 'Unformatted': # Only option done so far
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Ignoring {!r} mode for USFMEditWindow".format( self._formatViewMode ) )
@@ -1212,6 +1398,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
 
         if self.textBox.edit_modified(): # we need to extract the changes into self.bookText
             assert self.bookTextModified
+            self.updateAutocompleteWords()
             self.bookText = self._getEntireText()
             if newBBB == oldBBB: # We haven't changed books -- update our book cache
                 self.cacheBook( newBBB )
@@ -1222,6 +1409,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
                 self.clearText() # Leaves the text box enabled
                 self.textBox.configure( state=tk.DISABLED ) # Don't allow editing
                 self.textBox.edit_modified( False ) # clear modified flag (otherwise we could empty the book file)
+                self.autocompleteWordsNeedUpdating = False
                 self.refreshTitle()
             return
 
@@ -1259,140 +1447,105 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
             else: self.cacheBook( newBBB )
 
         # Now load the desired part of the book into the edit window
-        #   while at the same time, setting self.bookTextBefore and self.bookTextAfter
-        #   (so that combining these three components, would reconstitute the entire file).
+        #   while at the same time, setting the shown verse range in self.bookVerses
+        #   (so that combining the verses before and after with the edit box text, would reconstitute the entire file).
         if self.bookText is not None:
             self.loading = True # Turns off USFMEditWindow onTextChange notifications for now
             self.clearText() # Leaves the text box enabled
             startingFlag = True
+            BBB, intC, intV = newVerseKey.getBBB(), newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
+            if self.bookVerses is None or self.bookVerses.BBB != BBB:
+                self.bookVerses = USFMBookVerses( BBB, self.getNumChapters, self.getNumVerses )
+                self.bookVersesNeedLoading = True
+            if self.bookVersesNeedLoading: # cacheBook has been run since we last got the verses
+                self.bookVerses.loadVerseTexts( self.verseCache )
+                self.bookVersesNeedLoading = False
 
             if self._contextViewMode == 'BeforeAndAfter':
                 vPrint( 'Never', DEBUGGING_THIS_MODULE, 'USFMEditWindow.updateShownBCV', 'BeforeAndAfter2' )
-                BBB, intC, intV = newVerseKey.getBBB(), newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
-                self.bookTextBefore = self.bookTextAfter = ''
-                numChaps = self.getNumChapters( BBB )
-                if numChaps is None: numChaps = 0
-                for thisC in range( -1, numChaps+1 ):
-                    try: numVerses = self.getNumVerses( BBB, thisC )
-                    except KeyError: numVerses = 0
-                    for thisV in range( numVerses+1 ):
-                        thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
-                        thisVerseData = self.getCachedVerseData( thisVerseKey )
-                        if thisC < intC: self.bookTextBefore += thisVerseData if thisVerseData else ''
-                        elif thisC > intC: self.bookTextAfter += thisVerseData if thisVerseData else ''
-                        elif thisV < intV-1: self.bookTextBefore += thisVerseData if thisVerseData else ''
-                        elif thisV > intV+1: self.bookTextAfter += thisVerseData if thisVerseData else ''
-                        else: # these are the displayed verses
-                            RC = self.textBox.index( tk.INSERT ) # Something like 55.6 for line 55, before column 6
-                            self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
-                                                currentVerseFlag=thisC==intC and thisV==intV,
-                                                substituteTrailingSpaces=self.markTrailingSpacesFlag,
-                                                substituteMultipleSpaces=self.markMultipleSpacesFlag )
-                            if thisC==intC and thisV==intV and thisVerseData: # this is the current verse
-                                row, col = RC.split( '.', 1 ) # Get our starting row/column
-                                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'R.C', repr(RC), repr(row), repr(col), 'tVD', repr(thisVerseData) )
-                                lines = thisVerseData.split( '\n' )
-                                offset = 0
-                                if lines[0] and lines[0][0]=='\\' and lines[0][1:] in BibleOrgSysGlobals.USFMParagraphMarkers:
-                                    # Assume the first line is just a USFM paragraph marker (with no other info)
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Move to 2.end after", repr(lines[0]), "for", self.moduleID )
-                                    offset = 1
-                                savedCursorPosition = '{}.end'.format( int(row) + offset ) # Move the cursor to the end of the SECOND line in the verse
-                                #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Move to {!r} after {!r} for {}".format( savedCursorPosition, lines[0], self.moduleID ) )
-                            startingFlag = False
+                self.bookVerses.setShownRange( *self.bookVerses.getIndexRange( (intC,intV-1), (intC,intV+1) ) )
+                for thisC, thisV in self.bookVerses.getShownCVs(): # these are the displayed verses
+                    thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
+                    thisVerseData = self.getCachedVerseData( thisVerseKey )
+                    RC = self.textBox.index( tk.INSERT ) # Something like 55.6 for line 55, before column 6
+                    self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
+                                        currentVerseFlag=thisC==intC and thisV==intV,
+                                        substituteTrailingSpaces=self.markTrailingSpacesFlag,
+                                        substituteMultipleSpaces=self.markMultipleSpacesFlag )
+                    if thisC==intC and thisV==intV and thisVerseData: # this is the current verse
+                        row, col = RC.split( '.', 1 ) # Get our starting row/column
+                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'R.C', repr(RC), repr(row), repr(col), 'tVD', repr(thisVerseData) )
+                        lines = thisVerseData.split( '\n' )
+                        offset = 0
+                        if lines[0] and lines[0][0]=='\\' and lines[0][1:] in BibleOrgSysGlobals.USFMParagraphMarkers:
+                            # Assume the first line is just a USFM paragraph marker (with no other info)
+                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Move to 2.end after", repr(lines[0]), "for", self.moduleID )
+                            offset = 1
+                        savedCursorPosition = '{}.end'.format( int(row) + offset ) # Move the cursor to the end of the SECOND line in the verse
+                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Move to {!r} after {!r} for {}".format( savedCursorPosition, lines[0], self.moduleID ) )
+                    startingFlag = False
 
             elif self._contextViewMode == 'ByVerse':
                 vPrint( 'Never', DEBUGGING_THIS_MODULE, 'USFMEditWindow.updateShownBCV', 'ByVerse2' )
                 savedCursorPosition = '1.end' # Default the cursor to the end of the first line
-                BBB, intC, intV = newVerseKey.getBBB(), newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
-                self.bookTextBefore = self.bookTextAfter = ''
-                numChaps = self.getNumChapters( BBB )
-                if numChaps is None: numChaps = 0
-                for thisC in range( -1, numChaps+1 ):
-                    try: numVerses = self.getNumVerses( BBB, thisC )
-                    except KeyError: numVerses = 0
-                    for thisV in range( numVerses+1 ):
-                        thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
-                        thisVerseData = self.getCachedVerseData( thisVerseKey )
-                        if thisC < intC: self.bookTextBefore += thisVerseData if thisVerseData else ''
-                        elif thisC > intC: self.bookTextAfter += thisVerseData if thisVerseData else ''
-                        elif thisV < intV: self.bookTextBefore += thisVerseData if thisVerseData else ''
-                        elif thisV > intV: self.bookTextAfter += thisVerseData if thisVerseData else ''
-                        else: # this is the current verse
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "tVD for", self.moduleID, thisVerseKey, thisVerseData )
-                            if thisVerseData is None: # We might have a missing or bridged verse
-                                intV = int( thisV )
-                                while intV > 1:
-                                    intV -= 1 # Go back looking for bridged verses to display
-                                    thisVerseData = self.getCachedVerseData( SimpleVerseKey( BBB, thisC, intV ) )
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  tVD for", self.moduleID, intV, thisVerseData )
-                                    if thisVerseData is not None: # it seems to have worked
-                                        break # Might have been nice to check/confirm that it was actually a bridged verse???
-                            self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
-                                                currentVerseFlag=thisC==intC and thisV==intV,
-                                                substituteTrailingSpaces=self.markTrailingSpacesFlag,
-                                                substituteMultipleSpaces=self.markMultipleSpacesFlag )
-                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'tVD', repr(thisVerseData) )
-                            if thisVerseData:
-                                lines = thisVerseData.split( '\n' )
-                                if lines[0] and lines[0][0]=='\\' and lines[0][1:] in BibleOrgSysGlobals.USFMParagraphMarkers:
-                                    # Assume the first line is just a USFM paragraph marker (with no other info)
-                                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Move to 2.end after", repr(lines[0]), "for", self.moduleID )
-                                    savedCursorPosition = '2.end' # Move the cursor to the end of the SECOND line
+                self.bookVerses.setShownRange( *self.bookVerses.getIndexRange( (intC,intV), (intC,intV) ) )
+                for thisC, thisV in self.bookVerses.getShownCVs(): # this is the current verse
+                    thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
+                    thisVerseData = self.getCachedVerseData( thisVerseKey )
+                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "tVD for", self.moduleID, thisVerseKey, thisVerseData )
+                    if thisVerseData is None: # We might have a missing or bridged verse
+                        intV = int( thisV )
+                        while intV > 1:
+                            intV -= 1 # Go back looking for bridged verses to display
+                            thisVerseData = self.getCachedVerseData( SimpleVerseKey( BBB, thisC, intV ) )
+                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  tVD for", self.moduleID, intV, thisVerseData )
+                            if thisVerseData is not None: # it seems to have worked
+                                break # Might have been nice to check/confirm that it was actually a bridged verse???
+                    self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
+                                        currentVerseFlag=thisC==intC and thisV==intV,
+                                        substituteTrailingSpaces=self.markTrailingSpacesFlag,
+                                        substituteMultipleSpaces=self.markMultipleSpacesFlag )
+                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'tVD', repr(thisVerseData) )
+                    if thisVerseData:
+                        lines = thisVerseData.split( '\n' )
+                        if lines[0] and lines[0][0]=='\\' and lines[0][1:] in BibleOrgSysGlobals.USFMParagraphMarkers:
+                            # Assume the first line is just a USFM paragraph marker (with no other info)
+                            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Move to 2.end after", repr(lines[0]), "for", self.moduleID )
+                            savedCursorPosition = '2.end' # Move the cursor to the end of the SECOND line
 
             elif self._contextViewMode == 'BySection':
                 vPrint( 'Never', DEBUGGING_THIS_MODULE, 'USFMEditWindow.updateShownBCV', 'BySection2' )
-                BBB, intC, intV = newVerseKey.getBBB(), newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
                 sectionStart, sectionEnd = findCurrentSection( newVerseKey, self.getNumChapters, self.getNumVerses, self.getCachedVerseData )
                 intC1, intV1 = sectionStart.getChapterNumberInt(), sectionStart.getVerseNumberInt()
                 intC2, intV2 = sectionEnd.getChapterNumberInt(), sectionEnd.getVerseNumberInt()
-                self.bookTextBefore = self.bookTextAfter = ''
-                for thisC in range( -1, self.getNumChapters( BBB )+1 ):
-                    try: numVerses = self.getNumVerses( BBB, thisC )
-                    except KeyError: numVerses = 0
-                    for thisV in range( numVerses+1 ):
-                        thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
-                        thisVerseData = self.getCachedVerseData( thisVerseKey )
-                        if thisC < intC1 or (thisC==intC1 and thisV<intV1):
-                            self.bookTextBefore += thisVerseData if thisVerseData else ''
-                        elif thisC > intC2 or (thisC==intC2 and thisV>intV2):
-                            self.bookTextAfter += thisVerseData if thisVerseData else ''
-                        else: # we're in the section that we're interested in
-                            self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
-                                                    currentVerseFlag=thisC==intC and thisV==intV )
-                            startingFlag = False
+                self.bookVerses.setShownRange( *self.bookVerses.getIndexRange( (intC1,intV1), (intC2,intV2) ) )
+                for thisC, thisV in self.bookVerses.getShownCVs(): # we're in the section that we're interested in
+                    thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
+                    thisVerseData = self.getCachedVerseData( thisVerseKey )
+                    self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
+                                            currentVerseFlag=thisC==intC and thisV==intV )
+                    startingFlag = False
 
             elif self._contextViewMode == 'ByBook':
                 vPrint( 'Never', DEBUGGING_THIS_MODULE, 'USFMEditWindow.updateShownBCV', 'ByBook2' )
-                self.bookTextBefore = self.bookTextAfter = ''
-                BBB, intC, intV = newVerseKey.getBBB(), newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
-                for thisC in range( -1, self.getNumChapters( BBB ) + 1 ):
-                    try: numVerses = self.getNumVerses( BBB, thisC )
-                    except KeyError: numVerses = 0
-                    for thisV in range( numVerses+1 ):
-                        thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
-                        thisVerseData = self.getCachedVerseData( thisVerseKey )
-                        #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'tVD', repr(thisVerseData) )
-                        self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
-                                                currentVerseFlag=thisC==intC and thisV==intV )
-                        startingFlag = False
+                self.bookVerses.setShownRange( 0, len(self.bookVerses) )
+                for thisC, thisV in self.bookVerses.getShownCVs():
+                    thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
+                    thisVerseData = self.getCachedVerseData( thisVerseKey )
+                    #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, 'tVD', repr(thisVerseData) )
+                    self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
+                                            currentVerseFlag=thisC==intC and thisV==intV )
+                    startingFlag = False
 
             elif self._contextViewMode == 'ByChapter':
                 vPrint( 'Never', DEBUGGING_THIS_MODULE, 'USFMEditWindow.updateShownBCV', 'ByChapter2' )
-                BBB, intC, intV = newVerseKey.getBBB(), newVerseKey.getChapterNumberInt(), newVerseKey.getVerseNumberInt()
-                self.bookTextBefore = self.bookTextAfter = ''
-                for thisC in range( -1, self.getNumChapters( BBB ) + 1 ):
-                    try: numVerses = self.getNumVerses( BBB, thisC )
-                    except KeyError: numVerses = 0
-                    for thisV in range( numVerses + 1 ):
-                        thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
-                        thisVerseData = self.getCachedVerseData( thisVerseKey )
-                        if thisC < intC: self.bookTextBefore += thisVerseData if thisVerseData else ''
-                        elif thisC > intC: self.bookTextAfter += thisVerseData if thisVerseData else ''
-                        else:
-                            self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
-                                                currentVerseFlag=thisC==intC and thisV==intV )
-                            startingFlag = False
+                self.bookVerses.setShownRange( *self.bookVerses.getIndexRange( (intC,0), (intC,LARGE_DUMMY_VALUE) ) )
+                for thisC, thisV in self.bookVerses.getShownCVs():
+                    thisVerseKey = SimpleVerseKey( BBB, thisC, thisV )
+                    thisVerseData = self.getCachedVerseData( thisVerseKey )
+                    self.displayAppendVerse( startingFlag, thisVerseKey, thisVerseData,
+                                        currentVerseFlag=thisC==intC and thisV==intV )
+                    startingFlag = False
 
             else:
                 logging.critical( "USFMEditWindow.updateShownBCV: Bad context view mode {}".format( self._contextViewMode ) )
@@ -1402,6 +1555,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
 
         self.textBox.edit_reset() # clear undo/redo stks
         self.textBox.edit_modified( tk.FALSE ) # clear modified flag
+        self.autocompleteWordsNeedUpdating = False # Only what they type from now on needs counting
         self.loading = False # Turns onTextChange notifications back on
         self.lastCVMark = None
 
@@ -1432,16 +1586,11 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         editBoxText = self.getAllText()
 
         # Add the stuff that wasn't displayed before and after the currently displayed verses
-        try: entireText = self.bookTextBefore + editBoxText + self.bookTextAfter
-        except TypeError:
-            # Probably self.bookTextBefore and self.bookTextAfter are both None
-            #   Can happen if the book navigated to doesn't actually exist (and isn't created)
-            if BibleOrgSysGlobals.debugFlag and DEBUGGING_THIS_MODULE:
-                assert self.bookTextBefore is None
-                assert self.bookTextAfter is None
-            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "_getEntireText", repr(self.bookTextBefore), repr(editBoxText), repr(self.bookTextAfter) )
-            entireText = editBoxText
-        return entireText
+        if self.bookVerses is None:
+            # Can happen if the book navigated to doesn't actually exist (and isn't created)
+            #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "_getEntireText", repr(editBoxText) )
+            return editBoxText
+        return self.bookVerses.getEntireText( editBoxText )
     # end of USFMEditWindow._getEntireText
 
 
@@ -1469,10 +1618,11 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
             BiblelatorGlobals.theApp.logUsage( PROGRAM_NAME, DEBUGGING_THIS_MODULE, ' doBibleReplace {}'.format( self.BibleReplaceOptionsDict ) )
             #self._prepareInternalBible() # Make sure that all books are loaded
             self.doSave() # Make sure that any saves are made to disk
-            # We load and search/replace the actual text files
-            self.BibleReplaceOptionsDict, resultSummaryDict = findReplaceText( self.BibleReplaceOptionsDict['givenBible'], self.BibleReplaceOptionsDict, self.findReplaceCallback )
+            # We search the actual text files to find all the possible replacements first
+            givenBible = self.BibleReplaceOptionsDict['givenBible']
+            self.BibleReplaceOptionsDict, resultSummaryDict, candidateList = findReplaceCandidates( givenBible, self.BibleReplaceOptionsDict )
             #dPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Got findReplaceResults", resultSummaryDict )
-            if 'hadRegexError' in resultSummaryDict and resultSummaryDict['hadRegexError']:
+            if resultSummaryDict['hadRegexError']:
                 errorBeep()
                 showError( self, APP_NAME, _("Regex error with {!r} or {!r}") \
                     .format( self.BibleReplaceOptionsDict['findText'], self.BibleReplaceOptionsDict['replaceText'] ) )
@@ -1481,31 +1631,26 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
                 key = self.BibleReplaceOptionsDict['findText']
                 showError( self, APP_NAME, _("String {!r} not found").format( key if len(key)<20 else (key[:18]+'…') ) )
             else:
-                self._checkForDiskChanges( autoloadText=True )
-                if len(resultSummaryDict['replacedBookList']) == 1:
-                    showInfo( self, APP_NAME, _("Made {} replacements in {}").format( resultSummaryDict['numReplaces'], resultSummaryDict['replacedBookList'][0] ) )
-                elif resultSummaryDict['numReplaces'] == 0:
+                # Let the user check them all, and then make the accepted ones (with one write per book)
+                rpd = ReplacePreviewDialog( self, candidateList, _("Replace {!r}?").format( self.BibleReplaceOptionsDict['findText'] ) )
+                if rpd.result: # We have some accepted replacements
+                    BiblelatorGlobals.theApp.setWaitStatus( _("Replacing…") )
+                    resultSummaryDict.update( applyReplacements( givenBible, rpd.result, resultSummaryDict['bookFiles'], self.BibleReplaceOptionsDict['doBackups'] ) )
+                    self._checkForDiskChanges( autoloadText=True )
+                    if resultSummaryDict['changedBookList']:
+                        showError( self, APP_NAME, _("No replacements made in {} because the file(s) changed").format( ', '.join( resultSummaryDict['changedBookList'] ) ) )
+                    if len(resultSummaryDict['replacedBookList']) == 1:
+                        showInfo( self, APP_NAME, _("Made {} replacements in {}").format( resultSummaryDict['numReplaces'], resultSummaryDict['replacedBookList'][0] ) )
+                    elif resultSummaryDict['numReplaces'] == 0:
+                        showInfo( self, APP_NAME, _("No replacements made") )
+                    else: # more than one book
+                        showInfo( self, APP_NAME, _("Made {} replacements in {} books").format( resultSummaryDict['numReplaces'], len(resultSummaryDict['replacedBookList']) ) )
+                elif rpd.result is not None: # They unticked everything
                     showInfo( self, APP_NAME, _("No replacements made") )
-                else: # more than one book
-                    showInfo( self, APP_NAME, _("Made {} replacements in {} books").format( resultSummaryDict['numReplaces'], len(resultSummaryDict['replacedBookList']) ) )
         BiblelatorGlobals.theApp.setReadyStatus()
     # end of USFMEditWindow.doBibleReplace
 
 
-    def findReplaceCallback( self, ref, contextBefore, ourFindText, contextAfter, willBeText, haveUndosFlag ):
-        """
-        Asks the user if they want to do the replace.
-
-        Returns a single UPPERCASE character
-            'N' (no), 'Y' (yes), 'A' (all), or 'S' (stop).
-        """
-        rcd = ReplaceConfirmDialog( self, theApp, ref, contextBefore, ourFindText, contextAfter, willBeText, haveUndosFlag, _("Replace {!r}?").format( ourFindText ) )
-        if rcd.result is None: rcd.result = 'N' # ESC pressed
-        assert rcd.result in 'YNASU'
-        return rcd.result
-    # end of findReplaceCallback
-
-
     def doSave( self, event=None ):
         """
         Called if the user requests a save from the GUI.
@@ -1521,6 +1666,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         if self.modified():
             if self.folderpath and self.filename:
                 filepath = os.path.join( self.folderpath, self.filename )
+                self.updateAutocompleteWords()
                 self.bookText = self._getEntireText()
                 vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "Saving {} with {} encoding".format( filepath, self.internalBible.encoding ) )
                 logging.debug( "Saving {} with {} encoding".format( filepath, self.internalBible.encoding ) )
@@ -1529,13 +1675,15 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
                 self._rememberFileTimeAndSize()
                 BBB = self.currentVerseKey.getBBB()
                 self.internalBible.bookNeedsReloading[BBB] = True
+                BiblelatorGlobals.theApp.verseCache.removeBook( BiblelatorGlobals.theApp.verseCache.makeResourceID( self.internalBible ), BBB )
                 self.textBox.edit_modified( tk.FALSE ) # clear Tkinter modified flag
                 self.bookTextModified = False
                 #self.internalBible.unloadBooks() # coz they're now out of date
                 #self.internalBible.reloadBook( self.currentVerseKey.getBBB() ) # coz it's now out of date -- what? why?
                 self.cacheBook( BBB ) # Wasted if we're closing the window/program, but important if we're continuing to edit
                 self.refreshTitle()
-                logChangedFile( BiblelatorGlobals.theApp.currentUserName, BiblelatorGlobals.theApp.loggingFolderpath, self.projectName, BBB, self.bookText )
+                logChangedFile( BiblelatorGlobals.theApp.currentUserName, BiblelatorGlobals.theApp.loggingFolderpath, self.projectName, BBB, self.bookText,
+                                self.getBookChapterVerseCounts( BBB ) )
             else: self.doSaveAs()
     # end of USFMEditWindow.doSave
 
@@ -1668,6 +1816,7 @@ class USFMEditWindow( TextEditWindowAddon, InternalBibleResourceWindowAddon, Chi
         vPrint( 'Never', DEBUGGING_THIS_MODULE, "_doViewLog()" )
         if DEBUGGING_THIS_MODULE: BiblelatorGlobals.theApp.setDebugText( "_doViewLog…" )
 
+        flushLogs() # Make sure that the log file is up-to-date
         tEW = TextEditWindow( theApp )
         #if windowGeometry: tEW.geometry( windowGeometry )
         if not tEW.setFilepath( getChangeLogFilepath( BiblelatorGlobals.theApp.loggingFolderpath, self.projectName ) ) \